@@ -0,0 +1,151 @@
+# backtesting/api_client/code_master.py
+
+import json
+import logging
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+try:
+    import pyarrow # noqa: F401 (pandas의 parquet 엔진)
+except ImportError:
+    pyarrow = None
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from config.settings import CODE_MASTER_DIR
+
+logger = logging.getLogger(__name__)
+
+MARKET_TYPES = {1: 'KOSPI', 2: 'KOSDAQ'} # CpCodeMgr.GetStockListByMarket 시장 구분
+
+CODE_MASTER_COLUMNS = ['stock_code', 'stock_name', 'market_kind', 'market_type', 'section_kind',
+                       'control_kind', 'supervision_kind', 'status_kind']
+
+
+def current_trading_day(now: datetime = None) -> date:
+    """
+    종목 마스터 버전으로 쓰는 거래일. 주말이면 직전 금요일입니다.
+    (공휴일은 구분하지 않으므로 공휴일에는 한 번 더 생성될 뿐 결과는 같습니다)
+    """
+    day = (now or datetime.now()).date()
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return day
+
+
+class CodeMaster:
+    """
+    CpCodeMgr의 종목 마스터(종목명, 시장, 섹션/관리/투자유의/거래상태 구분)를 한 번에 읽어 둔 인덱스 테이블.
+    - build(): 시장별 종목 목록을 한 번씩 가져오고 종목마다 COM 속성을 한 번씩만 조회합니다.
+    - 조회는 종목코드 인덱스의 딕셔너리로 O(1)이며, 이후 COM 호출이 없습니다.
+    - save()/load(): {cache_dir}/code_master.parquet (+ .json 메타데이터에 거래일 버전)으로 저장하고,
+      load_or_build()는 같은 거래일에 만든 파일이 있으면 COM 조회 없이 다시 읽습니다.
+    사용 예:
+        master = CodeMaster.load_or_build(cp_code_mgr)
+        master.market_type('A005930') # 'KOSPI'
+    """
+    FILE_NAME = 'code_master'
+
+    def __init__(self, table: pd.DataFrame, trading_day: date = None):
+        """
+        :param table: CODE_MASTER_COLUMNS 컬럼의 DataFrame
+        :param trading_day: 마스터를 만든 거래일 (버전)
+        """
+        self.table = table.reindex(columns=CODE_MASTER_COLUMNS).set_index('stock_code', drop=False)
+        self.trading_day = trading_day
+        self._names = dict(zip(self.table['stock_code'], self.table['stock_name']))
+        self._market_types = dict(zip(self.table['stock_code'], self.table['market_type']))
+
+    def __len__(self):
+        return len(self.table)
+
+    def __contains__(self, stock_code):
+        return stock_code in self._names
+
+    @classmethod
+    def build(cls, cp_code_mgr, trading_day: date = None) -> 'CodeMaster':
+        """CpCodeMgr에서 KOSPI/KOSDAQ 전 종목의 마스터 정보를 읽어 만듭니다."""
+        rows = []
+        for market_kind, market_type in MARKET_TYPES.items():
+            for code in cp_code_mgr.GetStockListByMarket(market_kind):
+                rows.append((
+                    code,
+                    cp_code_mgr.CodeToName(code),
+                    market_kind,
+                    market_type,
+                    cp_code_mgr.GetStockSectionKind(code),
+                    cp_code_mgr.GetStockControlKind(code),
+                    cp_code_mgr.GetStockSupervisionKind(code),
+                    cp_code_mgr.GetStockStatusKind(code),
+                ))
+        logger.info(f"종목 마스터 생성 완료: {len(rows)}개 종목")
+        return cls(pd.DataFrame(rows, columns=CODE_MASTER_COLUMNS), trading_day or current_trading_day())
+
+    @classmethod
+    def _paths(cls, cache_dir: str):
+        base = os.path.join(cache_dir, cls.FILE_NAME)
+        return base + '.parquet', base + '.json'
+
+    def save(self, cache_dir: str = None) -> bool:
+        """마스터 테이블과 거래일 버전을 저장합니다. pyarrow가 없거나 실패하면 False"""
+        if pyarrow is None:
+            logger.warning("pyarrow가 없어 종목 마스터를 파일로 저장하지 않습니다.")
+            return False
+        data_path, meta_path = self._paths(cache_dir or CODE_MASTER_DIR)
+        try:
+            os.makedirs(os.path.dirname(data_path), exist_ok=True)
+            self.table.to_parquet(data_path, index=False)
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump({'trading_day': self.trading_day.isoformat() if self.trading_day else None,
+                           'count': len(self.table), 'created_at': datetime.now().isoformat(timespec='seconds')}, f)
+            return True
+        except Exception as e:
+            logger.error(f"종목 마스터 저장 중 오류 발생: {e}", exc_info=True)
+            return False
+
+    @classmethod
+    def load(cls, cache_dir: str = None, trading_day: date = None):
+        """
+        저장된 마스터를 읽습니다.
+        :param trading_day: 지정하면 이 거래일에 만든 파일만 사용합니다.
+        :return: CodeMaster, 파일이 없거나 버전이 다르면 None
+        """
+        if pyarrow is None:
+            return None
+        data_path, meta_path = cls._paths(cache_dir or CODE_MASTER_DIR)
+        if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+            return None
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+            saved_day = date.fromisoformat(meta['trading_day']) if meta.get('trading_day') else None
+            if trading_day is not None and saved_day != trading_day:
+                logger.info(f"저장된 종목 마스터({saved_day})가 현재 거래일({trading_day})과 달라 다시 생성합니다.")
+                return None
+            return cls(pd.read_parquet(data_path), saved_day)
+        except Exception as e:
+            logger.warning(f"종목 마스터 파일을 읽지 못했습니다: {e}")
+            return None
+
+    @classmethod
+    def load_or_build(cls, cp_code_mgr, cache_dir: str = None, trading_day: date = None) -> 'CodeMaster':
+        """같은 거래일에 저장한 마스터가 있으면 읽고, 없으면 CpCodeMgr에서 만들어 저장합니다."""
+        trading_day = trading_day or current_trading_day()
+        master = cls.load(cache_dir, trading_day)
+        if master is not None:
+            logger.info(f"저장된 종목 마스터를 사용합니다: {len(master)}개 종목 ({trading_day})")
+            return master
+        master = cls.build(cp_code_mgr, trading_day)
+        master.save(cache_dir)
+        return master
+
+    def stock_name(self, stock_code):
+        return self._names.get(stock_code)
+
+    def market_type(self, stock_code):
+        """'KOSPI', 'KOSDAQ' 또는 None"""
+        return self._market_types.get(stock_code)
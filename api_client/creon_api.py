@@ -1,6 +1,9 @@
 # backtesting/api_client/creon_api.py
 
-import win32com.client
+try:
+    import win32com.client
+except ImportError: # Windows/Creon 환경이 아니면 COM을 사용할 수 없음
+    win32com = None
 import ctypes
 import time
 import logging
@@ -14,31 +17,82 @@ import sys
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
+from config.settings import CREON_REQUEST_LIMIT, CREON_REQUEST_PERIOD, MARKETEYE_BATCH_SIZE, CODE_MASTER_DIR
+from api_client.code_master import CodeMaster
+from api_client.rate_limiter import TokenBucket
+from utils.metrics import metrics
+
 # 로거 설정 (기존 설정 유지)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+LT_NONTRADE_REQUEST = 1 # CpCybos.GetLimitRemainCount: 시세 조회 요청 제한 구분
+
+# MarketEye 재무 필드 번호 -> stock_info 컬럼 (86 매출액: 백만 원, 91 영업이익/88 당기순이익: 원)
+FINANCIAL_FIELDS = {17: 'stock_name', 67: 'per', 70: 'eps', 75: 'debt_ratio', 77: 'roe',
+                    86: 'sales', 91: 'operating_profit', 88: 'net_profit'}
+FINANCIAL_DATE_FIELDS = (95, 111) # 결산년월, 최근분기년월 (YYYYMM)
+
+
+def _yyyymm_to_month_end(yyyymm_str):
+    """'YYYYMM' 문자열을 해당 월의 마지막 날짜(date)로 변환합니다. 값이 없거나 잘못되면 None"""
+    if yyyymm_str and yyyymm_str != '0':
+        try:
+            year = int(yyyymm_str[:4])
+            month = int(yyyymm_str[4:])
+            if 1 <= month <= 12:
+                # 해당 월의 마지막 날짜 계산
+                return date(year, month, 1) + timedelta(days=31) - timedelta(days=(date(year, month, 1) + timedelta(days=31)).day)
+        except ValueError:
+            return None
+    return None
+
+
+def _recent_financial_date(annual_yyyymm, quarter_yyyymm):
+    """
+    결산년월과 최근분기년월 중 더 최근 월의 마지막 날짜. (둘 다 없으면 None)
+    MarketEye는 '최신' 재무 데이터의 기준년월을 제공하므로, recent_financial_date에는 해당 연월의 마지막 날짜를 넣습니다.
+    """
+    return max(filter(None, [_yyyymm_to_month_end(annual_yyyymm), _yyyymm_to_month_end(quarter_yyyymm)]), default=None)
+
+
 class CreonAPIClient:
-    def __init__(self):
+    def __init__(self, rate_limiter: TokenBucket = None, backend=None, code_master_dir: str = CODE_MASTER_DIR):
+        """
+        :param rate_limiter: 요청 제한기. None이면 Creon 시세 조회 한도(CREON_REQUEST_LIMIT건 / CREON_REQUEST_PERIOD초)로 생성
+        :param backend: COM 객체를 생성하는 Dispatch(prog_id)를 가진 객체. None이면 win32com.client를 사용합니다.
+                        (Linux 테스트/벤치마크에서는 api_client.fake_creon.FakeCreonBackend를 넘깁니다.)
+        :param code_master_dir: 종목 마스터(CodeMaster)를 거래일 단위로 저장/재사용할 디렉토리. None이면 매번 새로 만들고 저장하지 않습니다.
+        """
+        if backend is None:
+            if win32com is None:
+                logger.error("win32com을 사용할 수 없습니다. Windows에서 Creon Plus와 함께 실행하거나 backend를 지정하세요.")
+                raise ConnectionError("Creon COM backend is not available.")
+            backend = win32com.client
+        self.backend = backend
+        self.rate_limiter = rate_limiter or TokenBucket(CREON_REQUEST_LIMIT, CREON_REQUEST_PERIOD)
         self.connected = False
         self.cp_code_mgr = None
         self.cp_cybos = None
+        self.code_master_dir = code_master_dir
+        self.code_master = None
         self.stock_name_dic = {}
         self.stock_code_dic = {}
         self._connect_creon()
         if self.connected:
-            self.cp_code_mgr = win32com.client.Dispatch("CpUtil.CpCodeMgr")
+            self.cp_code_mgr = self.backend.Dispatch("CpUtil.CpCodeMgr")
             logger.info("CpCodeMgr COM object initialized.")
             self._make_stock_dic()
 
     def _connect_creon(self):
         """Creon Plus에 연결하고 COM 객체를 초기화합니다."""
-        if ctypes.windll.shell32.IsUserAnAdmin():
-            logger.info("Running with administrator privileges.")
-        else:
-            logger.warning("Not running with administrator privileges. Some Creon functions might be restricted.")
+        if self.backend is getattr(win32com, 'client', None): # 관리자 권한 확인은 실제 Creon(Windows)에서만 의미가 있음
+            if ctypes.windll.shell32.IsUserAnAdmin():
+                logger.info("Running with administrator privileges.")
+            else:
+                logger.warning("Not running with administrator privileges. Some Creon functions might be restricted.")
 
-        self.cp_cybos = win32com.client.Dispatch("CpUtil.CpCybos")
+        self.cp_cybos = self.backend.Dispatch("CpUtil.CpCybos")
         if self.cp_cybos.IsConnect:
             self.connected = True
             logger.info("Creon Plus is already connected.")
@@ -64,17 +118,27 @@ class CreonAPIClient:
             logger.error("Creon Plus is not connected.")
             return False
 
-        # 요청 제한 개수 확인 (기존 코드 유지)
-        # remain_count = self.cp_cybos.GetLimitRequestRemainTime() # 인자 제거
-        # if remain_count <= 0:
-        #      logger.warning(f"Creon API request limit reached. Waiting for 1 second.")
-        #      time.sleep(1)
-        #      remain_count = self.cp_cybos.GetLimitRequestRemainTime() # 인자 제거
-        #      if remain_count <= 0:
-        #          logger.error("Creon API request limit still active after waiting. Cannot proceed.")
-        #          return False
+        # 요청 제한 개수 확인은 BlockRequest 직전에 _wait_for_request_slot()에서 처리합니다.
         return True
 
+    def _wait_for_request_slot(self):
+        """
+        요청 한도 안에서 다음 BlockRequest를 보낼 수 있을 때까지 대기합니다.
+        로컬 토큰 버킷으로 속도를 맞추고, Creon이 알려 주는 남은 요청 수가 0이면 한도 초기화 시각까지 기다립니다.
+        """
+        with metrics.timer('creon_quota_wait'):
+            self.rate_limiter.acquire()
+            try:
+                remain_count = self.cp_cybos.GetLimitRemainCount(LT_NONTRADE_REQUEST)
+                if remain_count <= 0:
+                    remain_time_ms = self.cp_cybos.LimitRequestRemainTime
+                    logger.warning(f"Creon API 요청 한도 소진. {remain_time_ms / 1000:.1f}초 대기합니다.")
+                    self.rate_limiter.block_for(remain_time_ms / 1000)
+                    self.rate_limiter.acquire()
+            except Exception as e:
+                # 남은 한도 조회가 지원되지 않는 환경에서는 토큰 버킷만으로 제한합니다.
+                logger.debug(f"Creon 요청 한도 조회 실패: {e}")
+
     def _is_spac(self, code_name):
         """종목명에 숫자+'호' 패턴이 있으면 스펙주로 판단합니다."""
         return re.search(r'\d+호', code_name) is not None
@@ -88,26 +152,31 @@ class CreonAPIClient:
         return "리츠" in code_name
 
     def _make_stock_dic(self):
-        """주식 종목 정보를 딕셔너리로 저장합니다. 스펙주, 우선주, 리츠 제외."""
+        """
+        주식 종목 정보를 딕셔너리로 저장합니다. 스펙주, 우선주, 리츠 제외.
+        종목 속성은 CodeMaster(거래일마다 한 번 COM에서 읽어 파일로 저장)에서 가져오므로, 같은 거래일의 재시작에는 COM 호출이 없습니다.
+        """
         logger.info("종목 코드/명 딕셔너리 생성 시작")
         if not self.cp_code_mgr:
             logger.error("cp_code_mgr is not initialized. Cannot make stock dictionary.")
             return
 
         try:
-            kospi_codes = self.cp_code_mgr.GetStockListByMarket(1)
-            kosdaq_codes = self.cp_code_mgr.GetStockListByMarket(2)
-            all_codes = kospi_codes + kosdaq_codes
-            
+            if self.code_master_dir:
+                self.code_master = CodeMaster.load_or_build(self.cp_code_mgr, self.code_master_dir)
+            else:
+                self.code_master = CodeMaster.build(self.cp_code_mgr)
+
             processed_count = 0
-            for code in all_codes:
-                code_name = self.cp_code_mgr.CodeToName(code)
+            for code, code_name, section_kind, control_kind, supervision_kind, status_kind in zip(
+                    self.code_master.table['stock_code'], self.code_master.table['stock_name'],
+                    self.code_master.table['section_kind'], self.code_master.table['control_kind'],
+                    self.code_master.table['supervision_kind'], self.code_master.table['status_kind']):
                 if not code_name: # 종목명이 없으면 유효하지 않은 종목으로 간주
                     continue
 
                 # 1. 섹션 종류 필터링: 보통주(0)만 포함
                 # Creon API GetStockSectionKind: 0:보통주, 1:우선주, 2:뮤추얼펀드, 3:ETF, 4:ETN, 5:ELW, 6:워런트, 7:스펙, 8:리츠
-                section_kind = self.cp_code_mgr.GetStockSectionKind(code)
                 if section_kind != 1: # 보통주(1)가 아니면 다음 종목으로 건너뛰기
                     continue
 
@@ -119,15 +188,15 @@ class CreonAPIClient:
 
                 # 3. 관리/투자경고/거래정지 등 상태 필터링
                 # GetStockControlKind: 0:정상, 1:관리, 2:투자경고, 3:투자위험, 4:투자주의 등
-                if self.cp_code_mgr.GetStockControlKind(code) != 0: 
+                if control_kind != 0:
                     continue
                 # GetStockSupervisionKind: 0:정상, 1:투자유의
-                if self.cp_code_mgr.GetStockSupervisionKind(code) != 0: 
+                if supervision_kind != 0:
                     continue
                 # GetStockStatusKind: 0:정상, 2:거래정지, 3:거래중단
-                if self.cp_code_mgr.GetStockStatusKind(code) in [2, 3]: 
+                if status_kind in [2, 3]:
                     continue
-                
+
                 self.stock_name_dic[code_name] = code
                 self.stock_code_dic[code] = code_name
                 processed_count += 1
@@ -145,6 +214,10 @@ class CreonAPIClient:
         """종목명으로 종목목코드를 반환 합니다."""
         return self.stock_name_dic.get(find_name, None)
 
+    def get_market_type(self, stock_code):
+        """종목코드의 시장 구분('KOSPI'/'KOSDAQ')을 종목 마스터에서 반환합니다."""
+        return self.code_master.market_type(stock_code) if self.code_master is not None else None
+
     def get_filtered_stock_list(self):
         """필터링된 모든 종목 코드를 리스트로 반환합니다."""
         return list(self.stock_code_dic.keys())
@@ -163,7 +236,7 @@ class CreonAPIClient:
         if not self._check_creon_status():
             return pd.DataFrame()
 
-        objChart = win32com.client.Dispatch('CpSysDib.StockChart')
+        objChart = self.backend.Dispatch('CpSysDib.StockChart')
         
         # 입력 값 설정
         objChart.SetInputValue(0, stock_code)
@@ -187,8 +260,9 @@ class CreonAPIClient:
         data_list = []
         
         while True:
-            objChart.BlockRequest()
-            time.sleep(0.2) # 과도한 요청 방지 및 제한 시간 준수
+            self._wait_for_request_slot() # 요청 한도 준수
+            with metrics.timer('creon_request', request='StockChart'):
+                objChart.BlockRequest()
 
             rq_status = objChart.GetDibStatus()
             rq_msg = objChart.GetDibMsg1()
@@ -201,6 +275,7 @@ class CreonAPIClient:
                 return pd.DataFrame() # 빈 DataFrame 반환
 
             received_len = objChart.GetHeaderValue(3) # 현재 BlockRequest로 수신된 데이터 개수
+            metrics.inc('creon_rows', received_len, request='StockChart')
             if received_len == 0:
                 break # 더 이상 받을 데이터가 없으면 루프 종료
 
@@ -281,7 +356,7 @@ class CreonAPIClient:
             if not self._check_creon_status():
                 return pd.DataFrame()
 
-            objMarketEye = win32com.client.Dispatch("CpSysDib.MarketEye")
+            objMarketEye = self.backend.Dispatch("CpSysDib.MarketEye")
             
             # 요청할 필드 설정 (stock_info 테이블에 추가된 컬럼에 맞춰 확장)
             req_fields = [
@@ -302,7 +377,9 @@ class CreonAPIClient:
             objMarketEye.SetInputValue(0, req_fields)   # 요청할 필드 배열
             objMarketEye.SetInputValue(1, stock_code)   # 종목 코드 (단일 종목 요청)
 
-            objMarketEye.BlockRequest()
+            self._wait_for_request_slot() # 요청 한도 준수
+            with metrics.timer('creon_request', request='MarketEye'):
+                objMarketEye.BlockRequest()
 
             # 요청 상태 확인
             rq_status = objMarketEye.GetDibStatus()
@@ -320,46 +397,31 @@ class CreonAPIClient:
                 logger.warning(f"{stock_code}에 대한 MarketEye 재무 데이터가 없습니다.")
                 return pd.DataFrame()
 
+            # MarketEye는 요청 순서가 아니라 필드 번호 순으로 데이터를 돌려주므로, 수신 필드 배열에서 위치를 찾습니다.
+            received_fields = list(objMarketEye.GetHeaderValue(1))
+
             # 데이터 추출
             data = {
                 'stock_code': stock_code,
-                'stock_name': objMarketEye.GetDataValue(req_fields.index(17), 0),
-                'per': objMarketEye.GetDataValue(req_fields.index(67), 0),
-                'eps': objMarketEye.GetDataValue(req_fields.index(70), 0),
-                'debt_ratio': objMarketEye.GetDataValue(req_fields.index(75), 0),
-                'roe': objMarketEye.GetDataValue(req_fields.index(77), 0),
-                'sales': objMarketEye.GetDataValue(req_fields.index(86), 0), # 백만 원 단위
-                'operating_profit': objMarketEye.GetDataValue(req_fields.index(91), 0), # 원 단위
-                'net_profit': objMarketEye.GetDataValue(req_fields.index(88), 0), # 원 단위
-                'annual_base_date_str': str(objMarketEye.GetDataValue(req_fields.index(95), 0)), # YYYYMM
-                'quarter_base_date_str': str(objMarketEye.GetDataValue(req_fields.index(111), 0)) # YYYYMM
+                'stock_name': objMarketEye.GetDataValue(received_fields.index(17), 0),
+                'per': objMarketEye.GetDataValue(received_fields.index(67), 0),
+                'eps': objMarketEye.GetDataValue(received_fields.index(70), 0),
+                'debt_ratio': objMarketEye.GetDataValue(received_fields.index(75), 0),
+                'roe': objMarketEye.GetDataValue(received_fields.index(77), 0),
+                'sales': objMarketEye.GetDataValue(received_fields.index(86), 0), # 백만 원 단위
+                'operating_profit': objMarketEye.GetDataValue(received_fields.index(91), 0), # 원 단위
+                'net_profit': objMarketEye.GetDataValue(received_fields.index(88), 0), # 원 단위
+                'annual_base_date_str': str(objMarketEye.GetDataValue(received_fields.index(95), 0)), # YYYYMM
+                'quarter_base_date_str': str(objMarketEye.GetDataValue(received_fields.index(111), 0)) # YYYYMM
             }
 
             df = pd.DataFrame([data])
 
             # 최신 재무 데이터의 기준 일자 결정 (연간 또는 분기 중 더 최근 데이터)
-            # MarketEye는 '최신' 재무 데이터의 기준년월을 제공하므로,
-            # 'recent_financial_date' 컬럼에는 해당 연월의 마지막 날짜를 넣어주는 것이 일반적입니다.
-            def convert_yyyymm_to_date_end_of_month(yyyymm_str):
-                if yyyymm_str and yyyymm_str != '0':
-                    try:
-                        year = int(yyyymm_str[:4])
-                        month = int(yyyymm_str[4:])
-                        if 1 <= month <= 12:
-                            # 해당 월의 마지막 날짜 계산
-                            return date(year, month, 1) + timedelta(days=31) - timedelta(days=(date(year, month, 1) + timedelta(days=31)).day)
-                    except ValueError:
-                        return None
-                return None
-            
-            df['annual_base_date'] = df['annual_base_date_str'].apply(convert_yyyymm_to_date_end_of_month)
-            df['quarter_base_date'] = df['quarter_base_date_str'].apply(convert_yyyymm_to_date_end_of_month)
-
-            # 더 최신인 날짜를 recent_financial_date로 선택 (둘 다 None이면 None)
-            df['recent_financial_date'] = df.apply(
-                lambda row: max(filter(None, [row['annual_base_date'], row['quarter_base_date']]), default=None),
-                axis=1
-            )
+            df['recent_financial_date'] = [
+                _recent_financial_date(annual, quarter)
+                for annual, quarter in zip(df['annual_base_date_str'], df['quarter_base_date_str'])
+            ]
             # pbr은 EPS와 현재가로 직접 계산하거나, MarketEye의 PER/BPS 조합으로 계산
             # MarketEye 필드 67: PER, 89: BPS, 96: 현재가 -> pbr = 현재가 / BPS
             # 또는 PBR 필드 68을 직접 요청할 수 있지만, 여기서는 기존 EPS/PER/BPS 조합을 유지
@@ -376,4 +438,60 @@ class CreonAPIClient:
 
         except Exception as e:
             logger.error(f"MarketEye 재무 데이터 조회 중 오류 발생: {e}", exc_info=True)
-            return pd.DataFrame()
\ No newline at end of file
+            return pd.DataFrame()
+
+    def get_latest_financial_data_batch(self, stock_codes, batch_size: int = MARKETEYE_BATCH_SIZE):
+        """
+        여러 종목의 최신 재무 데이터를 MarketEye 한 번에 최대 batch_size개씩 묶어 조회합니다.
+        get_latest_financial_data와 같은 필드/단위이며, 종목마다 요청하는 대신 batch_size개당 요청 1회로 줄입니다.
+        실패한 배치는 로그를 남기고 건너뜁니다.
+        :param stock_codes: 종목 코드 리스트
+        :param batch_size: MarketEye 요청 1회당 종목 수 (최대 200)
+        :return: Pandas DataFrame (종목당 1행, get_latest_financial_data와 같은 컬럼), 데이터가 없으면 빈 DataFrame 반환
+        """
+        columns = ['stock_code', 'stock_name', 'per', 'eps', 'debt_ratio', 'roe',
+                   'sales', 'operating_profit', 'net_profit', 'recent_financial_date']
+        if not self._check_creon_status():
+            return pd.DataFrame(columns=columns)
+
+        stock_codes = list(dict.fromkeys(stock_codes))
+        batch_size = max(1, min(batch_size, MARKETEYE_BATCH_SIZE))
+        # 응답 행이 요청 순서와 어긋나도(없는 종목은 빠짐) 종목을 알 수 있도록 종목코드(0)도 요청
+        req_fields = [0] + list(FINANCIAL_FIELDS) + list(FINANCIAL_DATE_FIELDS)
+        objMarketEye = self.backend.Dispatch("CpSysDib.MarketEye")
+        rows = []
+        for i in range(0, len(stock_codes), batch_size):
+            batch = stock_codes[i:i + batch_size]
+            try:
+                objMarketEye.SetInputValue(0, req_fields)
+                objMarketEye.SetInputValue(1, batch)
+
+                self._wait_for_request_slot() # 요청 한도 준수
+                with metrics.timer('creon_request', request='MarketEye'):
+                    objMarketEye.BlockRequest()
+
+                rq_status = objMarketEye.GetDibStatus()
+                if rq_status != 0:
+                    logger.error(f"MarketEye 재무 데이터 배치 요청 실패 ({batch[0]} 외 {len(batch) - 1}종목). "
+                                 f"통신상태: {rq_status}, 메시지: {objMarketEye.GetDibMsg1()}")
+                    continue
+
+                num_stocks = objMarketEye.GetHeaderValue(2)
+                # MarketEye는 요청 순서가 아니라 필드 번호 순으로 데이터를 돌려주므로, 수신 필드 배열에서 위치를 찾습니다.
+                received_fields = list(objMarketEye.GetHeaderValue(1))
+                positions = {field: received_fields.index(field) for field in req_fields}
+                for idx in range(num_stocks):
+                    row = {column: objMarketEye.GetDataValue(positions[field], idx)
+                           for field, column in FINANCIAL_FIELDS.items()}
+                    row['stock_code'] = objMarketEye.GetDataValue(positions[0], idx)
+                    row['recent_financial_date'] = _recent_financial_date(
+                        *(str(objMarketEye.GetDataValue(positions[field], idx)) for field in FINANCIAL_DATE_FIELDS))
+                    rows.append(row)
+                metrics.inc('creon_rows', num_stocks, request='MarketEye')
+            except Exception as e:
+                logger.error(f"MarketEye 재무 데이터 배치 조회 중 오류 발생 ({batch[0]} 외 {len(batch) - 1}종목): {e}",
+                             exc_info=True)
+
+        logger.info(f"MarketEye 최신 재무 데이터 배치 조회 완료: {len(rows)}/{len(stock_codes)}종목, "
+                    f"요청 {-(-len(stock_codes) // batch_size)}회")
+        return pd.DataFrame(rows, columns=columns)
\ No newline at end of file
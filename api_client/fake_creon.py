@@ -0,0 +1,390 @@
+# backtesting/api_client/fake_creon.py
+
+import logging
+import os
+import sys
+import time
+import zlib
+from datetime import date, datetime
+
+import numpy as np
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from config.settings import CREON_REQUEST_LIMIT, CREON_REQUEST_PERIOD
+
+logger = logging.getLogger(__name__)
+
+# StockChart 필드 번호 (Creon 도움말 기준)
+CHART_DATE, CHART_TIME, CHART_OPEN, CHART_HIGH, CHART_LOW, CHART_CLOSE = 0, 1, 2, 3, 4, 5
+CHART_VOLUME, CHART_TRADING_VALUE = 8, 9
+
+SYNTHETIC_START = date(2000, 1, 3) # 합성 일봉 가격 경로의 시작일
+MINUTES_PER_DAY = 390 # 09:01 ~ 15:30
+MARKET_EYE_MAX_CODES = 200 # MarketEye 한 번에 요청할 수 있는 최대 종목 수
+
+DIB_OK = 0
+DIB_ERROR = -1
+BLOCK_REQUEST_LIMITED = 4 # BlockRequest 반환값: 요청 한도 초과
+
+
+def _code_seed(stock_code: str) -> int:
+    """프로세스와 무관하게 같은 값을 주는 종목별 시드 (hash()는 실행마다 바뀜)."""
+    return zlib.crc32(stock_code.encode('utf-8'))
+
+
+class FakeCreonBackend:
+    """
+    Creon Plus COM 객체를 흉내 내는 결정적(deterministic) 백엔드.
+    CreonAPIClient(backend=FakeCreonBackend())로 넘기면 win32com.client 대신 Dispatch()에 응답하므로,
+    Windows/HTS 없이 Linux에서도 수집 경로(StockDataManager 전체)를 실행하고 처리량을 측정할 수 있습니다.
+
+    지원 객체: CpUtil.CpCybos, CpUtil.CpCodeMgr, CpSysDib.StockChart, CpSysDib.MarketEye
+    - 같은 종목/기간에는 항상 같은 합성 OHLCV를 돌려줍니다.
+    - BlockRequest마다 latency초를 대기하고, quota건/quota_period초 한도를 넘으면 요청이 거부됩니다.
+    """
+    def __init__(self, stock_codes=None, num_stocks: int = 50, latency: float = 0.0,
+                 quota: int = CREON_REQUEST_LIMIT, quota_period: float = CREON_REQUEST_PERIOD,
+                 page_size: int = 2000, clock=time.monotonic, sleep=time.sleep):
+        """
+        :param stock_codes: 종목 코드 목록. None이면 num_stocks개의 보통주 코드를 생성합니다.
+        :param num_stocks: stock_codes가 없을 때 생성할 종목 수 (절반은 KOSPI, 나머지는 KOSDAQ)
+        :param latency: BlockRequest 한 번의 응답 지연 (초)
+        :param quota: quota_period초 동안 허용되는 BlockRequest 수 (None이면 제한 없음)
+        :param quota_period: 요청 한도 기준 시간 (초)
+        :param page_size: StockChart 한 번의 BlockRequest로 받는 최대 행 수 (나머지는 Continue로 조회)
+        :param clock: 현재 시각 함수 (테스트용)
+        :param sleep: 대기 함수 (테스트용)
+        """
+        if stock_codes is None:
+            stock_codes = [f"A{(i + 1) * 10:06d}" for i in range(num_stocks)]
+        self.stock_codes = list(stock_codes)
+        half = (len(self.stock_codes) + 1) // 2
+        self.markets = {1: tuple(self.stock_codes[:half]), 2: tuple(self.stock_codes[half:])}
+        self.latency = latency
+        self.quota = quota
+        self.quota_period = quota_period
+        self.page_size = page_size
+        self.clock = clock
+        self.sleep = sleep
+        self.request_count = 0 # 전체 BlockRequest 수 (벤치마크용)
+        self._window_start = None
+        self._window_count = 0
+        self._daily_cache = {}
+
+    def Dispatch(self, prog_id: str):
+        """win32com.client.Dispatch와 같은 방식으로 가짜 COM 객체를 생성합니다."""
+        objects = {
+            'CpUtil.CpCybos': FakeCpCybos,
+            'CpUtil.CpCodeMgr': FakeCpCodeMgr,
+            'CpSysDib.StockChart': FakeStockChart,
+            'CpSysDib.MarketEye': FakeMarketEye,
+        }
+        if prog_id not in objects:
+            raise ValueError(f"FakeCreonBackend에서 지원하지 않는 COM 객체입니다: {prog_id}")
+        return objects[prog_id](self)
+
+    # --- 요청 한도 ---
+    def _roll_window(self):
+        now = self.clock()
+        if self._window_start is None or now - self._window_start >= self.quota_period:
+            self._window_start = now
+            self._window_count = 0
+        return now
+
+    def remain_count(self) -> int:
+        if self.quota is None:
+            return 1 << 30
+        self._roll_window()
+        return max(self.quota - self._window_count, 0)
+
+    def remain_time_ms(self) -> int:
+        if self._window_start is None:
+            return 0
+        now = self.clock()
+        return max(int((self._window_start + self.quota_period - now) * 1000), 0)
+
+    def consume_request(self) -> bool:
+        """BlockRequest 한 건을 처리합니다. 한도를 넘으면 False."""
+        if self.latency:
+            self.sleep(self.latency)
+        if self.quota is not None:
+            self._roll_window()
+            if self._window_count >= self.quota:
+                logger.warning("FakeCreonBackend: 요청 한도 초과")
+                return False
+            self._window_count += 1
+        self.request_count += 1
+        return True
+
+    # --- 합성 데이터 ---
+    def market_of(self, stock_code: str) -> int:
+        return 1 if stock_code in self.markets[1] else 2 if stock_code in self.markets[2] else 0
+
+    def stock_name(self, stock_code: str) -> str:
+        if stock_code not in self.stock_codes:
+            return ''
+        return f"합성종목{self.stock_codes.index(stock_code) + 1:04d}"
+
+    def daily_bars(self, stock_code: str, to_yyyymmdd: int) -> np.ndarray:
+        """
+        SYNTHETIC_START부터 to_yyyymmdd까지 평일 일봉을 (n, 8) int64 배열로 반환합니다.
+        컬럼: 날짜(YYYYMMDD), 시가, 고가, 저가, 종가, 거래량, 거래대금, 날짜 서수(ordinal)
+        가격 경로는 시작일부터 누적하므로 조회 기간이 달라도 같은 날짜의 값은 같습니다.
+        """
+        end = datetime.strptime(str(to_yyyymmdd), '%Y%m%d').date()
+        cached = self._daily_cache.get(stock_code)
+        if cached is not None and cached[0] >= end:
+            bars = cached[1]
+            return bars[:np.searchsorted(bars[:, 7], end.toordinal(), side='right')]
+
+        days = np.arange(SYNTHETIC_START.toordinal(), end.toordinal() + 1)
+        days = days[(days % 7) % 6 != 0] # 서수 기준 요일: %7==0 일요일, %7==6 토요일
+        rng = np.random.default_rng(_code_seed(stock_code))
+        base = 5_000 + _code_seed(stock_code) % 95_000
+        close = base * np.exp(np.cumsum(rng.normal(0.0003, 0.02, len(days))))
+        open_ = close * (1 + rng.normal(0, 0.005, len(days)))
+        spread = np.abs(rng.normal(0, 0.01, len(days)))
+        high = np.maximum(open_, close) * (1 + spread)
+        low = np.minimum(open_, close) * (1 - spread)
+        volume = rng.integers(10_000, 1_000_000, len(days))
+
+        bars = np.empty((len(days), 8), dtype=np.int64)
+        dates = [date.fromordinal(int(d)) for d in days]
+        bars[:, 0] = [d.year * 10000 + d.month * 100 + d.day for d in dates]
+        bars[:, 1] = np.round(open_)
+        bars[:, 2] = np.round(high)
+        bars[:, 3] = np.round(low)
+        bars[:, 4] = np.round(close)
+        bars[:, 5] = volume
+        bars[:, 6] = bars[:, 4] * volume
+        bars[:, 7] = days
+        self._daily_cache[stock_code] = (end, bars)
+        return bars
+
+    def minute_bars(self, stock_code: str, day_bar: np.ndarray) -> np.ndarray:
+        """
+        일봉 한 개로부터 그날의 1분봉(MINUTES_PER_DAY개)을 (n, 7) int64 배열로 만듭니다.
+        컬럼: 날짜, 시간(HHMM), 시가, 고가, 저가, 종가, 거래량
+        """
+        rng = np.random.default_rng((_code_seed(stock_code), int(day_bar[7])))
+        open_, close = float(day_bar[1]), float(day_bar[4])
+        # 시가에서 출발해 종가로 끝나는 브라운 브리지 경로
+        walk = np.cumsum(rng.normal(0, 0.001, MINUTES_PER_DAY))
+        ramp = np.linspace(0, 1, MINUTES_PER_DAY)
+        path = open_ * np.exp(ramp * np.log(close / open_) + walk - walk[-1] * ramp)
+        prev = np.concatenate(([open_], path[:-1]))
+        minutes = np.arange(1, MINUTES_PER_DAY + 1) + 9 * 60
+
+        bars = np.empty((MINUTES_PER_DAY, 7), dtype=np.int64)
+        bars[:, 0] = day_bar[0]
+        bars[:, 1] = (minutes // 60) * 100 + minutes % 60
+        bars[:, 2] = np.round(prev)
+        bars[:, 3] = np.round(np.maximum(prev, path) * 1.0005)
+        bars[:, 4] = np.round(np.minimum(prev, path) * 0.9995)
+        bars[:, 5] = np.round(path)
+        bars[:, 6] = max(int(day_bar[5]) // MINUTES_PER_DAY, 1)
+        return bars
+
+    def financials(self, stock_code: str) -> dict:
+        """MarketEye 재무 필드의 합성 값 (종목별로 고정)."""
+        rng = np.random.default_rng((_code_seed(stock_code), 1))
+        return {
+            0: stock_code,
+            4: int(self.daily_bars(stock_code, int(date.today().strftime('%Y%m%d')))[-1, 4]),
+            17: self.stock_name(stock_code),
+            67: round(float(rng.uniform(3, 40)), 2), # PER
+            70: int(rng.integers(100, 10_000)), # EPS
+            75: round(float(rng.uniform(10, 300)), 2), # 부채비율
+            77: round(float(rng.uniform(-5, 30)), 2), # ROE
+            86: int(rng.integers(10_000, 5_000_000)), # 매출액 (백만)
+            88: int(rng.integers(1, 500_000)) * 1_000_000, # 당기순이익 (원)
+            89: int(rng.integers(1_000, 100_000)), # BPS
+            91: int(rng.integers(1, 800_000)) * 1_000_000, # 영업이익 (원)
+            95: 202412, # 결산년월
+            111: 202503, # 최근분기년월
+        }
+
+
+class _FakeRequest:
+    """SetInputValue/BlockRequest/GetDibStatus/GetDibMsg1 공통 동작."""
+    def __init__(self, backend: FakeCreonBackend):
+        self._backend = backend
+        self._inputs = {}
+        self._status = DIB_OK
+        self._msg = ''
+
+    def SetInputValue(self, index, value):
+        self._inputs[index] = value
+
+    def GetDibStatus(self):
+        return self._status
+
+    def GetDibMsg1(self):
+        return self._msg
+
+    def BlockRequest(self):
+        if not self._backend.consume_request():
+            self._status, self._msg = DIB_ERROR, '요청 한도를 초과했습니다.'
+            return BLOCK_REQUEST_LIMITED
+        self._status, self._msg = DIB_OK, '정상 처리되었습니다.'
+        self._on_request()
+        return 0
+
+    def _on_request(self):
+        raise NotImplementedError
+
+
+class FakeCpCybos:
+    def __init__(self, backend: FakeCreonBackend):
+        self._backend = backend
+        self.IsConnect = 1
+
+    def GetLimitRemainCount(self, limit_type):
+        return self._backend.remain_count()
+
+    @property
+    def LimitRequestRemainTime(self):
+        return self._backend.remain_time_ms()
+
+
+class FakeCpCodeMgr:
+    def __init__(self, backend: FakeCreonBackend):
+        self._backend = backend
+
+    def GetStockListByMarket(self, market):
+        return self._backend.markets.get(market, ())
+
+    def GetStockMarketKind(self, code):
+        return self._backend.market_of(code)
+
+    def CodeToName(self, code):
+        return self._backend.stock_name(code)
+
+    def GetStockSectionKind(self, code):
+        return 1
+
+    def GetStockControlKind(self, code):
+        return 0
+
+    def GetStockSupervisionKind(self, code):
+        return 0
+
+    def GetStockStatusKind(self, code):
+        return 0
+
+
+class FakeStockChart(_FakeRequest):
+    """
+    CpSysDib.StockChart: 입력 0(종목), 1(요청구분 '1' 기간/'2' 개수), 2(To), 3(From), 4(개수),
+    5(필드 배열), 6(주기 'D'/'m'), 7(분 주기)를 해석합니다. 최신 데이터부터 page_size개씩 돌려주며,
+    남은 데이터가 있으면 Continue가 1이 됩니다.
+    """
+    def __init__(self, backend: FakeCreonBackend):
+        super().__init__(backend)
+        self._pending = None # 아직 보내지 않은 행 (최신순)
+        self._page = None
+        self.Continue = 0
+
+    def SetInputValue(self, index, value):
+        super().SetInputValue(index, value)
+        self._pending = None # 입력이 바뀌면 새 조회
+
+    def _build_rows(self) -> np.ndarray:
+        code = self._inputs[0]
+        to_date = int(self._inputs.get(2, 0)) or int(date.today().strftime('%Y%m%d'))
+        if code not in self._backend.stock_codes:
+            return np.empty((0, 10), dtype=np.int64)
+        days = self._backend.daily_bars(code, to_date)
+        by_count = self._inputs.get(1) == ord('2')
+        if not by_count:
+            days = days[days[:, 0] >= int(self._inputs.get(3, 0))]
+
+        rows = np.zeros((0, 10), dtype=np.int64)
+        if self._inputs.get(6, ord('D')) == ord('m'):
+            count = int(self._inputs.get(4, 0)) if by_count else None
+            needed = -(-count // MINUTES_PER_DAY) if count else len(days)
+            minutes = [self._backend.minute_bars(code, bar) for bar in days[-needed:]] if len(days) else []
+            if minutes:
+                minute = np.concatenate(minutes)
+                interval = max(int(self._inputs.get(7, 1)), 1)
+                minute = self._resample_minutes(minute, interval)
+                rows = np.zeros((len(minute), 10), dtype=np.int64)
+                rows[:, [CHART_DATE, CHART_TIME, CHART_OPEN, CHART_HIGH, CHART_LOW, CHART_CLOSE, CHART_VOLUME]] = minute
+                rows[:, CHART_TRADING_VALUE] = minute[:, 5] * minute[:, 6]
+        elif len(days):
+            rows = np.zeros((len(days), 10), dtype=np.int64)
+            rows[:, [CHART_DATE, CHART_OPEN, CHART_HIGH, CHART_LOW, CHART_CLOSE, CHART_VOLUME, CHART_TRADING_VALUE]] = days[:, :7]
+        if by_count:
+            rows = rows[-int(self._inputs.get(4, 0)):] if self._inputs.get(4) else rows[:0]
+        return rows[::-1] # Creon은 최신 데이터부터 반환
+
+    @staticmethod
+    def _resample_minutes(minute: np.ndarray, interval: int) -> np.ndarray:
+        if interval == 1:
+            return minute
+        n = len(minute) // interval * interval
+        groups = minute[:n].reshape(-1, interval, minute.shape[1])
+        out = groups[:, -1, :].copy() # 날짜/시간/종가는 구간의 마지막 봉
+        out[:, 2] = groups[:, 0, 2]
+        out[:, 3] = groups[:, :, 3].max(axis=1)
+        out[:, 4] = groups[:, :, 4].min(axis=1)
+        out[:, 6] = groups[:, :, 6].sum(axis=1)
+        return out
+
+    def _on_request(self):
+        if self._pending is None:
+            self._pending = self._build_rows()
+        self._page = self._pending[:self._backend.page_size]
+        self._pending = self._pending[self._backend.page_size:]
+        self.Continue = 1 if len(self._pending) else 0
+
+    def GetHeaderValue(self, index):
+        fields = list(self._inputs.get(5, []))
+        if index == 0:
+            return self._inputs.get(0)
+        if index == 1:
+            return len(fields)
+        if index == 2:
+            return tuple(fields)
+        if index == 3:
+            return 0 if self._page is None else len(self._page)
+        return None
+
+    def GetDataValue(self, field_pos, row):
+        field = list(self._inputs[5])[field_pos]
+        return int(self._page[row, field])
+
+
+class FakeMarketEye(_FakeRequest):
+    """
+    CpSysDib.MarketEye: 입력 0(필드 배열), 1(종목 코드 또는 코드 목록, 최대 MARKET_EYE_MAX_CODES개).
+    실제 MarketEye와 같이 데이터는 요청 순서가 아니라 필드 번호 오름차순으로 정렬되어 반환됩니다.
+    """
+    def __init__(self, backend: FakeCreonBackend):
+        super().__init__(backend)
+        self._fields = []
+        self._rows = []
+
+    def _on_request(self):
+        codes = self._inputs.get(1, [])
+        codes = [codes] if isinstance(codes, str) else list(codes)
+        if len(codes) > MARKET_EYE_MAX_CODES:
+            self._status, self._msg = DIB_ERROR, f'종목 수는 {MARKET_EYE_MAX_CODES}개를 넘을 수 없습니다.'
+            self._fields, self._rows = [], []
+            return
+        self._fields = sorted(set(self._inputs.get(0, [])))
+        self._rows = [self._backend.financials(code) for code in codes if code in self._backend.stock_codes]
+
+    def GetHeaderValue(self, index):
+        if index == 0:
+            return len(self._fields)
+        if index == 1:
+            return tuple(self._fields)
+        if index == 2:
+            return len(self._rows)
+        return None
+
+    def GetDataValue(self, field_pos, stock_idx):
+        return self._rows[stock_idx].get(self._fields[field_pos])
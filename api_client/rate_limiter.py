@@ -0,0 +1,64 @@
+# backtesting/api_client/rate_limiter.py
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    토큰 버킷 요청 제한기.
+    period초 동안 capacity건까지 요청할 수 있으며, 토큰은 시간에 비례해 연속적으로 채워집니다.
+    (Creon 시세 조회 제한: 15초에 60건 -> TokenBucket(60, 15))
+    """
+    def __init__(self, capacity: int, period: float, clock=time.monotonic, sleep=time.sleep):
+        """
+        :param capacity: 버킷 크기 (period 동안 허용되는 최대 요청 수)
+        :param period: 버킷이 가득 차는 데 걸리는 시간 (초)
+        :param clock: 현재 시각 함수 (테스트용)
+        :param sleep: 대기 함수 (테스트용)
+        """
+        if capacity <= 0 or period <= 0:
+            raise ValueError("capacity와 period는 0보다 커야 합니다.")
+        self.capacity = capacity
+        self.rate = capacity / period # 초당 채워지는 토큰 수
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._last = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        토큰을 얻을 때까지 대기합니다.
+        :return: 대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = max(self._blocked_until - now, (tokens - self._tokens) / self.rate)
+            self._sleep(wait)
+            waited += wait
+
+    def block_for(self, seconds: float):
+        """
+        서버가 요청 한도 소진을 알려 왔을 때, 남은 토큰을 비우고 지정한 시간 동안 요청을 막습니다.
+        :param seconds: 한도가 초기화될 때까지 남은 시간 (초)
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, now + seconds)
@@ -0,0 +1,5 @@
+# backtesting/backtester/__init__.py
+
+from backtester.core import Backtester
+
+__all__ = ['Backtester']
@@ -0,0 +1,228 @@
+# backtesting/backtester/batch_runner.py
+
+import csv
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from db.db_manager import DBManager
+from feeds.db_data_loader import DBDataLoader
+from feeds.shared_memory_data import SharedOHLCVStore, SharedMemoryData
+from backtester.runner import run_single, DEFAULT_CASH, DEFAULT_COMMISSION
+from config.settings import BULK_FETCH_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+RESULT_FIELDS = ['stock_code', 'bars', 'final_value', 'pnl', 'trade_count', 'won', 'lost', 'elapsed_sec', 'error']
+
+# 워커 프로세스마다 하나씩 생성하는 DB 연결과 실행 설정
+_worker_state = {}
+
+
+def load_universe(db_manager: DBManager, market_types=None) -> list:
+    """
+    stock_info 테이블에서 백테스팅 대상 종목 코드 리스트를 가져옵니다.
+    (stock_info는 CreonAPIClient.get_filtered_stock_list() 결과로 채워집니다.)
+    :param db_manager: DBManager 인스턴스
+    :param market_types: 포함할 시장 구분 리스트 (예: ['KOSPI', 'KOSDAQ']). None이면 전체
+    :return: 종목 코드 리스트 (정렬됨)
+    """
+    stock_info_df = db_manager.fetch_stock_info()
+    if stock_info_df.empty:
+        logger.warning("stock_info 테이블에 종목 정보가 없습니다.")
+        return []
+    if market_types:
+        stock_info_df = stock_info_df[stock_info_df['market_type'].isin(market_types)]
+    return sorted(stock_info_df['stock_code'].tolist())
+
+
+def _set_worker_state(strategy, strategy_params, start_date, end_date, timeframe, cash, commission, registry=None,
+                      record=False, profile=False, db_manager_factory=None, db_manager=None):
+    """
+    실행 설정을 보관하고, 이 프로세스 전용 DB 연결을 생성합니다.
+    registry(SharedOHLCVStore.registry)가 있으면 DB 대신 공유 메모리에서 데이터를 읽으므로 DB 연결을 만들지 않습니다.
+    :param db_manager_factory: DB 연결을 만드는 함수 (None이면 DBManager)
+    :param db_manager: 이미 만든 DB 연결 (현재 프로세스에서 순차 실행할 때). 이 함수가 만든 연결만 닫습니다.
+    """
+    owns_db = False
+    if registry is not None:
+        db_manager = None
+    elif db_manager is None:
+        db_manager = (db_manager_factory or DBManager)()
+        owns_db = True
+    _worker_state.update(
+        strategy=strategy, strategy_params=strategy_params,
+        start_date=start_date, end_date=end_date, timeframe=timeframe,
+        cash=cash, commission=commission, registry=registry, record=record, profile=profile,
+        db_manager=db_manager, owns_db=owns_db, data_loader=DBDataLoader(db_manager) if db_manager else None
+    )
+
+
+def _init_worker(*state_args):
+    """워커 프로세스 초기화: DB 연결을 만들고, 전략의 매매 건별 로그를 줄입니다."""
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+    _set_worker_state(*state_args)
+
+
+def _load_stock(stock_code: str):
+    """워커 프로세스에서 한 종목의 데이터를 준비합니다. :return: (DataFrame 또는 피드, 바 개수)"""
+    state = _worker_state
+    if state['registry'] is not None:
+        if stock_code not in state['registry']:
+            return None, 0
+        feed = SharedMemoryData(dataname=stock_code, registry=state['registry'])
+        return feed, state['registry'][stock_code][1]
+
+    if state['timeframe'] == 'daily':
+        df = state['data_loader'].load_daily_frame(stock_code, state['start_date'], state['end_date'])
+    else:
+        df = state['data_loader'].load_minute_frame(
+            stock_code,
+            datetime.combine(state['start_date'], datetime.min.time()),
+            datetime.combine(state['end_date'], datetime.max.time())
+        )
+    return df, len(df)
+
+
+def _run_stock(stock_code: str) -> dict:
+    """워커 프로세스에서 한 종목의 데이터를 로드하고 백테스팅합니다."""
+    state = _worker_state
+    started = time.perf_counter()
+    try:
+        data, bars = _load_stock(stock_code)
+        result = run_single(state['strategy'], data, params=state['strategy_params'],
+                            cash=state['cash'], commission=state['commission'], record=state['record'],
+                            profile=state['profile'], profile_name=stock_code, stock_code=stock_code)
+    except Exception as e:
+        logger.error(f"{stock_code} 백테스팅 중 오류 발생: {e}", exc_info=True)
+        result = {'error': str(e)}
+        bars = 0
+    return {**result, 'stock_code': stock_code, 'bars': bars,
+            'elapsed_sec': round(time.perf_counter() - started, 3)}
+
+
+def publish_universe(stock_codes: list, start_date: date, end_date: date, timeframe: str,
+                     store: SharedOHLCVStore, db_manager: DBManager = None, db_manager_factory=None) -> dict:
+    """
+    유니버스 데이터를 DB에서 BULK_FETCH_CHUNK_SIZE개 종목씩 일괄 조회하여 공유 메모리에 올립니다.
+    DataFrame은 청크마다 버리므로 부모 프로세스에 남는 것은 공유 메모리 블록뿐입니다.
+    :param db_manager: 조회에 쓸 DB 연결. None이면 db_manager_factory(기본 DBManager)로 만들고 끝나면 닫습니다.
+    :return: store.registry
+    """
+    own_db = db_manager is None
+    db_manager = db_manager or (db_manager_factory or DBManager)()
+    data_loader = DBDataLoader(db_manager)
+    try:
+        for i in range(0, len(stock_codes), BULK_FETCH_CHUNK_SIZE):
+            chunk = stock_codes[i:i + BULK_FETCH_CHUNK_SIZE]
+            if timeframe == 'daily':
+                frames = data_loader.load_daily_frames(chunk, start_date, end_date)
+            else:
+                frames = data_loader.load_minute_frames(
+                    chunk,
+                    datetime.combine(start_date, datetime.min.time()),
+                    datetime.combine(end_date, datetime.max.time())
+                )
+            store.publish_frames(frames)
+    finally:
+        if own_db:
+            db_manager.close()
+    return store.registry
+
+
+def run_universe(strategy, stock_codes: list, start_date: date, end_date: date, results_path: str,
+                 strategy_params: dict = None, timeframe: str = 'daily', workers: int = None,
+                 cash: float = DEFAULT_CASH, commission: float = DEFAULT_COMMISSION,
+                 shared_memory: bool = False, results_store=None, profile: bool = False,
+                 db_manager: DBManager = None, db_manager_factory=None) -> dict:
+    """
+    여러 종목에 같은 전략을 워커 프로세스로 나누어 백테스팅하고,
+    종목별 결과를 끝나는 순서대로 CSV 파일에 기록합니다.
+    기본적으로 각 워커는 자체 DB 연결로 자신이 맡은 종목의 데이터만 로드합니다.
+    shared_memory=True이면 부모 프로세스가 DB에서 일괄 조회한 데이터를 공유 메모리에 한 번만 올리고,
+    워커는 DB 연결 없이 SharedMemoryData 피드로 읽습니다. (DB 부하와 워커별 DataFrame 메모리 절감)
+    :param strategy: backtrader.Strategy 클래스
+    :param stock_codes: 종목 코드 리스트 (load_universe() 결과 등)
+    :param start_date: 백테스팅 시작 날짜
+    :param end_date: 백테스팅 종료 날짜
+    :param results_path: 결과 CSV 파일 경로 (이미 있으면 덮어씁니다)
+    :param strategy_params: 모든 종목에 공통으로 적용할 전략 파라미터
+    :param timeframe: 'daily' 또는 'minute'
+    :param workers: 워커 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 순차 실행)
+    :param cash: 초기 투자 자산
+    :param commission: 거래 수수료율
+    :param shared_memory: True이면 공유 메모리 데이터 플레인 사용
+    :param results_store: ResultsStore. 지정하면 종목별 평가금액 곡선/거래/주문과 실행 메타데이터를 저장합니다.
+    :param profile: True이면 종목마다 프로파일 파일을 PROFILE_DIR에 씁니다. (run_single 참고)
+    :param db_manager: 현재 프로세스에서 쓸 DB 연결 (공유 메모리 게시, workers=1 순차 실행). None이면 새로 만들고 닫습니다.
+    :param db_manager_factory: 워커 프로세스마다 DB 연결을 만드는 함수 (None이면 DBManager).
+                               워커 프로세스로 전달되므로 모듈 수준 함수나 클래스여야 합니다.
+    :return: {'total', 'succeeded', 'failed', 'elapsed_sec'} 요약 딕셔너리
+    """
+    if timeframe not in ('daily', 'minute'):
+        raise ValueError("지원하지 않는 timeframe입니다. 'daily' 또는 'minute'을 사용하세요.")
+
+    total = len(stock_codes)
+    workers = min(workers or os.cpu_count() or 1, max(total, 1))
+    logger.info(f"유니버스 백테스팅 시작: {total}개 종목, 워커 {workers}개, 결과 파일 '{results_path}'")
+
+    started = time.perf_counter()
+    succeeded = failed = 0
+    store = SharedOHLCVStore() if shared_memory else None
+
+    results_dir = os.path.dirname(os.path.abspath(results_path))
+    os.makedirs(results_dir, exist_ok=True)
+    try:
+        registry = None
+        if store:
+            registry = publish_universe(stock_codes, start_date, end_date, timeframe, store, db_manager,
+                                        db_manager_factory)
+        state_args = (strategy, strategy_params or {}, start_date, end_date, timeframe, cash, commission, registry,
+                      results_store is not None, profile, db_manager_factory)
+
+        with open(results_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+
+            def _write(result):
+                nonlocal succeeded, failed
+                if results_store is not None:
+                    results_store.add_result(result, strategy, params=strategy_params,
+                                             stock_codes=result['stock_code'], fromdate=start_date, todate=end_date,
+                                             cash=cash, commission=commission, timeframe=timeframe)
+                writer.writerow(result)
+                f.flush() # 중간에 중단되어도 끝난 종목의 결과는 남도록 즉시 기록
+                if result.get('error'):
+                    failed += 1
+                else:
+                    succeeded += 1
+                done = succeeded + failed
+                if done % 100 == 0 or done == total:
+                    logger.info(f"유니버스 백테스팅 진행: {done}/{total} (실패 {failed})")
+
+            if workers == 1:
+                _set_worker_state(*state_args, db_manager=db_manager)
+                try:
+                    for stock_code in stock_codes:
+                        _write(_run_stock(stock_code))
+                finally:
+                    if _worker_state['owns_db']:
+                        _worker_state['db_manager'].close()
+            else:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=state_args) as executor:
+                    futures = [executor.submit(_run_stock, stock_code) for stock_code in stock_codes]
+                    for future in as_completed(futures):
+                        _write(future.result())
+    finally:
+        if store:
+            store.close() # 워커가 모두 끝난 뒤 공유 메모리 해제
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"유니버스 백테스팅 완료: 성공 {succeeded}, 실패 {failed}, 소요 {elapsed:.1f}초")
+    return {'total': total, 'succeeded': succeeded, 'failed': failed, 'elapsed_sec': round(elapsed, 3)}
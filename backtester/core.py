@@ -0,0 +1,388 @@
+# backtesting/backtester/core.py
+
+import backtrader as bt
+from datetime import datetime, date, timedelta
+import logging
+import sys
+import os
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from db.db_manager import DBManager
+from feeds.db_data_loader import DBDataLoader
+from feeds.parquet_cache import ParquetCache
+from feeds.streaming_minute_data import StreamingMinuteData
+from backtester.optimizer import optimize
+from backtester.batch_runner import load_universe, run_universe
+from backtester.vectorized import screen_sma_crossover
+from backtester.walk_forward import walk_forward
+from backtester.recorder import RunRecorder
+from config.settings import LEAN_EXACTBARS
+from utils.memory import get_peak_rss_mb
+from utils.metrics import metrics
+from utils.profiling import SamplingProfiler
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO) # 기본 로그 레벨 설정
+
+class Backtester:
+    """
+    backtrader Cerebro 엔진을 설정하고 백테스팅을 실행하는 클래스.
+    """
+    def __init__(self, start_date: date, end_date: date, cash: float = 100_000_000, commission: float = 0.0015,
+                 use_cache: bool = False, db_manager: DBManager = None, lean: bool = False):
+        """
+        Backtester를 초기화합니다.
+        :param start_date: 백테스팅 시작 날짜 (datetime.date 객체)
+        :param end_date: 백테스팅 종료 날짜 (datetime.date 객체)
+        :param cash: 초기 투자 자산
+        :param commission: 거래 수수료율 (기본 0.15%)
+        :param use_cache: True이면 로컬 Parquet 캐시(DATA_CACHE_DIR)를 거쳐 데이터를 로드합니다.
+        :param db_manager: 공유할 DBManager (BacktestSession.db_manager 등). None이면 새로 만들고 close() 시 닫습니다.
+        :param lean: True이면 장기간 분봉 실행용 저메모리 모드.
+                     Cerebro가 지표 계산에 필요한 바만 보관하고(exactbars), 기본 observer(stdstats)를 끄며,
+                     verbose 파라미터가 있는 전략은 건별 로그 대신 집계만 합니다. (plot 불가)
+                     분봉은 add_streaming_minute_data()와 함께 사용해야 전체 기간 DataFrame도 메모리에 두지 않습니다.
+        """
+        self.cerebro = bt.Cerebro()
+        self._owns_db = db_manager is None
+        self.db_manager = db_manager or DBManager()
+        self.data_loader = DBDataLoader(self.db_manager, cache=ParquetCache() if use_cache else None)
+        self.start_date = start_date
+        self.end_date = end_date
+        self.cash = cash
+        self.commission = commission
+        self.lean = lean
+        self.peak_rss_mb = None # run() 후 측정한 프로세스 최대 메모리 (MB)
+        self.profile_result = None # run(profile=True) 후 프로파일 파일 경로와 분류별 시간
+        self._setup_cerebro()
+
+    def _setup_cerebro(self):
+        """
+        Cerebro 엔진의 초기 설정을 수행합니다.
+        """
+        # 1. 초기 자산 설정
+        self.cerebro.broker.setcash(self.cash)
+        logger.info(f"초기 자산 설정 완료: {self.cash:,.0f}원")
+
+        # 2. 수수료 설정 (예시: 매수/매도 시 0.15% 수수료)
+        # 실제 증권사 수수료와 슬리피지를 고려하여 설정해야 합니다.
+        self.cerebro.broker.setcommission(commission=self.commission)
+        logger.info(f"거래 수수료 설정 완료: {self.commission:.2%}")
+
+        # lean 모드: 라인 버퍼를 필요한 길이로 제한하고 Broker/Trades/BuySell observer를 추가하지 않음
+        if self.lean:
+            self.cerebro.p.exactbars = LEAN_EXACTBARS
+            self.cerebro.p.stdstats = False
+            logger.info(f"lean 실행 모드 설정 완료: exactbars={LEAN_EXACTBARS}, stdstats=False")
+
+        # 3. 리샘플링 전략 및 기타 설정 (필요시 추가)
+        # 예: 일봉 데이터를 사용하여 백테스팅하므로, 특별한 리샘플링은 필요 없을 수 있습니다.
+        # self.cerebro.broker.set_cooldown(False) # 백테스팅 시 거래 간 쿨다운 해제 (선택 사항)
+
+    def add_data(self, stock_code: str, timeframe='daily'):
+        """
+        Cerebro에 데이터를 추가합니다.
+        :param stock_code: 종목 코드 (예: 'A005930')
+        :param timeframe: 'daily' 또는 'minute' (현재는 daily만 지원)
+        """
+        logger.info(f"데이터 '{stock_code}' ({timeframe}) 로드 및 Cerebro에 추가 중...")
+        try:
+            if timeframe == 'daily':
+                data = self.data_loader.load_daily_data(
+                    stock_code=stock_code,
+                    fromdate=self.start_date,
+                    todate=self.end_date
+                )
+            elif timeframe == 'minute':
+                # 분봉 데이터 로드 시 시작/종료 시간도 고려해야 함.
+                # 현재는 테스트를 위해 전체 기간을 불러오지만, 실제 사용 시에는 특정 일자를 지정할 수 있습니다.
+                # 예시를 위해 fromdatetime, todatetime을 인자로 받도록 수정 필요
+                data = self.data_loader.load_minute_data(
+                    stock_code=stock_code,
+                    fromdatetime=datetime.combine(self.start_date, datetime.min.time()),
+                    todatetime=datetime.combine(self.end_date, datetime.max.time())
+                )
+            else:
+                raise ValueError("지원하지 않는 timeframe입니다. 'daily' 또는 'minute'을 사용하세요.")
+
+            if data is not None:
+                self.cerebro.adddata(data, name=stock_code) # 결과 저장 시 종목 코드로 기록되도록 피드 이름 지정
+                logger.info(f"'{stock_code}' ({timeframe}) 데이터 Cerebro에 추가 완료.")
+            else:
+                logger.warning(f"'{stock_code}' ({timeframe}) 데이터 로드 실패. Cerebro에 추가하지 않습니다.")
+
+        except Exception as e:
+            logger.error(f"데이터 '{stock_code}' 로드 및 Cerebro 추가 중 오류 발생: {e}", exc_info=True)
+
+    def add_streaming_minute_data(self, stock_code: str, chunk_size: int = None):
+        """
+        분봉 데이터를 DB에서 청크 단위로 읽어 오는 스트리밍 피드를 Cerebro에 추가합니다.
+        장기간 분봉을 한 번에 메모리에 올리지 않도록 Cerebro의 preload를 끕니다.
+        스트리밍 피드는 실행 내내 DB 연결을 하나씩 점유하므로, 피드 수는 연결 풀 크기(DB_POOL_SIZE)보다 작아야 합니다.
+        (다른 조회에 쓸 연결을 하나 남겨 둠. 넘으면 추가하지 않습니다)
+        :param stock_code: 종목 코드 (예: 'A005930')
+        :param chunk_size: 한 번에 DB에서 읽을 행 수 (None이면 STREAM_CHUNK_SIZE)
+        :return: 추가했으면 True
+        """
+        pool = getattr(self.db_manager, 'pool', None)
+        streaming = sum(isinstance(data, StreamingMinuteData) for data in self.cerebro.datas)
+        if pool is not None and streaming + 1 >= pool.max_size:
+            logger.error(f"'{stock_code}' 분봉 스트리밍 피드를 추가할 수 없습니다: 스트리밍 피드 수({streaming + 1})는 "
+                         f"DB 연결 풀 크기({pool.max_size})보다 작아야 합니다. add_universe()를 사용하거나 풀 크기를 늘리세요.")
+            return False
+        kwargs = {'chunk_size': chunk_size} if chunk_size else {}
+        data = StreamingMinuteData(
+            db_manager=self.db_manager,
+            dataname=stock_code,
+            fromdate=datetime.combine(self.start_date, datetime.min.time()),
+            todate=datetime.combine(self.end_date, datetime.max.time()),
+            **kwargs
+        )
+        self.cerebro.adddata(data, name=stock_code)
+        self.cerebro.p.preload = False # 피드가 Cerebro 진행에 맞춰 DB에서 바를 읽도록 미리 읽기 해제
+        logger.info(f"'{stock_code}' 분봉 스트리밍 피드 Cerebro에 추가 완료.")
+        return True
+
+    def add_universe(self, stock_codes: list, timeframe='daily'):
+        """
+        여러 종목의 데이터를 DB에서 일괄 조회하여 Cerebro에 추가합니다.
+        종목마다 쿼리를 보내는 add_data 반복 호출과 달리 몇 번의 IN (...) 범위 조회로 처리합니다.
+        각 데이터 피드의 이름(_name)은 종목 코드입니다.
+        :param stock_codes: 종목 코드 리스트
+        :param timeframe: 'daily' 또는 'minute'
+        :return: Cerebro에 추가된 종목 코드 리스트
+        """
+        logger.info(f"{len(stock_codes)}개 종목 ({timeframe}) 데이터 일괄 로드 및 Cerebro에 추가 중...")
+        if timeframe == 'daily':
+            fromdate, todate = self.start_date, self.end_date
+        elif timeframe == 'minute':
+            fromdate = datetime.combine(self.start_date, datetime.min.time())
+            todate = datetime.combine(self.end_date, datetime.max.time())
+        else:
+            raise ValueError("지원하지 않는 timeframe입니다. 'daily' 또는 'minute'을 사용하세요.")
+
+        feeds = self.data_loader.load_universe_data(stock_codes, fromdate, todate, timeframe=timeframe)
+        for code, data in feeds.items():
+            self.cerebro.adddata(data, name=code)
+        logger.info(f"{len(feeds)}/{len(stock_codes)}개 종목 ({timeframe}) 데이터 Cerebro에 추가 완료.")
+        return list(feeds.keys())
+
+    def add_strategy(self, strategy, *args, **kwargs):
+        """
+        Cerebro에 백테스팅 전략을 추가합니다.
+        :param strategy: backtrader.Strategy 클래스
+        :param args: 전략 초기화에 필요한 위치 인자
+        :param kwargs: 전략 초기화에 필요한 키워드 인자
+        """
+        if self.lean and 'verbose' in strategy.params._getkeys():
+            kwargs.setdefault('verbose', False)
+        self.cerebro.addstrategy(strategy, *args, **kwargs)
+        logger.info(f"전략 '{strategy.__name__}' Cerebro에 추가 완료.")
+
+    def load_frame(self, stock_code: str, timeframe='daily'):
+        """
+        백테스팅 기간의 OHLCV 데이터를 DataFrame으로 로드합니다. (PandasData로 감싸기 전 단계)
+        :param stock_code: 종목 코드 (예: 'A005930')
+        :param timeframe: 'daily' 또는 'minute'
+        :return: OHLCV DataFrame (datetime 인덱스)
+        """
+        if timeframe == 'daily':
+            return self.data_loader.load_daily_frame(
+                stock_code=stock_code,
+                fromdate=self.start_date,
+                todate=self.end_date
+            )
+        elif timeframe == 'minute':
+            return self.data_loader.load_minute_frame(
+                stock_code=stock_code,
+                fromdatetime=datetime.combine(self.start_date, datetime.min.time()),
+                todatetime=datetime.combine(self.end_date, datetime.max.time())
+            )
+        raise ValueError("지원하지 않는 timeframe입니다. 'daily' 또는 'minute'을 사용하세요.")
+
+    def optimize(self, strategy, param_grid: dict, stock_code: str, timeframe='daily', workers: int = None,
+                 results_store=None, profile: bool = False):
+        """
+        파라미터 그리드 전체를 프로세스 풀로 나누어 백테스팅합니다.
+        데이터는 DB에서 한 번만 로드하여 모든 파라미터 조합이 공유합니다.
+        :param strategy: backtrader.Strategy 클래스
+        :param param_grid: 파라미터 이름 -> 후보 값 리스트 (예: {'sma_fast_period': range(5, 25), 'sma_slow_period': range(20, 60)})
+        :param stock_code: 종목 코드 (예: 'A005930')
+        :param timeframe: 'daily' 또는 'minute'
+        :param workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+        :param results_store: ResultsStore. 지정하면 조합별 평가금액 곡선/거래/주문을 저장합니다.
+        :param profile: True이면 조합마다 프로파일 파일(collapsed-stack, speedscope)을 PROFILE_DIR에 씁니다.
+        :return: 파라미터 조합별 final_value / pnl / trade_count를 담은 DataFrame (pnl 내림차순)
+        """
+        logger.info(f"'{strategy.__name__}' 파라미터 최적화 준비: {stock_code} ({timeframe})")
+        df = self.load_frame(stock_code, timeframe)
+        if df.empty:
+            logger.error(f"'{stock_code}' ({timeframe}) 데이터가 없어 최적화를 실행할 수 없습니다.")
+            return None
+
+        return optimize(
+            strategy, df, param_grid,
+            workers=workers,
+            cash=self.cash,
+            commission=self.commission,
+            results_store=results_store,
+            stock_code=stock_code,
+            profile=profile
+        )
+
+    def walk_forward(self, strategy, param_grid: dict, stock_code: str, in_sample_months: int,
+                     out_of_sample_months: int, step_months: int = None, anchored: bool = False,
+                     metric: str = 'pnl', timeframe='daily', workers: int = None):
+        """
+        백테스팅 기간(start_date ~ end_date)을 in-sample/out-of-sample 구간으로 굴려 가며
+        in-sample에서 최적화한 파라미터를 바로 다음 out-of-sample 구간에서 검증합니다.
+        데이터는 DB에서 전체 기간을 한 번만 로드하고, 구간들은 워커 프로세스에서 병렬로 실행됩니다.
+        :param strategy: backtrader.Strategy 클래스
+        :param param_grid: 파라미터 이름 -> 후보 값 리스트
+        :param stock_code: 종목 코드 (예: 'A005930')
+        :param in_sample_months: in-sample 구간 길이 (개월)
+        :param out_of_sample_months: out-of-sample 구간 길이 (개월)
+        :param step_months: 구간 이동 간격 (개월). None이면 out_of_sample_months
+        :param anchored: True이면 in-sample 시작을 start_date로 고정
+        :param metric: in-sample에서 최대화할 항목 (기본 'pnl')
+        :param timeframe: 'daily' 또는 'minute'
+        :param workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+        :return: 구간별 선택 파라미터와 out-of-sample 결과 DataFrame
+        """
+        logger.info(f"'{strategy.__name__}' 워크포워드 최적화 준비: {stock_code} ({timeframe})")
+        df = self.load_frame(stock_code, timeframe)
+        if df.empty:
+            logger.error(f"'{stock_code}' ({timeframe}) 데이터가 없어 워크포워드 최적화를 실행할 수 없습니다.")
+            return None
+
+        return walk_forward(
+            strategy, df, param_grid, self.start_date, self.end_date,
+            in_sample_months=in_sample_months,
+            out_of_sample_months=out_of_sample_months,
+            step_months=step_months,
+            anchored=anchored,
+            metric=metric,
+            workers=workers,
+            cash=self.cash,
+            commission=self.commission
+        )
+
+    def run_universe(self, strategy, results_path: str, stock_codes: list = None, market_types=None,
+                     timeframe='daily', workers: int = None, shared_memory: bool = False, results_store=None,
+                     profile: bool = False, **strategy_params):
+        """
+        여러 종목에 같은 전략을 워커 프로세스로 나누어 백테스팅하고 종목별 결과를 CSV 파일에 기록합니다.
+        :param strategy: backtrader.Strategy 클래스
+        :param results_path: 결과 CSV 파일 경로
+        :param stock_codes: 종목 코드 리스트. None이면 stock_info 테이블의 종목 전체
+        :param market_types: stock_codes가 None일 때 포함할 시장 구분 (예: ['KOSPI'])
+        :param timeframe: 'daily' 또는 'minute'
+        :param workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+        :param shared_memory: True이면 데이터를 한 번만 조회해 공유 메모리로 워커에 공급 (워커별 DB 조회 없음)
+        :param results_store: ResultsStore. 지정하면 종목별 평가금액 곡선/거래/주문을 저장합니다.
+        :param profile: True이면 종목마다 프로파일 파일(collapsed-stack, speedscope)을 PROFILE_DIR에 씁니다.
+        :param strategy_params: 모든 종목에 공통으로 적용할 전략 파라미터
+        :return: {'total', 'succeeded', 'failed', 'elapsed_sec'} 요약 딕셔너리
+        """
+        if stock_codes is None:
+            stock_codes = load_universe(self.db_manager, market_types=market_types)
+        return run_universe(
+            strategy, stock_codes, self.start_date, self.end_date, results_path,
+            strategy_params=strategy_params,
+            timeframe=timeframe,
+            workers=workers,
+            cash=self.cash,
+            commission=self.commission,
+            shared_memory=shared_memory,
+            results_store=results_store,
+            profile=profile,
+            db_manager=self.db_manager
+        )
+
+    def screen_sma_crossover(self, param_grid: dict, stock_codes: list = None, market_types=None):
+        """
+        SMA 교차 전략(SimpleMAStrategy)을 벡터화 엔진으로 여러 종목 x 파라미터 조합에 대해 한 번에 스크리닝합니다.
+        결과는 backtrader 실행과 허용 오차 안에서 같으므로, 상위 조합만 optimize()/run()으로 다시 확인하면 됩니다.
+        :param param_grid: {'sma_fast_period': [...], 'sma_slow_period': [...]}
+        :param stock_codes: 종목 코드 리스트. None이면 stock_info 테이블의 종목 전체
+        :param market_types: stock_codes가 None일 때 포함할 시장 구분 (예: ['KOSPI'])
+        :return: 종목/조합별 final_value / pnl / trade_count를 담은 DataFrame (pnl 내림차순)
+        """
+        if stock_codes is None:
+            stock_codes = load_universe(self.db_manager, market_types=market_types)
+        frames = self.data_loader.load_daily_frames(stock_codes, self.start_date, self.end_date)
+        return screen_sma_crossover(frames, param_grid, cash=self.cash, commission=self.commission)
+
+    def run(self, results_store=None, profile: bool = False):
+        """
+        백테스팅을 실행하고 결과를 반환합니다.
+        :param results_store: ResultsStore. 지정하면 평가금액 곡선/거래/주문과 실행 메타데이터를 저장합니다.
+        :param profile: True이면 실행을 표본 추출 프로파일링하여 PROFILE_DIR에 collapsed-stack/speedscope 파일을 쓰고,
+                        전략 next()/지표/브로커/데이터 피드별 시간을 self.profile_result['categories']에 남깁니다.
+        """
+        logger.info("백테스팅 시작...")
+        if not self.cerebro.datas:
+            logger.error("Cerebro에 추가된 데이터가 없습니다. run()을 실행하기 전에 add_data()를 호출하세요.")
+            return None
+
+        # Cerebro 실행
+        # backtrader는 실행 후 결과를 반환하며, 이는 주로 cerebro.run()의 리턴값으로 처리됩니다.
+        # 이 예제에서는 단순하게 runs를 반환합니다.
+        try:
+            # logstats=False 로 설정하면 백테스팅 중 출력되는 기본 통계 출력을 줄일 수 있습니다.
+            # 하지만 상세한 로그를 원한다면 True로 설정합니다.
+            # run()을 여러 번 호출해도 기록 분석기는 한 번만 추가
+            if results_store is not None and not any(ancls is RunRecorder for ancls, _, _ in self.cerebro.analyzers):
+                self.cerebro.addanalyzer(RunRecorder, _name='recorder')
+            profiler = SamplingProfiler() if profile else None
+            with metrics.timer('backtest_run', engine='cerebro') as t:
+                if profiler:
+                    profiler.start()
+                try:
+                    strategies = self.cerebro.run(maxcpus=1) # 멀티코어 사용 시 maxcpus > 1, 아니면 1 또는 None
+                finally:
+                    if profiler:
+                        profiler.stop()
+                t.add(bars=sum(len(data) for data in self.cerebro.datas), feeds=len(self.cerebro.datas))
+            if profiler:
+                strategy_names = '+'.join(type(strat).__name__ for strat in strategies)
+                feed_names = '+'.join(data._name or 'data' for data in self.cerebro.datas[:3])
+                self.profile_result = profiler.write(f"{strategy_names}-{feed_names}")
+            self.peak_rss_mb = get_peak_rss_mb()
+            logger.info(f"백테스팅 완료. (최대 메모리 {self.peak_rss_mb}MB)")
+            if results_store is not None:
+                strat = strategies[0]
+                results_store.add_run(
+                    strat.analyzers.recorder.get_analysis(),
+                    strategy=type(strat).__name__,
+                    params=strat.params._getkwargs(),
+                    stock_codes=[data._name for data in self.cerebro.datas],
+                    fromdate=self.start_date,
+                    todate=self.end_date,
+                    cash=self.cash,
+                    final_value=self.cerebro.broker.getvalue(),
+                    commission=self.commission
+                )
+            return strategies # 실행된 전략 인스턴스 리스트를 반환합니다.
+        except Exception as e:
+            logger.error(f"백테스팅 실행 중 오류 발생: {e}", exc_info=True)
+            return None
+
+    def close(self):
+        """
+        DB 연결을 종료합니다. run() 후에도 연결을 유지하므로 optimize()/run_universe() 등을 이어서 호출할 수 있으며,
+        사용이 끝나면 close()를 호출하거나 with 블록으로 사용합니다.
+        """
+        if self._owns_db and self.db_manager is not None:
+            self.db_manager.close()
+            self.db_manager = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
@@ -0,0 +1,112 @@
+# backtesting/backtester/optimizer.py
+
+import itertools
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from backtester.runner import run_single, DEFAULT_CASH, DEFAULT_COMMISSION
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스마다 한 번만 전달받아 재사용하는 데이터 (파라미터 조합마다 DataFrame을 다시 전달하지 않기 위함)
+_worker_state = {}
+
+
+def expand_param_grid(param_grid: dict) -> list:
+    """
+    파라미터 그리드를 개별 파라미터 조합 리스트로 펼칩니다.
+    :param param_grid: {'sma_fast_period': [5, 10], 'sma_slow_period': range(20, 60, 10)}
+    :return: [{'sma_fast_period': 5, 'sma_slow_period': 20}, ...]
+    """
+    keys = list(param_grid.keys())
+    values = [list(v) if isinstance(v, (list, tuple, range)) else [v] for v in param_grid.values()]
+    return [dict(zip(keys, combo)) for combo in itertools.product(*values)]
+
+
+def _set_worker_state(strategy, df, cash, commission, fromdate, todate, record=False, profile=False, stock_code=None):
+    """공통 데이터를 프로세스 전역에 보관합니다."""
+    _worker_state.update(strategy=strategy, df=df, cash=cash, commission=commission,
+                         fromdate=fromdate, todate=todate, record=record, profile=profile, stock_code=stock_code)
+
+
+def _init_worker(*state_args):
+    """워커 프로세스 초기화: 공통 데이터를 보관하고, 전략의 매매 건별 로그를 줄입니다."""
+    _set_worker_state(*state_args)
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+
+
+def _run_params(params: dict) -> dict:
+    """워커 프로세스에서 하나의 파라미터 조합을 실행합니다."""
+    state = _worker_state
+    result = run_single(state['strategy'], state['df'], params=params,
+                        cash=state['cash'], commission=state['commission'],
+                        fromdate=state['fromdate'], todate=state['todate'], record=state['record'],
+                        profile=state['profile'], stock_code=state['stock_code'])
+    return {**params, **result}
+
+
+def optimize(strategy, df: pd.DataFrame, param_grid: dict, workers: int = None,
+             cash: float = DEFAULT_CASH, commission: float = DEFAULT_COMMISSION,
+             fromdate=None, todate=None, results_store=None, stock_code: str = None,
+             profile: bool = False) -> pd.DataFrame:
+    """
+    하나의 데이터셋에 대해 파라미터 그리드 전체를 프로세스 풀로 나누어 백테스팅합니다.
+    데이터는 워커 프로세스당 한 번만 전달되며, 각 파라미터 조합은 독립된 Cerebro로 실행됩니다.
+    :param strategy: backtrader.Strategy 클래스
+    :param df: OHLCV DataFrame (DBDataLoader.load_daily_frame 결과)
+    :param param_grid: 파라미터 이름 -> 후보 값 리스트 딕셔너리
+    :param workers: 워커 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 순차 실행)
+    :param cash: 초기 투자 자산
+    :param commission: 거래 수수료율
+    :param fromdate: 백테스팅 시작 날짜/시간
+    :param todate: 백테스팅 종료 날짜/시간
+    :param results_store: ResultsStore. 지정하면 조합별 평가금액 곡선/거래/주문과 실행 메타데이터를 저장합니다.
+    :param stock_code: 결과 저장 시 기록할 종목 코드 (데이터 피드 이름으로도 사용)
+    :param profile: True이면 조합마다 프로파일 파일을 PROFILE_DIR에 씁니다. (run_single 참고)
+    :return: 파라미터 조합별 final_value / pnl / trade_count 등을 담은 DataFrame (pnl 내림차순)
+    """
+    combos = expand_param_grid(param_grid)
+    if not combos:
+        logger.warning("파라미터 조합이 없습니다. param_grid를 확인하세요.")
+        return pd.DataFrame()
+
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(combos))
+    logger.info(f"파라미터 최적화 시작: {len(combos)}개 조합, 워커 {workers}개")
+
+    init_args = (strategy, df, cash, commission, fromdate, todate, results_store is not None, profile, stock_code)
+    param_names = list(param_grid.keys())
+    results = []
+
+    def _collect(result):
+        if results_store is not None:
+            results_store.add_result(
+                result, strategy, params={name: result[name] for name in param_names},
+                stock_codes=stock_code, fromdate=fromdate or df.index[0], todate=todate or df.index[-1],
+                cash=cash, commission=commission
+            )
+        results.append(result)
+
+    if workers == 1:
+        _set_worker_state(*init_args)
+        for params in combos:
+            _collect(_run_params(params))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init_args) as executor:
+            futures = [executor.submit(_run_params, params) for params in combos]
+            for done_count, future in enumerate(as_completed(futures), start=1):
+                _collect(future.result())
+                if done_count % 100 == 0:
+                    logger.info(f"최적화 진행: {done_count}/{len(combos)}")
+
+    result_df = pd.DataFrame(results)
+    result_df = result_df.sort_values(by='pnl', ascending=False, na_position='last').reset_index(drop=True)
+    logger.info(f"파라미터 최적화 완료: {len(result_df)}개 조합")
+    return result_df
@@ -0,0 +1,65 @@
+# backtesting/backtester/recorder.py
+
+import backtrader as bt
+
+
+class RunRecorder(bt.Analyzer):
+    """
+    한 번의 Cerebro 실행에서 결과 저장에 필요한 원시 기록을 모으는 분석기.
+    - equity: 바마다 (datetime, value, cash)
+    - trades: 청산된 거래 (notify_trade)
+    - orders: 체결/취소/거부된 주문 (notify_order)
+    get_analysis()는 {'equity': [...], 'trades': [...], 'orders': [...]} 형태의 dict 리스트를 반환하며,
+    프로세스 간에 전달(pickle)할 수 있도록 기본 타입만 담습니다. ResultsStore.add_run()에 그대로 넘깁니다.
+    사용 예: cerebro.addanalyzer(RunRecorder, _name='recorder')
+    """
+    params = (
+        ('equity', True), # False이면 평가금액 곡선을 기록하지 않음 (대규모 스윕에서 용량 절감)
+    )
+
+    def start(self):
+        self.equity = []
+        self.trades = []
+        self.orders = []
+
+    def next(self):
+        if self.p.equity:
+            self.equity.append({
+                'datetime': self.strategy.datetime.datetime(0),
+                'value': self.strategy.broker.getvalue(),
+                'cash': self.strategy.broker.getcash(),
+            })
+
+    def notify_trade(self, trade):
+        if not trade.isclosed:
+            return
+        self.trades.append({
+            'trade_ref': trade.ref,
+            'stock_code': trade.data._name,
+            'open_datetime': bt.num2date(trade.dtopen),
+            'close_datetime': bt.num2date(trade.dtclose),
+            'bar_len': trade.barlen,
+            'price': trade.price,
+            'pnl': trade.pnl,
+            'pnlcomm': trade.pnlcomm,
+            'commission': trade.commission,
+        })
+
+    def notify_order(self, order):
+        if order.status in [order.Submitted, order.Accepted, order.Partial]:
+            return
+        executed = order.status == order.Completed
+        self.orders.append({
+            'order_ref': order.ref,
+            'stock_code': order.data._name,
+            'datetime': self.strategy.datetime.datetime(0),
+            'side': 'buy' if order.isbuy() else 'sell',
+            'status': order.getstatusname(),
+            'size': order.executed.size if executed else order.created.size,
+            'price': order.executed.price if executed else None,
+            'value': order.executed.value if executed else None,
+            'commission': order.executed.comm if executed else None,
+        })
+
+    def get_analysis(self):
+        return {'equity': self.equity, 'trades': self.trades, 'orders': self.orders}
@@ -0,0 +1,207 @@
+# backtesting/backtester/results_store.py
+
+import glob
+import json
+import logging
+import os
+import queue
+import subprocess
+import sys
+import threading
+import uuid
+from datetime import datetime
+
+import pandas as pd
+
+try:
+    import pyarrow # noqa: F401 (pandas의 parquet 엔진)
+except ImportError:
+    pyarrow = None
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from config.settings import RESULTS_DIR, RESULTS_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+RESULT_TABLES = ('runs', 'equity', 'trades', 'orders')
+
+_STOP = object() # 저장 스레드 종료 신호
+
+
+def get_code_version() -> str:
+    """현재 코드의 git 커밋 해시 (작업 트리에 변경이 있으면 '-dirty'). git을 쓸 수 없으면 None."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root,
+                                capture_output=True, text=True, timeout=5, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=project_root,
+                               capture_output=True, text=True, timeout=5).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"코드 버전 확인 실패: {e}")
+        return None
+
+
+class ResultsStore:
+    """
+    백테스트 실행 결과(실행 메타데이터, 평가금액 곡선, 거래, 주문)를 파티션된 Parquet 파일로 저장하는 배치 저장소.
+    - 파일 구조: {base_dir}/{table}/run_date=YYYY-MM-DD/part-{시각}-{id}.parquet (table: runs/equity/trades/orders)
+      read('trades')로 읽으면 run_date가 컬럼으로 붙습니다.
+    - add_run()은 행을 메모리에 쌓기만 하고, batch_size 행이 모이면 한 파일로 씁니다. (기존 파일은 수정하지 않는 append 방식)
+    - background=True이면 파일 쓰기를 별도 스레드에서 하여, 대규모 스윕에서 실행 루프가 디스크 I/O를 기다리지 않습니다.
+    모든 테이블은 run_id로 연결됩니다.
+    사용 예:
+        with ResultsStore() as store:
+            store.add_run(analysis, strategy='SimpleMAStrategy', params={...}, stock_codes=['A005930'], ...)
+    """
+    def __init__(self, base_dir: str = RESULTS_DIR, batch_size: int = RESULTS_BATCH_SIZE, background: bool = True):
+        """
+        :param base_dir: 결과 저장 디렉토리
+        :param batch_size: 테이블별로 이 행 수만큼 모이면 파일 하나로 기록
+        :param background: True이면 별도 저장 스레드에서 파일을 씁니다.
+        """
+        if pyarrow is None:
+            raise ImportError("ResultsStore를 사용하려면 pyarrow가 필요합니다. (pip install pyarrow)")
+        self.base_dir = base_dir
+        self.batch_size = batch_size
+        self.code_version = get_code_version()
+        self._buffers = {table: [] for table in RESULT_TABLES}
+        self._lock = threading.Lock()
+        self.files_written = 0
+        self._queue = None
+        self._writer = None
+        if background:
+            self._queue = queue.Queue(maxsize=8) # 저장이 밀리면 add_run이 기다려 메모리가 무한히 늘지 않도록 제한
+            self._writer = threading.Thread(target=self._writer_loop, name='results-writer', daemon=True)
+            self._writer.start()
+
+    def add_run(self, analysis: dict, strategy: str, params: dict = None, stock_codes=None,
+                fromdate=None, todate=None, cash: float = None, final_value: float = None, run_id: str = None,
+                **metadata) -> str:
+        """
+        한 번의 실행 결과를 버퍼에 추가합니다.
+        :param analysis: RunRecorder.get_analysis() 결과 (없으면 None - 메타데이터만 기록)
+        :param strategy: 전략 이름
+        :param params: 전략 파라미터
+        :param stock_codes: 실행에 사용한 종목 코드 (문자열 또는 리스트)
+        :param fromdate: 데이터 시작 날짜
+        :param todate: 데이터 종료 날짜
+        :param cash: 초기 자산
+        :param final_value: 최종 자산
+        :param run_id: 실행 ID (None이면 생성)
+        :param metadata: 추가로 runs 테이블에 기록할 값 (예: trade_count, commission, error)
+        :return: run_id
+        """
+        run_id = run_id or uuid.uuid4().hex
+        if isinstance(stock_codes, str):
+            stock_codes = [stock_codes]
+        run_row = {
+            'run_id': run_id,
+            'created_at': datetime.now(),
+            'strategy': strategy,
+            'params': json.dumps(params or {}, sort_keys=True, default=str),
+            'stock_codes': ','.join(stock_codes or []),
+            'fromdate': pd.Timestamp(fromdate) if fromdate is not None else None,
+            'todate': pd.Timestamp(todate) if todate is not None else None,
+            'cash': cash,
+            'final_value': final_value,
+            'pnl': final_value - cash if final_value is not None and cash is not None else None,
+            'code_version': self.code_version,
+            **metadata,
+        }
+        rows = {'runs': [run_row]}
+        for table in ('equity', 'trades', 'orders'):
+            rows[table] = [{'run_id': run_id, **row} for row in (analysis or {}).get(table, [])]
+
+        full = []
+        with self._lock:
+            for table, table_rows in rows.items():
+                self._buffers[table].extend(table_rows)
+                if len(self._buffers[table]) >= self.batch_size:
+                    full.append((table, self._buffers[table]))
+                    self._buffers[table] = []
+        for table, table_rows in full:
+            self._submit(table, table_rows)
+        return run_id
+
+    def add_result(self, result: dict, strategy, params: dict = None, **metadata) -> str:
+        """
+        run_single(record=True) 결과 딕셔너리를 저장합니다. 'record' 항목은 결과에서 꺼내 평가금액/거래/주문 테이블로 보냅니다.
+        :param result: run_single 결과 (final_value, pnl, trade_count, won, lost, error, record)
+        :param strategy: backtrader.Strategy 클래스 또는 전략 이름
+        :param params: 전략 파라미터
+        :param metadata: add_run에 전달할 값 (stock_codes, fromdate, todate, cash 등)
+        :return: run_id
+        """
+        analysis = result.pop('record', None)
+        return self.add_run(
+            analysis, strategy=getattr(strategy, '__name__', str(strategy)), params=params,
+            final_value=result.get('final_value'), trade_count=result.get('trade_count'),
+            won=result.get('won'), lost=result.get('lost'), error=result.get('error'),
+            **metadata
+        )
+
+    def flush(self):
+        """버퍼에 남은 행을 모두 파일로 씁니다."""
+        with self._lock:
+            pending = [(table, rows) for table, rows in self._buffers.items() if rows]
+            self._buffers = {table: [] for table in RESULT_TABLES}
+        for table, rows in pending:
+            self._submit(table, rows)
+
+    def _submit(self, table: str, rows: list):
+        if self._queue is not None:
+            self._queue.put((table, rows))
+        else:
+            self._write(table, rows)
+
+    def _writer_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            self._write(*item)
+
+    def _write(self, table: str, rows: list):
+        """행 묶음을 오늘 날짜(run_date) 파티션 아래 새 Parquet 파일로 씁니다."""
+        try:
+            now = datetime.now()
+            part_dir = os.path.join(self.base_dir, table, f"run_date={now.date().isoformat()}")
+            os.makedirs(part_dir, exist_ok=True)
+            file_name = f"part-{now:%H%M%S%f}-{uuid.uuid4().hex[:8]}.parquet"
+            tmp_path = os.path.join(part_dir, f".{file_name}.tmp") # '.'로 시작하는 파일은 읽을 때 무시됨
+            pd.DataFrame(rows).to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, os.path.join(part_dir, file_name))
+            self.files_written += 1
+            logger.debug(f"결과 저장: {table} {len(rows)}행")
+        except Exception as e:
+            logger.error(f"결과 저장 중 오류 발생 ({table}, {len(rows)}행): {e}", exc_info=True)
+
+    def close(self):
+        """남은 결과를 모두 기록하고 저장 스레드를 종료합니다."""
+        self.flush()
+        if self._writer is not None:
+            self._queue.put(_STOP)
+            self._writer.join()
+            self._writer = None
+        logger.info(f"결과 저장 완료: {self.files_written}개 파일 ({self.base_dir})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def read(self, table: str) -> pd.DataFrame:
+        """
+        저장된 테이블 전체를 읽습니다. (run_date 파티션 컬럼 포함)
+        실행마다 추가 메타데이터 컬럼이 다를 수 있으므로 파일별로 읽어 합칩니다.
+        """
+        frames = []
+        for path in sorted(glob.glob(os.path.join(self.base_dir, table, 'run_date=*', 'part-*.parquet'))):
+            df = pd.read_parquet(path)
+            df['run_date'] = os.path.basename(os.path.dirname(path)).split('=', 1)[1]
+            frames.append(df)
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
@@ -0,0 +1,135 @@
+# backtesting/backtester/runner.py
+
+import backtrader as bt
+import logging
+import pandas as pd
+from datetime import date, datetime
+
+import sys
+import os
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from backtester.recorder import RunRecorder
+from utils.metrics import metrics
+from utils.profiling import SamplingProfiler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CASH = 100_000_000
+DEFAULT_COMMISSION = 0.0015 # 매수/매도 시 0.15% 수수료 (Backtester._setup_cerebro와 동일)
+
+
+def build_cerebro(cash: float = DEFAULT_CASH, commission: float = DEFAULT_COMMISSION, **cerebro_kwargs) -> bt.Cerebro:
+    """
+    초기 자산과 수수료가 설정된 새 Cerebro 엔진을 생성합니다.
+    :param cash: 초기 투자 자산
+    :param commission: 거래 수수료율
+    :param cerebro_kwargs: bt.Cerebro 생성자에 전달할 추가 인자
+    :return: backtrader.Cerebro 인스턴스
+    """
+    cerebro = bt.Cerebro(**cerebro_kwargs)
+    cerebro.broker.setcash(cash)
+    cerebro.broker.setcommission(commission=commission)
+    return cerebro
+
+
+def warmup_strategy(strategy, trade_start):
+    """
+    trade_start 이전의 바에서는 주문을 내지 않는 전략 하위 클래스를 만듭니다.
+    지표는 앞선 데이터로 워밍업하고, 거래와 손익은 trade_start부터만 집계할 때 사용합니다. (워크포워드 out-of-sample 등)
+    buy()/sell()이 None을 반환하므로 close()/order_target_*()도 함께 막힙니다.
+    :param strategy: backtrader.Strategy 클래스
+    :param trade_start: 첫 주문을 허용할 날짜/시간
+    :return: 같은 이름의 backtrader.Strategy 하위 클래스
+    """
+    if isinstance(trade_start, date) and not isinstance(trade_start, datetime):
+        trade_start = datetime.combine(trade_start, datetime.min.time())
+    trade_start_num = bt.date2num(trade_start)
+
+    class WarmupStrategy(strategy):
+        def buy(self, *args, **kwargs):
+            if self.datetime[0] < trade_start_num:
+                return None
+            return super().buy(*args, **kwargs)
+
+        def sell(self, *args, **kwargs):
+            if self.datetime[0] < trade_start_num:
+                return None
+            return super().sell(*args, **kwargs)
+
+    WarmupStrategy.__name__ = WarmupStrategy.__qualname__ = strategy.__name__
+    return WarmupStrategy
+
+
+def run_single(strategy, df: pd.DataFrame, params: dict = None, cash: float = DEFAULT_CASH,
+               commission: float = DEFAULT_COMMISSION, fromdate=None, todate=None, record: bool = False,
+               profile: bool = False, profile_name: str = None, stock_code: str = None, trade_start=None) -> dict:
+    """
+    하나의 OHLCV DataFrame과 하나의 파라미터 조합으로 백테스팅을 실행하고 요약 결과를 반환합니다.
+    최적화/배치 실행의 작업 단위로 사용되므로, 예외를 던지지 않고 결과 딕셔너리의 'error'에 기록합니다.
+    :param strategy: backtrader.Strategy 클래스
+    :param df: DBDataLoader.load_daily_frame 등이 반환한 OHLCV DataFrame, 또는 이미 만든 backtrader 데이터 피드
+               (SharedMemoryData 등. 피드를 넘기면 fromdate/todate는 피드 생성 시 지정합니다.)
+    :param params: 전략 파라미터 딕셔너리
+    :param cash: 초기 투자 자산
+    :param commission: 거래 수수료율
+    :param fromdate: 백테스팅 시작 날짜/시간 (None이면 전체)
+    :param todate: 백테스팅 종료 날짜/시간 (None이면 전체)
+    :param record: True이면 RunRecorder로 평가금액 곡선/거래/주문을 기록하여 결과의 'record'에 담습니다. (ResultsStore 저장용)
+    :param profile: True이면 실행을 표본 추출 프로파일링하여 PROFILE_DIR에 collapsed-stack/speedscope 파일을 쓰고
+                    결과의 'profile'에 파일 경로와 분류별 시간을 담습니다.
+    :param profile_name: 프로파일 파일 이름에 붙일 실행 이름 (예: 종목 코드). None이면 파라미터
+    :param stock_code: 데이터 피드 이름 (RunRecorder가 거래/주문의 stock_code로 기록). None이면 profile_name
+    :param trade_start: 지정하면 이 시각 이전의 바는 지표 워밍업에만 쓰고 주문을 내지 않습니다. (warmup_strategy)
+                        평가금액 곡선도 이 시각부터 기록합니다.
+    :return: {'final_value', 'pnl', 'trade_count', 'won', 'lost', 'error'} 딕셔너리
+    """
+    params = params or {}
+    result = {'final_value': None, 'pnl': None, 'trade_count': 0, 'won': 0, 'lost': 0, 'error': None}
+    is_feed = isinstance(df, bt.feed.AbstractDataBase)
+    if df is None or (not is_feed and df.empty):
+        result['error'] = '데이터 없음'
+        return result
+
+    try:
+        cerebro = build_cerebro(cash=cash, commission=commission)
+        feed_name = stock_code or profile_name
+        cerebro.adddata(df if is_feed else bt.feeds.PandasData(dataname=df, fromdate=fromdate, todate=todate),
+                        name=feed_name)
+        cerebro.addstrategy(warmup_strategy(strategy, trade_start) if trade_start is not None else strategy, **params)
+        cerebro.addanalyzer(bt.analyzers.TradeAnalyzer, _name='trades')
+        if record:
+            cerebro.addanalyzer(RunRecorder, _name='recorder')
+        profiler = SamplingProfiler() if profile else None
+        with metrics.timer('backtest_run', engine='run_single') as t:
+            if profiler:
+                profiler.start()
+            try:
+                strategies = cerebro.run(maxcpus=1)
+            finally:
+                if profiler:
+                    profiler.stop()
+            t.add(bars=len(cerebro.datas[0]))
+        if profiler:
+            label = profile_name or '-'.join(f"{key}={value}" for key, value in params.items()) or 'default'
+            result['profile'] = profiler.write(f"{strategy.__name__}-{label}")
+
+        final_value = cerebro.broker.getvalue()
+        result['final_value'] = final_value
+        result['pnl'] = final_value - cash
+
+        trades = strategies[0].analyzers.trades.get_analysis()
+        total = trades.get('total', {})
+        result['trade_count'] = total.get('closed', 0)
+        result['won'] = trades.get('won', {}).get('total', 0)
+        result['lost'] = trades.get('lost', {}).get('total', 0)
+        if record:
+            result['record'] = strategies[0].analyzers.recorder.get_analysis()
+            if trade_start is not None:
+                start = pd.Timestamp(trade_start)
+                result['record']['equity'] = [row for row in result['record']['equity'] if row['datetime'] >= start]
+    except Exception as e:
+        logger.error(f"백테스팅 실행 중 오류 발생 (params={params}): {e}", exc_info=True)
+        result['error'] = str(e)
+    return result
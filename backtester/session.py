@@ -0,0 +1,162 @@
+# backtesting/backtester/session.py
+
+import logging
+import os
+import sys
+from datetime import date, datetime
+
+import backtrader as bt
+import pandas as pd
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from db.db_manager import DBManager
+from feeds.db_data_loader import DBDataLoader
+from feeds.parquet_cache import ParquetCache
+from backtester.optimizer import optimize
+from backtester.runner import build_cerebro, run_single, DEFAULT_CASH, DEFAULT_COMMISSION
+
+logger = logging.getLogger(__name__)
+
+
+class BacktestSession:
+    """
+    DB 연결과 로드한 데이터를 세션 동안 유지하면서, 같은 데이터로 새 Cerebro 실행을 여러 번 만드는 객체.
+    Backtester는 실행마다 Cerebro/DBManager/DBDataLoader를 새로 만들지만, 세션은 종목 데이터를 한 번만 로드하므로
+    대화형 연구에서 실험마다 재연결/재조회하는 비용이 없습니다.
+    사용 예:
+        with BacktestSession(date(2020, 1, 1), date(2024, 12, 31)) as session:
+            session.preload(['A005930', 'A000660'])
+            for fast in (5, 10, 20):
+                strategies = session.run(SimpleMAStrategy, 'A005930', sma_fast_period=fast)
+    """
+    def __init__(self, start_date: date, end_date: date, cash: float = DEFAULT_CASH,
+                 commission: float = DEFAULT_COMMISSION, use_cache: bool = False, db_manager: DBManager = None):
+        """
+        :param start_date: 백테스팅 시작 날짜
+        :param end_date: 백테스팅 종료 날짜
+        :param cash: 초기 투자 자산
+        :param commission: 거래 수수료율
+        :param use_cache: True이면 로컬 Parquet 캐시(DATA_CACHE_DIR)를 거쳐 데이터를 로드합니다.
+        :param db_manager: 공유할 DBManager. None이면 세션이 만들고 close() 시 닫습니다.
+        """
+        self.start_date = start_date
+        self.end_date = end_date
+        self.cash = cash
+        self.commission = commission
+        self._owns_db = db_manager is None
+        self.db_manager = db_manager or DBManager()
+        self.data_loader = DBDataLoader(self.db_manager, cache=ParquetCache() if use_cache else None)
+        self._frames = {} # (종목 코드, timeframe) -> OHLCV DataFrame
+        self.run_count = 0
+        logger.info(f"백테스트 세션 시작: {start_date} ~ {end_date}")
+
+    def _date_range(self, timeframe: str):
+        if timeframe == 'daily':
+            return self.start_date, self.end_date
+        if timeframe == 'minute':
+            return (datetime.combine(self.start_date, datetime.min.time()),
+                    datetime.combine(self.end_date, datetime.max.time()))
+        raise ValueError("지원하지 않는 timeframe입니다. 'daily' 또는 'minute'을 사용하세요.")
+
+    def preload(self, stock_codes: list, timeframe: str = 'daily') -> list:
+        """
+        아직 로드하지 않은 종목들의 데이터를 DB에서 일괄 조회하여 세션에 보관합니다.
+        :return: 세션에 데이터가 있는 종목 코드 리스트
+        """
+        fromdate, todate = self._date_range(timeframe)
+        missing = [code for code in stock_codes if (code, timeframe) not in self._frames]
+        if missing:
+            if timeframe == 'daily':
+                frames = self.data_loader.load_daily_frames(missing, fromdate, todate)
+            else:
+                frames = self.data_loader.load_minute_frames(missing, fromdate, todate)
+            for code in missing:
+                self._frames[(code, timeframe)] = frames.get(code, DBDataLoader.empty_frame())
+        return [code for code in stock_codes if not self._frames[(code, timeframe)].empty]
+
+    def load_frame(self, stock_code: str, timeframe: str = 'daily') -> pd.DataFrame:
+        """세션에 보관된 종목 데이터를 반환합니다. 처음 요청한 종목이면 DB에서 로드합니다."""
+        key = (stock_code, timeframe)
+        if key not in self._frames:
+            fromdate, todate = self._date_range(timeframe)
+            if timeframe == 'daily':
+                self._frames[key] = self.data_loader.load_daily_frame(stock_code, fromdate, todate)
+            else:
+                self._frames[key] = self.data_loader.load_minute_frame(stock_code, fromdate, todate)
+        return self._frames[key]
+
+    def make_cerebro(self, **cerebro_kwargs) -> bt.Cerebro:
+        """세션의 초기 자산/수수료가 설정된 새 Cerebro를 만듭니다."""
+        return build_cerebro(cash=self.cash, commission=self.commission, **cerebro_kwargs)
+
+    def make_feed(self, stock_code: str, timeframe: str = 'daily') -> bt.feeds.PandasData:
+        """세션에 보관된 데이터로 새 PandasData 피드를 만듭니다. (피드는 Cerebro 실행마다 새로 필요)"""
+        return bt.feeds.PandasData(dataname=self.load_frame(stock_code, timeframe), name=stock_code)
+
+    def run(self, strategy, stock_codes, timeframe: str = 'daily', analyzers: dict = None,
+            cerebro_kwargs: dict = None, **strategy_params):
+        """
+        세션 데이터로 새 Cerebro를 만들어 전략을 실행합니다. 여러 번 호출해도 DB를 다시 조회하지 않습니다.
+        :param strategy: backtrader.Strategy 클래스
+        :param stock_codes: 종목 코드 또는 종목 코드 리스트 (피드 이름은 종목 코드)
+        :param timeframe: 'daily' 또는 'minute'
+        :param analyzers: {이름: Analyzer 클래스} (예: {'trades': bt.analyzers.TradeAnalyzer})
+        :param cerebro_kwargs: bt.Cerebro 생성자/run()에 전달할 추가 인자 (예: {'stdstats': False})
+        :param strategy_params: 전략 파라미터
+        :return: 실행된 전략 인스턴스 리스트 (최종 자산은 strategies[0].broker.getvalue()). 데이터가 없으면 None
+        """
+        if isinstance(stock_codes, str):
+            stock_codes = [stock_codes]
+        cerebro = self.make_cerebro(**(cerebro_kwargs or {}))
+        for code in stock_codes:
+            if self.load_frame(code, timeframe).empty:
+                logger.warning(f"'{code}' ({timeframe}) 데이터가 없어 피드에서 제외합니다.")
+                continue
+            cerebro.adddata(self.make_feed(code, timeframe), name=code)
+        if not cerebro.datas:
+            logger.error("실행할 데이터가 없습니다.")
+            return None
+
+        cerebro.addstrategy(strategy, **strategy_params)
+        for name, analyzer in (analyzers or {}).items():
+            cerebro.addanalyzer(analyzer, _name=name)
+        self.run_count += 1
+        return cerebro.run(maxcpus=1)
+
+    def evaluate(self, strategy, stock_code: str, timeframe: str = 'daily', **strategy_params) -> dict:
+        """
+        한 종목/한 파라미터 조합을 실행하고 run_single 요약(final_value, pnl, trade_count, won, lost, error)을 반환합니다.
+        """
+        self.run_count += 1
+        return run_single(strategy, self.load_frame(stock_code, timeframe), params=strategy_params,
+                          cash=self.cash, commission=self.commission, stock_code=stock_code)
+
+    def optimize(self, strategy, param_grid: dict, stock_code: str, timeframe: str = 'daily', workers: int = None):
+        """세션에 보관된 데이터로 파라미터 그리드를 최적화합니다. (backtester.optimizer.optimize)"""
+        df = self.load_frame(stock_code, timeframe)
+        if df.empty:
+            logger.error(f"'{stock_code}' ({timeframe}) 데이터가 없어 최적화를 실행할 수 없습니다.")
+            return None
+        return optimize(strategy, df, param_grid, workers=workers, cash=self.cash, commission=self.commission,
+                        stock_code=stock_code)
+
+    def clear(self):
+        """보관 중인 데이터를 비웁니다. (DB 연결은 유지)"""
+        self._frames.clear()
+
+    def close(self):
+        """보관 데이터를 비우고, 세션이 만든 DB 연결을 닫습니다."""
+        self.clear()
+        if self._owns_db and self.db_manager is not None:
+            self.db_manager.close()
+        self.db_manager = None
+        logger.info(f"백테스트 세션 종료 (실행 {self.run_count}회)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
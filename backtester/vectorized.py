@@ -0,0 +1,179 @@
+# backtesting/backtester/vectorized.py
+
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from backtester.optimizer import expand_param_grid
+from backtester.runner import DEFAULT_CASH, DEFAULT_COMMISSION
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ORDER_SIZE = 10 # SimpleMAStrategy.next()의 buy(size=10)와 동일
+DEFAULT_FAST_PERIOD = 10 # SimpleMAStrategy.params 기본값
+DEFAULT_SLOW_PERIOD = 50
+
+
+def rolling_sma(close: np.ndarray, period: int) -> np.ndarray:
+    """
+    bt.indicators.SMA와 같은 단순 이동평균. 값이 없는 앞쪽 period-1개 바는 NaN입니다.
+    누적합 차분 대신 구간 합을 직접 계산하여 backtrader(math.fsum)와 교차 판정이 어긋나지 않도록 합니다.
+    """
+    sma = np.full(len(close), np.nan)
+    if 0 < period <= len(close):
+        windows = np.lib.stride_tricks.sliding_window_view(close, period)
+        sma[period - 1:] = windows.sum(axis=1) / period
+    return sma
+
+
+def crossover_signals(fast: np.ndarray, slow: np.ndarray, first_valid) -> np.ndarray:
+    """
+    bt.indicators.CrossOver와 같은 교차 신호를 (조합, 바) 행렬 단위로 계산합니다.
+    CrossOver는 차이가 0인 바를 건너뛰고 직전의 0이 아닌 차이(NonZeroDifference)와 비교하므로 같은 방식으로 처리합니다.
+    :param fast: (K, n) 단기 이동평균
+    :param slow: (K, n) 장기 이동평균
+    :param first_valid: (K,) 조합별로 두 이동평균이 모두 값을 갖는 첫 바 인덱스
+    :return: (K, n) int8 배열 (1: 상향 돌파, -1: 하향 돌파, 0: 없음)
+    """
+    k, n = fast.shape
+    bars = np.arange(n)
+    first_valid = np.asarray(first_valid).reshape(-1, 1)
+    diff = np.where(bars >= first_valid, fast - slow, np.nan)
+
+    # NonZeroDifference: 차이가 0이면 직전 값을 유지 (첫 유효 바는 0이어도 그대로 사용)
+    keep = (diff != 0) & ~np.isnan(diff) | (bars == first_valid)
+    last_idx = np.maximum.accumulate(np.where(keep, bars, 0), axis=1)
+    nzd = np.take_along_axis(diff, last_idx, axis=1)
+
+    prev_nzd = np.full_like(nzd, np.nan)
+    prev_nzd[:, 1:] = nzd[:, :-1]
+    signals = np.zeros((k, n), dtype=np.int8)
+    with np.errstate(invalid='ignore'):
+        signals[(prev_nzd < 0) & (diff > 0)] = 1
+        signals[(prev_nzd > 0) & (diff < 0)] = -1
+    signals[bars <= first_valid] = 0 # CrossOver는 첫 유효 바 다음부터 값이 나옴
+    return signals
+
+
+def backtest_sma_crossover(open_: np.ndarray, close: np.ndarray, fast_periods, slow_periods,
+                           size: int = DEFAULT_ORDER_SIZE, cash: float = DEFAULT_CASH,
+                           commission: float = DEFAULT_COMMISSION) -> dict:
+    """
+    한 종목의 시가/종가 배열로 여러 (단기, 장기) 기간 조합의 SMA 교차 전략을 한 번에 백테스팅합니다.
+    SimpleMAStrategy와 같은 규칙을 따릅니다: 상향 돌파 시 size주 매수, 하향 돌파 시 전량 매도,
+    주문은 다음 바 시가에 체결, 수수료는 체결 금액 x commission, 마지막 바의 신호는 체결되지 않습니다.
+    :param open_: (n,) 시가
+    :param close: (n,) 종가
+    :param fast_periods: 조합별 단기 기간 (K,)
+    :param slow_periods: 조합별 장기 기간 (K,)
+    :return: {'final_value', 'pnl', 'trade_count', 'won', 'lost'} (각각 (K,) 배열)와 'equity' ((K, n) 평가금액)
+    """
+    open_ = np.asarray(open_, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    fast_periods = np.asarray(fast_periods, dtype=np.int64)
+    slow_periods = np.asarray(slow_periods, dtype=np.int64)
+    k, n = len(fast_periods), len(close)
+
+    # 기간별 이동평균은 한 번만 계산하여 조합들이 공유
+    smas = {p: rolling_sma(close, int(p)) for p in np.unique(np.concatenate([fast_periods, slow_periods]))}
+    fast = np.stack([smas[p] for p in fast_periods]) if k else np.empty((0, n))
+    slow = np.stack([smas[p] for p in slow_periods]) if k else np.empty((0, n))
+    first_valid = np.maximum(fast_periods, slow_periods) - 1
+    signals = crossover_signals(fast, slow, first_valid)
+
+    # 교차 신호는 상향/하향이 번갈아 나오므로, 마지막 신호가 상향이면 보유 상태입니다.
+    # (포지션이 없을 때의 하향 돌파는 마지막 신호를 하향으로 두므로 자연히 무시됨)
+    bars = np.arange(n)
+    last_signal_idx = np.maximum.accumulate(np.where(signals != 0, bars, -1), axis=1)
+    wants_long = np.take_along_axis(signals, np.maximum(last_signal_idx, 0), axis=1) == 1
+    wants_long &= last_signal_idx >= 0
+
+    # t 바의 신호는 t+1 바 시가에 체결
+    position = np.zeros((k, n), dtype=np.int8)
+    position[:, 1:] = wants_long[:, :-1]
+    trades = np.diff(position, axis=1, prepend=0).astype(np.float64) # 1: 매수 체결, -1: 매도 체결
+
+    notional = trades * size * open_
+    cash_flow = -notional - np.abs(notional) * commission
+    equity = cash + np.cumsum(cash_flow, axis=1) + position * size * close
+
+    # 청산된 거래별 손익 (수수료 포함, TradeAnalyzer와 같이 0 이상이면 won)
+    trade_count = np.zeros(k, dtype=np.int64)
+    won = np.zeros(k, dtype=np.int64)
+    for i in range(k):
+        buys = open_[trades[i] > 0]
+        sells = open_[trades[i] < 0]
+        closed = len(sells)
+        if closed:
+            pnlcomm = size * (sells - buys[:closed]) - size * (sells + buys[:closed]) * commission
+            won[i] = int((pnlcomm >= 0).sum())
+        trade_count[i] = closed
+
+    final_value = equity[:, -1] if n else np.full(k, float(cash))
+    return {
+        'final_value': final_value,
+        'pnl': final_value - cash,
+        'trade_count': trade_count,
+        'won': won,
+        'lost': trade_count - won,
+        'equity': equity,
+    }
+
+
+def screen_sma_crossover(frames: dict, param_grid: dict, size: int = DEFAULT_ORDER_SIZE,
+                         cash: float = DEFAULT_CASH, commission: float = DEFAULT_COMMISSION,
+                         fromdate=None, todate=None, return_equity: bool = False):
+    """
+    여러 종목 x 파라미터 조합 전체를 벡터화 엔진으로 스크리닝합니다.
+    backtrader 실행(run_single/optimize)과 허용 오차 안에서 같은 결과를 내므로,
+    후보를 여기서 고른 뒤 상위 조합만 Cerebro로 확인하는 용도로 사용합니다.
+    :param frames: {종목 코드: OHLCV DataFrame} (DBDataLoader.load_daily_frames 결과)
+    :param param_grid: {'sma_fast_period': [...], 'sma_slow_period': [...]}
+    :param size: 매수 수량
+    :param cash: 초기 투자 자산
+    :param commission: 거래 수수료율
+    :param fromdate: 백테스팅 시작 날짜/시간 (None이면 전체)
+    :param todate: 백테스팅 종료 날짜/시간 (None이면 전체)
+    :param return_equity: True이면 {종목 코드: (조합 수, 바 수) 평가금액 DataFrame}도 함께 반환
+    :return: 종목/조합별 결과 DataFrame (pnl 내림차순). return_equity=True이면 (결과, 평가금액 dict)
+    """
+    started = time.time()
+    combos = expand_param_grid(param_grid)
+    fast_periods = [c.get('sma_fast_period', DEFAULT_FAST_PERIOD) for c in combos]
+    slow_periods = [c.get('sma_slow_period', DEFAULT_SLOW_PERIOD) for c in combos]
+
+    rows = []
+    equity_curves = {}
+    for stock_code, df in frames.items():
+        if df is None or df.empty:
+            continue
+        df = df.loc[fromdate:todate] if fromdate is not None or todate is not None else df
+        result = backtest_sma_crossover(df['open'].to_numpy(), df['close'].to_numpy(),
+                                        fast_periods, slow_periods,
+                                        size=size, cash=cash, commission=commission)
+        for i, params in enumerate(combos):
+            rows.append({
+                'stock_code': stock_code, **params,
+                'final_value': result['final_value'][i],
+                'pnl': result['pnl'][i],
+                'trade_count': int(result['trade_count'][i]),
+                'won': int(result['won'][i]),
+                'lost': int(result['lost'][i]),
+            })
+        if return_equity:
+            equity_curves[stock_code] = pd.DataFrame(result['equity'].T, index=df.index,
+                                                     columns=pd.MultiIndex.from_tuples(zip(fast_periods, slow_periods),
+                                                                                       names=['sma_fast_period', 'sma_slow_period']))
+
+    results = pd.DataFrame(rows)
+    if not results.empty:
+        results = results.sort_values('pnl', ascending=False).reset_index(drop=True)
+    logger.info(f"벡터화 스크리닝 완료: {len(frames)}개 종목 x {len(combos)}개 조합 ({time.time() - started:.2f}초)")
+    return (results, equity_curves) if return_equity else results
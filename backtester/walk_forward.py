@@ -0,0 +1,163 @@
+# backtesting/backtester/walk_forward.py
+
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from backtester.optimizer import expand_param_grid
+from backtester.runner import run_single, DEFAULT_CASH, DEFAULT_COMMISSION
+
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스마다 한 번만 전달받아 모든 구간이 공유하는 데이터 (구간마다 DB를 다시 조회하지 않기 위함)
+_worker_state = {}
+
+
+def split_walk_forward_windows(start_date: date, end_date: date, in_sample_months: int, out_of_sample_months: int,
+                               step_months: int = None, anchored: bool = False) -> list:
+    """
+    기간을 워크포워드 구간(in-sample 최적화 구간 + 바로 뒤의 out-of-sample 검증 구간)으로 나눕니다.
+    :param start_date: 전체 시작 날짜
+    :param end_date: 전체 종료 날짜
+    :param in_sample_months: in-sample 구간 길이 (개월)
+    :param out_of_sample_months: out-of-sample 구간 길이 (개월)
+    :param step_months: 구간을 옮기는 간격 (개월). None이면 out_of_sample_months (검증 구간이 겹치지 않음)
+    :param anchored: True이면 in-sample 시작을 start_date로 고정하고 끝만 늘려 갑니다.
+    :return: [{'window', 'is_start', 'is_end', 'oos_start', 'oos_end'}, ...] (마지막 검증 구간은 end_date에서 잘림)
+    """
+    if in_sample_months <= 0 or out_of_sample_months <= 0:
+        raise ValueError("in_sample_months와 out_of_sample_months는 0보다 커야 합니다.")
+    step = pd.DateOffset(months=step_months or out_of_sample_months)
+    start = pd.Timestamp(start_date)
+    end = pd.Timestamp(end_date)
+
+    windows = []
+    offset = start
+    while True:
+        is_start = start if anchored else offset
+        oos_start = offset + pd.DateOffset(months=in_sample_months)
+        if oos_start > end:
+            break
+        oos_end = min(oos_start + pd.DateOffset(months=out_of_sample_months) - timedelta(days=1), end)
+        windows.append({
+            'window': len(windows),
+            'is_start': is_start.date(),
+            'is_end': (oos_start - timedelta(days=1)).date(),
+            'oos_start': oos_start.date(),
+            'oos_end': oos_end.date(),
+        })
+        offset = offset + step
+    return windows
+
+
+def _slice(df: pd.DataFrame, start: date, end: date) -> pd.DataFrame:
+    """이미 로드한 전체 데이터에서 구간만 잘라냅니다. (종료일은 그날 장 마감까지 포함)"""
+    return df.loc[pd.Timestamp(start):pd.Timestamp(datetime.combine(end, datetime.max.time()))]
+
+
+def _set_worker_state(strategy, df, combos, metric, cash, commission):
+    """공통 데이터를 프로세스 전역에 보관합니다."""
+    _worker_state.update(strategy=strategy, df=df, combos=combos, metric=metric, cash=cash, commission=commission)
+
+
+def _init_worker(*state_args):
+    """워커 프로세스 초기화: 공통 데이터를 보관하고, 전략의 매매 건별 로그를 줄입니다."""
+    _set_worker_state(*state_args)
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+
+
+def _run_window(window: dict) -> dict:
+    """
+    한 구간을 처리합니다: in-sample 구간에서 모든 파라미터 조합을 실행해 metric이 가장 큰 조합을 고르고,
+    그 조합으로 out-of-sample 구간을 실행합니다.
+    out-of-sample 실행에는 in-sample 시작부터의 데이터를 넣어 지표를 미리 워밍업하고,
+    주문과 손익은 out-of-sample 시작부터만 집계합니다. (느린 지표일수록 검증 구간이 짧아지는 편향 방지)
+    """
+    state = _worker_state
+    metric = state['metric']
+    in_sample = _slice(state['df'], window['is_start'], window['is_end'])
+    out_of_sample = _slice(state['df'], window['oos_start'], window['oos_end'])
+    with_warmup = _slice(state['df'], window['is_start'], window['oos_end'])
+    result = {**window, 'is_bars': len(in_sample), 'oos_bars': len(out_of_sample)}
+
+    best_params, best_result = None, None
+    for params in state['combos']:
+        is_result = run_single(state['strategy'], in_sample, params=params,
+                               cash=state['cash'], commission=state['commission'])
+        score = is_result.get(metric)
+        if score is None:
+            continue
+        if best_result is None or score > best_result[metric]:
+            best_params, best_result = params, is_result
+
+    if best_params is None:
+        result['error'] = 'in-sample 구간에서 유효한 결과가 없습니다.'
+        return result
+
+    oos_result = run_single(state['strategy'], with_warmup, params=best_params,
+                            cash=state['cash'], commission=state['commission'], trade_start=window['oos_start'])
+    result.update(best_params)
+    result[f'is_{metric}'] = best_result[metric]
+    result.update({f'oos_{key}': value for key, value in oos_result.items() if key != 'error'})
+    result['error'] = oos_result['error']
+    return result
+
+
+def walk_forward(strategy, df: pd.DataFrame, param_grid: dict, start_date: date, end_date: date,
+                 in_sample_months: int, out_of_sample_months: int, step_months: int = None,
+                 anchored: bool = False, metric: str = 'pnl', workers: int = None,
+                 cash: float = DEFAULT_CASH, commission: float = DEFAULT_COMMISSION) -> pd.DataFrame:
+    """
+    워크포워드 최적화를 실행합니다. 구간들은 서로 독립이므로 프로세스 풀로 나누어 병렬 실행하며,
+    전체 기간 데이터는 워커당 한 번만 전달되고 각 구간은 그 데이터를 잘라서 사용합니다.
+    out-of-sample 구간은 in-sample 데이터로 지표를 워밍업한 상태에서 시작하며, 거래와 손익은 검증 구간 것만 집계합니다.
+    :param strategy: backtrader.Strategy 클래스
+    :param df: 전체 기간의 OHLCV DataFrame (DBDataLoader.load_daily_frame 결과)
+    :param param_grid: 파라미터 이름 -> 후보 값 리스트 딕셔너리
+    :param start_date: 전체 시작 날짜
+    :param end_date: 전체 종료 날짜
+    :param in_sample_months: in-sample 구간 길이 (개월)
+    :param out_of_sample_months: out-of-sample 구간 길이 (개월)
+    :param step_months: 구간 이동 간격 (개월). None이면 out_of_sample_months
+    :param anchored: True이면 in-sample 시작을 고정 (확장 구간)
+    :param metric: in-sample에서 최대화할 run_single 결과 항목 (예: 'pnl', 'final_value')
+    :param workers: 워커 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 순차 실행)
+    :param cash: 초기 투자 자산
+    :param commission: 거래 수수료율
+    :return: 구간별 선택 파라미터와 is_{metric}, oos_final_value / oos_pnl / oos_trade_count 등을 담은 DataFrame (구간 순)
+    """
+    windows = split_walk_forward_windows(start_date, end_date, in_sample_months, out_of_sample_months,
+                                         step_months=step_months, anchored=anchored)
+    combos = expand_param_grid(param_grid)
+    if not windows or not combos:
+        logger.warning("워크포워드 구간 또는 파라미터 조합이 없습니다. 기간과 param_grid를 확인하세요.")
+        return pd.DataFrame()
+
+    workers = min(workers or os.cpu_count() or 1, len(windows))
+    logger.info(f"워크포워드 최적화 시작: {len(windows)}개 구간 x {len(combos)}개 조합, 워커 {workers}개")
+
+    init_args = (strategy, df, combos, metric, cash, commission)
+    results = []
+    if workers == 1:
+        _set_worker_state(*init_args)
+        results = [_run_window(window) for window in windows]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init_args) as executor:
+            futures = [executor.submit(_run_window, window) for window in windows]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                logger.info(f"워크포워드 구간 {result['window']} 완료 "
+                            f"({result['oos_start']} ~ {result['oos_end']}, OOS 손익 {result.get('oos_pnl')})")
+
+    result_df = pd.DataFrame(results).sort_values('window').reset_index(drop=True)
+    if 'oos_pnl' in result_df:
+        logger.info(f"워크포워드 최적화 완료: OOS 손익 합계 {result_df['oos_pnl'].sum():,.0f}원")
+    return result_df
@@ -0,0 +1,227 @@
+# backtesting/benchmarks/memory_db.py
+
+import logging
+import os
+import sys
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from config.settings import (BULK_FETCH_CHUNK_SIZE, STREAM_CHUNK_SIZE, BACKFILL_LEASE_SECONDS, BACKFILL_MAX_ATTEMPTS,
+                             BACKFILL_RETRY_BACKOFF_SECONDS)
+from db.db_manager import DBManager
+
+logger = logging.getLogger(__name__)
+
+STOCK_INFO_COLUMNS = ['stock_code', 'stock_name', 'market_type', 'sector', 'per', 'pbr', 'eps', 'roe', 'debt_ratio',
+                      'sales', 'operating_profit', 'net_profit', 'recent_financial_date']
+
+
+class InMemoryDBManager:
+    """
+    MariaDB 없이 벤치마크/테스트를 돌리기 위한 DBManager 대용. (같은 메서드 이름과 반환 형식)
+    테이블은 {종목코드: {시각: 행 튜플}} 딕셔너리로 보관하며, save_*는 ON DUPLICATE KEY UPDATE처럼 덮어씁니다.
+    조회 결과는 pymysql DictCursor처럼 행 딕셔너리 리스트에서 DataFrame을 만들어, 드라이버 변환 비용도 비슷하게 포함됩니다.
+    네트워크/디스크 I/O가 없으므로 측정값은 DB 계층 위쪽(변환, Cerebro 실행) 비용의 하한으로 봐야 합니다.
+    """
+    DAILY_COLUMNS = DBManager.DAILY_COLUMNS
+    MINUTE_COLUMNS = DBManager.MINUTE_COLUMNS
+
+    def __init__(self):
+        self._stock_info = {}
+        self._daily = {}
+        self._minute = {}
+        self._backfill = {} # (job_name, stock_code, timeframe, chunk_start) -> 단위 딕셔너리
+        self._backfill_lock = threading.Lock()
+
+    def is_connected(self) -> bool:
+        return True
+
+    def close(self):
+        pass
+
+    def create_all_tables(self):
+        pass
+
+    def drop_all_tables(self):
+        self._stock_info.clear()
+        self._daily.clear()
+        self._minute.clear()
+        self._backfill.clear()
+
+    # --- 종목 정보 ---
+    def save_stock_info(self, stock_info_list):
+        for info in stock_info_list:
+            self._stock_info[info['stock_code']] = {column: info.get(column) for column in STOCK_INFO_COLUMNS}
+        return True
+
+    def fetch_stock_info(self, stock_codes=None):
+        rows = [info for code, info in self._stock_info.items() if not stock_codes or code in stock_codes]
+        return pd.DataFrame(rows)
+
+    # --- 저장 ---
+    @staticmethod
+    def _upsert(table: dict, rows):
+        for row in rows:
+            table.setdefault(row[0], {})[pd.Timestamp(row[1])] = row
+
+    def save_daily_data(self, daily_data_list):
+        self._upsert(self._daily, (tuple(d.get(column) for column in self.DAILY_COLUMNS) for d in daily_data_list))
+        return True
+
+    def save_minute_data(self, minute_data_list):
+        self._upsert(self._minute, (tuple(d.get(column) for column in self.MINUTE_COLUMNS) for d in minute_data_list))
+        return True
+
+    def bulk_load_daily_data(self, daily_df, **kwargs):
+        daily_df = daily_df.reindex(columns=self.DAILY_COLUMNS)
+        self._upsert(self._daily, daily_df.itertuples(index=False, name=None))
+        return True
+
+    def bulk_load_minute_data(self, minute_df, **kwargs):
+        minute_df = minute_df.reindex(columns=self.MINUTE_COLUMNS)
+        self._upsert(self._minute, minute_df.itertuples(index=False, name=None))
+        return True
+
+    # --- 조회 ---
+    @staticmethod
+    def _select(table: dict, stock_code: str, start=None, end=None) -> list:
+        """한 종목의 행 튜플을 시각 순으로 [start, end] 구간만 반환합니다."""
+        rows = table.get(stock_code, {})
+        start = pd.Timestamp(start) if start is not None else None
+        end = pd.Timestamp(end) if end is not None else None
+        return [rows[key] for key in sorted(rows)
+                if (start is None or key >= start) and (end is None or key <= end)]
+
+    def fetch_daily_data(self, stock_code, start_date=None, end_date=None):
+        rows = self._select(self._daily, stock_code, start_date, end_date)
+        return pd.DataFrame([dict(zip(self.DAILY_COLUMNS, row)) for row in rows])
+
+    def fetch_minute_data(self, stock_code, date=None, start_datetime=None, end_datetime=None):
+        rows = self._select(self._minute, stock_code, start_datetime, end_datetime)
+        if date:
+            rows = [row for row in rows if pd.Timestamp(row[1]).date() == date]
+        return pd.DataFrame([dict(zip(self.MINUTE_COLUMNS, row)) for row in rows])
+
+    def get_latest_daily_data_date(self, stock_code):
+        rows = self._daily.get(stock_code)
+        return max(rows).date() if rows else None
+
+    def get_latest_minute_data_datetime(self, stock_code):
+        rows = self._minute.get(stock_code)
+        return max(rows).to_pydatetime() if rows else None
+
+    @staticmethod
+    def _latest_by_code(table: dict, stock_codes=None) -> dict:
+        codes = table if stock_codes is None else [code for code in stock_codes if code in table]
+        return {code: max(table[code]) for code in codes if table[code]}
+
+    def get_latest_daily_data_dates(self, stock_codes=None):
+        return {code: ts.date() for code, ts in self._latest_by_code(self._daily, stock_codes).items()}
+
+    def get_latest_daily_close(self, stock_code, before_date=None):
+        rows = self._select(self._daily, stock_code)
+        if before_date:
+            rows = [row for row in rows if pd.Timestamp(row[1]) < pd.Timestamp(before_date)]
+        close_idx = self.DAILY_COLUMNS.index('close_price')
+        return (pd.Timestamp(rows[-1][1]).date(), rows[-1][close_idx]) if rows else None
+
+    def get_latest_daily_closes(self, stock_codes=None):
+        close_idx = self.DAILY_COLUMNS.index('close_price')
+        return {code: (ts.date(), self._daily[code][ts][close_idx])
+                for code, ts in self._latest_by_code(self._daily, stock_codes).items()}
+
+    def update_daily_change_rates(self, rows):
+        rate_idx = self.DAILY_COLUMNS.index('change_rate')
+        for code, day, rate in rows:
+            key = pd.Timestamp(day)
+            row = self._daily.get(code, {}).get(key)
+            if row is not None:
+                self._daily[code][key] = row[:rate_idx] + (rate,) + row[rate_idx + 1:]
+        return True
+
+    def get_latest_minute_data_datetimes(self, stock_codes=None):
+        return {code: ts.to_pydatetime() for code, ts in self._latest_by_code(self._minute, stock_codes).items()}
+
+    def iter_minute_data(self, stock_code, start_datetime=None, end_datetime=None, chunk_size=STREAM_CHUNK_SIZE):
+        rows = [row[1:] for row in self._select(self._minute, stock_code, start_datetime, end_datetime)]
+        for i in range(0, len(rows), chunk_size):
+            yield rows[i:i + chunk_size]
+
+    def _fetch_bulk(self, table: dict, columns: list, stock_codes, start=None, end=None, as_dict=False):
+        rows = []
+        for code in dict.fromkeys(stock_codes):
+            rows.extend(self._select(table, code, start, end))
+        df = pd.DataFrame.from_records(rows, columns=columns)
+        return DBManager._split_by_code(df) if as_dict else df
+
+    def fetch_daily_data_bulk(self, stock_codes, start_date=None, end_date=None, as_dict=False,
+                              chunk_size=BULK_FETCH_CHUNK_SIZE):
+        return self._fetch_bulk(self._daily, self.DAILY_COLUMNS, stock_codes, start_date, end_date, as_dict)
+
+    def fetch_minute_data_bulk(self, stock_codes, start_datetime=None, end_datetime=None, as_dict=False,
+                               chunk_size=BULK_FETCH_CHUNK_SIZE):
+        return self._fetch_bulk(self._minute, self.MINUTE_COLUMNS, stock_codes, start_datetime, end_datetime, as_dict)
+
+    # --- 백필 작업 단위 ---
+    def add_backfill_units(self, job_name, units):
+        with self._backfill_lock:
+            for stock_code, timeframe, chunk_start, chunk_end in units:
+                self._backfill.setdefault((job_name, stock_code, timeframe, chunk_start), {
+                    'stock_code': stock_code, 'timeframe': timeframe, 'chunk_start': chunk_start, 'chunk_end': chunk_end,
+                    'status': 'pending', 'attempts': 0, 'claim_token': None, 'worker_id': None, 'lease_expires': None,
+                    'rows_saved': None, 'last_error': None, 'next_attempt_at': None,
+                })
+        return True
+
+    def claim_backfill_units(self, job_name, worker_id, limit=1, lease_seconds=BACKFILL_LEASE_SECONDS,
+                             max_attempts=BACKFILL_MAX_ATTEMPTS):
+        token = str(uuid.uuid4())
+        now = datetime.now()
+        claimed = []
+        with self._backfill_lock:
+            for key in sorted(key for key in self._backfill if key[0] == job_name):
+                unit = self._backfill[key]
+                expired = unit['status'] == 'running' and unit['lease_expires'] < now
+                if expired and unit['attempts'] >= max_attempts:
+                    unit.update(status='failed', last_error='점유 시간 초과 (워커 중단)', lease_expires=None)
+                    continue
+                if not (unit['status'] == 'pending' or expired
+                        or (unit['status'] == 'failed' and unit['attempts'] < max_attempts
+                            and (unit['next_attempt_at'] is None or unit['next_attempt_at'] <= now))):
+                    continue
+                unit.update(status='running', claim_token=token, worker_id=worker_id, attempts=unit['attempts'] + 1,
+                            lease_expires=now + timedelta(seconds=lease_seconds))
+                claimed.append({column: unit[column] for column in
+                                ('stock_code', 'timeframe', 'chunk_start', 'chunk_end', 'attempts', 'claim_token')})
+                if len(claimed) >= limit:
+                    break
+        return claimed
+
+    def finish_backfill_unit(self, job_name, unit, rows_saved=None, error=None,
+                             retry_backoff_seconds=BACKFILL_RETRY_BACKOFF_SECONDS):
+        with self._backfill_lock:
+            stored = self._backfill.get((job_name, unit['stock_code'], unit['timeframe'], unit['chunk_start']))
+            if stored is None or stored['claim_token'] != unit['claim_token']:
+                return False
+            if error is None:
+                stored.update(status='done', rows_saved=rows_saved, last_error=None, lease_expires=None,
+                              next_attempt_at=None)
+            else:
+                backoff = timedelta(seconds=retry_backoff_seconds * 2 ** (stored['attempts'] - 1))
+                stored.update(status='failed', last_error=str(error)[:255], lease_expires=None,
+                              next_attempt_at=datetime.now() + backoff)
+        return True
+
+    def get_backfill_status(self, job_name):
+        status = dict.fromkeys(('pending', 'running', 'done', 'failed'), 0)
+        with self._backfill_lock:
+            for key, unit in self._backfill.items():
+                if key[0] == job_name:
+                    status[unit['status']] += 1
+        return status
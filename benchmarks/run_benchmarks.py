@@ -0,0 +1,227 @@
+# backtesting/benchmarks/run_benchmarks.py
+
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from datetime import date, datetime
+
+import backtrader as bt
+import pandas as pd
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from benchmarks.memory_db import InMemoryDBManager
+from benchmarks.synthetic_data import make_stock_codes, generate_daily_data, generate_minute_data
+from backtester.results_store import get_code_version
+from backtester.runner import run_single
+from feeds.db_data_loader import DBDataLoader
+from strategies.simple_ma_strategy import SimpleMAStrategy
+from utils.memory import get_peak_rss_mb
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# 느려졌다고 판단할 기준 (이전 결과 대비 처리량 감소 비율)
+REGRESSION_THRESHOLD = 0.10
+
+
+class BenchmarkTimer:
+    """한 단계의 경과 시간을 재고 처리량(행/초, 종목/초)과 그 시점의 peak RSS를 결과 리스트에 추가합니다."""
+    def __init__(self, results: list, name: str, timeframe: str, rows: int = 0, symbols: int = 0):
+        self.results = results
+        self.record = {'name': name, 'timeframe': timeframe, 'rows': rows, 'symbols': symbols}
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self.record
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        seconds = time.perf_counter() - self._started
+        record = self.record
+        record['seconds'] = round(seconds, 4)
+        record['rows_per_sec'] = round(record['rows'] / seconds, 1) if seconds > 0 and record['rows'] else None
+        record['symbols_per_sec'] = round(record['symbols'] / seconds, 2) if seconds > 0 and record['symbols'] else None
+        record['peak_rss_mb'] = get_peak_rss_mb()
+        self.results.append(record)
+        logger.info(f"[{record['timeframe']}] {record['name']}: {seconds:.3f}초, "
+                    f"{record['rows_per_sec']} 행/초, {record['symbols_per_sec']} 종목/초")
+        return False
+
+
+def bench_timeframe(db_manager, timeframe: str, num_stocks: int, start_date: date, end_date: date,
+                    seed: int = 0) -> list:
+    """
+    한 timeframe에 대해 생성 -> DB 저장 -> DB 조회 -> DBDataLoader 변환 -> Cerebro 실행 -> 종단간 처리량을 측정합니다.
+    :param db_manager: DBManager 또는 InMemoryDBManager (빈 테이블 권장, 합성 데이터로 덮어씀)
+    :return: 단계별 측정 결과 리스트
+    """
+    results = []
+    stock_codes = make_stock_codes(num_stocks)
+    generate = generate_daily_data if timeframe == 'daily' else generate_minute_data
+    if timeframe == 'daily':
+        start, end = start_date, end_date
+        fetch_bulk = lambda: db_manager.fetch_daily_data_bulk(stock_codes, start_date=start, end_date=end, as_dict=True)
+        bulk_load = db_manager.bulk_load_daily_data
+    else:
+        start = datetime.combine(start_date, datetime.min.time())
+        end = datetime.combine(end_date, datetime.max.time())
+        fetch_bulk = lambda: db_manager.fetch_minute_data_bulk(stock_codes, start_datetime=start, end_datetime=end,
+                                                               as_dict=True)
+        bulk_load = db_manager.bulk_load_minute_data
+
+    with BenchmarkTimer(results, 'generate', timeframe, symbols=num_stocks) as record:
+        data = generate(stock_codes, start_date, end_date, seed=seed)
+        record['rows'] = len(data)
+    rows = len(data)
+
+    # stock_info 외래 키를 만족하도록 종목 정보를 먼저 저장
+    db_manager.save_stock_info([{'stock_code': code, 'stock_name': code, 'market_type': 'KOSPI'} for code in stock_codes])
+    with BenchmarkTimer(results, 'db_save', timeframe, rows=rows, symbols=num_stocks):
+        bulk_load(data)
+    del data
+
+    with BenchmarkTimer(results, 'db_fetch', timeframe, rows=rows, symbols=num_stocks):
+        raw_frames = fetch_bulk()
+
+    with BenchmarkTimer(results, 'loader_convert', timeframe, rows=rows, symbols=num_stocks):
+        frames = {code: DBDataLoader.to_bt_frame(df) for code, df in raw_frames.items()}
+    del raw_frames
+
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+    with BenchmarkTimer(results, 'cerebro_run', timeframe, rows=rows, symbols=num_stocks) as record:
+        errors = [run_single(SimpleMAStrategy, df)['error'] for df in frames.values()]
+        record['errors'] = sum(1 for error in errors if error)
+    del frames
+
+    with BenchmarkTimer(results, 'end_to_end', timeframe, rows=rows, symbols=num_stocks):
+        data_loader = DBDataLoader(db_manager)
+        if timeframe == 'daily':
+            frames = data_loader.load_daily_frames(stock_codes, start, end)
+        else:
+            frames = data_loader.load_minute_frames(stock_codes, start, end)
+        for df in frames.values():
+            run_single(SimpleMAStrategy, df)
+    return results
+
+
+def run_benchmarks(daily_stocks: int = 100, minute_stocks: int = 5, daily_years: int = 5, minute_days: int = 20,
+                   db: str = 'memory', seed: int = 0) -> dict:
+    """
+    일봉/분봉 벤치마크를 모두 실행합니다.
+    :param daily_stocks: 일봉 벤치마크 종목 수
+    :param minute_stocks: 분봉 벤치마크 종목 수 (0이면 생략)
+    :param daily_years: 일봉 기간 (년)
+    :param minute_days: 분봉 기간 (영업일)
+    :param db: 'memory'(InMemoryDBManager) 또는 'mariadb'(config.settings의 DB, 로컬 컨테이너 등. 테이블을 다시 만듭니다)
+    :param seed: 합성 데이터 난수 시드
+    :return: {'meta': {...}, 'results': [...]} 딕셔너리
+    """
+    if db == 'memory':
+        db_manager = InMemoryDBManager()
+    elif db == 'mariadb':
+        from db.db_manager import DBManager
+        db_manager = DBManager()
+        db_manager.drop_all_tables()
+        db_manager.create_all_tables()
+    else:
+        raise ValueError("db는 'memory' 또는 'mariadb'만 지원합니다.")
+
+    end_date = date(2024, 12, 31)
+    results = []
+    try:
+        if daily_stocks:
+            results += bench_timeframe(db_manager, 'daily', daily_stocks,
+                                       date(end_date.year - daily_years + 1, 1, 1), end_date, seed=seed)
+        if minute_stocks:
+            minute_start = (pd.Timestamp(end_date) - pd.offsets.BDay(minute_days - 1)).date()
+            results += bench_timeframe(db_manager, 'minute', minute_stocks, minute_start, end_date, seed=seed)
+    finally:
+        db_manager.close()
+
+    return {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'code_version': get_code_version(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'backtrader': bt.__version__,
+            'db': db,
+            'seed': seed,
+            'daily_stocks': daily_stocks,
+            'daily_years': daily_years,
+            'minute_stocks': minute_stocks,
+            'minute_days': minute_days,
+        },
+        'peak_rss_mb': get_peak_rss_mb(),
+        'results': results,
+    }
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = REGRESSION_THRESHOLD) -> list:
+    """
+    두 벤치마크 결과를 비교하여 처리량(rows_per_sec)이 threshold 이상 줄어든 단계를 찾습니다.
+    :return: [{'name', 'timeframe', 'baseline', 'current', 'change'}, ...] (느려진 단계만)
+    """
+    baseline_rates = {(r['timeframe'], r['name']): r.get('rows_per_sec') for r in baseline.get('results', [])}
+    regressions = []
+    for record in current.get('results', []):
+        before = baseline_rates.get((record['timeframe'], record['name']))
+        after = record.get('rows_per_sec')
+        if not before or not after:
+            continue
+        change = (after - before) / before
+        if change <= -threshold:
+            regressions.append({'name': record['name'], 'timeframe': record['timeframe'],
+                                'baseline': before, 'current': after, 'change': round(change, 3)})
+    return regressions
+
+
+def save_results(report: dict, path: str = None) -> str:
+    """벤치마크 결과를 JSON으로 저장합니다. path가 없으면 BENCHMARK_RESULTS_DIR/bench-{시각}-{버전}.json"""
+    if path is None:
+        os.makedirs(BENCHMARK_RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        path = os.path.join(BENCHMARK_RESULTS_DIR, f"bench-{stamp}-{report['meta']['code_version'] or 'unknown'}.json")
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+    logger.info(f"벤치마크 결과 저장: {path}")
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='백테스팅 파이프라인 벤치마크 (합성 데이터)')
+    parser.add_argument('--daily-stocks', type=int, default=100)
+    parser.add_argument('--daily-years', type=int, default=5)
+    parser.add_argument('--minute-stocks', type=int, default=5)
+    parser.add_argument('--minute-days', type=int, default=20)
+    parser.add_argument('--db', choices=['memory', 'mariadb'], default='memory')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: benchmarks/results/bench-*.json)')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON 경로')
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(daily_stocks=args.daily_stocks, minute_stocks=args.minute_stocks,
+                            daily_years=args.daily_years, minute_days=args.minute_days, db=args.db, seed=args.seed)
+    save_results(report, args.output)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare_results(json.load(f), report)
+        for r in regressions:
+            logger.warning(f"성능 저하: [{r['timeframe']}] {r['name']} {r['baseline']} -> {r['current']} 행/초 "
+                           f"({r['change']:+.1%})")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                        handlers=[logging.StreamHandler(sys.stdout)])
+    sys.exit(main())
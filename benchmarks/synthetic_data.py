@@ -0,0 +1,84 @@
+# backtesting/benchmarks/synthetic_data.py
+
+import zlib
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+MINUTES_PER_DAY = 390 # 09:01 ~ 15:30
+
+
+def make_stock_codes(num_stocks: int) -> list:
+    """합성 종목 코드 리스트 ('A000010', 'A000020', ... FakeCreonBackend와 같은 형식)"""
+    return [f"A{(i + 1) * 10:06d}" for i in range(num_stocks)]
+
+
+def _rng(stock_code: str, seed: int) -> np.random.Generator:
+    """종목마다 독립적이고 재현 가능한 난수 생성기 (같은 seed/종목이면 항상 같은 데이터)"""
+    return np.random.default_rng([seed, zlib.crc32(stock_code.encode())])
+
+
+def _ohlcv(rng: np.random.Generator, n: int, start_price: float, volatility: float, volume_scale: float) -> dict:
+    """로그 수익률 랜덤워크로 정수 호가의 OHLCV 배열을 만듭니다. (low <= open/close <= high 보장)"""
+    close = start_price * np.exp(np.cumsum(rng.normal(0, volatility, n)))
+    open_ = np.empty(n)
+    open_[0] = start_price
+    open_[1:] = close[:-1] * np.exp(rng.normal(0, volatility / 4, n - 1))
+    spread = np.abs(rng.normal(0, volatility / 2, n))
+    high = np.maximum(open_, close) * (1 + spread)
+    low = np.minimum(open_, close) * (1 - spread)
+    return {
+        'open_price': np.round(open_).astype(np.int64),
+        'high_price': np.ceil(high).astype(np.int64),
+        'low_price': np.floor(low).astype(np.int64),
+        'close_price': np.round(close).astype(np.int64),
+        'volume': rng.integers(1_000, 1_000_000, n) * volume_scale,
+    }
+
+
+def generate_daily_data(stock_codes: list, start_date: date, end_date: date, seed: int = 0) -> pd.DataFrame:
+    """
+    종목별 합성 일봉 데이터를 만듭니다. (평일만, daily_stock_data 테이블과 같은 컬럼)
+    :param stock_codes: 종목 코드 리스트
+    :param start_date: 시작 날짜
+    :param end_date: 종료 날짜
+    :param seed: 난수 시드
+    :return: DBManager.DAILY_COLUMNS 컬럼의 long-format DataFrame (stock_code, date 순 정렬)
+    """
+    dates = pd.bdate_range(start_date, end_date).date
+    frames = []
+    for code in stock_codes:
+        rng = _rng(code, seed)
+        bars = _ohlcv(rng, len(dates), start_price=float(rng.integers(1_000, 500_000)), volatility=0.02,
+                      volume_scale=10)
+        prev_close = np.concatenate(([bars['open_price'][0]], bars['close_price'][:-1]))
+        frames.append(pd.DataFrame({
+            'stock_code': code,
+            'date': dates,
+            **bars,
+            'change_rate': np.round((bars['close_price'] - prev_close) / prev_close * 100, 2),
+            'trading_value': bars['close_price'] * bars['volume'],
+        }))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def generate_minute_data(stock_codes: list, start_date: date, end_date: date, seed: int = 0) -> pd.DataFrame:
+    """
+    종목별 합성 1분봉 데이터를 만듭니다. (평일 09:01 ~ 15:30, 하루 390개, minute_stock_data 테이블과 같은 컬럼)
+    :param stock_codes: 종목 코드 리스트
+    :param start_date: 시작 날짜
+    :param end_date: 종료 날짜
+    :param seed: 난수 시드
+    :return: DBManager.MINUTE_COLUMNS 컬럼의 long-format DataFrame (stock_code, datetime 순 정렬)
+    """
+    days = pd.bdate_range(start_date, end_date)
+    offsets = pd.timedelta_range(start='9h1min', periods=MINUTES_PER_DAY, freq='min')
+    times = (days.values[:, None] + offsets.values[None, :]).ravel()
+    frames = []
+    for code in stock_codes:
+        rng = _rng(code, seed)
+        bars = _ohlcv(rng, len(times), start_price=float(rng.integers(1_000, 500_000)), volatility=0.001,
+                      volume_scale=1)
+        frames.append(pd.DataFrame({'stock_code': code, 'datetime': times, **bars}))
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
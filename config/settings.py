@@ -17,9 +17,47 @@ DB_NAME = 'backtest_db' # 데이터베이스 이름 (예: task 2에서 생성 
 DB_USER = os.getenv('DB_USER')
 DB_PASSWORD = os.getenv('DB_PASSWORD')
 
-# Creon API Settings (향후 필요시 추가)
+# DB 연결 풀 설정 (병렬 로더/백테스트가 동시에 DB에 접근할 때 사용)
+DB_POOL_SIZE = 8 # 프로세스당 최대 연결 수
+DB_POOL_TIMEOUT = 30 # 모든 연결이 사용 중일 때 대기할 최대 시간 (초)
+BULK_FETCH_CHUNK_SIZE = 200 # 다종목 조회 시 한 쿼리의 IN (...) 목록에 넣을 최대 종목 수
+STREAM_CHUNK_SIZE = 5000 # 분봉 스트리밍 조회 시 한 번에 읽을 행 수
+LEAN_EXACTBARS = 1 # lean 실행 모드에서 Cerebro exactbars 값 (1: 지표 계산에 필요한 바만 보관, 미리 읽기 해제)
+BULK_LOAD_BATCH_SIZE = 50000 # 대량 적재(LOAD DATA) 시 임시 파일 하나에 담을 행 수
+BULK_LOAD_COMMIT_INTERVAL = 10 # 대량 적재 시 몇 개 배치마다 병합/커밋할지 (0이면 마지막에 한 번)
+
+# 장기 백필 설정 (data_manager.backfill: backfill_job_unit 테이블에 기록한 단위로 나눠 재시작/다중 워커 처리)
+BACKFILL_DAILY_CHUNK_DAYS = 365 # 일봉 작업 단위 기간 (일)
+BACKFILL_MINUTE_CHUNK_DAYS = 7 # 분봉 작업 단위 기간 (일)
+BACKFILL_LEASE_SECONDS = 600 # 워커가 가져간 단위를 점유하는 시간. 지나도록 완료하지 못하면 다른 워커가 다시 가져감
+BACKFILL_MAX_ATTEMPTS = 3 # 실패한 단위를 다시 시도할 최대 횟수
+BACKFILL_RETRY_BACKOFF_SECONDS = 300 # 실패한 단위를 다시 가져가기까지 기다리는 시간. 실패할 때마다 2배 (300초, 600초, ...)
+
+# 로컬 데이터 캐시 설정 (DBDataLoader의 Parquet 캐시 저장 위치)
+DATA_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache')
+
+CODE_MASTER_DIR = DATA_CACHE_DIR # 종목 마스터(api_client.code_master.CodeMaster)를 거래일 버전으로 저장할 디렉토리
+
+# 백테스트 결과 저장 설정 (ResultsStore)
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'results')
+RESULTS_BATCH_SIZE = 100_000 # 테이블별로 이 행 수가 모이면 Parquet 파일 하나로 기록
+
+# 계측 설정 (utils.metrics: DB 조회/데이터 변환/Creon 요청/백테스트 실행 시간과 처리량)
+METRICS_ENABLED = os.getenv('BACKTEST_METRICS', '0') == '1' # 기본 꺼짐. 켜면 metrics.to_json()/to_prometheus()로 확인
+METRICS_PREFIX = 'backtesting_' # Prometheus 출력 시 메트릭 이름 앞에 붙일 접두사
+
+# 프로파일링 설정 (utils.profiling.SamplingProfiler: run(profile=True)로 실행별 프로파일 저장)
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'profiles')
+PROFILE_INTERVAL = 0.005 # 호출 스택 표본 추출 간격 (초)
+
+# 지표 캐시 설정 (최적화 시 같은 데이터/기간의 지표를 전략 인스턴스 간에 재사용)
+INDICATOR_CACHE_SIZE = 256 # 프로세스당 보관할 최대 지표 시계열 수
+
+# Creon API Settings
 # API_CONNECT_TIMEOUT = 30 # Creon API 연결 시도 타임아웃 (초)
-# API_REQUEST_INTERVAL = 0.2 # API 요청 간 최소 대기 시간 (초)
+CREON_REQUEST_LIMIT = 60 # 시세 조회 요청 한도 (CREON_REQUEST_PERIOD초당 건수)
+CREON_REQUEST_PERIOD = 15 # 시세 조회 요청 한도 기준 시간 (초)
+MARKETEYE_BATCH_SIZE = 200 # MarketEye 요청 1회당 최대 종목 수
 
 # Data Manager Settings (향후 필요시 추가)
 # DEFAULT_OHLCV_DAYS_TO_FETCH = 365 # 기본적으로 가져올 일봉 데이터 기간 (일)
@@ -0,0 +1,209 @@
+# backtesting/data_manager/backfill.py
+
+import argparse
+import logging
+import os
+import socket
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from config.settings import (BACKFILL_DAILY_CHUNK_DAYS, BACKFILL_MINUTE_CHUNK_DAYS,
+                             BACKFILL_LEASE_SECONDS, BACKFILL_MAX_ATTEMPTS, BACKFILL_RETRY_BACKOFF_SECONDS)
+from data_manager.stock_data_manager import StockDataManager, MARKET_OPEN, MARKET_CLOSE
+
+logger = logging.getLogger(__name__)
+
+TIMEFRAMES = ('daily', 'minute')
+
+
+def make_backfill_units(stock_codes, start_date, end_date, timeframes=('daily',),
+                        daily_chunk_days: int = BACKFILL_DAILY_CHUNK_DAYS,
+                        minute_chunk_days: int = BACKFILL_MINUTE_CHUNK_DAYS) -> list:
+    """
+    백필 기간을 종목/타임프레임별 기간 청크로 나눕니다. 평일이 없는 청크(주말만 포함)는 만들지 않습니다.
+    :return: [(stock_code, timeframe, chunk_start, chunk_end), ...]
+    """
+    units = []
+    for timeframe in timeframes:
+        if timeframe not in TIMEFRAMES:
+            raise ValueError("지원하지 않는 timeframe입니다. 'daily' 또는 'minute'을 사용하세요.")
+        chunk_days = daily_chunk_days if timeframe == 'daily' else minute_chunk_days
+        chunks = []
+        chunk_start = start_date
+        while chunk_start <= end_date:
+            chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end_date)
+            if any((chunk_start + timedelta(days=i)).weekday() < 5 for i in range((chunk_end - chunk_start).days + 1)):
+                chunks.append((chunk_start, chunk_end))
+            chunk_start = chunk_end + timedelta(days=1)
+        units.extend((code, timeframe, start, end) for code in stock_codes for start, end in chunks)
+    return units
+
+
+def create_backfill_job(db_manager, job_name, stock_codes, start_date, end_date, timeframes=('daily',)) -> int:
+    """
+    백필 작업 단위를 backfill_job_unit 테이블에 등록합니다.
+    이미 등록된 단위는 상태를 유지하므로, 종목을 추가하거나 중단 후 다시 호출해도 완료한 단위를 다시 처리하지 않습니다.
+    :return: 등록 요청한 단위 수, 실패 시 None
+    """
+    units = make_backfill_units(stock_codes, start_date, end_date, timeframes)
+    if not db_manager.add_backfill_units(job_name, units):
+        logger.error(f"백필 작업 '{job_name}' 등록에 실패했습니다.")
+        return None
+    logger.info(f"백필 작업 '{job_name}' 등록: {len(stock_codes)}개 종목, {'/'.join(timeframes)}, "
+                f"{start_date}~{end_date}, {len(units)}개 단위")
+    return len(units)
+
+
+class BackfillWorker:
+    """
+    backfill_job_unit 테이블에서 (종목, 타임프레임, 기간 청크) 단위를 가져와 Creon 조회 -> DB 저장 후 완료로 기록하는 워커.
+    - 완료한 단위는 테이블에 남으므로, 프로세스가 멈추거나 HTS 연결이 끊겨도 다시 실행하면 남은 단위부터 이어서 처리합니다.
+    - 단위는 lease_seconds 동안만 점유하며, 그 안에 완료하지 못한 단위(워커 중단)는 다른 워커가 다시 가져갑니다.
+    - 실패한 단위는 retry_backoff_seconds(실패할 때마다 2배)가 지난 뒤 다시 가져갑니다. 대기 중인 단위만 남으면 종료하므로
+      다음 실행에서 이어서 처리합니다.
+    - 여러 워커(다른 PC의 Creon 계정 등)가 같은 job_name으로 실행하면 단위를 나눠 처리합니다.
+    - 저장은 ON DUPLICATE KEY UPDATE(또는 대량 적재)이므로 같은 단위를 두 번 처리해도 결과는 같습니다.
+    사용 예:
+        create_backfill_job(db_manager, 'daily-10y', stock_codes, date(2015, 1, 1), date.today())
+        summary = BackfillWorker(stock_data_manager, 'daily-10y').run()
+    """
+    def __init__(self, stock_data_manager: StockDataManager, job_name: str, worker_id: str = None,
+                 claim_size: int = 1, lease_seconds: int = BACKFILL_LEASE_SECONDS,
+                 max_attempts: int = BACKFILL_MAX_ATTEMPTS,
+                 retry_backoff_seconds: int = BACKFILL_RETRY_BACKOFF_SECONDS, interval: int = 1):
+        """
+        :param stock_data_manager: 조회(fetch_*_window)와 저장(save_*_update)에 사용할 StockDataManager
+        :param job_name: 처리할 백필 작업 이름
+        :param worker_id: 워커 이름 (기본: 호스트명-PID)
+        :param claim_size: 한 번에 가져갈 단위 수 (lease_seconds 안에 처리할 수 있을 만큼)
+        :param lease_seconds: 가져간 단위의 점유 시간 (초)
+        :param max_attempts: 실패한 단위를 다시 시도할 최대 횟수
+        :param retry_backoff_seconds: 실패한 단위를 다시 가져가기까지 기다리는 시간 (초, 실패할 때마다 2배)
+        :param interval: 분봉 주기
+        """
+        self.stock_data_manager = stock_data_manager
+        self.db_manager = stock_data_manager.db_manager
+        self.job_name = job_name
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.claim_size = claim_size
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.interval = interval
+
+    def _creon_connected(self) -> bool:
+        client = self.stock_data_manager.creon_api_client
+        cp_cybos = getattr(client, 'cp_cybos', None)
+        return bool(client.connected and (cp_cybos is None or cp_cybos.IsConnect))
+
+    def process_unit(self, unit) -> int:
+        """
+        단위 하나를 조회/저장합니다.
+        :return: 저장한 행 수
+        :raises RuntimeError: 조회 또는 저장에 실패한 경우
+        """
+        stock_code = unit['stock_code']
+        if unit['timeframe'] == 'daily':
+            # 바로 앞 거래일까지 저장되어 있으면 그 종가로 첫 행의 등락률을 계산
+            # (앞 청크가 아직 없거나 실패해 빈 구간이 있으면 첫 행은 0, repair_change_rates로 보정)
+            previous = self.db_manager.get_latest_daily_close(stock_code, before_date=unit['chunk_start'])
+            ohlcv_df = self.stock_data_manager.fetch_daily_window(
+                stock_code, unit['chunk_start'], unit['chunk_end'],
+                StockDataManager._seed_close(previous, unit['chunk_start']))
+            save = self.stock_data_manager.save_daily_update
+        else:
+            ohlcv_df = self.stock_data_manager.fetch_minute_window(
+                stock_code, datetime.combine(unit['chunk_start'], MARKET_OPEN),
+                datetime.combine(unit['chunk_end'], MARKET_CLOSE), self.interval)
+            save = self.stock_data_manager.save_minute_update
+        if ohlcv_df is None:
+            raise RuntimeError("Creon 조회 실패")
+        if not save(stock_code, ohlcv_df):
+            raise RuntimeError("DB 저장 실패")
+        return len(ohlcv_df)
+
+    def run(self, max_units: int = None) -> dict:
+        """
+        남은 단위가 없거나 Creon 연결이 끊길 때까지 단위를 가져와 처리합니다.
+        :param max_units: 처리할 최대 단위 수 (None이면 제한 없음)
+        :return: {'processed', 'done', 'failed', 'rows', 'stopped', 'elapsed_sec', 'status'} 요약
+        """
+        started = time.time()
+        summary = {'processed': 0, 'done': 0, 'failed': 0, 'rows': 0, 'stopped': None}
+        logger.info(f"백필 워커 {self.worker_id} 시작: 작업 '{self.job_name}'")
+
+        while max_units is None or summary['processed'] < max_units:
+            if not self._creon_connected():
+                summary['stopped'] = 'disconnected'
+                logger.error("Creon 연결이 끊겨 백필을 중단합니다. 다시 연결한 뒤 실행하면 이어서 처리합니다.")
+                break
+            limit = self.claim_size if max_units is None else min(self.claim_size, max_units - summary['processed'])
+            units = self.db_manager.claim_backfill_units(self.job_name, self.worker_id, limit,
+                                                         self.lease_seconds, self.max_attempts)
+            if units is None:
+                summary['stopped'] = 'db_error'
+                break
+            if not units:
+                break
+
+            for unit in units:
+                label = f"{unit['stock_code']} {unit['timeframe']} {unit['chunk_start']}~{unit['chunk_end']}"
+                try:
+                    rows = self.process_unit(unit)
+                except Exception as e:
+                    logger.error(f"백필 단위 처리 실패 ({label}, {unit['attempts']}회째): {e}")
+                    self.db_manager.finish_backfill_unit(self.job_name, unit, error=e,
+                                                         retry_backoff_seconds=self.retry_backoff_seconds)
+                    summary['failed'] += 1
+                else:
+                    self.db_manager.finish_backfill_unit(self.job_name, unit, rows_saved=rows)
+                    summary['done'] += 1
+                    summary['rows'] += rows
+                    logger.debug(f"백필 단위 완료: {label} ({rows}행)")
+                summary['processed'] += 1
+
+        summary['elapsed_sec'] = round(time.time() - started, 3)
+        summary['status'] = self.db_manager.get_backfill_status(self.job_name)
+        logger.info(f"백필 워커 {self.worker_id} 종료: 완료 {summary['done']}개, 실패 {summary['failed']}개, "
+                    f"{summary['rows']}행 ({summary['elapsed_sec']}초), 작업 상태 {summary['status']}")
+        return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='재시작 가능한 장기 백필 (backfill_job_unit 테이블 기반)')
+    parser.add_argument('--job', required=True, help='백필 작업 이름 (여러 워커가 같은 이름으로 실행하면 작업을 나눠 처리)')
+    parser.add_argument('--start', help='시작 날짜 YYYY-MM-DD (지정하면 작업 단위를 등록)')
+    parser.add_argument('--end', help='종료 날짜 YYYY-MM-DD (기본: 오늘)')
+    parser.add_argument('--timeframes', default='daily', help="'daily', 'minute' 또는 'daily,minute'")
+    parser.add_argument('--codes', help='쉼표로 구분한 종목 코드 (기본: 필터링된 전체 종목)')
+    parser.add_argument('--claim-size', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    from api_client.creon_api import CreonAPIClient
+    from db.db_manager import DBManager
+
+    db_manager = DBManager()
+    creon_api_client = CreonAPIClient()
+    stock_data_manager = StockDataManager(db_manager, creon_api_client)
+    try:
+        if args.start:
+            stock_codes = args.codes.split(',') if args.codes else creon_api_client.get_filtered_stock_list()
+            end_date = date.fromisoformat(args.end) if args.end else date.today()
+            if create_backfill_job(db_manager, args.job, stock_codes, date.fromisoformat(args.start), end_date,
+                                   tuple(args.timeframes.split(','))) is None:
+                return 1
+        summary = BackfillWorker(stock_data_manager, args.job, claim_size=args.claim_size).run()
+        return 0 if summary['stopped'] is None else 1
+    finally:
+        db_manager.close()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                        handlers=[logging.StreamHandler(sys.stdout)])
+    sys.exit(main())
@@ -0,0 +1,248 @@
+# backtesting/data_manager/ingestion_scheduler.py
+
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import date, datetime
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from config.settings import DATA_CACHE_DIR
+from data_manager.stock_data_manager import StockDataManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_DIR = os.path.join(DATA_CACHE_DIR, 'checkpoints')
+
+_STOP = object() # 저장 스레드 종료 신호
+
+
+class IngestionScheduler:
+    """
+    여러 종목의 OHLCV를 Creon API에서 가져와 DB에 저장하는 수집 스케줄러.
+
+    - Creon 요청 속도는 CreonAPIClient의 토큰 버킷(요청 한도)이 결정하며, 고정 sleep을 두지 않습니다.
+    - Creon COM 객체는 만든 스레드에서만 호출해야 하므로 조회는 호출한 스레드에서 순서대로 하고,
+      DB 저장은 별도 저장 스레드가 큐에서 꺼내 처리합니다. 다음 종목을 조회하는 동안 이전 종목이 저장됩니다.
+    - 저장이 끝난 종목은 실행별 체크포인트 파일({checkpoint_dir}/{timeframe}-{종료 날짜}.txt)에 한 줄씩 기록하며,
+      중단 후 같은 timeframe/종료 날짜로 다시 실행하면 기록된 종목을 건너뜁니다.
+      실패 없이 끝난 실행의 체크포인트는 삭제하므로, 다음 날(또는 같은 날 다시) 실행하면 모든 종목을 다시 처리합니다.
+    - run_*_incremental은 종목별 최신 시각을 한 번에 조회해 조회 구간을 정하고, 이미 최신인 종목은 Creon 요청 없이 건너뜁니다.
+    사용 예:
+        scheduler = IngestionScheduler(stock_data_manager, checkpoint_dir=DEFAULT_CHECKPOINT_DIR)
+        summary = scheduler.run_daily(stock_codes, start_date, end_date)
+        summary = scheduler.run_daily_incremental() # 전체 종목 야간 업데이트
+    """
+    def __init__(self, stock_data_manager: StockDataManager, checkpoint_dir: str = None, queue_size: int = 4,
+                 progress_interval: int = 100, progress_callback=None):
+        """
+        :param stock_data_manager: 조회(fetch_*_update)와 저장(save_*_update)에 사용할 StockDataManager
+        :param checkpoint_dir: 실행별 완료 종목 파일을 둘 디렉토리. None이면 체크포인트를 쓰지 않습니다.
+        :param queue_size: 저장 대기 큐 크기. 저장이 밀리면 조회가 이 개수만큼 앞서 나간 뒤 기다립니다.
+        :param progress_interval: 몇 종목마다 진행률/예상 남은 시간을 로그로 남길지
+        :param progress_callback: 종목 조회가 끝날 때마다 progress 딕셔너리
+                                  ({'label', 'done', 'total', 'elapsed_sec', 'codes_per_sec', 'eta_sec'})로 호출할 함수
+        """
+        self.stock_data_manager = stock_data_manager
+        self.checkpoint_dir = checkpoint_dir
+        self.queue_size = queue_size
+        self.progress_interval = progress_interval
+        self.progress_callback = progress_callback
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def checkpoint_name(timeframe: str, end) -> str:
+        """실행별 체크포인트 이름. (예: 'daily-2024-01-03', 'minute1-2024-01-03')"""
+        end = end.date() if isinstance(end, datetime) else end
+        return f"{timeframe}-{end.isoformat()}"
+
+    def checkpoint_path(self, name: str):
+        """체크포인트 이름의 파일 경로. checkpoint_dir가 없으면 None"""
+        return os.path.join(self.checkpoint_dir, f"{name}.txt") if self.checkpoint_dir else None
+
+    def load_checkpoint(self, name: str) -> set:
+        """체크포인트 파일에서 이미 저장을 마친 종목 코드 집합을 읽습니다."""
+        path = self.checkpoint_path(name)
+        if not path or not os.path.exists(path):
+            return set()
+        with open(path, 'r', encoding='utf-8') as f:
+            return {line.strip() for line in f if line.strip()}
+
+    def clear_checkpoint(self, name: str):
+        """체크포인트 파일을 삭제하여 다음 실행이 처음부터 시작하도록 합니다."""
+        path = self.checkpoint_path(name)
+        if path and os.path.exists(path):
+            os.remove(path)
+            logger.info(f"체크포인트 삭제: {path}")
+
+    def _mark_done(self, path: str, stock_code: str):
+        if not path:
+            return
+        with self._lock:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(f"{stock_code}\n")
+                f.flush()
+
+    def run_daily(self, stock_codes, start_date=None, end_date=None) -> dict:
+        """
+        종목 목록의 일봉을 업데이트합니다. (StockDataManager.update_daily_ohlcv의 파이프라인 버전)
+        :return: 요약 dict (total, skipped, saved, failed, failed_codes, elapsed_sec)
+        """
+        return self._run(
+            stock_codes,
+            fetch=lambda code: self.stock_data_manager.fetch_daily_update(code, start_date, end_date),
+            save=self.stock_data_manager.save_daily_update,
+            label='일봉',
+            checkpoint=self.checkpoint_name('daily', end_date or date.today())
+        )
+
+    def run_minute(self, stock_codes, start_datetime=None, end_datetime=None, interval=1) -> dict:
+        """
+        종목 목록의 분봉을 업데이트합니다. (StockDataManager.update_minute_ohlcv의 파이프라인 버전)
+        :return: 요약 dict (total, skipped, saved, failed, failed_codes, elapsed_sec)
+        """
+        return self._run(
+            stock_codes,
+            fetch=lambda code: self.stock_data_manager.fetch_minute_update(code, start_datetime, end_datetime, interval),
+            save=self.stock_data_manager.save_minute_update,
+            label=f'{interval}분봉',
+            checkpoint=self.checkpoint_name(f'minute{interval}', end_datetime or datetime.now())
+        )
+
+    def run_daily_incremental(self, stock_codes=None, start_date=None, end_date=None) -> dict:
+        """
+        종목 전체의 일봉을 증분 업데이트합니다.
+        StockDataManager.plan_daily_update로 종목별 최신 날짜를 쿼리 한 번에 조회해 조회 구간을 정하고,
+        조회가 필요한 종목만 Creon에 요청합니다. (종목마다 MAX(date)를 조회하는 run_daily와 달리 DB 조회가 한 번)
+        :param stock_codes: 종목 코드 리스트. None이면 CreonAPIClient.get_filtered_stock_list()
+        :return: run_daily 요약 + current(이미 최신이라 요청하지 않은 종목 수), DB 조회 실패 시 None
+        """
+        if stock_codes is None:
+            stock_codes = self.stock_data_manager.creon_api_client.get_filtered_stock_list()
+        plan = self.stock_data_manager.plan_daily_update(stock_codes, start_date, end_date)
+        if plan is None:
+            return None
+        windows = {item['stock_code']: item for item in plan}
+        summary = self._run(
+            list(windows),
+            fetch=lambda code: self.stock_data_manager.fetch_daily_window(
+                code, windows[code]['fetch_start'], windows[code]['fetch_end'], windows[code]['prev_close']),
+            save=self.stock_data_manager.save_daily_update,
+            label='일봉',
+            checkpoint=self.checkpoint_name('daily', end_date or date.today())
+        )
+        summary['total'] = len(stock_codes)
+        summary['current'] = len(stock_codes) - len(plan)
+        return summary
+
+    def run_minute_incremental(self, stock_codes=None, start_datetime=None, end_datetime=None, interval=1) -> dict:
+        """
+        종목 전체의 분봉을 증분 업데이트합니다. (run_daily_incremental의 분봉 버전)
+        :return: run_minute 요약 + current(이미 최신이라 요청하지 않은 종목 수), DB 조회 실패 시 None
+        """
+        if stock_codes is None:
+            stock_codes = self.stock_data_manager.creon_api_client.get_filtered_stock_list()
+        plan = self.stock_data_manager.plan_minute_update(stock_codes, start_datetime, end_datetime, interval)
+        if plan is None:
+            return None
+        windows = {item['stock_code']: item for item in plan}
+        summary = self._run(
+            list(windows),
+            fetch=lambda code: self.stock_data_manager.fetch_minute_window(
+                code, windows[code]['fetch_start'], windows[code]['fetch_end'], interval),
+            save=self.stock_data_manager.save_minute_update,
+            label=f'{interval}분봉',
+            checkpoint=self.checkpoint_name(f'minute{interval}', end_datetime or datetime.now())
+        )
+        summary['total'] = len(stock_codes)
+        summary['current'] = len(stock_codes) - len(plan)
+        return summary
+
+    def _report_progress(self, label, done, total, started):
+        """조회 진행률과 지금까지의 속도로 계산한 예상 남은 시간을 콜백에 전달하고, progress_interval마다 로그로 남깁니다."""
+        elapsed = time.time() - started
+        rate = done / elapsed if elapsed > 0 else None
+        progress = {
+            'label': label, 'done': done, 'total': total, 'elapsed_sec': round(elapsed, 3),
+            'codes_per_sec': round(rate, 3) if rate else None,
+            'eta_sec': round((total - done) / rate, 1) if rate else None,
+        }
+        if self.progress_callback is not None:
+            self.progress_callback(progress)
+        if done == total or (self.progress_interval and done % self.progress_interval == 0):
+            eta = f"{progress['eta_sec']:.0f}초" if progress['eta_sec'] is not None else '-'
+            logger.info(f"{label} 수집 진행: {done}/{total} 종목 조회 ({done / total:.0%}), "
+                        f"{progress['codes_per_sec']} 종목/초, 남은 시간 약 {eta}")
+        return progress
+
+    def _run(self, stock_codes, fetch, save, label, checkpoint) -> dict:
+        """
+        :param checkpoint: 체크포인트 이름 (checkpoint_name). 같은 이름의 이전 실행에서 저장을 마친 종목은 건너뜁니다.
+        """
+        started = time.time()
+        done = self.load_checkpoint(checkpoint)
+        checkpoint_path = self.checkpoint_path(checkpoint)
+        if checkpoint_path:
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+        pending = [code for code in stock_codes if code not in done]
+        skipped = len(stock_codes) - len(pending)
+        if skipped:
+            logger.info(f"체크포인트에서 {skipped}개 종목을 건너뜁니다.")
+        logger.info(f"{label} 수집 시작: {len(pending)}개 종목")
+
+        summary = {'total': len(stock_codes), 'skipped': skipped, 'saved': 0, 'failed': 0, 'failed_codes': []}
+        save_queue = queue.Queue(maxsize=self.queue_size)
+        writer = threading.Thread(target=self._writer_loop, args=(save_queue, save, summary, checkpoint_path),
+                                  name='ingestion-writer', daemon=True)
+        writer.start()
+
+        try:
+            for i, stock_code in enumerate(pending, 1):
+                try:
+                    ohlcv_df = fetch(stock_code)
+                except Exception as e:
+                    logger.error(f"{stock_code} {label} 조회 중 오류 발생: {e}", exc_info=True)
+                    ohlcv_df = None
+                if ohlcv_df is None:
+                    self._record_failure(summary, stock_code)
+                else:
+                    save_queue.put((stock_code, ohlcv_df)) # 큐가 가득 차면 저장 스레드가 따라올 때까지 대기
+                self._report_progress(label, i, len(pending), started)
+        finally:
+            save_queue.put(_STOP)
+            writer.join()
+
+        if summary['failed'] == 0:
+            self.clear_checkpoint(checkpoint) # 모두 끝난 실행은 다음 실행에서 건너뛰지 않도록 삭제
+        summary['elapsed_sec'] = round(time.time() - started, 3)
+        logger.info(f"{label} 수집 완료: 저장 {summary['saved']}개, 실패 {summary['failed']}개, "
+                    f"건너뜀 {summary['skipped']}개 ({summary['elapsed_sec']}초)")
+        return summary
+
+    def _writer_loop(self, save_queue, save, summary, checkpoint_path):
+        """저장 스레드: 큐에서 조회 결과를 꺼내 DB에 저장하고 체크포인트를 기록합니다."""
+        while True:
+            item = save_queue.get()
+            if item is _STOP:
+                return
+            stock_code, ohlcv_df = item
+            try:
+                ok = save(stock_code, ohlcv_df)
+            except Exception as e:
+                logger.error(f"{stock_code} DB 저장 중 오류 발생: {e}", exc_info=True)
+                ok = False
+            if ok:
+                self._mark_done(checkpoint_path, stock_code)
+                with self._lock:
+                    summary['saved'] += 1
+            else:
+                self._record_failure(summary, stock_code)
+
+    def _record_failure(self, summary, stock_code):
+        with self._lock:
+            summary['failed'] += 1
+            summary['failed_codes'].append(stock_code)
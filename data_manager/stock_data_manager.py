@@ -2,7 +2,7 @@
 
 import logging
 import pandas as pd
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta, date, time
 import os
 import sys
 
@@ -12,17 +12,86 @@ sys.path.insert(0, project_root)
 
 from db.db_manager import DBManager
 from api_client.creon_api import CreonAPIClient
+from feeds.parquet_cache import ParquetCache
+from feeds.numpy_mmap_data import invalidate_mmap
+from config.settings import BULK_FETCH_CHUNK_SIZE
 # from config.settings import DEFAULT_OHLCV_DAYS_TO_FETCH # 향후 사용될 수 있음
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+MARKET_OPEN = time(9, 0) # 정규장 시작 (분봉 증분 조회 시작 시각)
+MARKET_CLOSE = time(15, 30) # 정규장 마감 (이후 시각은 다음 거래일부터 조회)
+
+
+def _next_weekday(day: date) -> date:
+    """주말이면 다음 월요일, 아니면 그대로 반환합니다."""
+    while day.weekday() >= 5:
+        day += timedelta(days=1)
+    return day
+
+
+def _change_rates(close: pd.Series, prev_close=None) -> pd.Series:
+    """
+    종가 시계열(날짜 오름차순)의 전일 대비 등락률(%, 소수 둘째 자리).
+    :param prev_close: 첫 행의 전일 종가 (DB에 저장된 마지막 종가). 없으면 첫 행의 등락률은 0
+    """
+    prev = close.shift(1)
+    if prev_close is not None and len(prev):
+        prev.iloc[0] = prev_close
+    return ((close - prev) / prev * 100).round(2).fillna(0.0)
+
 class StockDataManager:
-    def __init__(self, db_manager: DBManager, creon_api_client: CreonAPIClient):
+    def __init__(self, db_manager: DBManager, creon_api_client: CreonAPIClient, cache: ParquetCache = None,
+                 bulk_load: bool = False, use_cache: bool = True):
+        """
+        :param db_manager: DBManager 인스턴스
+        :param creon_api_client: CreonAPIClient 인스턴스
+        :param cache: DBDataLoader가 사용하는 ParquetCache. DB에 저장한 구간의 캐시를 무효화합니다.
+                      None이면 Backtester와 같은 기본 캐시 디렉토리의 ParquetCache를 사용합니다. (pyarrow가 없으면 캐시 없음)
+        :param bulk_load: True이면 OHLCV를 LOAD DATA LOCAL INFILE 대량 적재로 저장합니다. (장기 백필용)
+        :param use_cache: False이면 캐시를 무효화하지 않습니다. (Backtester(use_cache=False)로만 백테스팅할 때)
+        """
         self.db_manager = db_manager
         self.creon_api_client = creon_api_client
+        # 백테스터는 기본으로 ParquetCache를 읽으므로, 수집 쪽도 기본으로 같은 캐시를 무효화해야
+        # 장중에 캐시된 미완성 바가 야간 업데이트 이후에도 남지 않습니다.
+        if cache is None and use_cache:
+            try:
+                cache = ParquetCache()
+            except ImportError as e:
+                logger.warning(f"로컬 캐시 없이 진행합니다. 캐시 무효화를 건너뜁니다: {e}")
+        self.cache = cache
+        self.bulk_load = bulk_load
         logger.info("StockDataManager 초기화 완료.")
 
+    def _invalidate_cache(self, stock_code, timeframe, since):
+        """DB에 저장한 구간(since 이후)의 로컬 캐시와 메모리 맵 파일을 무효화합니다."""
+        invalidate_mmap(stock_code, timeframe)
+        if self.cache is None:
+            return
+        try:
+            self.cache.invalidate(stock_code, timeframe, since=since)
+        except Exception as e:
+            logger.warning(f"{stock_code} ({timeframe}) 캐시 무효화 실패: {e}")
+
+    def _bulk_save(self, stock_code, timeframe, ohlcv_df):
+        """OHLCV DataFrame을 DBManager의 대량 적재 경로로 저장하고 캐시를 무효화합니다."""
+        if timeframe == 'daily':
+            saved = self.db_manager.bulk_load_daily_data(ohlcv_df)
+            since = ohlcv_df['date'].min()
+        else:
+            saved = self.db_manager.bulk_load_minute_data(ohlcv_df)
+            since = ohlcv_df['datetime'].min()
+
+        label = '일봉' if timeframe == 'daily' else '분봉'
+        if saved:
+            self._invalidate_cache(stock_code, timeframe, since)
+            logger.info(f"{stock_code} {label} 데이터 {len(ohlcv_df)}개를 대량 적재로 DB에 업데이트했습니다.")
+        else:
+            logger.error(f"{stock_code} {label} 데이터 대량 적재에 실패했습니다.")
+        return saved
+
     def update_all_stock_info(self):
         """
         Creon API에서 모든 종목 정보를 가져와 DB의 stock_info 테이블에 저장/업데이트합니다.
@@ -38,7 +107,7 @@ class StockDataManager:
             stock_info_list = []
             for code in filtered_codes:
                 name = self.creon_api_client.get_stock_name(code)
-                market_type = 'KOSPI' if code in self.creon_api_client.cp_code_mgr.GetStockListByMarket(1) else 'KOSDAQ'
+                market_type = self.creon_api_client.get_market_type(code) # 종목 마스터 조회 (COM 호출 없음)
 
                 stock_info_list.append({
                     'stock_code': code,
@@ -73,17 +142,53 @@ class StockDataManager:
         :param start_date: 조회 시작 날짜 (datetime.date 객체). None이면 DB 최신 날짜 + 1일 부터 조회.
         :param end_date: 조회 종료 날짜 (datetime.date 객체). None이면 오늘 날짜까지 조회.
         """
+        ohlcv_df = self.fetch_daily_update(stock_code, start_date, end_date)
+        if ohlcv_df is None:
+            return False
+        return self.save_daily_update(stock_code, ohlcv_df)
+
+    def fetch_daily_update(self, stock_code, start_date=None, end_date=None):
+        """
+        update_daily_ohlcv의 조회 단계: DB에 저장할 일봉 데이터를 Creon API에서 가져와 등락률까지 계산합니다.
+        조회(Creon)와 저장(DB)을 다른 스레드에서 처리할 때 save_daily_update와 나누어 호출합니다.
+        :return: 저장할 일봉 DataFrame (업데이트할 데이터가 없으면 빈 DataFrame, 실패 시 None)
+        """
         logger.info(f"{stock_code} 일봉 데이터 업데이트를 시작합니다.")
 
         if not self.creon_api_client.connected:
             logger.error("Creon API가 연결되어 있지 않아 일봉 데이터를 가져올 수 없습니다.")
-            return False
+            return None
 
         if not end_date:
             end_date = date.today()
 
-        db_latest_date = self.db_manager.get_latest_daily_data_date(stock_code)
+        # 마지막 저장 날짜와 그 날의 종가를 함께 조회 (첫 행의 등락률 계산에 사용)
+        latest = self.db_manager.get_latest_daily_close(stock_code)
+        db_latest_date = latest[0] if latest else None
+        fetch_start_date = self._daily_fetch_start(db_latest_date, start_date, end_date)
+        if fetch_start_date is None:
+            logger.info(f"{stock_code} 일봉 데이터는 최신 상태입니다. 업데이트할 데이터가 없습니다.")
+            return pd.DataFrame()
+        return self.fetch_daily_window(stock_code, fetch_start_date, end_date, self._seed_close(latest, start_date))
 
+    @staticmethod
+    def _seed_close(latest, start_date):
+        """
+        증분 조회의 첫 행 등락률 계산에 쓸 DB 마지막 종가.
+        조회가 DB 마지막 날짜 다음 거래일(평일)부터 이어질 때만 사용합니다. (start_date로 평일을 건너뛰면 None)
+        금요일까지 저장된 종목을 월요일 start_date로 조회하는 경우처럼 주말만 건너뛰면 그대로 사용합니다.
+        :param latest: (마지막 날짜, 종가) 또는 None
+        """
+        if not latest or (start_date and start_date > _next_weekday(latest[0] + timedelta(days=1))):
+            return None
+        return latest[1]
+
+    @staticmethod
+    def _daily_fetch_start(db_latest_date, start_date, end_date):
+        """
+        일봉 증분 조회 시작 날짜를 정합니다.
+        :return: 조회 시작 날짜, 이미 최신이면(조회할 평일이 없으면) None
+        """
         fetch_start_date = start_date
         if db_latest_date:
             # DB에 이미 데이터가 있다면, 최신 날짜 다음 날부터 가져옵니다.
@@ -95,10 +200,16 @@ class StockDataManager:
             # DB에 데이터가 없고, 시작 날짜도 지정되지 않았다면, 5년 전부터 가져옵니다.
             fetch_start_date = end_date - timedelta(days=365 * 5) # 기본 5년치
 
-        if fetch_start_date > end_date:
-            logger.info(f"{stock_code} 일봉 데이터는 최신 상태입니다. 업데이트할 데이터가 없습니다.")
-            return True
+        fetch_start_date = _next_weekday(fetch_start_date) # 주말에는 일봉이 없으므로 다음 평일부터
+        return fetch_start_date if fetch_start_date <= end_date else None
 
+    def fetch_daily_window(self, stock_code, fetch_start_date, end_date, prev_close=None):
+        """
+        fetch_daily_update의 Creon 조회 부분: 정해진 구간의 일봉을 가져와 등락률까지 계산합니다.
+        (plan_daily_update로 조회 구간을 미리 정한 경우 DB 조회 없이 바로 호출합니다)
+        :param prev_close: fetch_start_date 직전 거래일의 종가 (DB 마지막 종가). 없으면 첫 행의 등락률은 0
+        :return: 저장할 일봉 DataFrame (조회된 데이터가 없으면 빈 DataFrame)
+        """
         start_date_str = fetch_start_date.strftime('%Y%m%d')
         end_date_str = end_date.strftime('%Y%m%d')
 
@@ -106,17 +217,23 @@ class StockDataManager:
 
         if ohlcv_df.empty:
             logger.info(f"{stock_code} 기간 {start_date_str}~{end_date_str} 동안 Creon API에서 조회된 일봉 데이터가 없습니다.")
-            return True
+            return ohlcv_df
 
-        # 등락률(change_rate) 계산
-        # DB에서 이전 종가를 가져와서 계산하거나, 조회된 데이터프레임 내에서 계산
+        # 등락률(change_rate) 계산: 첫 행은 DB에 저장된 직전 종가(prev_close) 기준, 없으면 0
         ohlcv_df = ohlcv_df.sort_values(by='date', ascending=True).reset_index(drop=True)
-        # 첫 데이터의 이전 종가는 DB에서 가져와야 하지만, 현재는 DataFrame 내에서만 처리
-        # 만약 fetch_start_date가 DB의 첫 데이터가 아니라면, 이전 데이터의 종가를 가져와야 정확한 등락률 계산 가능
-        # 복잡도를 위해 여기서는 조회된 DataFrame 내에서만 계산하고, 첫 행의 등락률은 0으로 처리합니다.
-        ohlcv_df['prev_close_price'] = ohlcv_df['close_price'].shift(1)
-        ohlcv_df['change_rate'] = ((ohlcv_df['close_price'] - ohlcv_df['prev_close_price']) / ohlcv_df['prev_close_price'] * 100).round(2)
-        ohlcv_df.loc[0, 'change_rate'] = 0.0 # 첫 데이터의 등락률은 0으로 설정
+        ohlcv_df['change_rate'] = _change_rates(ohlcv_df['close_price'], prev_close)
+        return ohlcv_df
+
+    def save_daily_update(self, stock_code, ohlcv_df):
+        """
+        update_daily_ohlcv의 저장 단계: fetch_daily_update가 반환한 일봉 데이터를 DB에 저장하고 캐시를 무효화합니다.
+        :return: 성공 여부 (저장할 데이터가 없으면 True)
+        """
+        if ohlcv_df.empty:
+            return True
+
+        if self.bulk_load:
+            return self._bulk_save(stock_code, 'daily', ohlcv_df)
 
         # 필요한 컬럼만 선택하여 DB에 저장할 형태로 변환
         save_data = ohlcv_df[['stock_code', 'date', 'open_price', 'high_price',
@@ -124,6 +241,7 @@ class StockDataManager:
 
         if save_data:
             if self.db_manager.save_daily_data(save_data):
+                self._invalidate_cache(stock_code, 'daily', ohlcv_df['date'].min())
                 logger.info(f"{stock_code} 일봉 데이터 {len(save_data)}개를 성공적으로 DB에 업데이트했습니다.")
                 return True
             else:
@@ -133,6 +251,73 @@ class StockDataManager:
             logger.info(f"{stock_code} 업데이트할 새로운 일봉 데이터가 없습니다.")
             return True
 
+    def plan_daily_update(self, stock_codes, start_date=None, end_date=None):
+        """
+        여러 종목의 일봉 증분 업데이트 계획을 세웁니다.
+        종목별 DB 최신 날짜를 get_latest_daily_data_dates 한 번으로 조회하고, 이미 최신인 종목은 계획에서 뺍니다.
+        :param stock_codes: 종목 코드 리스트
+        :param start_date: 조회 시작 날짜 (fetch_daily_update와 같은 의미)
+        :param end_date: 조회 종료 날짜. None이면 오늘
+        :return: [{'stock_code', 'latest', 'prev_close', 'fetch_start', 'fetch_end'}, ...] (조회가 필요한 종목만),
+                 DB 조회 실패 시 None
+        """
+        end_date = end_date or date.today()
+        # 종목별 마지막 날짜와 그 날의 종가를 함께 조회 (첫 행의 등락률 계산에 사용)
+        latest_closes = self.db_manager.get_latest_daily_closes(stock_codes)
+        if latest_closes is None:
+            logger.error("종목별 최신 일봉 날짜를 조회하지 못해 업데이트 계획을 세울 수 없습니다.")
+            return None
+
+        plan = []
+        for stock_code in stock_codes:
+            latest = latest_closes.get(stock_code)
+            fetch_start = self._daily_fetch_start(latest[0] if latest else None, start_date, end_date)
+            if fetch_start is not None:
+                plan.append({'stock_code': stock_code, 'latest': latest[0] if latest else None,
+                             'prev_close': self._seed_close(latest, start_date),
+                             'fetch_start': fetch_start, 'fetch_end': end_date})
+        logger.info(f"일봉 업데이트 계획: {len(stock_codes)}개 종목 중 {len(plan)}개 조회, "
+                    f"{len(stock_codes) - len(plan)}개는 최신 상태")
+        return plan
+
+    def repair_change_rates(self, stock_codes=None, batch_size: int = BULK_FETCH_CHUNK_SIZE):
+        """
+        DB에 저장된 일봉 전체의 등락률(change_rate)을 종가로 다시 계산하고, 값이 다른 행만 갱신합니다.
+        (이전 버전의 증분 업데이트가 첫 행을 0으로 저장한 값 등을 바로잡습니다)
+        batch_size개 종목씩 한 번에 조회해 종목별 전일 종가(groupby shift)로 벡터 연산하며, 종목당 DB 조회는 없습니다.
+        :param stock_codes: 종목 코드 리스트. None이면 DB에 일봉이 있는 전체 종목
+        :param batch_size: 한 번에 조회/계산할 종목 수
+        :return: {'codes': 처리 종목 수, 'rows': 검사한 행 수, 'updated': 갱신한 행 수}, DB 조회 실패 시 None
+        """
+        if stock_codes is None:
+            latest_dates = self.db_manager.get_latest_daily_data_dates()
+            if latest_dates is None:
+                return None
+            stock_codes = sorted(latest_dates)
+        summary = {'codes': len(stock_codes), 'rows': 0, 'updated': 0}
+        logger.info(f"{len(stock_codes)}개 종목 일봉 등락률 재계산을 시작합니다.")
+
+        for i in range(0, len(stock_codes), batch_size):
+            df = self.db_manager.fetch_daily_data_bulk(stock_codes[i:i + batch_size])
+            if df.empty:
+                continue
+            df = df.sort_values(['stock_code', 'date'], kind='stable').reset_index(drop=True)
+            close = pd.to_numeric(df['close_price'], errors='coerce').astype(float)
+            prev = close.groupby(df['stock_code']).shift(1)
+            rates = ((close - prev) / prev * 100).round(2).fillna(0.0) # 종목의 첫 행은 0
+            stored = pd.to_numeric(df['change_rate'], errors='coerce').astype(float)
+            changed = stored.isna() | ((stored - rates).abs() > 0.005)
+
+            rows = list(zip(df.loc[changed, 'stock_code'], df.loc[changed, 'date'], rates[changed].tolist()))
+            if rows and not self.db_manager.update_daily_change_rates(rows):
+                logger.error(f"일봉 등락률 갱신 실패 ({stock_codes[i]} 외 {len(stock_codes[i:i + batch_size]) - 1}종목)")
+                continue
+            summary['rows'] += len(df)
+            summary['updated'] += len(rows)
+
+        logger.info(f"일봉 등락률 재계산 완료: {summary['rows']}행 중 {summary['updated']}행 갱신")
+        return summary
+
     def update_minute_ohlcv(self, stock_code, start_datetime=None, end_datetime=None, interval=1):
         """
         특정 종목의 분봉 데이터를 Creon API에서 가져와 DB에 저장/업데이트합니다.
@@ -142,17 +327,38 @@ class StockDataManager:
         :param end_datetime: 조회 종료 시각 (datetime.datetime 객체). None이면 현재 시각까지 조회.
         :param interval: 분봉 주기 (기본 1분)
         """
+        ohlcv_df = self.fetch_minute_update(stock_code, start_datetime, end_datetime, interval)
+        if ohlcv_df is None:
+            return False
+        return self.save_minute_update(stock_code, ohlcv_df)
+
+    def fetch_minute_update(self, stock_code, start_datetime=None, end_datetime=None, interval=1):
+        """
+        update_minute_ohlcv의 조회 단계: DB에 저장할 분봉 데이터를 Creon API에서 가져옵니다.
+        :return: 저장할 분봉 DataFrame (업데이트할 데이터가 없으면 빈 DataFrame, 실패 시 None)
+        """
         logger.info(f"{stock_code} {interval}분봉 데이터 업데이트를 시작합니다.")
 
         if not self.creon_api_client.connected:
             logger.error("Creon API가 연결되어 있지 않아 분봉 데이터를 가져올 수 없습니다.")
-            return False
+            return None
 
         if not end_datetime:
             end_datetime = datetime.now()
 
         db_latest_datetime = self.db_manager.get_latest_minute_data_datetime(stock_code)
+        fetch_start_datetime = self._minute_fetch_start(db_latest_datetime, start_datetime, end_datetime, interval)
+        if fetch_start_datetime is None:
+            logger.info(f"{stock_code} 분봉 데이터는 최신 상태입니다. 업데이트할 데이터가 없습니다.")
+            return pd.DataFrame()
+        return self.fetch_minute_window(stock_code, fetch_start_datetime, end_datetime, interval)
 
+    @staticmethod
+    def _minute_fetch_start(db_latest_datetime, start_datetime, end_datetime, interval=1):
+        """
+        분봉 증분 조회 시작 시각을 정합니다. 장 마감 이후나 주말이면 다음 평일 장 시작부터 조회합니다.
+        :return: 조회 시작 시각, 이미 최신이면 None
+        """
         fetch_start_datetime = start_datetime
         if db_latest_datetime:
             # DB에 이미 데이터가 있다면, 최신 시각 다음 분부터 가져옵니다.
@@ -164,10 +370,19 @@ class StockDataManager:
             # DB에 데이터가 없고, 시작 시각도 지정되지 않았다면, 최근 7일치만 가져옵니다.
             fetch_start_datetime = end_datetime - timedelta(days=7) # 기본 7일치
 
-        if fetch_start_datetime > end_datetime:
-            logger.info(f"{stock_code} 분봉 데이터는 최신 상태입니다. 업데이트할 데이터가 없습니다.")
-            return True
+        if fetch_start_datetime.time() > MARKET_CLOSE:
+            fetch_start_datetime = datetime.combine(fetch_start_datetime.date() + timedelta(days=1), MARKET_OPEN)
+        trading_day = _next_weekday(fetch_start_datetime.date())
+        if trading_day != fetch_start_datetime.date():
+            fetch_start_datetime = datetime.combine(trading_day, MARKET_OPEN)
+        return fetch_start_datetime if fetch_start_datetime <= end_datetime else None
 
+    def fetch_minute_window(self, stock_code, fetch_start_datetime, end_datetime, interval=1):
+        """
+        fetch_minute_update의 Creon 조회 부분: 정해진 구간의 분봉을 가져옵니다.
+        (plan_minute_update로 조회 구간을 미리 정한 경우 DB 조회 없이 바로 호출합니다)
+        :return: 저장할 분봉 DataFrame (조회된 데이터가 없으면 빈 DataFrame)
+        """
         start_date_str = fetch_start_datetime.strftime('%Y%m%d')
         end_date_str = end_datetime.strftime('%Y%m%d')
 
@@ -175,14 +390,48 @@ class StockDataManager:
 
         if ohlcv_df.empty:
             logger.info(f"{stock_code} 기간 {start_date_str}~{end_date_str} 동안 Creon API에서 조회된 분봉 데이터가 없습니다.")
+        return ohlcv_df
+
+    def plan_minute_update(self, stock_codes, start_datetime=None, end_datetime=None, interval=1):
+        """
+        여러 종목의 분봉 증분 업데이트 계획을 세웁니다. (plan_daily_update의 분봉 버전)
+        :return: [{'stock_code', 'latest', 'fetch_start', 'fetch_end'}, ...] (조회가 필요한 종목만), DB 조회 실패 시 None
+        """
+        end_datetime = end_datetime or datetime.now()
+        latest_datetimes = self.db_manager.get_latest_minute_data_datetimes(stock_codes)
+        if latest_datetimes is None:
+            logger.error("종목별 최신 분봉 시각을 조회하지 못해 업데이트 계획을 세울 수 없습니다.")
+            return None
+
+        plan = []
+        for stock_code in stock_codes:
+            latest = latest_datetimes.get(stock_code)
+            fetch_start = self._minute_fetch_start(latest, start_datetime, end_datetime, interval)
+            if fetch_start is not None:
+                plan.append({'stock_code': stock_code, 'latest': latest, 'fetch_start': fetch_start,
+                             'fetch_end': end_datetime})
+        logger.info(f"분봉 업데이트 계획: {len(stock_codes)}개 종목 중 {len(plan)}개 조회, "
+                    f"{len(stock_codes) - len(plan)}개는 최신 상태")
+        return plan
+
+    def save_minute_update(self, stock_code, ohlcv_df):
+        """
+        update_minute_ohlcv의 저장 단계: fetch_minute_update가 반환한 분봉 데이터를 DB에 저장하고 캐시를 무효화합니다.
+        :return: 성공 여부 (저장할 데이터가 없으면 True)
+        """
+        if ohlcv_df.empty:
             return True
 
+        if self.bulk_load:
+            return self._bulk_save(stock_code, 'minute', ohlcv_df)
+
         # 필요한 컬럼만 선택하여 DB에 저장할 형태로 변환
         save_data = ohlcv_df[['stock_code', 'datetime', 'open_price', 'high_price',
                               'low_price', 'close_price', 'volume']].to_dict(orient='records')
 
         if save_data:
             if self.db_manager.save_minute_data(save_data):
+                self._invalidate_cache(stock_code, 'minute', ohlcv_df['datetime'].min())
                 logger.info(f"{stock_code} 분봉 데이터 {len(save_data)}개를 성공적으로 DB에 업데이트했습니다.")
                 return True
             else:
@@ -224,4 +473,45 @@ class StockDataManager:
 
         except Exception as e:
             logger.error(f"stock_info 재무 데이터 업데이트 중 오류 발생: {e}", exc_info=True)
-        logger.info(f"{stock_code} 재무 데이터 업데이트 완료.")
\ No newline at end of file
+        logger.info(f"{stock_code} 재무 데이터 업데이트 완료.")
+
+    def update_financial_data_for_universe(self, stock_codes=None):
+        """
+        여러 종목의 최신 재무 데이터를 MarketEye 배치 요청(요청 1회당 최대 200종목)으로 가져와
+        stock_info 테이블에 한 번의 save_stock_info 호출로 업데이트합니다.
+        update_financial_data_for_stock_info를 종목마다 호출하는 것과 같은 값(백만 원 단위)을 저장하며,
+        저장된 시장 구분/업종(market_type, sector)은 유지합니다.
+        :param stock_codes: 종목 코드 리스트. None이면 get_filtered_stock_list()의 전체 종목
+        :return: {'requested': 요청 종목 수, 'fetched': 조회된 종목 수, 'saved': 저장 성공 여부}
+        """
+        if stock_codes is None:
+            stock_codes = self.creon_api_client.get_filtered_stock_list()
+        summary = {'requested': len(stock_codes), 'fetched': 0, 'saved': False}
+        logger.info(f"{len(stock_codes)}개 종목 stock_info 테이블의 최신 재무 데이터 일괄 업데이트 중...")
+
+        try:
+            finance_df = self.creon_api_client.get_latest_financial_data_batch(stock_codes)
+            summary['fetched'] = len(finance_df)
+            if finance_df.empty:
+                logger.info("Creon API에서 조회된 재무 데이터가 없습니다.")
+                return summary
+
+            # update_financial_data_for_stock_info와 같은 단위 변환 (영업이익/당기순이익: 원 -> 백만 원)
+            finance_df['operating_profit'] = finance_df['operating_profit'] / 1_000_000
+            finance_df['net_profit'] = finance_df['net_profit'] / 1_000_000
+
+            # save_stock_info는 모든 컬럼을 덮어쓰므로, 이미 저장된 시장 구분/업종을 한 번에 조회해 채워 넣습니다.
+            existing = self.db_manager.fetch_stock_info(finance_df['stock_code'].tolist())
+            if existing is not None and not existing.empty:
+                keep = existing.set_index('stock_code')[['market_type', 'sector']]
+                finance_df = finance_df.join(keep, on='stock_code')
+
+            records = finance_df.astype(object).where(finance_df.notna(), None).to_dict(orient='records')
+            summary['saved'] = bool(self.db_manager.save_stock_info(records))
+            if summary['saved']:
+                logger.info(f"{len(records)}개 종목 stock_info 테이블의 최신 재무 데이터가 성공적으로 업데이트되었습니다.")
+            else:
+                logger.error("stock_info 재무 데이터 일괄 저장에 실패했습니다.")
+        except Exception as e:
+            logger.error(f"stock_info 재무 데이터 일괄 업데이트 중 오류 발생: {e}", exc_info=True)
+        return summary
\ No newline at end of file
@@ -0,0 +1,129 @@
+# backtesting/db/connection_pool.py
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(Exception):
+    """풀의 모든 연결이 사용 중이고, 대기 시간 안에 반환되지 않았을 때 발생합니다."""
+
+
+class ConnectionPool:
+    """
+    크기가 제한된 DB 연결 풀.
+    - 동시에 열 수 있는 연결 수를 max_size로 제한합니다. (초과 요청은 반환될 때까지 대기)
+    - 대여 시 연결 상태를 확인하고, 오래 쉬었던 연결은 ping으로 검사한 뒤 끊어졌으면 새로 만듭니다.
+    - fork된 자식 프로세스에서는 부모의 소켓을 공유하지 않도록 풀을 비우고 새로 시작합니다.
+    """
+    def __init__(self, connect_func, max_size: int = 5, timeout: float = 30.0, health_check_interval: float = 30.0):
+        """
+        :param connect_func: 새 연결 객체를 생성하는 함수 (예: pymysql.connect를 감싼 함수)
+        :param max_size: 최대 연결 수
+        :param timeout: 대여 대기 최대 시간 (초). None이면 무한 대기
+        :param health_check_interval: 이 시간(초) 이상 쉬었던 연결은 대여 전에 ping으로 확인
+        """
+        if max_size < 1:
+            raise ValueError("max_size는 1 이상이어야 합니다.")
+        self._connect_func = connect_func
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self._reset_state()
+
+    def _reset_state(self):
+        """프로세스 단위 상태를 초기화합니다."""
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._idle = deque() # (connection, 마지막 반환 시각) - 최근 반환된 연결부터 재사용
+        self._slots = threading.BoundedSemaphore(self.max_size)
+
+    def _check_fork(self):
+        """fork 이후 처음 사용될 때 부모 프로세스에서 물려받은 연결을 버리고 풀을 재초기화합니다."""
+        if self._pid != os.getpid():
+            # 부모의 연결은 닫지 않고 참조만 버립니다. (close()는 부모 세션에 종료 패킷을 보내므로)
+            logger.info(f"프로세스 fork 감지 (pid {self._pid} -> {os.getpid()}). 연결 풀을 재초기화합니다.")
+            self._reset_state()
+
+    def _is_healthy(self, conn, idle_since: float) -> bool:
+        """연결이 사용 가능한지 확인합니다."""
+        if not getattr(conn, 'open', True):
+            return False
+        if time.monotonic() - idle_since < self.health_check_interval:
+            return True
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception as e:
+            logger.warning(f"유휴 연결 상태 확인 실패, 새 연결로 교체합니다: {e}")
+            return False
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def acquire(self):
+        """
+        풀에서 연결을 대여합니다. 사용 후 반드시 release()로 반환해야 합니다.
+        :return: 연결 객체
+        """
+        self._check_fork()
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolTimeoutError(f"{self.timeout}초 동안 사용 가능한 DB 연결이 없습니다. (max_size={self.max_size})")
+        try:
+            while True:
+                with self._lock:
+                    entry = self._idle.pop() if self._idle else None
+                if entry is None:
+                    return self._connect_func()
+                conn, idle_since = entry
+                if self._is_healthy(conn, idle_since):
+                    return conn
+                self._close_quietly(conn)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, conn, discard: bool = False):
+        """
+        대여한 연결을 풀에 반환합니다.
+        :param conn: acquire()로 받은 연결 객체
+        :param discard: True이면 재사용하지 않고 닫습니다. (오류가 발생한 연결 등)
+        """
+        if self._pid != os.getpid():
+            return # fork 이전에 대여한 연결은 이 프로세스의 풀 소유가 아님
+        if discard or not getattr(conn, 'open', True):
+            self._close_quietly(conn)
+        else:
+            with self._lock:
+                self._idle.append((conn, time.monotonic()))
+        self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """with 문에서 연결을 대여/반환합니다. 블록 안에서 예외가 발생하면 연결을 폐기합니다."""
+        conn = self.acquire()
+        try:
+            yield conn
+        except BaseException:
+            self.release(conn, discard=True)
+            raise
+        else:
+            self.release(conn)
+
+    def close_all(self):
+        """유휴 연결을 모두 닫습니다. 대여 중인 연결은 반환될 때 다시 풀에 들어갑니다."""
+        self._check_fork()
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for conn, _ in idle:
+            self._close_quietly(conn)
+        return len(idle)
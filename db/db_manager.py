@@ -6,161 +6,220 @@ import pandas as pd
 from datetime import datetime, date, timedelta
 import os
 import sys
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
 
 # sys.path에 프로젝트 루트 추가 (settings.py 임포트를 위함)
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
-from config.settings import DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD
+from config.settings import (DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD,
+                             DB_POOL_SIZE, DB_POOL_TIMEOUT, BULK_FETCH_CHUNK_SIZE,
+                             STREAM_CHUNK_SIZE, BULK_LOAD_BATCH_SIZE, BULK_LOAD_COMMIT_INTERVAL,
+                             BACKFILL_LEASE_SECONDS, BACKFILL_MAX_ATTEMPTS, BACKFILL_RETRY_BACKOFF_SECONDS)
+from db.connection_pool import ConnectionPool, PoolTimeoutError
+from utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO) # 기본 로그 레벨 설정
 
 class DBManager:
-    def __init__(self):
+    def __init__(self, pool_size: int = DB_POOL_SIZE, pool_timeout: float = DB_POOL_TIMEOUT, db_name: str = None):
+        """
+        :param pool_size: 동시에 열 수 있는 최대 DB 연결 수
+        :param pool_timeout: 모든 연결이 사용 중일 때 반환을 기다리는 최대 시간 (초)
+        :param db_name: 접속할 데이터베이스 이름 (None이면 DB_NAME, 테스트용 DB 지정 등)
+        """
         self.host = DB_HOST
         self.port = DB_PORT
         self.user = DB_USER
         self.password = DB_PASSWORD
-        self.db_name = DB_NAME
-        self.conn = None
+        self.db_name = db_name or DB_NAME
+        self.pool = ConnectionPool(self._create_connection, max_size=pool_size, timeout=pool_timeout)
         self._connect()
 
+    def _create_connection(self, local_infile: bool = False):
+        """
+        새 데이터베이스 연결을 생성합니다. (ConnectionPool이 필요할 때 호출)
+        :param local_infile: True이면 LOAD DATA LOCAL INFILE을 허용합니다. 풀 연결에는 켜지 않고
+                             bulk_load_*가 쓰는 전용 연결(_bulk_load_connection)에만 사용합니다.
+        """
+        return pymysql.connect(
+            host=self.host,
+            port=self.port,
+            user=self.user,
+            password=self.password,
+            db=self.db_name,
+            charset='utf8mb4',
+            cursorclass=pymysql.cursors.DictCursor, # 딕셔너리 형태로 결과 반환
+            local_infile=local_infile
+        )
+
     def _connect(self):
-        """데이터베이스에 연결합니다."""
-        try:
-            self.conn = pymysql.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                db=self.db_name,
-                charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor # 딕셔너리 형태로 결과 반환
-            )
+        """연결 풀에 첫 연결을 만들어 데이터베이스 접속 가능 여부를 확인합니다."""
+        if self.is_connected():
             logger.info(f"데이터베이스 '{self.db_name}'에 성공적으로 연결되었습니다.")
-        except pymysql.err.MySQLError as e:
+
+    def is_connected(self) -> bool:
+        """데이터베이스에 연결할 수 있으면 True를 반환합니다."""
+        with self.connection() as conn:
+            return conn is not None
+
+    @contextmanager
+    def connection(self):
+        """
+        연결 풀에서 DB 연결을 대여하고, with 블록이 끝나면 반환합니다.
+        스레드/프로세스마다 별도의 연결을 사용하므로 동시에 호출해도 안전합니다.
+        연결할 수 없으면 None을 넘겨줍니다.
+        """
+        try:
+            conn = self.pool.acquire()
+        except (pymysql.err.MySQLError, PoolTimeoutError) as e:
             logger.error(f"데이터베이스 연결 실패: {e}", exc_info=True)
-            self.conn = None # 연결 실패 시 conn 초기화
+            yield None
+            return
 
-    def get_db_connection(self):
-        """현재 데이터베이스 연결 객체를 반환합니다. 연결이 끊어졌으면 재연결을 시도합니다."""
-        if not self.conn or not self.conn.open:
-            logger.warning("데이터베이스 연결이 끊어졌습니다. 재연결을 시도합니다.")
-            self._connect()
-        return self.conn
+        try:
+            yield conn
+        except BaseException:
+            self.pool.release(conn, discard=True) # 상태를 알 수 없는 연결은 재사용하지 않음
+            raise
+        else:
+            self.pool.release(conn)
+
+    @contextmanager
+    def _bulk_load_connection(self):
+        """
+        LOAD DATA LOCAL INFILE을 허용한 전용 연결을 열고, with 블록이 끝나면 닫습니다.
+        일반 조회/저장에 쓰는 풀 연결에서는 local_infile을 켜지 않기 위해 풀을 거치지 않습니다.
+        연결할 수 없으면 None을 넘겨줍니다.
+        """
+        try:
+            conn = self._create_connection(local_infile=True)
+        except pymysql.err.MySQLError as e:
+            logger.error(f"대량 적재용 데이터베이스 연결 실패: {e}", exc_info=True)
+            yield None
+            return
+        try:
+            yield conn
+        finally:
+            conn.close()
 
     def close(self):
-        """데이터베이스 연결을 닫습니다."""
-        if self.conn and self.conn.open:
-            self.conn.close()
-            logger.info("데이터베이스 연결이 닫혔습니다.")
+        """풀의 유휴 데이터베이스 연결을 모두 닫습니다."""
+        closed_count = self.pool.close_all()
+        if closed_count:
+            logger.info(f"데이터베이스 연결 {closed_count}개가 닫혔습니다.")
 
     def create_all_tables(self):
         """schema.sql 파일의 SQL 쿼리를 실행하여 모든 테이블을 생성합니다."""
-        conn = self.get_db_connection()
-        if not conn:
-            logger.error("DB 연결이 없어 테이블을 생성할 수 없습니다.")
-            return
+        with self.connection() as conn:
+            if not conn:
+                logger.error("DB 연결이 없어 테이블을 생성할 수 없습니다.")
+                return
 
-        schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
-        try:
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                sql_script = f.read()
-
-            sql_commands = sql_script.split(';')
-            with conn.cursor() as cursor:
-                for command in sql_commands:
-                    command = command.strip()
-                    if command: # 빈 문자열이 아니면 실행
-                        cursor.execute(command)
-            conn.commit()
-            logger.info("모든 테이블이 성공적으로 생성되었거나 이미 존재합니다.")
-        except FileNotFoundError:
-            logger.error(f"스키마 파일 '{schema_path}'을 찾을 수 없습니다.")
-        except Exception as e:
-            logger.error(f"테이블 생성 중 오류 발생: {e}", exc_info=True)
-            conn.rollback()
+            schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
+            try:
+                with open(schema_path, 'r', encoding='utf-8') as f:
+                    sql_script = f.read()
+
+                sql_commands = sql_script.split(';')
+                with conn.cursor() as cursor:
+                    for command in sql_commands:
+                        command = command.strip()
+                        if command: # 빈 문자열이 아니면 실행
+                            cursor.execute(command)
+                conn.commit()
+                logger.info("모든 테이블이 성공적으로 생성되었거나 이미 존재합니다.")
+            except FileNotFoundError:
+                logger.error(f"스키마 파일 '{schema_path}'을 찾을 수 없습니다.")
+            except Exception as e:
+                logger.error(f"테이블 생성 중 오류 발생: {e}", exc_info=True)
+                conn.rollback()
 
     def drop_all_tables(self):
         """모든 테이블을 삭제합니다."""
-        conn = self.get_db_connection()
-        if not conn:
-            logger.error("DB 연결이 없어 테이블을 삭제할 수 없습니다.")
-            return
+        with self.connection() as conn:
+            if not conn:
+                logger.error("DB 연결이 없어 테이블을 삭제할 수 없습니다.")
+                return
 
-        # 외래 키 제약 조건이 있는 테이블부터 먼저 삭제
-        tables_to_drop = ['minute_stock_data', 'daily_stock_data', 'stock_info'] # stock_finance 제거
-        try:
-            with conn.cursor() as cursor:
-                for table_name in tables_to_drop:
-                    cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
-                    logger.info(f"테이블 '{table_name}' 삭제 완료.")
-            conn.commit()
-            logger.info("모든 테이블이 성공적으로 삭제되었습니다.")
-        except Exception as e:
-            logger.error(f"테이블 삭제 중 오류 발생: {e}", exc_info=True)
-            conn.rollback()
+            # 외래 키 제약 조건이 있는 테이블부터 먼저 삭제
+            tables_to_drop = ['backfill_job_unit', 'minute_stock_data', 'daily_stock_data', 'stock_info'] # stock_finance 제거
+            try:
+                with conn.cursor() as cursor:
+                    for table_name in tables_to_drop:
+                        cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+                        logger.info(f"테이블 '{table_name}' 삭제 완료.")
+                conn.commit()
+                logger.info("모든 테이블이 성공적으로 삭제되었습니다.")
+            except Exception as e:
+                logger.error(f"테이블 삭제 중 오류 발생: {e}", exc_info=True)
+                conn.rollback()
 
     def save_stock_info(self, stock_info_list):
         """
         종목 기본 정보 및 최신 재무 데이터를 DB의 stock_info 테이블에 저장하거나 업데이트합니다.
         :param stock_info_list: [{'stock_code': 'A005930', 'stock_name': '삼성전자', 'per': 10.5, ...}, ...]
         """
-        conn = self.get_db_connection()
-        if not conn: return False
-        sql = """
-        INSERT INTO stock_info
-        (stock_code, stock_name, market_type, sector, per, pbr, eps, roe, debt_ratio, sales, operating_profit, net_profit, recent_financial_date)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON DUPLICATE KEY UPDATE
-            stock_name=VALUES(stock_name),
-            market_type=VALUES(market_type),
-            sector=VALUES(sector),
-            per=VALUES(per),
-            pbr=VALUES(pbr),
-            eps=VALUES(eps),
-            roe=VALUES(roe),
-            debt_ratio=VALUES(debt_ratio),
-            sales=VALUES(sales),
-            operating_profit=VALUES(operating_profit),
-            net_profit=VALUES(net_profit),
-            recent_financial_date=VALUES(recent_financial_date),
-            upd_date=CURRENT_TIMESTAMP
-        """
-        try:
-            with conn.cursor() as cursor:
-                data = []
-                for info in stock_info_list:
-                    # pbr은 Creon MarketEye에서 직접 제공되지 않을 수 있으므로, 기본값 0 또는 None
-                    # schema.sql에 pbr 컬럼이 있으므로, 값을 넣어주거나 NULL 허용해야 함
-                    pbr_value = info.get('pbr') # MarketEye에서 PBR 필드를 요청하지 않았다면 None이 될 것
-                    if pbr_value is None: # 또는 0.0으로 초기화
-                        pbr_value = 0.0 # 스키마가 DECIMAL(10,2)이고 NOT NULL이 아니므로 NULL도 가능
-
-                    data.append((
-                        info['stock_code'],
-                        info['stock_name'],
-                        info.get('market_type'),
-                        info.get('sector'),
-                        info.get('per'),
-                        pbr_value, # pbr 값 처리
-                        info.get('eps'),
-                        info.get('roe'),
-                        info.get('debt_ratio'),
-                        info.get('sales'),
-                        info.get('operating_profit'),
-                        info.get('net_profit'),
-                        info.get('recent_financial_date') # 새로운 재무 기준일 컬럼
-                    ))
-                cursor.executemany(sql, data)
-            conn.commit()
-            logger.debug(f"{len(stock_info_list)}개의 종목 정보를 저장/업데이트했습니다.")
-            return True
-        except Exception as e:
-            logger.error(f"종목 정보 저장/업데이트 오류: {e}", exc_info=True)
-            conn.rollback()
-            return False
+        with self.connection() as conn:
+            if not conn: return False
+            sql = """
+            INSERT INTO stock_info
+            (stock_code, stock_name, market_type, sector, per, pbr, eps, roe, debt_ratio, sales, operating_profit, net_profit, recent_financial_date)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                stock_name=VALUES(stock_name),
+                market_type=VALUES(market_type),
+                sector=VALUES(sector),
+                per=VALUES(per),
+                pbr=VALUES(pbr),
+                eps=VALUES(eps),
+                roe=VALUES(roe),
+                debt_ratio=VALUES(debt_ratio),
+                sales=VALUES(sales),
+                operating_profit=VALUES(operating_profit),
+                net_profit=VALUES(net_profit),
+                recent_financial_date=VALUES(recent_financial_date),
+                upd_date=CURRENT_TIMESTAMP
+            """
+            try:
+                with conn.cursor() as cursor:
+                    data = []
+                    for info in stock_info_list:
+                        # pbr은 Creon MarketEye에서 직접 제공되지 않을 수 있으므로, 기본값 0 또는 None
+                        # schema.sql에 pbr 컬럼이 있으므로, 값을 넣어주거나 NULL 허용해야 함
+                        pbr_value = info.get('pbr') # MarketEye에서 PBR 필드를 요청하지 않았다면 None이 될 것
+                        if pbr_value is None: # 또는 0.0으로 초기화
+                            pbr_value = 0.0 # 스키마가 DECIMAL(10,2)이고 NOT NULL이 아니므로 NULL도 가능
+
+                        data.append((
+                            info['stock_code'],
+                            info['stock_name'],
+                            info.get('market_type'),
+                            info.get('sector'),
+                            info.get('per'),
+                            pbr_value, # pbr 값 처리
+                            info.get('eps'),
+                            info.get('roe'),
+                            info.get('debt_ratio'),
+                            info.get('sales'),
+                            info.get('operating_profit'),
+                            info.get('net_profit'),
+                            info.get('recent_financial_date') # 새로운 재무 기준일 컬럼
+                        ))
+                    with metrics.timer('db_query', op='save', table='stock_info') as t:
+                        cursor.executemany(sql, data)
+                        t.add(rows=len(data))
+                conn.commit()
+                logger.debug(f"{len(stock_info_list)}개의 종목 정보를 저장/업데이트했습니다.")
+                return True
+            except Exception as e:
+                logger.error(f"종목 정보 저장/업데이트 오류: {e}", exc_info=True)
+                conn.rollback()
+                return False
 
     def fetch_stock_info(self, stock_codes=None):
         """
@@ -168,61 +227,174 @@ class DBManager:
         :param stock_codes: 조회할 종목 코드 리스트 (없으면 전체 조회)
         :return: Pandas DataFrame
         """
-        conn = self.get_db_connection()
-        if not conn: return pd.DataFrame()
-        sql = """
-        SELECT stock_code, stock_name, market_type, sector, per, pbr, eps, roe, debt_ratio, sales, operating_profit, net_profit, recent_financial_date
-        FROM stock_info
-        """
-        if stock_codes:
-            placeholders = ','.join(['%s'] * len(stock_codes))
-            sql += f" WHERE stock_code IN ({placeholders})"
-        try:
-            with conn.cursor() as cursor:
-                if stock_codes:
-                    cursor.execute(sql, stock_codes)
-                else:
-                    cursor.execute(sql)
-                result = cursor.fetchall()
-                return pd.DataFrame(result)
-        except Exception as e:
-            logger.error(f"종목 정보 조회 오류: {e}", exc_info=True)
-            return pd.DataFrame()
+        with self.connection() as conn:
+            if not conn: return pd.DataFrame()
+            sql = """
+            SELECT stock_code, stock_name, market_type, sector, per, pbr, eps, roe, debt_ratio, sales, operating_profit, net_profit, recent_financial_date
+            FROM stock_info
+            """
+            if stock_codes:
+                placeholders = ','.join(['%s'] * len(stock_codes))
+                sql += f" WHERE stock_code IN ({placeholders})"
+            try:
+                with conn.cursor() as cursor, metrics.timer('db_query', op='fetch', table='stock_info') as t:
+                    if stock_codes:
+                        cursor.execute(sql, stock_codes)
+                    else:
+                        cursor.execute(sql)
+                    df = pd.DataFrame(cursor.fetchall())
+                    t.add_frame(df)
+                    return df
+            except Exception as e:
+                logger.error(f"종목 정보 조회 오류: {e}", exc_info=True)
+                return pd.DataFrame()
 
     def save_daily_data(self, daily_data_list):
         """
         일봉 데이터를 DB에 저장하거나 업데이트합니다.
         :param daily_data_list: [{'stock_code': 'A005930', 'date': '2023-01-02', ...}, ...]
         """
-        conn = self.get_db_connection()
-        if not conn: return False
-        sql = """
-        INSERT INTO daily_stock_data
-        (stock_code, date, open_price, high_price, low_price, close_price, volume, change_rate, trading_value)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON DUPLICATE KEY UPDATE
-            open_price=VALUES(open_price),
-            high_price=VALUES(high_price),
-            low_price=VALUES(low_price),
-            close_price=VALUES(close_price),
-            volume=VALUES(volume),
-            change_rate=VALUES(change_rate),
-            trading_value=VALUES(trading_value)
+        with self.connection() as conn:
+            if not conn: return False
+            sql = """
+            INSERT INTO daily_stock_data
+            (stock_code, date, open_price, high_price, low_price, close_price, volume, change_rate, trading_value)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                open_price=VALUES(open_price),
+                high_price=VALUES(high_price),
+                low_price=VALUES(low_price),
+                close_price=VALUES(close_price),
+                volume=VALUES(volume),
+                change_rate=VALUES(change_rate),
+                trading_value=VALUES(trading_value)
+            """
+            try:
+                with conn.cursor() as cursor:
+                    data = [(d['stock_code'], d['date'], d['open_price'], d['high_price'],
+                             d['low_price'], d['close_price'], d['volume'],
+                             d.get('change_rate'), d.get('trading_value'))
+                            for d in daily_data_list]
+                    with metrics.timer('db_query', op='save', table='daily_stock_data') as t:
+                        cursor.executemany(sql, data)
+                        t.add(rows=len(data))
+                conn.commit()
+                logger.debug(f"{len(daily_data_list)}개의 일봉 데이터를 저장/업데이트했습니다.")
+                return True
+            except Exception as e:
+                logger.error(f"일봉 데이터 저장/업데이트 오류: {e}", exc_info=True)
+                conn.rollback()
+                return False
+
+    DAILY_COLUMNS = ['stock_code', 'date', 'open_price', 'high_price', 'low_price', 'close_price',
+                     'volume', 'change_rate', 'trading_value']
+    MINUTE_COLUMNS = ['stock_code', 'datetime', 'open_price', 'high_price', 'low_price', 'close_price', 'volume']
+
+    @staticmethod
+    def _escape_tsv_value(value):
+        """LOAD DATA 기본 이스케이프 문자(역슬래시)와 구분자(탭/줄바꿈)가 문자열 값 안에 있으면 이스케이프합니다."""
+        if not isinstance(value, str):
+            return value
+        return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+    @classmethod
+    def _write_tsv(cls, df, columns, path):
         """
-        try:
-            with conn.cursor() as cursor:
-                data = [(d['stock_code'], d['date'], d['open_price'], d['high_price'],
-                         d['low_price'], d['close_price'], d['volume'],
-                         d.get('change_rate'), d.get('trading_value'))
-                        for d in daily_data_list]
-                cursor.executemany(sql, data)
-            conn.commit()
-            logger.debug(f"{len(daily_data_list)}개의 일봉 데이터를 저장/업데이트했습니다.")
+        DataFrame을 LOAD DATA LOCAL INFILE 기본 형식(탭 구분, 줄바꿈 행 구분, 역슬래시 이스케이프)의 파일로 씁니다.
+        NULL(NaN/None/NaT)은 \\N으로 씁니다.
+        """
+        df = df[columns]
+        text_columns = [col for col in columns
+                        if not (pd.api.types.is_numeric_dtype(df[col]) or pd.api.types.is_datetime64_any_dtype(df[col]))]
+        if text_columns:
+            df = df.assign(**{col: df[col].map(cls._escape_tsv_value) for col in text_columns})
+        df.to_csv(path, sep='\t', header=False, index=False, na_rep='\\N', lineterminator='\n')
+
+    def _bulk_load(self, table, columns, df, batch_size, commit_interval):
+        """
+        DataFrame을 batch_size 행씩 임시 TSV 파일로 쓰고 LOAD DATA LOCAL INFILE로 스테이징 테이블에 적재한 뒤,
+        INSERT ... SELECT ... ON DUPLICATE KEY UPDATE 한 번으로 본 테이블에 병합합니다.
+        commit_interval개 배치마다 병합/커밋하고, 남은 배치는 마지막에 병합/커밋합니다.
+        :return: 성공 여부
+        """
+        if df.empty:
             return True
-        except Exception as e:
-            logger.error(f"일봉 데이터 저장/업데이트 오류: {e}", exc_info=True)
-            conn.rollback()
-            return False
+        stage_table = f"{table}_stage"
+        key_columns = columns[:2] # (stock_code, date/datetime) 기본 키
+        update_clause = ', '.join(f"{col}=VALUES({col})" for col in columns if col not in key_columns)
+        column_list = ', '.join(columns)
+        merge_sql = (f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {stage_table} "
+                     f"ON DUPLICATE KEY UPDATE {update_clause}")
+
+        with self._bulk_load_connection() as conn, metrics.timer('db_query', op='bulk_load', table=table) as t:
+            if not conn: return False
+            started = time.perf_counter()
+            loaded_rows = merged_rows = pending_batches = 0
+            fd, tsv_path = tempfile.mkstemp(prefix=f'{table}_', suffix='.tsv')
+            os.close(fd)
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {stage_table}")
+                    cursor.execute(f"CREATE TEMPORARY TABLE {stage_table} LIKE {table}")
+
+                    def merge():
+                        cursor.execute(merge_sql)
+                        cursor.execute(f"DELETE FROM {stage_table}")
+                        conn.commit()
+
+                    for offset in range(0, len(df), batch_size):
+                        batch = df.iloc[offset:offset + batch_size]
+                        self._write_tsv(batch, columns, tsv_path)
+                        cursor.execute(
+                            f"LOAD DATA LOCAL INFILE %s REPLACE INTO TABLE {stage_table} "
+                            f"FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' ({column_list})",
+                            (tsv_path,)
+                        )
+                        loaded_rows += len(batch)
+                        pending_batches += 1
+                        if commit_interval and pending_batches >= commit_interval:
+                            merge()
+                            merged_rows = loaded_rows
+                            pending_batches = 0
+                            elapsed = time.perf_counter() - started
+                            logger.info(f"{table} 대량 적재 진행: {merged_rows}/{len(df)}행 ({merged_rows / elapsed:,.0f} rows/sec)")
+                    if pending_batches:
+                        merge()
+                    cursor.execute(f"DROP TEMPORARY TABLE IF EXISTS {stage_table}")
+
+                t.add(rows=loaded_rows)
+                elapsed = time.perf_counter() - started
+                logger.info(f"{table} 대량 적재 완료: {loaded_rows}행, {elapsed:.2f}초 ({loaded_rows / max(elapsed, 1e-9):,.0f} rows/sec)")
+                return True
+            except Exception as e:
+                logger.error(f"{table} 대량 적재 오류 ({loaded_rows}행 적재 후): {e}", exc_info=True)
+                conn.rollback()
+                return False
+            finally:
+                os.remove(tsv_path)
+
+    def bulk_load_daily_data(self, daily_df, batch_size=BULK_LOAD_BATCH_SIZE, commit_interval=BULK_LOAD_COMMIT_INTERVAL):
+        """
+        대량의 일봉 데이터를 LOAD DATA LOCAL INFILE + 스테이징 테이블 병합으로 저장/업데이트합니다.
+        save_daily_data와 결과는 같지만, 전 종목 장기 백필처럼 행 수가 많을 때 훨씬 빠릅니다.
+        :param daily_df: DAILY_COLUMNS 컬럼을 가진 DataFrame (change_rate, trading_value는 없으면 NULL)
+        :param batch_size: 임시 파일 하나에 담을 행 수
+        :param commit_interval: 몇 개 배치마다 병합/커밋할지 (None 또는 0이면 마지막에 한 번)
+        :return: 성공 여부
+        """
+        daily_df = daily_df.reindex(columns=self.DAILY_COLUMNS)
+        return self._bulk_load('daily_stock_data', self.DAILY_COLUMNS, daily_df, batch_size, commit_interval)
+
+    def bulk_load_minute_data(self, minute_df, batch_size=BULK_LOAD_BATCH_SIZE, commit_interval=BULK_LOAD_COMMIT_INTERVAL):
+        """
+        대량의 분봉 데이터를 LOAD DATA LOCAL INFILE + 스테이징 테이블 병합으로 저장/업데이트합니다.
+        :param minute_df: MINUTE_COLUMNS 컬럼을 가진 DataFrame
+        :param batch_size: 임시 파일 하나에 담을 행 수
+        :param commit_interval: 몇 개 배치마다 병합/커밋할지 (None 또는 0이면 마지막에 한 번)
+        :return: 성공 여부
+        """
+        minute_df = minute_df.reindex(columns=self.MINUTE_COLUMNS)
+        return self._bulk_load('minute_stock_data', self.MINUTE_COLUMNS, minute_df, batch_size, commit_interval)
 
     def fetch_daily_data(self, stock_code, start_date=None, end_date=None):
         """
@@ -232,30 +404,31 @@ class DBManager:
         :param end_date: 종료 날짜 (YYYY-MM-DD 또는 date 객체)
         :return: Pandas DataFrame
         """
-        conn = self.get_db_connection()
-        if not conn: return pd.DataFrame()
-        sql = """
-        SELECT stock_code, date, open_price, high_price, low_price, close_price, volume, change_rate, trading_value
-        FROM daily_stock_data
-        WHERE stock_code = %s
-        """
-        params = [stock_code]
-        if start_date:
-            sql += " AND date >= %s"
-            params.append(start_date)
-        if end_date:
-            sql += " AND date <= %s"
-            params.append(end_date)
-        sql += " ORDER BY date ASC" # 오래된 순서대로 정렬
+        with self.connection() as conn:
+            if not conn: return pd.DataFrame()
+            sql = """
+            SELECT stock_code, date, open_price, high_price, low_price, close_price, volume, change_rate, trading_value
+            FROM daily_stock_data
+            WHERE stock_code = %s
+            """
+            params = [stock_code]
+            if start_date:
+                sql += " AND date >= %s"
+                params.append(start_date)
+            if end_date:
+                sql += " AND date <= %s"
+                params.append(end_date)
+            sql += " ORDER BY date ASC" # 오래된 순서대로 정렬
 
-        try:
-            with conn.cursor() as cursor:
-                cursor.execute(sql, tuple(params))
-                result = cursor.fetchall()
-                return pd.DataFrame(result)
-        except Exception as e:
-            logger.error(f"일봉 데이터 조회 오류 ({stock_code}, {start_date}~{end_date}): {e}", exc_info=True)
-            return pd.DataFrame()
+            try:
+                with conn.cursor() as cursor, metrics.timer('db_query', op='fetch', table='daily_stock_data') as t:
+                    cursor.execute(sql, tuple(params))
+                    df = pd.DataFrame(cursor.fetchall())
+                    t.add_frame(df)
+                    return df
+            except Exception as e:
+                logger.error(f"일봉 데이터 조회 오류 ({stock_code}, {start_date}~{end_date}): {e}", exc_info=True)
+                return pd.DataFrame()
 
     def get_latest_daily_data_date(self, stock_code):
         """
@@ -263,49 +436,96 @@ class DBManager:
         :param stock_code: 종목 코드
         :return: datetime.date 객체 또는 None
         """
-        conn = self.get_db_connection()
-        if not conn: return None
-        sql = "SELECT MAX(date) AS latest_date FROM daily_stock_data WHERE stock_code = %s"
-        try:
-            with conn.cursor() as cursor:
-                cursor.execute(sql, (stock_code,))
-                result = cursor.fetchone()
-                return result['latest_date'] if result and result['latest_date'] else None
-        except Exception as e:
-            logger.error(f"최신 일봉 날짜 조회 오류 ({stock_code}): {e}", exc_info=True)
-            return None
+        with self.connection() as conn:
+            if not conn: return None
+            sql = "SELECT MAX(date) AS latest_date FROM daily_stock_data WHERE stock_code = %s"
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(sql, (stock_code,))
+                    result = cursor.fetchone()
+                    return result['latest_date'] if result and result['latest_date'] else None
+            except Exception as e:
+                logger.error(f"최신 일봉 날짜 조회 오류 ({stock_code}): {e}", exc_info=True)
+                return None
+
+    def get_latest_daily_close(self, stock_code, before_date=None):
+        """
+        특정 종목의 마지막 일봉 날짜와 종가를 한 번에 조회합니다. (증분 업데이트의 첫 등락률 계산용)
+        :param stock_code: 종목 코드
+        :param before_date: 지정하면 이 날짜보다 앞선 마지막 일봉
+        :return: (datetime.date, 종가) 튜플 또는 None
+        """
+        with self.connection() as conn:
+            if not conn: return None
+            sql = "SELECT date, close_price FROM daily_stock_data WHERE stock_code = %s"
+            params = [stock_code]
+            if before_date:
+                sql += " AND date < %s"
+                params.append(before_date)
+            sql += " ORDER BY date DESC LIMIT 1"
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(sql, tuple(params))
+                    result = cursor.fetchone()
+                    return (result['date'], result['close_price']) if result else None
+            except Exception as e:
+                logger.error(f"최신 일봉 종가 조회 오류 ({stock_code}): {e}", exc_info=True)
+                return None
+
+    def update_daily_change_rates(self, rows):
+        """
+        일봉의 등락률(change_rate)만 갱신합니다. (repair_change_rates용, 다른 컬럼은 건드리지 않음)
+        :param rows: [(stock_code, date, change_rate), ...]
+        :return: 성공 여부
+        """
+        with self.connection() as conn:
+            if not conn: return False
+            sql = "UPDATE daily_stock_data SET change_rate = %s WHERE stock_code = %s AND date = %s"
+            try:
+                with conn.cursor() as cursor, \
+                        metrics.timer('db_query', op='update', table='daily_stock_data') as t:
+                    cursor.executemany(sql, [(rate, code, day) for code, day, rate in rows])
+                    t.add(rows=len(rows))
+                conn.commit()
+                return True
+            except Exception as e:
+                logger.error(f"일봉 등락률 갱신 오류: {e}", exc_info=True)
+                conn.rollback()
+                return False
 
     def save_minute_data(self, minute_data_list):
         """
         분봉 데이터를 DB에 저장하거나 업데이트합니다.
         :param minute_data_list: [{'stock_code': 'A005930', 'datetime': '2023-01-02 09:00', ...}, ...]
         """
-        conn = self.get_db_connection()
-        if not conn: return False
-        sql = """
-        INSERT INTO minute_stock_data
-        (stock_code, datetime, open_price, high_price, low_price, close_price, volume)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
-        ON DUPLICATE KEY UPDATE
-            open_price=VALUES(open_price),
-            high_price=VALUES(high_price),
-            low_price=VALUES(low_price),
-            close_price=VALUES(close_price),
-            volume=VALUES(volume)
-        """
-        try:
-            with conn.cursor() as cursor:
-                data = [(d['stock_code'], d['datetime'], d['open_price'], d['high_price'],
-                         d['low_price'], d['close_price'], d['volume'])
-                        for d in minute_data_list]
-                cursor.executemany(sql, data)
-            conn.commit()
-            logger.debug(f"{len(minute_data_list)}개의 분봉 데이터를 저장/업데이트했습니다.")
-            return True
-        except Exception as e:
-            logger.error(f"분봉 데이터 저장/업데이트 오류: {e}", exc_info=True)
-            conn.rollback()
-            return False
+        with self.connection() as conn:
+            if not conn: return False
+            sql = """
+            INSERT INTO minute_stock_data
+            (stock_code, datetime, open_price, high_price, low_price, close_price, volume)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE
+                open_price=VALUES(open_price),
+                high_price=VALUES(high_price),
+                low_price=VALUES(low_price),
+                close_price=VALUES(close_price),
+                volume=VALUES(volume)
+            """
+            try:
+                with conn.cursor() as cursor:
+                    data = [(d['stock_code'], d['datetime'], d['open_price'], d['high_price'],
+                             d['low_price'], d['close_price'], d['volume'])
+                            for d in minute_data_list]
+                    with metrics.timer('db_query', op='save', table='minute_stock_data') as t:
+                        cursor.executemany(sql, data)
+                        t.add(rows=len(data))
+                conn.commit()
+                logger.debug(f"{len(minute_data_list)}개의 분봉 데이터를 저장/업데이트했습니다.")
+                return True
+            except Exception as e:
+                logger.error(f"분봉 데이터 저장/업데이트 오류: {e}", exc_info=True)
+                conn.rollback()
+                return False
 
     def fetch_minute_data(self, stock_code, date=None, start_datetime=None, end_datetime=None):
         """
@@ -316,50 +536,381 @@ class DBManager:
         :param end_datetime: 종료 시간 (datetime.datetime 객체)
         :return: Pandas DataFrame
         """
-        conn = self.get_db_connection()
-        if not conn: return pd.DataFrame()
+        with self.connection() as conn:
+            if not conn: return pd.DataFrame()
+            sql = """
+            SELECT stock_code, datetime, open_price, high_price, low_price, close_price, volume
+            FROM minute_stock_data
+            WHERE stock_code = %s
+            """
+            params = [stock_code]
+            if date:
+                sql += " AND DATE(datetime) = %s"
+                params.append(date)
+            if start_datetime:
+                sql += " AND datetime >= %s"
+                params.append(start_datetime)
+            if end_datetime:
+                sql += " AND datetime <= %s"
+                params.append(end_datetime)
+            sql += " ORDER BY datetime ASC" # 오래된 순서대로 정렬
+
+            try:
+                with conn.cursor() as cursor, metrics.timer('db_query', op='fetch', table='minute_stock_data') as t:
+                    cursor.execute(sql, tuple(params))
+                    df = pd.DataFrame(cursor.fetchall())
+                    t.add_frame(df)
+                    return df
+            except Exception as e:
+                logger.error(f"분봉 데이터 조회 오류 ({stock_code}, {date}~{start_datetime}~{end_datetime}): {e}", exc_info=True)
+                return pd.DataFrame()
+
+    def get_latest_minute_data_datetime(self, stock_code):
+        """
+        특정 종목의 DB에 저장된 최신 분봉 데이터 시각을 조회합니다.
+        :param stock_code: 종목 코드
+        :return: datetime.datetime 객체 또는 None
+        """
+        with self.connection() as conn:
+            if not conn: return None
+            sql = "SELECT MAX(datetime) AS latest_datetime FROM minute_stock_data WHERE stock_code = %s"
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(sql, (stock_code,))
+                    result = cursor.fetchone()
+                    return result['latest_datetime'] if result and result['latest_datetime'] else None
+            except Exception as e:
+                logger.error(f"최신 분봉 시각 조회 오류 ({stock_code}): {e}", exc_info=True)
+                return None
+
+    def _latest_by_code(self, table, time_column, stock_codes=None):
+        """
+        종목별 최신 시각을 GROUP BY 쿼리 한 번으로 조회합니다. (PK (stock_code, 시각) 인덱스만 읽음)
+        :return: {종목코드: 최신 시각}, 데이터가 없는 종목은 포함하지 않습니다. 오류 시 None
+        """
+        with self.connection() as conn:
+            if not conn: return None
+            sql = f"SELECT stock_code, MAX({time_column}) FROM {table} GROUP BY stock_code"
+            try:
+                with conn.cursor(pymysql.cursors.Cursor) as cursor, \
+                        metrics.timer('db_query', op='latest', table=table) as t:
+                    cursor.execute(sql)
+                    rows = cursor.fetchall()
+                    t.add(rows=len(rows))
+            except Exception as e:
+                logger.error(f"{table} 종목별 최신 시각 조회 오류: {e}", exc_info=True)
+                return None
+        latest = {code: value for code, value in rows if value is not None}
+        if stock_codes is not None:
+            wanted = set(stock_codes)
+            latest = {code: value for code, value in latest.items() if code in wanted}
+        return latest
+
+    def get_latest_daily_data_dates(self, stock_codes=None):
+        """
+        여러 종목의 DB에 저장된 최신 일봉 날짜를 한 번에 조회합니다. (get_latest_daily_data_date의 다종목 버전)
+        :param stock_codes: 종목 코드 리스트 (없으면 전체 종목)
+        :return: {종목코드: datetime.date}, 데이터가 없는 종목은 빠집니다. 오류 시 None
+        """
+        return self._latest_by_code('daily_stock_data', 'date', stock_codes)
+
+    def get_latest_daily_closes(self, stock_codes=None):
+        """
+        여러 종목의 마지막 일봉 날짜와 종가를 쿼리 한 번으로 조회합니다. (종목별 MAX(date)와 그 날의 종가)
+        :param stock_codes: 종목 코드 리스트 (없으면 전체 종목)
+        :return: {종목코드: (datetime.date, 종가)}, 데이터가 없는 종목은 빠집니다. 오류 시 None
+        """
+        with self.connection() as conn:
+            if not conn: return None
+            sql = """
+            SELECT d.stock_code, d.date, d.close_price
+            FROM daily_stock_data d
+            JOIN (SELECT stock_code, MAX(date) AS date FROM daily_stock_data GROUP BY stock_code) m
+              ON d.stock_code = m.stock_code AND d.date = m.date
+            """
+            try:
+                with conn.cursor(pymysql.cursors.Cursor) as cursor, \
+                        metrics.timer('db_query', op='latest', table='daily_stock_data') as t:
+                    cursor.execute(sql)
+                    rows = cursor.fetchall()
+                    t.add(rows=len(rows))
+            except Exception as e:
+                logger.error(f"종목별 최신 일봉 종가 조회 오류: {e}", exc_info=True)
+                return None
+        wanted = set(stock_codes) if stock_codes is not None else None
+        return {code: (day, close) for code, day, close in rows if wanted is None or code in wanted}
+
+    def get_latest_minute_data_datetimes(self, stock_codes=None):
+        """
+        여러 종목의 DB에 저장된 최신 분봉 시각을 한 번에 조회합니다. (get_latest_minute_data_datetime의 다종목 버전)
+        :param stock_codes: 종목 코드 리스트 (없으면 전체 종목)
+        :return: {종목코드: datetime.datetime}, 데이터가 없는 종목은 빠집니다. 오류 시 None
+        """
+        return self._latest_by_code('minute_stock_data', 'datetime', stock_codes)
+
+    def iter_minute_data(self, stock_code, start_datetime=None, end_datetime=None, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        특정 종목의 분봉 데이터를 서버 측 커서(SSCursor)로 조금씩 읽어 청크 단위로 반환하는 제너레이터.
+        결과 전체를 메모리에 올리지 않으므로 조회 기간과 관계없이 메모리 사용량이 chunk_size에 비례합니다.
+        제너레이터가 끝나거나 닫힐 때까지 연결 하나를 점유합니다. (중간에 닫으면 해당 연결은 폐기)
+        :param stock_code: 조회할 종목 코드
+        :param start_datetime: 시작 시간 (datetime.datetime 객체)
+        :param end_datetime: 종료 시간 (datetime.datetime 객체)
+        :param chunk_size: 한 번에 읽을 행 수
+        :return: [(datetime, open, high, low, close, volume), ...] 리스트를 차례로 반환 (오래된 순서)
+        """
         sql = """
-        SELECT stock_code, datetime, open_price, high_price, low_price, close_price, volume
+        SELECT datetime, open_price, high_price, low_price, close_price, volume
         FROM minute_stock_data
         WHERE stock_code = %s
         """
         params = [stock_code]
-        if date:
-            sql += " AND DATE(datetime) = %s"
-            params.append(date)
         if start_datetime:
             sql += " AND datetime >= %s"
             params.append(start_datetime)
         if end_datetime:
             sql += " AND datetime <= %s"
             params.append(end_datetime)
-        sql += " ORDER BY datetime ASC" # 오래된 순서대로 정렬
+        sql += " ORDER BY datetime ASC"
 
-        try:
-            with conn.cursor() as cursor:
-                cursor.execute(sql, tuple(params))
-                result = cursor.fetchall()
-                return pd.DataFrame(result)
-        except Exception as e:
-            logger.error(f"분봉 데이터 조회 오류 ({stock_code}, {date}~{start_datetime}~{end_datetime}): {e}", exc_info=True)
-            return pd.DataFrame()
+        with self.connection() as conn:
+            if not conn:
+                raise ConnectionError(f"DB 연결이 없어 {stock_code} 분봉 데이터를 스트리밍할 수 없습니다.")
+            try:
+                with conn.cursor(pymysql.cursors.SSCursor) as cursor:
+                    cursor.execute(sql, tuple(params))
+                    while True:
+                        with metrics.timer('db_query', op='stream', table='minute_stock_data') as t:
+                            rows = cursor.fetchmany(chunk_size)
+                            t.add(rows=len(rows))
+                        if not rows:
+                            break
+                        yield rows
+            except pymysql.err.MySQLError as e:
+                # 스트리밍 도중 끊기면 일부 구간만 백테스팅되는 것을 막기 위해 예외를 그대로 전달합니다.
+                logger.error(f"분봉 데이터 스트리밍 오류 ({stock_code}, {start_datetime}~{end_datetime}): {e}", exc_info=True)
+                raise
 
-    def get_latest_minute_data_datetime(self, stock_code):
+    def _fetch_bulk(self, table, time_column, columns, stock_codes, start=None, end=None, chunk_size=BULK_FETCH_CHUNK_SIZE):
         """
-        특정 종목의 DB에 저장된 최신 분봉 데이터 시각을 조회합니다.
-        :param stock_code: 종목 코드
-        :return: datetime.datetime 객체 또는 None
+        여러 종목의 시계열 데이터를 stock_code IN (...) 범위 조회로 가져옵니다.
+        종목 수가 많으면 chunk_size 단위로 나누어 조회합니다.
+        딕셔너리 대신 튜플 커서로 받아 DataFrame을 한 번에 만듭니다.
+        :return: (stock_code, time_column) 순으로 정렬된 long-format DataFrame
         """
-        conn = self.get_db_connection()
-        if not conn: return None
-        sql = "SELECT MAX(datetime) AS latest_datetime FROM minute_stock_data WHERE stock_code = %s"
-        try:
-            with conn.cursor() as cursor:
-                cursor.execute(sql, (stock_code,))
-                result = cursor.fetchone()
-                return result['latest_datetime'] if result and result['latest_datetime'] else None
-        except Exception as e:
-            logger.error(f"최신 분봉 시각 조회 오류 ({stock_code}): {e}", exc_info=True)
-            return None
-
-    # stock_finance 관련 메서드 제거 (save_finance_data, fetch_finance_data)
\ No newline at end of file
+        stock_codes = list(dict.fromkeys(stock_codes)) # 중복 제거 (순서 유지)
+        if not stock_codes:
+            return pd.DataFrame(columns=columns)
+
+        with self.connection() as conn:
+            if not conn: return pd.DataFrame(columns=columns)
+            frames = []
+            try:
+                with conn.cursor(pymysql.cursors.Cursor) as cursor:
+                    for i in range(0, len(stock_codes), chunk_size):
+                        chunk = stock_codes[i:i + chunk_size]
+                        placeholders = ','.join(['%s'] * len(chunk))
+                        sql = f"SELECT {', '.join(columns)} FROM {table} WHERE stock_code IN ({placeholders})"
+                        params = list(chunk)
+                        if start:
+                            sql += f" AND {time_column} >= %s"
+                            params.append(start)
+                        if end:
+                            sql += f" AND {time_column} <= %s"
+                            params.append(end)
+                        sql += f" ORDER BY stock_code, {time_column}"
+                        with metrics.timer('db_query', op='fetch_bulk', table=table) as t:
+                            cursor.execute(sql, tuple(params))
+                            rows = cursor.fetchall()
+                            if rows:
+                                frames.append(pd.DataFrame.from_records(rows, columns=columns))
+                                t.add_frame(frames[-1])
+            except Exception as e:
+                logger.error(f"{table} 다종목 조회 오류 ({len(stock_codes)}개 종목, {start}~{end}): {e}", exc_info=True)
+                return pd.DataFrame(columns=columns)
+
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        df = pd.concat(frames, ignore_index=True)
+        logger.debug(f"{table} {len(stock_codes)}개 종목 {len(df)}행 조회 완료.")
+        return df
+
+    @staticmethod
+    def _split_by_code(df):
+        """long-format DataFrame을 {종목코드: DataFrame} 딕셔너리로 나눕니다."""
+        return {code: group.reset_index(drop=True) for code, group in df.groupby('stock_code', sort=False)}
+
+    def fetch_daily_data_bulk(self, stock_codes, start_date=None, end_date=None, as_dict=False,
+                              chunk_size=BULK_FETCH_CHUNK_SIZE):
+        """
+        DB에서 여러 종목의 일봉 데이터를 한 번(또는 몇 번의 청크)에 조회합니다.
+        :param stock_codes: 조회할 종목 코드 리스트
+        :param start_date: 시작 날짜 (YYYY-MM-DD 또는 date 객체)
+        :param end_date: 종료 날짜 (YYYY-MM-DD 또는 date 객체)
+        :param as_dict: True이면 {종목코드: DataFrame} 딕셔너리로 반환 (데이터가 있는 종목만)
+        :param chunk_size: 한 쿼리의 IN (...) 목록에 넣을 최대 종목 수
+        :return: fetch_daily_data와 같은 컬럼의 long-format DataFrame 또는 종목별 DataFrame 딕셔너리
+        """
+        df = self._fetch_bulk(
+            'daily_stock_data', 'date',
+            ['stock_code', 'date', 'open_price', 'high_price', 'low_price', 'close_price',
+             'volume', 'change_rate', 'trading_value'],
+            stock_codes, start_date, end_date, chunk_size
+        )
+        return self._split_by_code(df) if as_dict else df
+
+    def fetch_minute_data_bulk(self, stock_codes, start_datetime=None, end_datetime=None, as_dict=False,
+                               chunk_size=BULK_FETCH_CHUNK_SIZE):
+        """
+        DB에서 여러 종목의 분봉 데이터를 한 번(또는 몇 번의 청크)에 조회합니다.
+        :param stock_codes: 조회할 종목 코드 리스트
+        :param start_datetime: 시작 시간 (datetime.datetime 객체)
+        :param end_datetime: 종료 시간 (datetime.datetime 객체)
+        :param as_dict: True이면 {종목코드: DataFrame} 딕셔너리로 반환 (데이터가 있는 종목만)
+        :param chunk_size: 한 쿼리의 IN (...) 목록에 넣을 최대 종목 수
+        :return: fetch_minute_data와 같은 컬럼의 long-format DataFrame 또는 종목별 DataFrame 딕셔너리
+        """
+        df = self._fetch_bulk(
+            'minute_stock_data', 'datetime',
+            ['stock_code', 'datetime', 'open_price', 'high_price', 'low_price', 'close_price', 'volume'],
+            stock_codes, start_datetime, end_datetime, chunk_size
+        )
+        return self._split_by_code(df) if as_dict else df
+
+    # stock_finance 관련 메서드 제거 (save_finance_data, fetch_finance_data)
+
+    # --- 백필 작업 단위 (backfill_job_unit) ---
+    def add_backfill_units(self, job_name, units):
+        """
+        백필 작업 단위를 등록합니다. 이미 등록된 단위(상태 포함)는 그대로 두므로 같은 작업을 다시 등록해도 안전합니다.
+        :param job_name: 작업 이름
+        :param units: [(stock_code, timeframe, chunk_start, chunk_end), ...]
+        :return: 성공 여부
+        """
+        with self.connection() as conn:
+            if not conn: return False
+            sql = """
+            INSERT IGNORE INTO backfill_job_unit (job_name, stock_code, timeframe, chunk_start, chunk_end)
+            VALUES (%s, %s, %s, %s, %s)
+            """
+            try:
+                with conn.cursor() as cursor:
+                    cursor.executemany(sql, [(job_name, *unit) for unit in units])
+                conn.commit()
+                return True
+            except Exception as e:
+                logger.error(f"백필 작업 단위 등록 오류 ({job_name}): {e}", exc_info=True)
+                conn.rollback()
+                return False
+
+    def claim_backfill_units(self, job_name, worker_id, limit=1, lease_seconds=BACKFILL_LEASE_SECONDS,
+                             max_attempts=BACKFILL_MAX_ATTEMPTS):
+        """
+        처리할 백필 작업 단위를 최대 limit개 가져가고 lease_seconds 동안 점유합니다.
+        대기(pending) 단위, 점유 시간이 지난 실행 중(running, 워커 중단) 단위,
+        시도 횟수가 남고 재시도 대기 시각(next_attempt_at)이 지난 실패(failed) 단위가 대상입니다.
+        점유 시간이 지난 단위도 max_attempts번 시도했으면 다시 가져가지 않고 실패(failed)로 기록합니다.
+        (워커 프로세스를 죽이는 단위가 무한히 재시도되지 않도록)
+        UPDATE ... LIMIT 한 문장으로 점유하므로 여러 워커가 동시에 호출해도 같은 단위를 가져가지 않습니다.
+        :return: [{'stock_code', 'timeframe', 'chunk_start', 'chunk_end', 'attempts', 'claim_token'}, ...], 오류 시 None
+        """
+        token = str(uuid.uuid4())
+        with self.connection() as conn:
+            if not conn: return None
+            expire_sql = """
+            UPDATE backfill_job_unit
+            SET status = 'failed', last_error = '점유 시간 초과 (워커 중단)', lease_expires = NULL
+            WHERE job_name = %s AND status = 'running' AND lease_expires < NOW() AND attempts >= %s
+            """
+            claim_sql = """
+            UPDATE backfill_job_unit
+            SET status = 'running', claim_token = %s, worker_id = %s, attempts = attempts + 1,
+                lease_expires = NOW() + INTERVAL %s SECOND
+            WHERE job_name = %s
+              AND (status = 'pending'
+                   OR (status = 'running' AND lease_expires < NOW() AND attempts < %s)
+                   OR (status = 'failed' AND attempts < %s AND (next_attempt_at IS NULL OR next_attempt_at <= NOW())))
+            ORDER BY stock_code, timeframe, chunk_start
+            LIMIT %s
+            """
+            select_sql = """
+            SELECT stock_code, timeframe, chunk_start, chunk_end, attempts, claim_token
+            FROM backfill_job_unit
+            WHERE job_name = %s AND claim_token = %s
+            ORDER BY stock_code, timeframe, chunk_start
+            """
+            try:
+                with conn.cursor() as cursor:
+                    expired = cursor.execute(expire_sql, (job_name, max_attempts))
+                    if expired:
+                        logger.warning(f"백필 작업 '{job_name}': 시도 횟수({max_attempts}회)를 모두 쓰고 점유 시간이 지난 "
+                                       f"단위 {expired}개를 실패로 기록했습니다.")
+                    cursor.execute(claim_sql, (token, worker_id, int(lease_seconds), job_name, max_attempts,
+                                               max_attempts, limit))
+                    conn.commit()
+                    cursor.execute(select_sql, (job_name, token))
+                    return list(cursor.fetchall())
+            except Exception as e:
+                logger.error(f"백필 작업 단위 점유 오류 ({job_name}): {e}", exc_info=True)
+                conn.rollback()
+                return None
+
+    def finish_backfill_unit(self, job_name, unit, rows_saved=None, error=None,
+                             retry_backoff_seconds=BACKFILL_RETRY_BACKOFF_SECONDS):
+        """
+        점유한 백필 작업 단위를 완료(done) 또는 실패(failed)로 기록합니다.
+        점유 시간이 지나 다른 워커가 다시 가져간 단위(claim_token이 다름)는 바꾸지 않습니다.
+        실패한 단위는 retry_backoff_seconds * 2^(시도 횟수 - 1)초가 지나야 다시 가져갑니다.
+        (상장폐지 종목 등 계속 실패하는 단위가 Creon 요청 한도를 몇 초 만에 소모하지 않도록)
+        :param unit: claim_backfill_units가 반환한 딕셔너리
+        :param error: 실패 시 오류 메시지 (None이면 완료)
+        :param retry_backoff_seconds: 첫 실패 후 재시도 대기 시간 (초)
+        :return: 기록했으면 True
+        """
+        with self.connection() as conn:
+            if not conn: return False
+            if error is None:
+                sql = """
+                UPDATE backfill_job_unit
+                SET status = 'done', rows_saved = %s, last_error = NULL, lease_expires = NULL, next_attempt_at = NULL,
+                    completed_at = NOW()
+                WHERE job_name = %s AND stock_code = %s AND timeframe = %s AND chunk_start = %s AND claim_token = %s
+                """
+                params = (rows_saved, job_name, unit['stock_code'], unit['timeframe'], unit['chunk_start'],
+                          unit['claim_token'])
+            else:
+                sql = """
+                UPDATE backfill_job_unit
+                SET status = 'failed', last_error = %s, lease_expires = NULL,
+                    next_attempt_at = NOW() + INTERVAL (%s * POW(2, attempts - 1)) SECOND
+                WHERE job_name = %s AND stock_code = %s AND timeframe = %s AND chunk_start = %s AND claim_token = %s
+                """
+                params = (str(error)[:255], int(retry_backoff_seconds), job_name, unit['stock_code'], unit['timeframe'],
+                          unit['chunk_start'], unit['claim_token'])
+            try:
+                with conn.cursor() as cursor:
+                    updated = cursor.execute(sql, params)
+                conn.commit()
+                return updated > 0
+            except Exception as e:
+                logger.error(f"백필 작업 단위 상태 기록 오류 ({job_name}, {unit['stock_code']}): {e}", exc_info=True)
+                conn.rollback()
+                return False
+
+    def get_backfill_status(self, job_name):
+        """
+        백필 작업의 상태별 단위 수를 조회합니다.
+        :return: {'pending': n, 'running': n, 'done': n, 'failed': n}, 오류 시 None
+        """
+        with self.connection() as conn:
+            if not conn: return None
+            sql = "SELECT status, COUNT(*) AS count FROM backfill_job_unit WHERE job_name = %s GROUP BY status"
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute(sql, (job_name,))
+                    status = dict.fromkeys(('pending', 'running', 'done', 'failed'), 0)
+                    status.update({row['status']: row['count'] for row in cursor.fetchall()})
+                    return status
+            except Exception as e:
+                logger.error(f"백필 작업 상태 조회 오류 ({job_name}): {e}", exc_info=True)
+                return None
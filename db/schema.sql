@@ -58,4 +58,24 @@ CREATE TABLE IF NOT EXISTS minute_stock_data (
     PRIMARY KEY (stock_code, datetime), -- 종목코드와 시간 조합을 기본 키로
     FOREIGN KEY (stock_code) REFERENCES stock_info(stock_code)
         ON DELETE CASCADE ON UPDATE CASCADE
-);
\ No newline at end of file
+);
+-- backfill_job_unit 테이블: 장기 백필 작업의 (종목, 타임프레임, 기간 청크) 단위 진행 상태
+-- 위의 DROP 대상이 아니므로 테이블을 다시 만들어도 진행 상태가 유지됩니다. (초기화는 drop_all_tables)
+CREATE TABLE IF NOT EXISTS backfill_job_unit (
+    job_name VARCHAR(64) NOT NULL,      -- 백필 작업 이름 (여러 워커가 같은 이름으로 작업을 나눠 처리)
+    stock_code VARCHAR(10) NOT NULL,    -- 종목 코드
+    timeframe VARCHAR(10) NOT NULL,     -- 'daily' 또는 'minute'
+    chunk_start DATE NOT NULL,          -- 청크 시작 날짜
+    chunk_end DATE NOT NULL,            -- 청크 종료 날짜
+    status VARCHAR(10) NOT NULL DEFAULT 'pending', -- pending / running / done / failed
+    attempts INT NOT NULL DEFAULT 0,    -- 처리 시도 횟수
+    claim_token VARCHAR(36),            -- 마지막으로 가져간 워커의 claim 토큰
+    worker_id VARCHAR(64),              -- 마지막으로 가져간 워커
+    lease_expires DATETIME,             -- 이 시각이 지나도록 끝나지 않으면 (워커 중단) 다른 워커가 다시 가져감
+    rows_saved INT,                     -- 저장한 행 수
+    last_error VARCHAR(255),            -- 마지막 오류 메시지
+    next_attempt_at DATETIME,           -- 실패한 단위를 이 시각 이후에 다시 가져감 (재시도 대기)
+    completed_at DATETIME,              -- 완료 일시
+    PRIMARY KEY (job_name, stock_code, timeframe, chunk_start),
+    INDEX idx_backfill_claim (job_name, status, lease_expires)
+);
@@ -11,69 +11,153 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, project_root)
 
 from db.db_manager import DBManager
+from feeds.parquet_cache import ParquetCache
+from feeds.numpy_mmap_data import NumpyMMapData, mmap_path, read_mmap_range, write_ohlcv_mmap
+from utils.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
 class DBDataLoader:
     """
     MariaDB에서 주식 데이터를 로드하여 backtrader의 PandasData 객체로 변환하는 클래스.
+    cache(ParquetCache)를 지정하면 캐시에 없는 구간만 DB에서 조회합니다.
     """
-    def __init__(self, db_manager: DBManager):
+    def __init__(self, db_manager: DBManager, cache: ParquetCache = None):
         self.db_manager = db_manager
+        self.cache = cache
 
-    def load_daily_data(self, stock_code: str, fromdate: date, todate: date) -> bt.feeds.PandasData:
+    # DB 컬럼명 -> backtrader 컬럼명 매핑
+    COLUMN_MAP = {
+        'date': 'datetime', # 'date' 컬럼을 backtrader의 기본 datetime 컬럼명으로 변경
+        'open_price': 'open',
+        'high_price': 'high',
+        'low_price': 'low',
+        'close_price': 'close',
+        'volume': 'volume'
+    }
+    OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+    @classmethod
+    def empty_frame(cls) -> pd.DataFrame:
         """
-        데이터베이스에서 특정 종목의 일봉 데이터를 로드하여 PandasData 객체로 반환합니다.
-        :param stock_code: 종목 코드
-        :param fromdate: 시작 날짜 (datetime.date)
-        :param todate: 종료 날짜 (datetime.date)
-        :return: backtrader.feeds.PandasData 인스턴스
+        backtrader가 기대하는 컬럼과 인덱스 타입을 갖춘 빈 DataFrame을 반환합니다.
+        """
+        empty_df = pd.DataFrame(columns=cls.OHLCV_COLUMNS)
+        empty_df.index.name = 'datetime' # 인덱스 이름 설정
+        empty_df.index = pd.to_datetime(empty_df.index) # 인덱스 타입을 datetime으로
+        return empty_df
+
+    @classmethod
+    def to_bt_frame(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        DBManager가 반환한 DataFrame을 backtrader용 OHLCV DataFrame(datetime 인덱스)으로 변환합니다.
+        :param df: fetch_daily_data / fetch_minute_data 결과 DataFrame
+        :return: 'open', 'high', 'low', 'close', 'volume' 컬럼과 datetime 인덱스를 가진 DataFrame
+        """
+        if df.empty:
+            return cls.empty_frame()
+
+        with metrics.timer('loader_convert') as t:
+            # 데이터프레임의 컬럼명을 backtrader가 인식하는 이름으로 변경
+            df = df.rename(columns=cls.COLUMN_MAP)
+            df = df.set_index('datetime') # 'datetime' 컬럼을 인덱스로 설정
+
+            # 인덱스가 datetime.datetime 타입인지 확인하고 변환
+            # datetime.date 객체인 경우, 00:00:00 시간을 추가하여 datetime.datetime으로 변환합니다.
+            df.index = pd.to_datetime(df.index)
+            df = df.sort_index()          # 시간 순서대로 정렬
+
+            df = df[cls.OHLCV_COLUMNS] # backtrader에 필요한 OHLCV 컬럼만 선택
+            t.add_frame(df)
+        return df
+
+    def _load_frame(self, stock_code: str, timeframe: str, start, end, fetch, label: str) -> pd.DataFrame:
+        """
+        단일 종목 로드 공통 처리.
+        캐시를 사용하면 캐시에 없는 구간만 fetch로 조회하고, 캐시 적중과 DB 조회를 구분해 로그를 남깁니다.
         """
-        logger.info(f"DB에서 {stock_code}의 일봉 데이터 로드 중: {fromdate} ~ {todate}")
-        
+        if self.cache is None:
+            logger.info(f"DB에서 {stock_code}의 {label} 데이터 로드 중: {start} ~ {end}")
+            return fetch(start, end)
+
+        db_ranges = []
+
+        def fetch_missing(range_start, range_end):
+            db_ranges.append((range_start, range_end))
+            return fetch(range_start, range_end)
+
+        df = self.cache.get_frame(stock_code, timeframe, start, end, fetch_missing)
+        if db_ranges:
+            logger.info(f"DB에서 {stock_code}의 {label} 데이터 로드 중: 캐시에 없는 구간 {len(db_ranges)}개 "
+                        f"(요청 기간: {start} ~ {end})")
+        else:
+            logger.info(f"캐시에서 {stock_code}의 {label} 데이터 로드: {start} ~ {end}")
+        return df
+
+    def _fetch_daily_frame(self, stock_code: str, fromdate: date, todate: date) -> pd.DataFrame:
+        """DB에서 일봉 데이터를 조회하여 backtrader용 DataFrame으로 변환합니다. (캐시 미사용)"""
         df = self.db_manager.fetch_daily_data(
             stock_code=stock_code,
             start_date=fromdate,
             end_date=todate
         )
+        return self.to_bt_frame(df)
 
-        if df.empty:
+    def load_daily_frame(self, stock_code: str, fromdate: date, todate: date) -> pd.DataFrame:
+        """
+        데이터베이스에서 특정 종목의 일봉 데이터를 로드하여 backtrader용 DataFrame으로 반환합니다.
+        PandasData로 감싸기 전의 DataFrame이 필요할 때(예: 다중 프로세스 최적화) 사용합니다.
+        :param stock_code: 종목 코드
+        :param fromdate: 시작 날짜 (datetime.date)
+        :param todate: 종료 날짜 (datetime.date)
+        :return: OHLCV DataFrame (datetime 인덱스)
+        """
+        df = self._load_frame(stock_code, 'daily', fromdate, todate,
+                              lambda start, end: self._fetch_daily_frame(stock_code, start, end), '일봉')
+
+        if df is None or df.empty:
             logger.warning(f"DB에 {stock_code}의 일봉 데이터가 없습니다. (기간: {fromdate} ~ {todate})")
-            # 빈 DataFrame이라도 backtrader가 기대하는 컬럼과 인덱스 타입을 맞춥니다.
-            # 'date'를 'datetime'으로 변경 (rename)
-            # 'datetime'을 인덱스로 설정
-            # 인덱스를 datetime.datetime 타입으로 강제 변환
-            # (이 부분은 실제로 데이터가 없으면 빈 DataFrame에 적용되어도 오류는 안남)
-            df_columns = ['open', 'high', 'low', 'close', 'volume']
-            empty_df = pd.DataFrame(columns=df_columns)
-            empty_df.index.name = 'datetime' # 인덱스 이름 설정
-            empty_df.index = pd.to_datetime(empty_df.index) # 인덱스 타입을 datetime으로
-            return bt.feeds.PandasData(dataname=empty_df, fromdate=fromdate, todate=todate)
-
-
-        # 데이터프레임의 컬럼명을 backtrader가 인식하는 이름으로 변경
-        # 'date' 컬럼을 'datetime'으로 변경하고 인덱스로 설정
-        df.rename(columns={
-            'date': 'datetime', # 'date' 컬럼을 backtrader의 기본 datetime 컬럼명으로 변경
-            'open_price': 'open',
-            'high_price': 'high',
-            'low_price': 'low',
-            'close_price': 'close',
-            'volume': 'volume'
-        }, inplace=True)
-
-        df = df.set_index('datetime') # 'datetime' 컬럼을 인덱스로 설정
-        
-        # !!!! 중요: 인덱스가 datetime.datetime 타입인지 확인하고 변환 (이번 오류 해결을 위해)
-        # pd.to_datetime은 이미 datetime.datetime 객체인 경우 아무것도 하지 않고 반환합니다.
-        # datetime.date 객체인 경우, 00:00:00 시간을 추가하여 datetime.datetime으로 변환합니다.
-        df.index = pd.to_datetime(df.index) 
-        
-        df = df.sort_index()          # 시간 순서대로 정렬
-
-        df = df[['open', 'high', 'low', 'close', 'volume']] # backtrader에 필요한 OHLCV 컬럼만 선택
-        
+            return self.empty_frame()
+
         logger.info(f"{stock_code} 일봉 데이터 {len(df)}개 로드 완료.")
+        return df
+
+    def _fetch_minute_frame(self, stock_code: str, fromdatetime: datetime, todatetime: datetime) -> pd.DataFrame:
+        """DB에서 분봉 데이터를 조회하여 backtrader용 DataFrame으로 변환합니다. (캐시 미사용)"""
+        df = self.db_manager.fetch_minute_data(
+            stock_code=stock_code,
+            start_datetime=fromdatetime,
+            end_datetime=todatetime
+        )
+        return self.to_bt_frame(df)
+
+    def load_minute_frame(self, stock_code: str, fromdatetime: datetime, todatetime: datetime) -> pd.DataFrame:
+        """
+        데이터베이스에서 특정 종목의 분봉 데이터를 로드하여 backtrader용 DataFrame으로 반환합니다.
+        :param stock_code: 종목 코드
+        :param fromdatetime: 시작 날짜/시간 (datetime.datetime)
+        :param todatetime: 종료 날짜/시간 (datetime.datetime)
+        :return: OHLCV DataFrame (datetime 인덱스)
+        """
+        df = self._load_frame(stock_code, 'minute', fromdatetime, todatetime,
+                              lambda start, end: self._fetch_minute_frame(stock_code, start, end), '분봉')
+
+        if df is None or df.empty:
+            logger.warning(f"DB에 {stock_code}의 분봉 데이터가 없습니다. (기간: {fromdatetime} ~ {todatetime})")
+            return self.empty_frame()
+
+        logger.info(f"{stock_code} 분봉 데이터 {len(df)}개 로드 완료.")
+        return df
+
+    def load_daily_data(self, stock_code: str, fromdate: date, todate: date) -> bt.feeds.PandasData:
+        """
+        데이터베이스에서 특정 종목의 일봉 데이터를 로드하여 PandasData 객체로 반환합니다.
+        :param stock_code: 종목 코드
+        :param fromdate: 시작 날짜 (datetime.date)
+        :param todate: 종료 날짜 (datetime.date)
+        :return: backtrader.feeds.PandasData 인스턴스
+        """
+        df = self.load_daily_frame(stock_code, fromdate, todate)
         return bt.feeds.PandasData(dataname=df, fromdate=fromdate, todate=todate)
 
     def load_minute_data(self, stock_code: str, fromdatetime: datetime, todatetime: datetime) -> bt.feeds.PandasData:
@@ -84,37 +168,129 @@ class DBDataLoader:
         :param todatetime: 종료 날짜/시간 (datetime.datetime)
         :return: backtrader.feeds.PandasData 인스턴스
         """
-        logger.info(f"DB에서 {stock_code}의 분봉 데이터 로드 중: {fromdatetime} ~ {todatetime}")
-        df = self.db_manager.fetch_minute_data(
-            stock_code=stock_code,
-            start_datetime=fromdatetime,
-            end_datetime=todatetime
-        )
+        df = self.load_minute_frame(stock_code, fromdatetime, todatetime)
+        return bt.feeds.PandasData(dataname=df, fromdate=fromdatetime, todate=todatetime)
 
+    def load_daily_frames(self, stock_codes: list, fromdate: date, todate: date) -> dict:
+        """
+        여러 종목의 일봉 데이터를 DB에서 한 번에 조회하여 종목별 backtrader용 DataFrame으로 반환합니다.
+        :param stock_codes: 종목 코드 리스트
+        :param fromdate: 시작 날짜 (datetime.date)
+        :param todate: 종료 날짜 (datetime.date)
+        :return: {종목코드: OHLCV DataFrame} 딕셔너리 (데이터가 없는 종목은 제외)
+        """
+        logger.info(f"DB에서 {len(stock_codes)}개 종목의 일봉 데이터 일괄 로드 중: {fromdate} ~ {todate}")
+        fetch_bulk = lambda codes, start, end: self.db_manager.fetch_daily_data_bulk(
+            codes, start_date=start, end_date=end, as_dict=True)
+        return self._load_frames(stock_codes, 'daily', fromdate, todate, fetch_bulk, '일봉')
+
+    def load_minute_frames(self, stock_codes: list, fromdatetime: datetime, todatetime: datetime) -> dict:
+        """
+        여러 종목의 분봉 데이터를 DB에서 한 번에 조회하여 종목별 backtrader용 DataFrame으로 반환합니다.
+        :param stock_codes: 종목 코드 리스트
+        :param fromdatetime: 시작 날짜/시간 (datetime.datetime)
+        :param todatetime: 종료 날짜/시간 (datetime.datetime)
+        :return: {종목코드: OHLCV DataFrame} 딕셔너리 (데이터가 없는 종목은 제외)
+        """
+        logger.info(f"DB에서 {len(stock_codes)}개 종목의 분봉 데이터 일괄 로드 중: {fromdatetime} ~ {todatetime}")
+        fetch_bulk = lambda codes, start, end: self.db_manager.fetch_minute_data_bulk(
+            codes, start_datetime=start, end_datetime=end, as_dict=True)
+        return self._load_frames(stock_codes, 'minute', fromdatetime, todatetime, fetch_bulk, '분봉')
+
+    def _load_frames(self, stock_codes: list, timeframe: str, start, end, fetch_bulk, label: str) -> dict:
+        """
+        다종목 일괄 로드 공통 처리.
+        캐시를 사용하면 종목별로 캐시에 없는 구간을 구한 뒤, 같은 구간이 필요한 종목끼리 묶어 한 번에 조회합니다.
+        """
+        if self.cache is None:
+            raw_frames = fetch_bulk(stock_codes, start, end)
+            frames = {code: self.to_bt_frame(raw_frames[code]) for code in stock_codes if code in raw_frames}
+        else:
+            codes_by_range = {}
+            for code in stock_codes:
+                for missing in self.cache.missing_ranges(code, timeframe, start, end):
+                    codes_by_range.setdefault(missing, []).append(code)
+
+            fetched = {code: [] for code in stock_codes}
+            for (range_start, range_end), codes in codes_by_range.items():
+                raw_frames = fetch_bulk(codes, range_start, range_end)
+                for code, raw_df in raw_frames.items():
+                    fetched[code].append(self.to_bt_frame(raw_df))
+            logger.debug(f"캐시 보충 조회 {len(codes_by_range)}회 ({sum(map(len, codes_by_range.values()))}개 종목-구간)")
+
+            frames = {}
+            for code in stock_codes:
+                df = self.cache.merge(code, timeframe, start, end, fetched[code])
+                if df is not None and not df.empty:
+                    frames[code] = df
+
+        missing = [code for code in stock_codes if code not in frames]
+        if missing:
+            logger.warning(f"DB에 {label} 데이터가 없는 종목 {len(missing)}개: {missing[:10]}{' ...' if len(missing) > 10 else ''}")
+        logger.info(f"{len(frames)}개 종목 {label} 데이터 {sum(len(df) for df in frames.values())}개 로드 완료.")
+        return frames
+
+    def load_universe_data(self, stock_codes: list, fromdate, todate, timeframe: str = 'daily') -> dict:
+        """
+        여러 종목의 데이터를 일괄 로드하여 종목별 PandasData 객체로 반환합니다.
+        :param stock_codes: 종목 코드 리스트
+        :param fromdate: 시작 날짜 (daily: datetime.date, minute: datetime.datetime)
+        :param todate: 종료 날짜 (daily: datetime.date, minute: datetime.datetime)
+        :param timeframe: 'daily' 또는 'minute'
+        :return: {종목코드: backtrader.feeds.PandasData} 딕셔너리 (데이터가 없는 종목은 제외)
+        """
+        if timeframe == 'daily':
+            frames = self.load_daily_frames(stock_codes, fromdate, todate)
+        elif timeframe == 'minute':
+            frames = self.load_minute_frames(stock_codes, fromdate, todate)
+        else:
+            raise ValueError("지원하지 않는 timeframe입니다. 'daily' 또는 'minute'을 사용하세요.")
+        return {code: bt.feeds.PandasData(dataname=df, fromdate=fromdate, todate=todate, name=code)
+                for code, df in frames.items()}
+
+    def build_mmap_file(self, stock_code: str, fromdate, todate, timeframe: str = 'daily', path: str = None) -> str:
+        """
+        종목 데이터를 메모리 맵 파일(.npy)로 저장합니다. 저장한 파일은 NumpyMMapData 피드로 읽습니다.
+        :param stock_code: 종목 코드
+        :param fromdate: 시작 날짜 (daily: datetime.date, minute: datetime.datetime)
+        :param todate: 종료 날짜 (daily: datetime.date, minute: datetime.datetime)
+        :param timeframe: 'daily' 또는 'minute'
+        :param path: 저장 경로. None이면 mmap_path(stock_code, timeframe)
+        :return: 저장한 파일 경로 (데이터가 없으면 None)
+        """
+        if timeframe == 'daily':
+            df = self.load_daily_frame(stock_code, fromdate, todate)
+        elif timeframe == 'minute':
+            df = self.load_minute_frame(stock_code, fromdate, todate)
+        else:
+            raise ValueError("지원하지 않는 timeframe입니다. 'daily' 또는 'minute'을 사용하세요.")
         if df.empty:
-            logger.warning(f"DB에 {stock_code}의 분봉 데이터가 없습니다. (기간: {fromdatetime} ~ {todatetime})")
-            df_columns = ['open', 'high', 'low', 'close', 'volume']
-            empty_df = pd.DataFrame(columns=df_columns)
-            empty_df.index.name = 'datetime'
-            empty_df.index = pd.to_datetime(empty_df.index) # 인덱스 타입을 datetime으로
-            return bt.feeds.PandasData(dataname=empty_df, fromdate=fromdatetime, todate=todatetime)
-
-        df.rename(columns={
-            'open_price': 'open',
-            'high_price': 'high',
-            'low_price': 'low',
-            'close_price': 'close',
-            'volume': 'volume'
-        }, inplace=True)
-        
-        df = df.set_index('datetime') # 'datetime' 컬럼을 인덱스로 설정
-        
-        # 분봉 데이터는 이미 datetime.datetime 타입일 가능성이 높지만, 혹시 모를 상황에 대비하여 추가
-        df.index = pd.to_datetime(df.index) 
-        
-        df = df.sort_index()          # 시간 순서대로 정렬
-
-        df = df[['open', 'high', 'low', 'close', 'volume']]
-        
-        logger.info(f"{stock_code} 분봉 데이터 {len(df)}개 로드 완료.")
-        return bt.feeds.PandasData(dataname=df, fromdate=fromdatetime, todate=todatetime)
\ No newline at end of file
+            return None
+
+        path = path or mmap_path(stock_code, timeframe)
+        bars = write_ohlcv_mmap(path, df, fromdate, todate)
+        logger.info(f"{stock_code} ({timeframe}) 메모리 맵 파일 {bars}개 바 저장 완료: {path}")
+        return path
+
+    def load_mmap_data(self, stock_code: str, fromdate, todate, timeframe: str = 'daily') -> NumpyMMapData:
+        """
+        build_mmap_file()로 만든 파일을 NumpyMMapData 피드로 엽니다.
+        파일이 없거나 요청 구간이 파일에 기록된 조회 구간을 벗어나면, 두 구간을 합친 구간으로 다시 생성합니다.
+        (StockDataManager가 DB에 새 데이터를 저장하면 invalidate_mmap()으로 파일을 무효화합니다)
+        :return: backtrader 데이터 피드 (데이터가 없으면 None)
+        """
+        path = mmap_path(stock_code, timeframe)
+        covered = read_mmap_range(path)
+        if covered is None or pd.Timestamp(fromdate) < covered[0] or pd.Timestamp(todate) > covered[1]:
+            build_from, build_to = fromdate, todate
+            if covered is not None:
+                logger.info(f"{stock_code} ({timeframe}) 메모리 맵 파일 구간({covered[0]} ~ {covered[1]})이 "
+                            f"요청 구간을 포함하지 않아 다시 생성합니다.")
+                build_from = min(pd.Timestamp(fromdate), covered[0]).to_pydatetime()
+                build_to = max(pd.Timestamp(todate), covered[1]).to_pydatetime()
+                if timeframe == 'daily':
+                    build_from, build_to = build_from.date(), build_to.date()
+            path = self.build_mmap_file(stock_code, build_from, build_to, timeframe=timeframe, path=path)
+            if path is None:
+                return None
+        return NumpyMMapData(dataname=path, fromdate=fromdate, todate=todate, name=stock_code)
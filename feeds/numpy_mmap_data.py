@@ -0,0 +1,155 @@
+# backtesting/feeds/numpy_mmap_data.py
+
+import json
+import logging
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import backtrader as bt
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from config.settings import DATA_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# 파일 레이아웃: (바 개수, 6) float64 C-contiguous 배열
+# datetime 컬럼은 backtrader 내부 표현(bt.date2num, 0001-01-01 = 1.0인 일 단위 실수)입니다.
+OHLCV_ARRAY_COLUMNS = ('datetime', 'open', 'high', 'low', 'close', 'volume')
+MMAP_DIR = os.path.join(DATA_CACHE_DIR, 'mmap')
+
+_NUM_EPOCH = np.datetime64('0001-01-01T00:00:00', 'us')
+_ONE_DAY = np.timedelta64(1, 'D')
+
+
+def frame_to_ohlcv_array(df: pd.DataFrame) -> np.ndarray:
+    """
+    DBDataLoader.to_bt_frame 형식의 DataFrame을 (n, 6) float64 배열로 변환합니다.
+    :param df: 'open', 'high', 'low', 'close', 'volume' 컬럼과 datetime 인덱스를 가진 DataFrame
+    :return: OHLCV_ARRAY_COLUMNS 순서의 C-contiguous 배열
+    """
+    array = np.empty((len(df), len(OHLCV_ARRAY_COLUMNS)), dtype=np.float64)
+    index = pd.DatetimeIndex(df.index).values.astype('datetime64[us]')
+    array[:, 0] = (index - _NUM_EPOCH) / _ONE_DAY + 1.0 # bt.date2num과 같은 값
+    array[:, 1:] = df[list(OHLCV_ARRAY_COLUMNS[1:])].to_numpy(dtype=np.float64)
+    return array
+
+
+def mmap_path(stock_code: str, timeframe: str = 'daily', base_dir: str = None) -> str:
+    """종목/타임프레임별 메모리 맵 파일 경로를 반환합니다. (base_dir 기본값: MMAP_DIR)"""
+    return os.path.join(base_dir or MMAP_DIR, timeframe, f'{stock_code}.npy')
+
+
+def _meta_path(path: str) -> str:
+    """메모리 맵 파일이 담고 있는 조회 구간을 기록하는 .json 메타데이터 경로"""
+    return os.path.splitext(path)[0] + '.json'
+
+
+def write_ohlcv_mmap(path: str, df: pd.DataFrame, fromdate=None, todate=None) -> int:
+    """
+    OHLCV DataFrame을 메모리 맵으로 읽을 수 있는 .npy 파일로 저장합니다.
+    다른 프로세스가 기존 파일을 매핑하고 있어도 안전하도록 임시 파일을 쓴 뒤 교체합니다.
+    :param fromdate: DB 조회 구간의 시작 (None이면 첫 바 시각). 메타데이터에 기록합니다.
+    :param todate: DB 조회 구간의 종료 (None이면 마지막 바 시각). 메타데이터에 기록합니다.
+    :return: 저장한 바 개수
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    array = frame_to_ohlcv_array(df)
+    meta = {
+        'fromdate': pd.Timestamp(fromdate if fromdate is not None else df.index[0]).isoformat(),
+        'todate': pd.Timestamp(todate if todate is not None else df.index[-1]).isoformat(),
+        'bars': len(array),
+    }
+    meta_path = _meta_path(path)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.save(f, array)
+    with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    # 메타데이터를 데이터보다 나중에 교체하여, 메타데이터가 가리키는 구간은 항상 데이터 파일에 존재하도록 합니다.
+    os.replace(tmp_path, path)
+    os.replace(meta_path + '.tmp', meta_path)
+    logger.debug(f"메모리 맵 파일 저장 완료: {path} ({len(array)}개 바, {meta['fromdate']} ~ {meta['todate']})")
+    return len(array)
+
+
+def read_mmap_range(path: str):
+    """
+    메모리 맵 파일이 담고 있는 조회 구간을 읽습니다.
+    :return: (시작 Timestamp, 종료 Timestamp). 파일이나 메타데이터가 없거나 손상되었으면 None
+    """
+    meta_path = _meta_path(path)
+    if not (os.path.exists(path) and os.path.exists(meta_path)):
+        return None
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        return pd.Timestamp(meta['fromdate']), pd.Timestamp(meta['todate'])
+    except Exception as e:
+        logger.warning(f"메모리 맵 메타데이터를 읽을 수 없어 무시합니다: {meta_path} ({e})")
+        return None
+
+
+def invalidate_mmap(stock_code: str, timeframe: str = 'daily', base_dir: str = None):
+    """
+    종목의 메모리 맵 파일을 무효화합니다. DB에 데이터가 새로 저장/수정되었을 때 호출합니다.
+    메타데이터를 먼저 지우므로, 다른 프로세스가 매핑 중이라 .npy 파일을 지우지 못해도(Windows) 다음 로드 때 다시 생성합니다.
+    """
+    path = mmap_path(stock_code, timeframe, base_dir)
+    for target in (_meta_path(path), path):
+        if os.path.exists(target):
+            try:
+                os.remove(target)
+            except OSError as e:
+                logger.warning(f"메모리 맵 파일을 삭제하지 못했습니다: {target} ({e})")
+
+
+class NumpyMMapData(bt.feed.DataBase):
+    """
+    write_ohlcv_mmap()으로 만든 .npy 파일을 메모리 맵으로 열어 backtrader에 바를 공급하는 피드.
+    DataFrame을 만들지 않고 파일 페이지를 그대로 읽으므로, 같은 파일을 쓰는 여러 워커 프로세스가
+    OS 페이지 캐시를 공유합니다.
+    사용 예: NumpyMMapData(dataname=mmap_path('A005930'), fromdate=..., todate=...)
+    """
+    def _open_array(self) -> np.ndarray:
+        """(n, 6) OHLCV 배열을 엽니다. 하위 클래스에서 다른 저장소(공유 메모리 등)로 바꿀 수 있습니다."""
+        return np.load(self.p.dataname, mmap_mode='r')
+
+    def start(self):
+        super(NumpyMMapData, self).start()
+        self._array = self._open_array()
+        if self._array.ndim != 2 or self._array.shape[1] != len(OHLCV_ARRAY_COLUMNS):
+            raise ValueError(f"OHLCV 배열의 형태가 올바르지 않습니다: {self._array.shape}")
+
+        # fromdate/todate 구간을 이진 탐색으로 찾아 구간 밖의 바는 읽지 않습니다.
+        datetimes = self._array[:, 0]
+        begin, end = 0, len(datetimes)
+        if self.p.fromdate is not None:
+            begin = int(np.searchsorted(datetimes, bt.date2num(self.p.fromdate), side='left'))
+        if self.p.todate is not None:
+            end = int(np.searchsorted(datetimes, bt.date2num(self.p.todate), side='right'))
+        self._idx = begin - 1
+        self._end = end
+
+    def stop(self):
+        self._array = None # 매핑 해제 (다른 참조가 없으면 파일이 닫힘)
+        super(NumpyMMapData, self).stop()
+
+    def _load(self):
+        self._idx += 1
+        if self._idx >= self._end:
+            return False
+
+        dt, open_, high, low, close, volume = self._array[self._idx]
+        lines = self.lines
+        lines.datetime[0] = dt
+        lines.open[0] = open_
+        lines.high[0] = high
+        lines.low[0] = low
+        lines.close[0] = close
+        lines.volume[0] = volume
+        lines.openinterest[0] = 0.0
+        return True
@@ -0,0 +1,186 @@
+# backtesting/feeds/parquet_cache.py
+
+import json
+import logging
+import os
+import sys
+import threading
+from datetime import datetime, date, timedelta
+
+import pandas as pd
+
+try:
+    import pyarrow # noqa: F401 (pandas의 parquet 엔진)
+except ImportError:
+    pyarrow = None
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from config.settings import DATA_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# 캐시 high-water mark 다음부터 조회할 때 더하는 최소 간격
+_TIMEFRAME_STEP = {
+    'daily': timedelta(days=1),
+    'minute': timedelta(seconds=1),
+}
+
+
+class ParquetCache:
+    """
+    DB의 OHLCV 데이터를 종목/타임프레임별 Parquet 파일로 보관하는 로컬 캐시.
+    - 파일 구조: {cache_dir}/{timeframe}/{stock_code}.parquet (+ 같은 이름의 .json 메타데이터)
+    - 메타데이터에는 DB에서 조회를 마친 구간의 시작(start)과 마지막 바 시각(high_water_mark)을 기록합니다.
+    - 요청 구간이 캐시 구간을 벗어나면 벗어난 부분만 DB에서 가져와 합칩니다.
+      (과거 데이터는 바뀌지 않으므로 high_water_mark 이후만 추가 조회)
+    - StockDataManager가 DB에 새 데이터를 저장하면 invalidate()로 해당 시점 이후를 잘라냅니다.
+    캐시 데이터는 DBDataLoader.to_bt_frame 형식(OHLCV 컬럼, datetime 인덱스)입니다.
+    """
+    def __init__(self, cache_dir: str = DATA_CACHE_DIR):
+        if pyarrow is None:
+            raise ImportError("ParquetCache를 사용하려면 pyarrow가 필요합니다. (pip install pyarrow)")
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+
+    def _paths(self, stock_code: str, timeframe: str):
+        if timeframe not in _TIMEFRAME_STEP:
+            raise ValueError("지원하지 않는 timeframe입니다. 'daily' 또는 'minute'을 사용하세요.")
+        base = os.path.join(self.cache_dir, timeframe, stock_code)
+        return base + '.parquet', base + '.json'
+
+    @staticmethod
+    def _to_timestamp(value) -> pd.Timestamp:
+        if isinstance(value, date) and not isinstance(value, datetime):
+            value = datetime.combine(value, datetime.min.time())
+        return pd.Timestamp(value)
+
+    @staticmethod
+    def _to_request_type(ts: pd.Timestamp, like):
+        """캐시 내부의 Timestamp를 호출자가 넘긴 타입(date 또는 datetime)으로 되돌립니다."""
+        if isinstance(like, date) and not isinstance(like, datetime):
+            return ts.date()
+        return ts.to_pydatetime()
+
+    def _read_meta(self, stock_code: str, timeframe: str):
+        """메타데이터만 읽습니다. 캐시가 없거나 손상되었으면 None"""
+        data_path, meta_path = self._paths(stock_code, timeframe)
+        if not (os.path.exists(data_path) and os.path.exists(meta_path)):
+            return None
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return {key: pd.Timestamp(value) for key, value in json.load(f).items()}
+        except Exception as e:
+            logger.warning(f"{stock_code} ({timeframe}) 캐시 메타데이터를 읽을 수 없어 무시합니다: {e}")
+            return None
+
+    def read(self, stock_code: str, timeframe: str):
+        """
+        캐시된 데이터와 메타데이터를 읽습니다.
+        :return: (DataFrame, 메타데이터 딕셔너리). 캐시가 없거나 손상되었으면 (None, None)
+        """
+        meta = self._read_meta(stock_code, timeframe)
+        if meta is None:
+            return None, None
+        data_path, _ = self._paths(stock_code, timeframe)
+        try:
+            df = pd.read_parquet(data_path)
+            return df, meta
+        except Exception as e:
+            logger.warning(f"{stock_code} ({timeframe}) 캐시를 읽을 수 없어 무시합니다: {e}")
+            return None, None
+
+    def write(self, stock_code: str, timeframe: str, df: pd.DataFrame, start):
+        """
+        데이터를 캐시에 기록합니다. 다른 프로세스가 읽는 중이어도 안전하도록 임시 파일을 쓴 뒤 교체합니다.
+        :param df: OHLCV DataFrame (datetime 인덱스, 정렬됨)
+        :param start: DB 조회를 마친 구간의 시작 시각
+        """
+        if df.empty:
+            return
+        data_path, meta_path = self._paths(stock_code, timeframe)
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+        meta = {
+            'start': self._to_timestamp(start).isoformat(),
+            'high_water_mark': df.index[-1].isoformat(),
+        }
+        suffix = f'.{os.getpid()}.{threading.get_ident()}.tmp'
+        df.to_parquet(data_path + suffix)
+        with open(meta_path + suffix, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        # 메타데이터를 데이터보다 나중에 교체하여, 메타데이터가 가리키는 구간은 항상 데이터 파일에 존재하도록 합니다.
+        os.replace(data_path + suffix, data_path)
+        os.replace(meta_path + suffix, meta_path)
+
+    def invalidate(self, stock_code: str, timeframe: str, since=None):
+        """
+        캐시를 무효화합니다. DB에 데이터가 새로 저장/수정되었을 때 호출합니다.
+        :param since: 이 시각 이후(포함)의 데이터만 잘라냅니다. None이면 해당 종목 캐시 전체를 삭제
+        """
+        with self._lock:
+            data_path, meta_path = self._paths(stock_code, timeframe)
+            if since is not None:
+                df, meta = self.read(stock_code, timeframe)
+                if df is not None:
+                    kept = df[df.index < self._to_timestamp(since)]
+                    if not kept.empty:
+                        self.write(stock_code, timeframe, kept, meta['start'])
+                        logger.debug(f"{stock_code} ({timeframe}) 캐시를 {since} 이전까지로 잘라냈습니다.")
+                        return
+            for path in (meta_path, data_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            logger.debug(f"{stock_code} ({timeframe}) 캐시를 삭제했습니다.")
+
+    def missing_ranges(self, stock_code: str, timeframe: str, start, end) -> list:
+        """
+        요청 구간 중 캐시에 없어 DB에서 가져와야 하는 구간 목록을 반환합니다.
+        :return: [(조회 시작, 조회 종료), ...] - start/end와 같은 타입
+        """
+        meta = self._read_meta(stock_code, timeframe)
+        if meta is None:
+            return [(start, end)]
+        step = _TIMEFRAME_STEP[timeframe]
+        ranges = []
+        if self._to_timestamp(start) < meta['start']:
+            ranges.append((start, self._to_request_type(meta['start'] - step, start)))
+        if self._to_timestamp(end) > meta['high_water_mark']:
+            ranges.append((self._to_request_type(meta['high_water_mark'] + step, end), end))
+        return ranges
+
+    def merge(self, stock_code: str, timeframe: str, start, end, fetched: list) -> pd.DataFrame:
+        """
+        DB에서 새로 가져온 데이터를 캐시와 합쳐 저장하고, 요청 구간의 데이터를 반환합니다.
+        :param fetched: missing_ranges() 구간별로 DB에서 가져온 OHLCV DataFrame 리스트
+        :return: 요청 구간 [start, end]의 OHLCV DataFrame
+        """
+        with self._lock:
+            cached, meta = self.read(stock_code, timeframe)
+            fetched = [df for df in fetched if df is not None and not df.empty]
+            combined = cached
+            if fetched:
+                frames = ([cached] if cached is not None else []) + fetched
+                combined = pd.concat(frames)
+                combined = combined[~combined.index.duplicated(keep='last')].sort_index()
+            covered_start = self._to_timestamp(start)
+            if meta is not None:
+                covered_start = min(meta['start'], covered_start)
+            # 새 데이터가 없더라도 조회를 마친 구간이 넓어졌으면 메타데이터를 갱신하여 같은 구간을 다시 조회하지 않습니다.
+            if combined is not None and (fetched or covered_start < meta['start']):
+                self.write(stock_code, timeframe, combined, covered_start)
+        if combined is None:
+            return None
+        return combined[(combined.index >= self._to_timestamp(start)) & (combined.index <= self._to_timestamp(end))]
+
+    def get_frame(self, stock_code: str, timeframe: str, start, end, fetch_func) -> pd.DataFrame:
+        """
+        요청 구간의 데이터를 캐시에서 읽고, 캐시에 없는 구간만 fetch_func로 DB에서 가져와 보충합니다.
+        :param fetch_func: fetch_func(start, end) -> OHLCV DataFrame (DB 조회 함수)
+        :return: OHLCV DataFrame. 캐시와 DB 모두에 데이터가 없으면 None
+        """
+        ranges = self.missing_ranges(stock_code, timeframe, start, end)
+        if ranges:
+            logger.debug(f"{stock_code} ({timeframe}) 캐시 보충 구간: {ranges}")
+        fetched = [fetch_func(range_start, range_end) for range_start, range_end in ranges]
+        return self.merge(stock_code, timeframe, start, end, fetched)
@@ -0,0 +1,116 @@
+# backtesting/feeds/shared_memory_data.py
+
+import logging
+import os
+import sys
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from feeds.numpy_mmap_data import NumpyMMapData, OHLCV_ARRAY_COLUMNS, frame_to_ohlcv_array
+
+logger = logging.getLogger(__name__)
+
+
+def attach_ohlcv(entry):
+    """
+    레지스트리 항목 (공유 메모리 이름, 바 개수)이 가리키는 블록에 연결합니다.
+    :return: (SharedMemory, (바 개수, 6) float64 배열 뷰). 배열을 다 쓴 뒤 SharedMemory.close()를 호출해야 합니다.
+    """
+    name, rows = entry
+    shm = shared_memory.SharedMemory(name=name)
+    array = np.ndarray((rows, len(OHLCV_ARRAY_COLUMNS)), dtype=np.float64, buffer=shm.buf)
+    return shm, array
+
+
+class SharedOHLCVStore:
+    """
+    종목별 OHLCV를 multiprocessing.shared_memory 블록에 한 번만 올려 두는 저장소 (부모 프로세스 측).
+    배열 레이아웃은 NumpyMMapData와 같으며(frame_to_ohlcv_array), registry만 워커에 넘기면
+    워커는 SharedMemoryData 피드로 복사 없이 같은 메모리를 읽습니다.
+    블록은 close()(또는 with 블록 종료) 시 해제되므로, 워커가 모두 끝난 뒤에 닫아야 합니다.
+    사용 예:
+        with SharedOHLCVStore() as store:
+            store.publish_frames(data_loader.load_daily_frames(codes, fromdate, todate))
+            ... ProcessPoolExecutor(initargs=(store.registry, ...)) ...
+    """
+    def __init__(self):
+        self.registry = {} # {종목 코드: (공유 메모리 이름, 바 개수)} - 워커에 전달하는 작은 dict
+        self._blocks = {}
+
+    def publish(self, stock_code: str, df: pd.DataFrame):
+        """
+        DBDataLoader.to_bt_frame 형식의 DataFrame을 공유 메모리 블록으로 복사합니다.
+        같은 종목을 다시 올리면 이전 블록을 해제합니다.
+        :return: 레지스트리 항목 (공유 메모리 이름, 바 개수)
+        """
+        array = frame_to_ohlcv_array(df)
+        shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+
+        self.release(stock_code)
+        self._blocks[stock_code] = shm
+        self.registry[stock_code] = (shm.name, len(array))
+        return self.registry[stock_code]
+
+    def publish_frames(self, frames: dict) -> dict:
+        """
+        {종목 코드: DataFrame}을 모두 공유 메모리에 올립니다. (DBDataLoader.load_daily_frames 결과 등)
+        :return: registry
+        """
+        for stock_code, df in frames.items():
+            self.publish(stock_code, df)
+        logger.info(f"공유 메모리에 {len(frames)}개 종목 게시 완료 (총 {self.nbytes / 1024 / 1024:.1f}MB)")
+        return self.registry
+
+    @property
+    def nbytes(self) -> int:
+        return sum(rows * len(OHLCV_ARRAY_COLUMNS) * 8 for _, rows in self.registry.values())
+
+    def release(self, stock_code: str):
+        """한 종목의 블록을 해제합니다."""
+        shm = self._blocks.pop(stock_code, None)
+        self.registry.pop(stock_code, None)
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    def close(self):
+        """모든 블록을 해제합니다."""
+        for stock_code in list(self._blocks):
+            self.release(stock_code)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class SharedMemoryData(NumpyMMapData):
+    """
+    SharedOHLCVStore에 올려 둔 종목 데이터를 복사 없이 읽는 피드.
+    NumpyMMapData와 같은 방식으로 바를 공급하며, 배열을 파일 대신 공유 메모리에서 엽니다.
+    사용 예: SharedMemoryData(dataname='A005930', registry=store.registry, fromdate=..., todate=...)
+    """
+    params = (
+        ('registry', None), # SharedOHLCVStore.registry
+    )
+
+    def _open_array(self) -> np.ndarray:
+        if self.p.registry is None or self.p.dataname not in self.p.registry:
+            raise KeyError(f"공유 메모리 레지스트리에 종목이 없습니다: {self.p.dataname}")
+        self._shm, array = attach_ohlcv(self.p.registry[self.p.dataname])
+        return array
+
+    def stop(self):
+        super(SharedMemoryData, self).stop() # 배열 뷰를 먼저 놓아야 블록을 닫을 수 있음
+        shm = getattr(self, '_shm', None)
+        if shm is not None:
+            shm.close()
+            self._shm = None
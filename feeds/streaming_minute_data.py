@@ -0,0 +1,88 @@
+# backtesting/feeds/streaming_minute_data.py
+
+import logging
+import os
+import sys
+
+import backtrader as bt
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from config.settings import STREAM_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingMinuteData(bt.feed.DataBase):
+    """
+    DBManager.iter_minute_data()로 분봉을 청크 단위로 읽으면서 Cerebro가 진행하는 만큼만 바를 공급하는 피드.
+    수년치 1분봉도 DB 결과 전체나 DataFrame을 메모리에 올리지 않습니다.
+
+    Cerebro가 데이터를 미리 읽어 두지 않도록 preload=False로 실행해야 효과가 있습니다.
+    (exactbars를 함께 쓰면 line 버퍼까지 고정 크기로 유지됩니다.)
+    피드마다 실행이 끝날 때까지 DB 연결 풀의 연결을 하나 점유하므로, 한 DBManager로 동시에 여는 스트리밍 피드 수는
+    풀 크기(DB_POOL_SIZE)보다 작아야 합니다. 넘으면 마지막 피드가 연결을 기다리다 DB_POOL_TIMEOUT 후 실패합니다.
+    (Backtester.add_streaming_minute_data가 확인합니다)
+    사용 예:
+        data = StreamingMinuteData(db_manager=db_manager, dataname='A005930', fromdate=..., todate=...)
+        cerebro.adddata(data)
+        cerebro.run(preload=False)
+    """
+    params = (
+        ('db_manager', None), # DBManager 인스턴스
+        ('chunk_size', STREAM_CHUNK_SIZE), # 한 번에 DB에서 읽을 행 수
+        ('timeframe', bt.TimeFrame.Minutes),
+        ('compression', 1),
+    )
+
+    def start(self):
+        super(StreamingMinuteData, self).start()
+        if self.p.db_manager is None:
+            raise ValueError("StreamingMinuteData에는 db_manager 파라미터가 필요합니다.")
+        stock_code = self.p.dataname
+        logger.info(f"{stock_code} 분봉 스트리밍 시작: {self.p.fromdate} ~ {self.p.todate} (청크 {self.p.chunk_size}행)")
+        self._chunks = self.p.db_manager.iter_minute_data(
+            stock_code,
+            start_datetime=self.p.fromdate,
+            end_datetime=self.p.todate,
+            chunk_size=self.p.chunk_size
+        )
+        self._rows = iter(())
+        self._bar_count = 0
+
+    def stop(self):
+        chunks = getattr(self, '_chunks', None)
+        if chunks is not None:
+            chunks.close() # 끝까지 읽지 않았으면 서버 측 커서와 연결을 정리
+            self._chunks = None
+            logger.info(f"{self.p.dataname} 분봉 스트리밍 종료: {self._bar_count}개 바 공급")
+        super(StreamingMinuteData, self).stop()
+
+    def _next_row(self):
+        """현재 청크에서 다음 행을 꺼내고, 청크가 끝나면 DB에서 다음 청크를 읽습니다."""
+        row = next(self._rows, None)
+        while row is None:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return None
+            self._rows = iter(chunk)
+            row = next(self._rows, None)
+        return row
+
+    def _load(self):
+        row = self._next_row()
+        if row is None:
+            return False
+
+        dt, open_, high, low, close, volume = row
+        lines = self.lines
+        lines.datetime[0] = bt.date2num(dt)
+        lines.open[0] = float(open_)
+        lines.high[0] = float(high)
+        lines.low[0] = float(low)
+        lines.close[0] = float(close)
+        lines.volume[0] = float(volume)
+        lines.openinterest[0] = 0.0
+        self._bar_count += 1
+        return True
@@ -0,0 +1,110 @@
+# backtesting/strategies/indicators.py
+
+import hashlib
+import logging
+import math
+import os
+import sys
+from array import array
+from collections import OrderedDict
+
+import backtrader as bt
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from config.settings import INDICATOR_CACHE_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class IndicatorCache:
+    """
+    지표 계산 결과를 (입력 데이터, 지표 이름, 파라미터) 키로 보관하는 LRU 캐시.
+    파라미터 최적화에서 같은 데이터와 같은 기간의 SMA를 조합마다 다시 계산하지 않도록
+    같은 프로세스의 전략 인스턴스들이 공유합니다. (프로세스 풀의 워커는 각자 캐시를 가짐)
+    """
+    def __init__(self, maxsize: int = INDICATOR_CACHE_SIZE):
+        """
+        :param maxsize: 보관할 최대 지표 시계열 수. 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+        """
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def data_key(values) -> bytes:
+        """
+        입력 시계열의 내용으로 키를 만듭니다.
+        피드 객체는 Cerebro 실행마다 새로 만들어지므로 객체 id 대신 값 자체를 해시합니다.
+        """
+        return hashlib.blake2b(memoryview(values), digest_size=16).digest()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, values):
+        self._entries[key] = values
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# 프로세스 전역 기본 캐시
+indicator_cache = IndicatorCache()
+
+
+class CachedSMA(bt.Indicator):
+    """
+    IndicatorCache를 거치는 단순 이동평균. bt.indicators.SMA와 같은 값을 냅니다.
+    데이터를 미리 읽는 runonce 모드에서는 once()가 캐시된 시계열을 복사만 하고,
+    처음 보는 (데이터, 기간) 조합일 때만 계산하여 캐시에 넣습니다.
+    preload/runonce가 꺼진 실행(exactbars, 스트리밍 피드)에서는 next()로 바마다 계산합니다.
+    """
+    lines = ('sma',)
+    params = (
+        ('period', 30),
+        ('cache', None), # None이면 모듈 기본 캐시(indicator_cache)
+    )
+
+    def __init__(self):
+        self.addminperiod(self.p.period)
+        self._values = None
+
+    def next(self):
+        self.lines.sma[0] = math.fsum(self.data.get(size=self.p.period)) / self.p.period
+
+    def _cached_values(self) -> array:
+        """입력 시계열 전체의 SMA를 캐시에서 찾고, 없으면 계산하여 넣습니다."""
+        cache = self.p.cache if self.p.cache is not None else indicator_cache
+        src = self.data.array
+        key = (cache.data_key(src), 'SMA', self.p.period)
+        values = cache.get(key)
+        if values is None:
+            period = self.p.period
+            values = array('d', [float('nan')] * len(src))
+            for i in range(period - 1, len(src)):
+                values[i] = math.fsum(src[i - period + 1:i + 1]) / period
+            cache.put(key, values)
+        return values
+
+    def once(self, start, end):
+        # oncestart()와 once()로 나누어 호출되므로 조회는 실행당 한 번만 합니다.
+        if self._values is None:
+            self._values = self._cached_values()
+        self.lines.sma.array[start:end] = self._values[start:end]
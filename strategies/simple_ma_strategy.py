@@ -2,6 +2,13 @@
 
 import backtrader as bt
 import logging
+import os
+import sys
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from strategies.indicators import CachedSMA
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +21,8 @@ class SimpleMAStrategy(bt.Strategy):
     params = (
         ('sma_fast_period', 10), # 단기 이동평균 기간
         ('sma_slow_period', 50), # 장기 이동평균 기간
+        ('cache_indicators', True), # True이면 같은 프로세스의 다른 실행과 SMA 계산 결과를 공유 (파라미터 최적화용)
+        ('verbose', True), # False이면 신호/주문/거래별 로그 대신 counters만 집계하고 종료 시 한 번 요약 (장기간 분봉 실행용)
     )
 
     def __init__(self):
@@ -23,11 +32,16 @@ class SimpleMAStrategy(bt.Strategy):
         # 주문 상태 추적을 위한 변수
         self.order = None
 
+        # 신호/주문/거래 집계 (verbose=False일 때 건별 로그 대신 사용)
+        self.counters = {'buy_signals': 0, 'sell_signals': 0, 'buy_orders': 0, 'sell_orders': 0,
+                         'failed_orders': 0, 'closed_trades': 0}
+
         # 이동평균 지표 계산
         # bt.indicators.SMA(self.dataclose, period=self.p.sma_fast_period)
         # backtrader 튜토리얼에서 보통 self.data.close 를 사용하므로, self.datas[0].close를 넣어줍니다.
-        self.sma_fast = bt.indicators.SMA(self.dataclose, period=self.p.sma_fast_period)
-        self.sma_slow = bt.indicators.SMA(self.dataclose, period=self.p.sma_slow_period)
+        sma = CachedSMA if self.p.cache_indicators else bt.indicators.SMA
+        self.sma_fast = sma(self.dataclose, period=self.p.sma_fast_period)
+        self.sma_slow = sma(self.dataclose, period=self.p.sma_slow_period)
 
         # 이동평균 교차 지표 (Crossover)
         # 단기 SMA가 장기 SMA를 상향/하향 돌파하는지 알려주는 지표
@@ -43,25 +57,29 @@ class SimpleMAStrategy(bt.Strategy):
 
         if order.status in [order.Completed]:
             # 주문 완료
-            if order.isbuy():
-                logger.info(
-                    f'매수 완료: 날짜={self.data.datetime.date(0)}, '
-                    f'가격={order.executed.price:.2f}, '
-                    f'수량={order.executed.size}, '
-                    f'수수료={order.executed.comm:.2f}'
-                )
-            elif order.issell():
-                logger.info(
-                    f'매도 완료: 날짜={self.data.datetime.date(0)}, '
-                    f'가격={order.executed.price:.2f}, '
-                    f'수량={order.executed.size}, '
-                    f'수수료={order.executed.comm:.2f}'
-                )
+            self.counters['buy_orders' if order.isbuy() else 'sell_orders'] += 1
+            if self.p.verbose:
+                if order.isbuy():
+                    logger.info(
+                        f'매수 완료: 날짜={self.data.datetime.date(0)}, '
+                        f'가격={order.executed.price:.2f}, '
+                        f'수량={order.executed.size}, '
+                        f'수수료={order.executed.comm:.2f}'
+                    )
+                elif order.issell():
+                    logger.info(
+                        f'매도 완료: 날짜={self.data.datetime.date(0)}, '
+                        f'가격={order.executed.price:.2f}, '
+                        f'수량={order.executed.size}, '
+                        f'수수료={order.executed.comm:.2f}'
+                    )
             self.bar_executed = len(self) # 주문이 실행된 바(bar)의 인덱스 기록
 
         elif order.status in [order.Canceled, order.Margin, order.Rejected]:
             # 주문 취소, 마진 부족, 거부됨
-            logger.warning(f'주문 실패: 상태={order.Status[order.status]}, 날짜={self.data.datetime.date(0)}')
+            self.counters['failed_orders'] += 1
+            if self.p.verbose:
+                logger.warning(f'주문 실패: 상태={order.Status[order.status]}, 날짜={self.data.datetime.date(0)}')
 
         # 주문이 완료되거나 실패하면 self.order를 초기화하여 다음 주문을 낼 수 있도록 합니다.
         self.order = None
@@ -71,7 +89,9 @@ class SimpleMAStrategy(bt.Strategy):
         if not trade.isclosed:
             return # 아직 닫히지 않은 거래는 무시
 
-        logger.info(f'거래 종료: 총 손익={trade.pnl:.2f}, 수수료 포함 손익={trade.pnlcomm:.2f}')
+        self.counters['closed_trades'] += 1
+        if self.p.verbose:
+            logger.info(f'거래 종료: 총 손익={trade.pnl:.2f}, 수수료 포함 손익={trade.pnlcomm:.2f}')
 
     def next(self):
         # 다음 데이터 바(bar)가 들어올 때마다 호출됩니다.
@@ -86,7 +106,9 @@ class SimpleMAStrategy(bt.Strategy):
             # 단기 이동평균이 장기 이동평균을 상향 돌파 (매수 신호)
             # crossover > 0 : 상향 돌파 (단기선이 장기선을 위로 통과)
             if self.crossover[0] > 0: # crossover[0]는 현재 바(bar)에서의 crossover 값
-                logger.info(f'매수 신호 발생: 날짜={self.data.datetime.date(0)}, 단기SMA={self.sma_fast[0]:.2f}, 장기SMA={self.sma_slow[0]:.2f}')
+                self.counters['buy_signals'] += 1
+                if self.p.verbose:
+                    logger.info(f'매수 신호 발생: 날짜={self.data.datetime.date(0)}, 단기SMA={self.sma_fast[0]:.2f}, 장기SMA={self.sma_slow[0]:.2f}')
                 # 시장가 매수 주문 (전체 현금의 90% 사용)
                 # size는 매수할 수량입니다. backtrader가 알아서 계산해줍니다.
                 # backtrader.py에서 setcash(100_000_000)으로 설정했으므로
@@ -101,6 +123,12 @@ class SimpleMAStrategy(bt.Strategy):
             # 단기 이동평균이 장기 이동평균을 하향 돌파 (매도 신호)
             # crossover < 0 : 하향 돌파 (단기선이 장기선을 아래로 통과)
             if self.crossover[0] < 0:
-                logger.info(f'매도 신호 발생: 날짜={self.data.datetime.date(0)}, 단기SMA={self.sma_fast[0]:.2f}, 장기SMA={self.sma_slow[0]:.2f}')
+                self.counters['sell_signals'] += 1
+                if self.p.verbose:
+                    logger.info(f'매도 신호 발생: 날짜={self.data.datetime.date(0)}, 단기SMA={self.sma_fast[0]:.2f}, 장기SMA={self.sma_slow[0]:.2f}')
                 # 시장가 매도 주문 (현재 보유한 모든 포지션 매도)
-                self.order = self.sell(size=self.position.size) # 모든 포지션 매도
\ No newline at end of file
+                self.order = self.sell(size=self.position.size) # 모든 포지션 매도
+
+    def stop(self):
+        if not self.p.verbose:
+            logger.info(f"전략 종료: {self.counters}")
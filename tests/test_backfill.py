@@ -0,0 +1,135 @@
+# backtesting/tests/test_backfill.py
+
+import os
+import sys
+import threading
+from datetime import date, datetime, timedelta
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from api_client.creon_api import CreonAPIClient
+from api_client.fake_creon import FakeCreonBackend
+from benchmarks.memory_db import InMemoryDBManager
+from data_manager.backfill import BackfillWorker, create_backfill_job, make_backfill_units
+from data_manager.stock_data_manager import StockDataManager
+
+
+def make_manager(db, num_stocks=4):
+    backend = FakeCreonBackend(num_stocks=num_stocks, quota=10_000)
+    return StockDataManager(db, CreonAPIClient(backend=backend, code_master_dir=None)), backend
+
+
+def test_units_are_chunked_and_skip_weekend_only_chunks():
+    units = make_backfill_units(['A000010'], date(2024, 1, 1), date(2024, 1, 14), ('daily', 'minute'),
+                                daily_chunk_days=365, minute_chunk_days=5)
+    assert units == [
+        ('A000010', 'daily', date(2024, 1, 1), date(2024, 1, 14)),
+        ('A000010', 'minute', date(2024, 1, 1), date(2024, 1, 5)),
+        ('A000010', 'minute', date(2024, 1, 6), date(2024, 1, 10)),
+        # 1/11~1/14도 평일(목, 금)이 있으므로 포함
+        ('A000010', 'minute', date(2024, 1, 11), date(2024, 1, 14)),
+    ]
+    assert make_backfill_units(['A000010'], date(2024, 1, 6), date(2024, 1, 7)) == [] # 주말만
+
+
+def test_worker_recovers_crashed_claims_and_resumes():
+    db = InMemoryDBManager()
+    manager, backend = make_manager(db, num_stocks=3)
+    codes = backend.stock_codes
+    assert create_backfill_job(db, 'job', codes, date(2024, 1, 1), date(2024, 3, 29)) == 3
+
+    # 다른 워커가 단위 하나를 가져간 뒤 중단됨 (점유 시간 0초 -> 바로 만료)
+    crashed = db.claim_backfill_units('job', 'crashed-worker', limit=1, lease_seconds=0)
+
+    summary = BackfillWorker(manager, 'job', worker_id='w1').run()
+
+    assert summary['done'] == 3 and summary['failed'] == 0 and summary['stopped'] is None
+    assert summary['status'] == {'pending': 0, 'running': 0, 'done': 3, 'failed': 0}
+    assert len(db.fetch_daily_data(codes[0])) == 65 # 2024년 1~3월 평일 수
+    assert not db.finish_backfill_unit('job', crashed[0], rows_saved=0) # 늦게 끝난 워커는 기록하지 않음
+
+    # 다시 실행해도 Creon 요청 없이 끝남, 같은 작업을 다시 등록해도 완료 상태 유지
+    requests = backend.request_count
+    assert create_backfill_job(db, 'job', codes, date(2024, 1, 1), date(2024, 3, 29)) == 3
+    assert BackfillWorker(manager, 'job').run()['processed'] == 0
+    assert backend.request_count == requests
+
+
+def test_crashing_unit_stops_after_max_attempts():
+    db = InMemoryDBManager()
+    create_backfill_job(db, 'job', ['A000010'], date(2024, 1, 1), date(2024, 1, 31))
+
+    # 단위가 매번 워커를 죽이는 경우 (점유 시간 0초 -> 바로 만료)
+    for attempt in range(1, 3):
+        assert [unit['attempts'] for unit in db.claim_backfill_units('job', 'w', lease_seconds=0, max_attempts=2)] == \
+            [attempt]
+
+    assert db.claim_backfill_units('job', 'w', lease_seconds=0, max_attempts=2) == []
+    assert db.get_backfill_status('job') == {'pending': 0, 'running': 0, 'done': 0, 'failed': 1}
+
+
+def test_failed_unit_waits_for_retry_backoff(monkeypatch):
+    db = InMemoryDBManager()
+    manager, backend = make_manager(db, num_stocks=1)
+    create_backfill_job(db, 'job', backend.stock_codes, date(2024, 1, 1), date(2024, 1, 31))
+    monkeypatch.setattr(manager, 'fetch_daily_window', lambda *args: None) # 계속 실패하는 종목
+
+    # 실패 직후에는 다시 가져가지 않으므로 한 번만 시도하고 종료
+    summary = BackfillWorker(manager, 'job', retry_backoff_seconds=300).run()
+    assert summary['processed'] == 1 and summary['failed'] == 1
+    assert db.get_backfill_status('job')['failed'] == 1
+
+    # 대기 시간이 지나면 다시 가져가고, 다음 대기 시간은 2배
+    (unit,) = db._backfill.values()
+    unit['next_attempt_at'] = datetime.now() - timedelta(seconds=1)
+    assert BackfillWorker(manager, 'job', retry_backoff_seconds=300).run()['failed'] == 1
+    assert unit['attempts'] == 2
+    assert timedelta(seconds=590) < unit['next_attempt_at'] - datetime.now() <= timedelta(seconds=600)
+    assert BackfillWorker(manager, 'job', retry_backoff_seconds=300).run()['processed'] == 0
+
+
+def test_out_of_order_chunk_does_not_seed_change_rate_across_a_gap():
+    db = InMemoryDBManager()
+    manager, backend = make_manager(db, num_stocks=1)
+    code = backend.stock_codes[0]
+    january, february, march = [(code, 'daily', date(2024, month, 1), date(2024, month + 1, 1) - timedelta(days=1))
+                                for month in (1, 2, 3)]
+    assert db.add_backfill_units('job', [january, march]) # 2월 청크가 빠진 상태로 1월, 3월 처리
+    BackfillWorker(manager, 'job').run()
+    assert db.add_backfill_units('job', [february])
+    BackfillWorker(manager, 'job').run()
+
+    df = db.fetch_daily_data(code).sort_values('date').reset_index(drop=True)
+    close = df['close_price'].astype(float)
+    rates = df.set_index('date')['change_rate'].astype(float)
+    expected = ((close - close.shift(1)) / close.shift(1) * 100).round(2)
+    expected.index = df['date']
+
+    assert rates[date(2024, 3, 1)] == 0.0 # 1월 말 종가로 계산하지 않음 (repair_change_rates 대상)
+    assert rates[date(2024, 2, 1)] == pytest.approx(expected[date(2024, 2, 1)]) # 1월 31일(전 거래일) 종가 사용
+    assert manager.repair_change_rates([code])['updated'] == 1
+
+
+def test_workers_share_one_job():
+    db = InMemoryDBManager()
+    codes = make_manager(db, num_stocks=8)[1].stock_codes
+    create_backfill_job(db, 'shared', codes, date(2024, 1, 1), date(2024, 1, 31))
+
+    results = {}
+
+    def work(name):
+        manager, _ = make_manager(db, num_stocks=8) # 워커마다 별도 Creon 연결
+        results[name] = BackfillWorker(manager, 'shared', worker_id=name).run()
+
+    threads = [threading.Thread(target=work, args=(f'w{i}',)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(summary['done'] for summary in results.values()) == 8
+    assert db.get_backfill_status('shared')['done'] == 8
@@ -0,0 +1,71 @@
+# backtesting/tests/test_backtester.py
+
+import logging
+import os
+import sys
+from datetime import date
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from backtester import Backtester
+from backtester.results_store import ResultsStore
+from benchmarks.memory_db import InMemoryDBManager
+from benchmarks.synthetic_data import make_stock_codes, generate_daily_data
+from strategies.simple_ma_strategy import SimpleMAStrategy
+
+START, END = date(2022, 1, 1), date(2023, 12, 31)
+
+
+@pytest.fixture
+def db():
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+    db = InMemoryDBManager()
+    db.bulk_load_daily_data(generate_daily_data(make_stock_codes(2), START, END, seed=5))
+    return db
+
+
+def test_optimize_with_workers_matches_serial(db):
+    grid = {'sma_fast_period': [3, 5, 10], 'sma_slow_period': [20, 40]}
+    with Backtester(START, END, db_manager=db) as backtester:
+        serial = backtester.optimize(SimpleMAStrategy, grid, 'A000010', workers=1)
+        parallel = backtester.optimize(SimpleMAStrategy, grid, 'A000010', workers=2)
+
+    key = ['sma_fast_period', 'sma_slow_period']
+    serial = serial.sort_values(key).reset_index(drop=True)
+    parallel = parallel.sort_values(key).reset_index(drop=True)
+    assert len(serial) == 6
+    assert serial[key + ['trade_count', 'won', 'lost']].equals(parallel[key + ['trade_count', 'won', 'lost']])
+    assert parallel['final_value'].tolist() == pytest.approx(serial['final_value'].tolist())
+
+
+def test_run_records_to_results_store(db, tmp_path):
+    with Backtester(START, END, db_manager=db) as backtester:
+        backtester.add_data('A000010')
+        backtester.add_strategy(SimpleMAStrategy, sma_fast_period=5, sma_slow_period=20)
+        with ResultsStore(base_dir=str(tmp_path)) as store:
+            strategies = backtester.run(results_store=store)
+
+    assert strategies
+    runs = store.read('runs')
+    assert len(runs) == 1
+    assert runs['final_value'].iloc[0] == pytest.approx(backtester.cerebro.broker.getvalue())
+    assert runs['stock_codes'].iloc[0] == 'A000010' # 피드 이름이 종목 코드
+    trades = store.read('trades')
+    assert len(trades) > 0 and set(trades['stock_code']) == {'A000010'}
+    assert set(store.read('orders')['stock_code']) == {'A000010'}
+
+
+def test_repeated_runs_add_recorder_once(db, tmp_path):
+    with Backtester(START, END, db_manager=db) as backtester:
+        backtester.add_data('A000010')
+        backtester.add_strategy(SimpleMAStrategy, sma_fast_period=5, sma_slow_period=20)
+        with ResultsStore(base_dir=str(tmp_path)) as store:
+            backtester.run(results_store=store)
+            backtester.run(results_store=store)
+
+    assert sum(ancls.__name__ == 'RunRecorder' for ancls, _, _ in backtester.cerebro.analyzers) == 1
+    assert len(store.read('runs')) == 2
@@ -0,0 +1,83 @@
+# backtesting/tests/test_batch_runner.py
+
+import csv
+import logging
+import os
+import sys
+from datetime import date
+from multiprocessing import shared_memory
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from backtester.batch_runner import run_universe
+from backtester.results_store import ResultsStore
+from backtester.runner import run_single
+from benchmarks.memory_db import InMemoryDBManager
+from benchmarks.synthetic_data import make_stock_codes, generate_daily_data
+from feeds.db_data_loader import DBDataLoader
+from feeds.shared_memory_data import SharedOHLCVStore
+from strategies.simple_ma_strategy import SimpleMAStrategy
+
+START, END = date(2023, 1, 1), date(2023, 12, 31)
+PARAMS = {'sma_fast_period': 5, 'sma_slow_period': 20}
+
+
+def test_shared_memory_universe_matches_run_single(tmp_path, monkeypatch):
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+    codes = make_stock_codes(4)
+    db = InMemoryDBManager()
+    db.bulk_load_daily_data(generate_daily_data(codes, START, END, seed=3))
+
+    published = []
+    publish = SharedOHLCVStore.publish
+
+    def spy_publish(self, stock_code, df):
+        entry = publish(self, stock_code, df)
+        published.append(entry[0])
+        return entry
+
+    monkeypatch.setattr(SharedOHLCVStore, 'publish', spy_publish)
+
+    results_path = str(tmp_path / 'universe.csv')
+    summary = run_universe(SimpleMAStrategy, codes + ['A999999'], START, END, results_path, strategy_params=PARAMS,
+                           workers=2, shared_memory=True, db_manager=db)
+
+    assert summary['total'] == 5 and summary['succeeded'] == 4 and summary['failed'] == 1
+    with open(results_path, encoding='utf-8') as f:
+        rows = {row['stock_code']: row for row in csv.DictReader(f)}
+    assert rows['A999999']['error']
+
+    loader = DBDataLoader(db)
+    for code in codes:
+        expected = run_single(SimpleMAStrategy, loader.load_daily_frame(code, START, END), PARAMS)
+        assert int(rows[code]['bars']) == 260
+        assert float(rows[code]['final_value']) == pytest.approx(expected['final_value'])
+        assert int(rows[code]['trade_count']) == expected['trade_count']
+        assert not rows[code]['error']
+
+    # 실행이 끝나면 공유 메모리 블록이 모두 해제됨
+    assert len(published) == 4
+    for name in published:
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+def test_serial_universe_uses_injected_db_manager(tmp_path):
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+    codes = make_stock_codes(2)
+    db = InMemoryDBManager()
+    db.bulk_load_daily_data(generate_daily_data(codes, START, END, seed=3))
+
+    results_path = str(tmp_path / 'universe.csv')
+    with ResultsStore(base_dir=str(tmp_path / 'results')) as store:
+        summary = run_universe(SimpleMAStrategy, codes, START, END, results_path, strategy_params=PARAMS,
+                               workers=1, db_manager=db, results_store=store)
+
+    assert summary['succeeded'] == 2
+    with open(results_path, encoding='utf-8') as f:
+        assert [int(row['bars']) for row in csv.DictReader(f)] == [260, 260]
+    assert set(store.read('trades')['stock_code']) == set(codes) # 피드 이름이 종목 코드
@@ -0,0 +1,59 @@
+# backtesting/tests/test_benchmarks.py
+
+import json
+import os
+import sys
+from datetime import date, datetime
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from benchmarks.memory_db import InMemoryDBManager
+from benchmarks.run_benchmarks import run_benchmarks, compare_results, save_results
+from benchmarks.synthetic_data import make_stock_codes, generate_daily_data, generate_minute_data
+from feeds.db_data_loader import DBDataLoader
+
+
+def test_synthetic_data_is_seeded_and_consistent():
+    codes = make_stock_codes(3)
+    first = generate_daily_data(codes, date(2024, 1, 1), date(2024, 3, 31), seed=7)
+    again = generate_daily_data(codes, date(2024, 1, 1), date(2024, 3, 31), seed=7)
+    other = generate_daily_data(codes, date(2024, 1, 1), date(2024, 3, 31), seed=8)
+    assert first.equals(again) and not first.equals(other)
+    assert (first['low_price'] <= first[['open_price', 'close_price']].min(axis=1)).all()
+    assert (first['high_price'] >= first[['open_price', 'close_price']].max(axis=1)).all()
+
+    minute = generate_minute_data(codes[:1], date(2024, 1, 2), date(2024, 1, 3))
+    assert len(minute) == 2 * 390
+    assert minute['datetime'].iloc[0] == datetime(2024, 1, 2, 9, 1)
+
+
+def test_memory_db_round_trip_through_loader():
+    db = InMemoryDBManager()
+    codes = make_stock_codes(2)
+    db.bulk_load_daily_data(generate_daily_data(codes, date(2024, 1, 1), date(2024, 6, 30)))
+    frames = DBDataLoader(db).load_daily_frames(codes + ['A999999'], date(2024, 2, 1), date(2024, 2, 29))
+    assert sorted(frames) == codes
+    assert frames[codes[0]].index.min() >= datetime(2024, 2, 1)
+    assert list(frames[codes[0]].columns) == DBDataLoader.OHLCV_COLUMNS
+    assert db.get_latest_daily_data_date(codes[0]) == date(2024, 6, 28)
+
+
+def test_run_benchmarks_writes_json_report(tmp_path):
+    report = run_benchmarks(daily_stocks=2, daily_years=1, minute_stocks=1, minute_days=1)
+    names = [(r['timeframe'], r['name']) for r in report['results']]
+    assert ('daily', 'cerebro_run') in names and ('minute', 'end_to_end') in names
+    assert all(r['seconds'] >= 0 for r in report['results'])
+
+    path = save_results(report, str(tmp_path / 'bench.json'))
+    with open(path, encoding='utf-8') as f:
+        saved = json.load(f)
+    assert saved['meta']['daily_stocks'] == 2
+
+    slower = json.loads(json.dumps(saved))
+    for record in slower['results']:
+        if record['rows_per_sec']:
+            record['rows_per_sec'] /= 2
+    assert compare_results(saved, saved) == []
+    assert {r['name'] for r in compare_results(saved, slower)} >= {'cerebro_run'}
@@ -0,0 +1,110 @@
+# backtesting/tests/test_connection_pool.py
+
+import os
+import sys
+import threading
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from db.connection_pool import ConnectionPool, PoolTimeoutError
+
+
+class FakeConnection:
+    """pymysql 연결 대용: open 상태와 ping 결과만 흉내 냅니다."""
+    def __init__(self):
+        self.open = True
+        self.ping_ok = True
+        self.closed = False
+
+    def ping(self, reconnect=False):
+        if not self.ping_ok:
+            raise ConnectionError("server has gone away")
+
+    def close(self):
+        self.open = False
+        self.closed = True
+
+
+def make_pool(**kwargs):
+    created = []
+
+    def connect():
+        conn = FakeConnection()
+        created.append(conn)
+        return conn
+
+    return ConnectionPool(connect, **kwargs), created
+
+
+def test_reuses_released_connection():
+    pool, created = make_pool(max_size=2)
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+    assert first is second
+    assert len(created) == 1
+
+
+def test_bounded_size_times_out():
+    pool, _ = make_pool(max_size=1, timeout=0.05)
+    conn = pool.acquire()
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+    pool.release(conn)
+    pool.release(pool.acquire())
+
+
+def test_health_check_replaces_dead_connection():
+    pool, created = make_pool(max_size=1, health_check_interval=0)
+    with pool.connection() as conn:
+        pass
+    conn.ping_ok = False
+    with pool.connection() as replacement:
+        pass
+    assert replacement is not conn
+    assert conn.closed
+    assert len(created) == 2
+
+
+def test_error_in_block_discards_connection():
+    pool, created = make_pool(max_size=1)
+    with pytest.raises(RuntimeError):
+        with pool.connection() as conn:
+            raise RuntimeError("query failed")
+    assert conn.closed
+    with pool.connection() as fresh:
+        assert fresh is not conn
+
+
+def test_threads_get_distinct_connections():
+    pool, created = make_pool(max_size=4)
+    barrier = threading.Barrier(4)
+    seen = []
+
+    def worker():
+        with pool.connection() as conn:
+            seen.append(conn)
+            barrier.wait(timeout=5)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(c) for c in seen}) == 4
+
+
+def test_fork_reinitializes_without_closing_parent_connections():
+    pool, created = make_pool(max_size=1)
+    with pool.connection() as parent_conn:
+        pass
+    pool._pid = -1 # fork된 자식 프로세스를 흉내 냄
+    with pool.connection() as child_conn:
+        pass
+    assert child_conn is not parent_conn
+    assert not parent_conn.closed
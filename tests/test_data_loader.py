@@ -27,7 +27,7 @@ def run_data_loader_tests():
     db_manager = DBManager()
 
     # DB 연결 확인
-    if not db_manager.conn:
+    if not db_manager.is_connected():
         logger.error("DB 연결 실패. DBDataLoader 테스트를 실행할 수 없습니다.")
         sys.exit(1)
 
@@ -0,0 +1,178 @@
+# backtesting/tests/test_db_manager.py
+
+import os
+import sys
+import time
+from datetime import date, datetime
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from benchmarks.synthetic_data import make_stock_codes, generate_daily_data, generate_minute_data
+from db.db_manager import DBManager
+
+# create_all_tables()가 테이블을 다시 만들므로, 실제 DB 테스트는 전용 데이터베이스를 지정했을 때만 실행합니다.
+# 예: TEST_DB_NAME=backtest_test_db python -m pytest tests/test_db_manager.py
+TEST_DB_NAME = os.getenv('TEST_DB_NAME')
+
+
+@pytest.fixture
+def db():
+    if not TEST_DB_NAME:
+        pytest.skip("TEST_DB_NAME이 지정되지 않아 MariaDB 테스트를 건너뜁니다.")
+    db = DBManager(pool_timeout=5, db_name=TEST_DB_NAME)
+    if not db.is_connected():
+        pytest.skip(f"테스트 DB '{TEST_DB_NAME}'에 연결할 수 없습니다.")
+    db.drop_all_tables()
+    db.create_all_tables()
+    yield db
+    db.drop_all_tables()
+    db.close()
+
+
+def test_write_tsv_escapes_and_writes_nulls(tmp_path):
+    df = pd.DataFrame({
+        'stock_code': ['A000010', 'A\t\\1\n'],
+        'datetime': [datetime(2024, 1, 2, 9, 1), datetime(2024, 1, 2, 9, 2)],
+        'close_price': [100, np.nan],
+        'ignored': ['x', 'y'],
+    })
+    path = tmp_path / 'stage.tsv'
+
+    DBManager._write_tsv(df, ['stock_code', 'datetime', 'close_price'], str(path))
+
+    lines = path.read_text(encoding='utf-8').split('\n')
+    assert lines[0] == 'A000010\t2024-01-02 09:01:00\t100.0'
+    assert lines[1] == 'A\\t\\\\1\\n\t2024-01-02 09:02:00\t\\N'
+    assert lines[2:] == ['']
+
+
+def test_pooled_connections_do_not_enable_local_infile():
+    with mock.patch('db.db_manager.pymysql.connect') as connect, \
+            mock.patch.object(DBManager, '_connect'):
+        db = DBManager()
+        db._create_connection()
+        with db._bulk_load_connection():
+            pass
+    assert connect.call_args_list[0].kwargs['local_infile'] is False
+    assert connect.call_args_list[1].kwargs['local_infile'] is True
+    connect.return_value.close.assert_called_once()
+
+
+def test_bulk_load_merges_batches_and_updates_duplicates(db):
+    codes = make_stock_codes(2)
+    daily = generate_daily_data(codes, date(2024, 1, 1), date(2024, 1, 31))
+    daily.loc[daily.index[0], 'trading_value'] = np.nan
+
+    # 배치 5행, 2배치마다 병합/커밋 -> 중간 병합과 마지막 병합을 모두 거침
+    assert db.bulk_load_daily_data(daily, batch_size=5, commit_interval=2)
+    stored = db.fetch_daily_data(codes[0])
+    assert len(stored) == len(daily) // 2
+    assert pd.isna(stored['trading_value'].iloc[0])
+
+    updated = daily.assign(close_price=daily['close_price'] + 1)
+    assert db.bulk_load_daily_data(updated, batch_size=7, commit_interval=0)
+    refetched = db.fetch_daily_data_bulk(codes)
+    assert len(refetched) == len(daily)
+    assert refetched.sort_values(['stock_code', 'date'])['close_price'].tolist() == \
+        updated.sort_values(['stock_code', 'date'])['close_price'].tolist()
+
+
+def test_fetch_bulk_chunks_in_list_and_splits_by_code(db):
+    codes = make_stock_codes(5)
+    assert db.bulk_load_daily_data(generate_daily_data(codes, date(2024, 1, 1), date(2024, 2, 29)))
+    assert db.bulk_load_minute_data(generate_minute_data(codes[:3], date(2024, 1, 2), date(2024, 1, 3)))
+    start, end = date(2024, 1, 10), date(2024, 2, 9)
+
+    # 청크 2개 종목씩 -> IN (...) 쿼리 3번, 데이터가 없는 종목은 빠짐
+    frames = db.fetch_daily_data_bulk(codes + ['A999999'], start, end, as_dict=True, chunk_size=2)
+    assert sorted(frames) == codes
+    for code in codes:
+        expected = db.fetch_daily_data(code, start, end)
+        assert frames[code].reset_index(drop=True).equals(expected.reset_index(drop=True))
+
+    long_df = db.fetch_daily_data_bulk(codes, start, end, chunk_size=1)
+    assert len(long_df) == sum(len(df) for df in frames.values())
+    assert set(long_df['stock_code']) == set(codes)
+
+    minute = db.fetch_minute_data_bulk(codes, datetime(2024, 1, 2, 15, 0), datetime(2024, 1, 3, 9, 30),
+                                       as_dict=True, chunk_size=2)
+    assert sorted(minute) == codes[:3]
+    assert all(len(df) == 31 + 30 for df in minute.values())
+
+
+def test_latest_by_code_queries(db):
+    codes = make_stock_codes(3)
+    daily = generate_daily_data(codes[:2], date(2024, 1, 1), date(2024, 1, 31))
+    assert db.bulk_load_daily_data(daily)
+    assert db.bulk_load_minute_data(generate_minute_data(codes[:1], date(2024, 1, 2), date(2024, 1, 3)))
+    last = daily[daily['stock_code'] == codes[0]].sort_values('date').iloc[-1]
+
+    assert db.get_latest_daily_data_dates(codes) == {codes[0]: date(2024, 1, 31), codes[1]: date(2024, 1, 31)}
+    assert db.get_latest_daily_data_dates() == db.get_latest_daily_data_dates(codes[:2])
+    assert db.get_latest_minute_data_datetimes(codes) == {codes[0]: datetime(2024, 1, 3, 15, 30)}
+
+    closes = db.get_latest_daily_closes(codes)
+    assert sorted(closes) == codes[:2]
+    assert closes[codes[0]] == (date(2024, 1, 31), int(last['close_price']))
+    assert db.get_latest_daily_close(codes[0]) == closes[codes[0]]
+    assert db.get_latest_daily_close(codes[0], before_date=date(2024, 1, 31))[0] == date(2024, 1, 30)
+    assert db.get_latest_daily_close(codes[2]) is None
+
+
+def test_update_daily_change_rates_only_touches_change_rate(db):
+    codes = make_stock_codes(2)
+    assert db.bulk_load_daily_data(generate_daily_data(codes, date(2024, 1, 1), date(2024, 1, 10)))
+    before = db.fetch_daily_data_bulk(codes)
+
+    assert db.update_daily_change_rates([(codes[0], date(2024, 1, 2), 1.23), (codes[1], date(2024, 1, 3), -4.56)])
+    after = db.fetch_daily_data_bulk(codes).set_index(['stock_code', 'date'])
+    assert float(after.loc[(codes[0], date(2024, 1, 2)), 'change_rate']) == pytest.approx(1.23)
+    assert float(after.loc[(codes[1], date(2024, 1, 3)), 'change_rate']) == pytest.approx(-4.56)
+    unchanged = ['open_price', 'high_price', 'low_price', 'close_price', 'volume']
+    assert after[unchanged].equals(before.set_index(['stock_code', 'date'])[unchanged])
+
+
+def test_backfill_claim_finish_and_retry(db):
+    job = 'test_job'
+    units = [(code, 'daily', date(2024, 1, 1), date(2024, 1, 31)) for code in make_stock_codes(3)]
+    assert db.add_backfill_units(job, units)
+    assert db.add_backfill_units(job, units) # 다시 등록해도 그대로
+    assert db.get_backfill_status(job) == {'pending': 3, 'running': 0, 'done': 0, 'failed': 0}
+
+    first = db.claim_backfill_units(job, 'w1', limit=2)
+    second = db.claim_backfill_units(job, 'w2', limit=2)
+    assert [u['stock_code'] for u in first] == ['A000010', 'A000020'] and first[0]['attempts'] == 1
+    assert [u['stock_code'] for u in second] == ['A000030'] # 점유 중인 단위는 가져가지 않음
+    assert db.finish_backfill_unit(job, first[0], rows_saved=21)
+    assert db.finish_backfill_unit(job, first[1], error='timeout') # 기본 재시도 대기
+    assert db.finish_backfill_unit(job, second[0], error='timeout', retry_backoff_seconds=0)
+    assert db.get_backfill_status(job) == {'pending': 0, 'running': 0, 'done': 1, 'failed': 2}
+
+    # 재시도 대기가 지난 실패 단위만 다시 가져가고, 이전 토큰으로는 기록할 수 없음
+    retried = db.claim_backfill_units(job, 'w3', limit=5, max_attempts=2)
+    assert [(u['stock_code'], u['attempts']) for u in retried] == [('A000030', 2)]
+    assert not db.finish_backfill_unit(job, second[0], rows_saved=1)
+    assert db.finish_backfill_unit(job, retried[0], error='timeout', retry_backoff_seconds=0)
+    assert db.claim_backfill_units(job, 'w3', limit=5, max_attempts=2) == []
+
+
+def test_backfill_expired_lease_is_reclaimed_until_max_attempts(db):
+    job = 'test_lease'
+    assert db.add_backfill_units(job, [('A000010', 'minute', date(2024, 1, 1), date(2024, 1, 7))])
+
+    claimed = db.claim_backfill_units(job, 'w1', lease_seconds=0, max_attempts=2)
+    time.sleep(1.1) # NOW()가 초 단위이므로 점유 시간이 확실히 지나도록 대기
+    reclaimed = db.claim_backfill_units(job, 'w2', lease_seconds=0, max_attempts=2)
+    assert [u['attempts'] for u in claimed + reclaimed] == [1, 2]
+    assert not db.finish_backfill_unit(job, claimed[0], rows_saved=1) # 다른 워커가 다시 가져감
+
+    time.sleep(1.1)
+    assert db.claim_backfill_units(job, 'w3', lease_seconds=0, max_attempts=2) == []
+    assert db.get_backfill_status(job) == {'pending': 0, 'running': 0, 'done': 0, 'failed': 1}
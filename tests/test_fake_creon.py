@@ -0,0 +1,156 @@
+# backtesting/tests/test_fake_creon.py
+
+import os
+import sys
+from datetime import date, datetime
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from api_client.code_master import CodeMaster
+from api_client.creon_api import CreonAPIClient
+from api_client.fake_creon import FakeCreonBackend, MINUTES_PER_DAY
+from api_client.rate_limiter import TokenBucket
+from benchmarks.memory_db import InMemoryDBManager
+from data_manager.stock_data_manager import StockDataManager
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def make_client(num_stocks=4, code_master_dir=None, **backend_kwargs):
+    clock = FakeClock()
+    backend = FakeCreonBackend(num_stocks=num_stocks, clock=clock, sleep=clock.sleep, **backend_kwargs)
+    limiter = TokenBucket(1000, 1, clock=clock, sleep=clock.sleep) # 서버 한도는 GetLimitRemainCount로 확인
+    client = CreonAPIClient(rate_limiter=limiter, backend=backend, code_master_dir=code_master_dir)
+    return client, backend, clock
+
+
+def test_stock_dictionary_and_markets():
+    client, backend, _ = make_client()
+    assert client.get_filtered_stock_list() == backend.stock_codes
+    code = backend.stock_codes[0]
+    assert client.get_stock_code(client.get_stock_name(code)) == code
+    assert client.cp_code_mgr.GetStockMarketKind(backend.stock_codes[-1]) == 2
+
+
+def test_daily_ohlcv_is_deterministic_and_paged():
+    client, backend, _ = make_client(page_size=100)
+    code = backend.stock_codes[0]
+
+    df = client.get_daily_ohlcv(code, '20230101', '20231231')
+    again = client.get_daily_ohlcv(code, '20230601', '20231231')
+
+    assert len(df) == 260 # 2023년 평일 수
+    assert backend.request_count == 3 + 2 # 260행 = 100행씩 3회, 150행 = 2회
+    assert df['date'].is_monotonic_increasing
+    assert (df['high_price'] >= df[['open_price', 'close_price']].max(axis=1)).all()
+    merged = df.merge(again, on='date', suffixes=('', '_again'))
+    assert (merged['close_price'] == merged['close_price_again']).all()
+
+
+def test_minute_ohlcv_ends_at_daily_close():
+    client, backend, _ = make_client()
+    code = backend.stock_codes[1]
+
+    minute = client.get_minute_ohlcv(code, '20240102', '20240103')
+    daily = client.get_daily_ohlcv(code, '20240102', '20240103')
+
+    assert len(minute) == 2 * MINUTES_PER_DAY
+    assert minute['datetime'].iloc[0] == datetime(2024, 1, 2, 9, 1)
+    last_close = minute.groupby(minute['datetime'].dt.date)['close_price'].last()
+    assert list(last_close) == list(daily['close_price'])
+
+
+def test_quota_waits_for_server_reset():
+    client, backend, clock = make_client(quota=2, quota_period=15, latency=0.1)
+    code = backend.stock_codes[0]
+
+    for _ in range(3):
+        assert not client.get_daily_ohlcv(code, '20240102', '20240105').empty
+
+    assert backend.request_count == 3
+    assert clock.now >= 15 # 세 번째 요청은 한도 초기화 이후에 전송
+
+
+def test_market_eye_financials_use_returned_field_order():
+    client, backend, _ = make_client()
+    code = backend.stock_codes[2]
+
+    df = client.get_latest_financial_data(code)
+    expected = backend.financials(code)
+
+    row = df.iloc[0]
+    assert row['stock_name'] == expected[17]
+    assert row['operating_profit'] == expected[91]
+    assert row['net_profit'] == expected[88]
+    assert row['recent_financial_date'] == date(2025, 3, 31)
+
+
+def test_market_eye_batch_financials_match_single_requests():
+    client, backend, _ = make_client(num_stocks=450)
+    codes = backend.stock_codes
+
+    batch = client.get_latest_financial_data_batch(codes)
+    assert backend.request_count == 3 # 450종목 = 200종목씩 3회
+    assert list(batch['stock_code']) == codes
+
+    for code in (codes[0], codes[250], codes[-1]):
+        single = client.get_latest_financial_data(code).iloc[0]
+        row = batch.set_index('stock_code').loc[code]
+        for column in ('stock_name', 'per', 'eps', 'sales', 'operating_profit', 'net_profit', 'recent_financial_date'):
+            assert row[column] == single[column]
+
+
+def test_universe_financial_refresh_saves_once_and_keeps_market_type():
+    client, backend, _ = make_client(num_stocks=6)
+    db = InMemoryDBManager()
+    db.save_stock_info([{'stock_code': code, 'stock_name': code, 'market_type': 'KOSDAQ'} for code in backend.stock_codes])
+    saves = []
+    save_stock_info = db.save_stock_info
+    db.save_stock_info = lambda rows: saves.append(len(rows)) or save_stock_info(rows)
+
+    summary = StockDataManager(db, client).update_financial_data_for_universe()
+
+    assert summary == {'requested': 6, 'fetched': 6, 'saved': True}
+    assert saves == [6] and backend.request_count == 1
+    info = db.fetch_stock_info().set_index('stock_code')
+    code = backend.stock_codes[0]
+    assert info.loc[code, 'market_type'] == 'KOSDAQ'
+    assert info.loc[code, 'operating_profit'] == backend.financials(code)[91] / 1_000_000
+
+
+class NoComCodeMgr:
+    def __getattr__(self, name):
+        raise AssertionError(f"CpCodeMgr.{name}를 호출하면 안 됩니다.")
+
+
+def test_code_master_is_reused_within_trading_day(tmp_path):
+    client, backend, _ = make_client(num_stocks=6, code_master_dir=str(tmp_path))
+    master = client.code_master
+    assert client.get_market_type(backend.stock_codes[0]) == 'KOSPI'
+    assert client.get_market_type(backend.stock_codes[-1]) == 'KOSDAQ'
+
+    reloaded = CodeMaster.load_or_build(NoComCodeMgr(), str(tmp_path), trading_day=master.trading_day)
+    assert list(reloaded.table['stock_code']) == backend.stock_codes
+    assert reloaded.stock_name(backend.stock_codes[1]) == master.stock_name(backend.stock_codes[1])
+    assert CodeMaster.load(str(tmp_path), trading_day=date(2000, 1, 3)) is None # 다른 거래일이면 다시 생성
+
+
+def test_update_all_stock_info_uses_code_master_markets():
+    client, backend, _ = make_client(num_stocks=6)
+    db = InMemoryDBManager()
+
+    assert StockDataManager(db, client).update_all_stock_info()
+
+    markets = db.fetch_stock_info().set_index('stock_code')['market_type']
+    assert list(markets) == ['KOSPI'] * 3 + ['KOSDAQ'] * 3
@@ -0,0 +1,67 @@
+# backtesting/tests/test_indicator_cache.py
+
+import os
+import sys
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from strategies.indicators import CachedSMA, IndicatorCache
+
+
+class SMAPairStrategy(bt.Strategy):
+    params = (('period', 5), ('cache', None))
+
+    def __init__(self):
+        self.cached = CachedSMA(self.data.close, period=self.p.period, cache=self.p.cache)
+        self.plain = bt.indicators.SMA(self.data.close, period=self.p.period)
+
+
+def run(df, cache, period=5, **run_kwargs):
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.adddata(bt.feeds.PandasData(dataname=df))
+    cerebro.addstrategy(SMAPairStrategy, period=period, cache=cache)
+    strategy = cerebro.run(**run_kwargs)[0]
+    return np.array(strategy.cached.array), np.array(strategy.plain.array)
+
+
+def make_frame(n=120):
+    close = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, n))
+    return pd.DataFrame({'open': close, 'high': close, 'low': close, 'close': close, 'volume': 1.0},
+                        index=pd.bdate_range('2024-01-01', periods=n))
+
+
+def test_cached_sma_matches_sma_and_reuses_series():
+    cache = IndicatorCache(maxsize=8)
+    df = make_frame()
+
+    cached, plain = run(df, cache)
+    again, _ = run(df, cache)
+
+    np.testing.assert_array_equal(cached, plain)
+    np.testing.assert_array_equal(again, plain)
+    assert (cache.misses, cache.hits) == (1, 1)
+
+
+def test_cached_sma_without_preload_uses_next():
+    cache = IndicatorCache()
+    cached, plain = run(make_frame(), cache, preload=False)
+
+    np.testing.assert_array_equal(cached, plain)
+    assert len(cache) == 0
+
+
+def test_lru_eviction():
+    cache = IndicatorCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
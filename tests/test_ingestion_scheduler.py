@@ -0,0 +1,198 @@
+# backtesting/tests/test_ingestion_scheduler.py
+
+import os
+import sys
+import threading
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from api_client.rate_limiter import TokenBucket
+from benchmarks.memory_db import InMemoryDBManager
+from data_manager.ingestion_scheduler import IngestionScheduler
+from data_manager.stock_data_manager import StockDataManager
+
+
+class FakeClock:
+    """TokenBucket용 가짜 시계: sleep하면 시간이 그만큼 흐릅니다."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class FakeCreonClient:
+    """CreonAPIClient 대용: 요청마다 토큰 버킷을 거쳐 합성 일봉을 반환합니다."""
+    def __init__(self, rate_limiter, fail_codes=()):
+        self.connected = True
+        self.rate_limiter = rate_limiter
+        self.fail_codes = set(fail_codes)
+        self.requested = []
+
+    def get_daily_ohlcv(self, code, from_date, to_date):
+        self.rate_limiter.acquire()
+        self.requested.append(code)
+        if code in self.fail_codes:
+            raise RuntimeError("BlockRequest failed")
+        dates = [date(2024, 1, 1) + timedelta(days=i) for i in range(3)]
+        return pd.DataFrame({
+            'stock_code': code, 'date': dates,
+            'open_price': 100.0, 'high_price': 110.0, 'low_price': 90.0,
+            'close_price': [100.0, 105.0, 102.0], 'volume': 1000, 'trading_value': 100000,
+        })
+
+
+class FakeDBManager:
+    def __init__(self):
+        self.saved = {}
+        self.save_threads = set()
+
+    def get_latest_daily_close(self, code, before_date=None):
+        return None
+
+    def save_daily_data(self, rows):
+        self.save_threads.add(threading.current_thread().name)
+        self.saved[rows[0]['stock_code']] = rows
+        return True
+
+
+def make_scheduler(tmp_path, fail_codes=()):
+    clock = FakeClock()
+    creon = FakeCreonClient(TokenBucket(2, 1, clock=clock, sleep=clock.sleep), fail_codes)
+    db = FakeDBManager()
+    manager = StockDataManager(db, creon)
+    scheduler = IngestionScheduler(manager, checkpoint_dir=str(tmp_path))
+    return scheduler, creon, db, clock
+
+
+def test_token_bucket_waits_for_refill():
+    clock = FakeClock()
+    bucket = TokenBucket(2, 1, clock=clock, sleep=clock.sleep)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.5 # 초당 2개 -> 토큰 1개에 0.5초
+    bucket.block_for(3)
+    assert bucket.acquire() == 3.0
+
+
+def test_run_daily_saves_on_writer_thread(tmp_path):
+    scheduler, creon, db, clock = make_scheduler(tmp_path)
+    codes = [f'A{i:06d}' for i in range(6)]
+
+    summary = scheduler.run_daily(codes, end_date=date(2024, 1, 3))
+
+    assert summary['saved'] == 6 and summary['failed'] == 0
+    assert set(db.saved) == set(codes)
+    assert db.save_threads == {'ingestion-writer'}
+    assert db.saved['A000000'][1]['change_rate'] == 5.0
+    assert clock.now == 2.0 # 버킷 2개 이후 4건은 0.5초씩 대기
+    assert scheduler.load_checkpoint('daily-2024-01-03') == set() # 실패 없이 끝나면 체크포인트 삭제
+
+
+def test_run_daily_resumes_from_checkpoint(tmp_path):
+    scheduler, creon, db, _ = make_scheduler(tmp_path, fail_codes={'A000002'})
+    codes = ['A000001', 'A000002', 'A000003']
+
+    first = scheduler.run_daily(codes, end_date=date(2024, 1, 3))
+    assert first['failed_codes'] == ['A000002']
+    assert scheduler.load_checkpoint('daily-2024-01-03') == {'A000001', 'A000003'}
+
+    creon.fail_codes.clear()
+    creon.requested.clear()
+    second = scheduler.run_daily(codes, end_date=date(2024, 1, 3))
+
+    assert creon.requested == ['A000002']
+    assert second['skipped'] == 2 and second['saved'] == 1
+    assert not os.listdir(tmp_path) # 남은 종목까지 끝나면 체크포인트 삭제
+
+
+def test_checkpoint_is_keyed_by_run_and_does_not_skip_next_runs(tmp_path):
+    scheduler, creon, db, _ = make_scheduler(tmp_path, fail_codes={'A000002'})
+    codes = ['A000001', 'A000002', 'A000003']
+
+    scheduler.run_daily(codes, end_date=date(2024, 1, 3)) # 실패가 있어 체크포인트가 남음
+    creon.fail_codes.clear()
+    creon.requested.clear()
+    scheduler.run_daily(codes, end_date=date(2024, 1, 4)) # 다음 날 실행은 다른 체크포인트
+    assert creon.requested == codes
+
+    creon.requested.clear()
+    scheduler.run_daily(codes, end_date=date(2024, 1, 4)) # 성공한 실행을 다시 돌려도 건너뛰지 않음
+    assert creon.requested == codes
+    assert os.listdir(tmp_path) == ['daily-2024-01-03.txt']
+
+
+def test_run_daily_incremental_plans_with_one_query_and_skips_current_codes():
+    clock = FakeClock()
+    creon = FakeCreonClient(TokenBucket(100, 1, clock=clock, sleep=clock.sleep))
+    db = InMemoryDBManager()
+    row = {'open_price': 100.0, 'high_price': 110.0, 'low_price': 90.0, 'close_price': 100.0, 'volume': 1000,
+           'change_rate': 0.0, 'trading_value': 100000}
+    db.save_daily_data([{'stock_code': 'A000001', 'date': date(2024, 1, 3), **row}, # 최신
+                        {'stock_code': 'A000002', 'date': date(2023, 12, 29), **row}]) # 금요일 -> 1/1부터 조회
+    db.get_latest_daily_close = lambda code, before_date=None: pytest.fail("종목별 최신 날짜 조회를 하면 안 됩니다.")
+    progress = []
+    scheduler = IngestionScheduler(StockDataManager(db, creon), progress_callback=progress.append)
+
+    summary = scheduler.run_daily_incremental(['A000001', 'A000002', 'A000003'], end_date=date(2024, 1, 3))
+
+    assert creon.requested == ['A000002', 'A000003']
+    assert summary['total'] == 3 and summary['current'] == 1 and summary['saved'] == 2
+    assert [p['done'] for p in progress] == [1, 2]
+    assert progress[-1]['total'] == 2 and progress[-1]['eta_sec'] in (0.0, None)
+    assert db.get_latest_daily_data_dates(['A000003']) == {'A000003': date(2024, 1, 3)}
+
+
+def test_daily_fetch_start_skips_weekends():
+    friday = date(2024, 1, 5)
+    assert StockDataManager._daily_fetch_start(friday, None, date(2024, 1, 7)) is None # 토/일만 남음
+    assert StockDataManager._daily_fetch_start(friday, None, date(2024, 1, 8)) == date(2024, 1, 8)
+
+
+def test_incremental_update_seeds_change_rate_from_stored_close():
+    clock = FakeClock()
+    creon = FakeCreonClient(TokenBucket(100, 1, clock=clock, sleep=clock.sleep))
+    db = InMemoryDBManager()
+    db.save_daily_data([{'stock_code': 'A000001', 'date': date(2023, 12, 29), 'open_price': 100.0,
+                         'high_price': 110.0, 'low_price': 90.0, 'close_price': 80.0, 'volume': 1000,
+                         'change_rate': 0.0, 'trading_value': 100000}])
+    manager = StockDataManager(db, creon)
+
+    assert manager.update_daily_ohlcv('A000001', end_date=date(2024, 1, 3))
+    stored = db.fetch_daily_data('A000001').set_index('date')['change_rate']
+    assert stored[date(2024, 1, 1)] == 25.0 # 80 -> 100 (첫 행도 DB 종가 기준)
+
+    db.update_daily_change_rates([('A000001', date(2024, 1, 1), 0.0), ('A000001', date(2024, 1, 3), None)])
+    summary = manager.repair_change_rates()
+    assert summary == {'codes': 1, 'rows': 4, 'updated': 2}
+    repaired = db.fetch_daily_data('A000001')['change_rate'].tolist()
+    assert repaired == [0.0, 25.0, 5.0, round((102 - 105) / 105 * 100, 2)]
+
+
+def test_explicit_start_after_weekend_keeps_stored_close_seed():
+    clock = FakeClock()
+    creon = FakeCreonClient(TokenBucket(100, 1, clock=clock, sleep=clock.sleep))
+    db = InMemoryDBManager()
+    db.save_daily_data([{'stock_code': 'A000001', 'date': date(2023, 12, 29), 'open_price': 100.0,
+                         'high_price': 110.0, 'low_price': 90.0, 'close_price': 80.0, 'volume': 1000,
+                         'change_rate': 0.0, 'trading_value': 100000}])
+    manager = StockDataManager(db, creon, use_cache=False)
+
+    # 금요일(2023-12-29)까지 저장된 종목을 월요일(2024-01-01) start_date로 조회
+    assert manager.update_daily_ohlcv('A000001', start_date=date(2024, 1, 1), end_date=date(2024, 1, 3))
+    stored = db.fetch_daily_data('A000001').set_index('date')['change_rate']
+    assert stored[date(2024, 1, 1)] == 25.0
+
+    latest = (date(2023, 12, 29), 80.0)
+    assert StockDataManager._seed_close(latest, date(2024, 1, 1)) == 80.0
+    assert StockDataManager._seed_close(latest, date(2023, 12, 30)) == 80.0
+    assert StockDataManager._seed_close(latest, date(2024, 1, 2)) is None # 평일(월요일)을 건너뜀
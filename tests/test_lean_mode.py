@@ -0,0 +1,61 @@
+# backtesting/tests/test_lean_mode.py
+
+import logging
+import os
+import sys
+from datetime import date
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from backtester import Backtester
+from benchmarks.memory_db import InMemoryDBManager
+from benchmarks.synthetic_data import generate_minute_data
+from config.settings import LEAN_EXACTBARS
+from strategies.simple_ma_strategy import SimpleMAStrategy
+
+CODE = 'A000010'
+START, END = date(2024, 1, 2), date(2024, 1, 12)
+
+
+def _run(db, lean: bool, streaming: bool = False):
+    backtester = Backtester(START, END, db_manager=db, lean=lean)
+    if streaming:
+        backtester.add_streaming_minute_data(CODE, chunk_size=500)
+    else:
+        backtester.add_data(CODE, timeframe='minute')
+    backtester.add_strategy(SimpleMAStrategy, sma_fast_period=5, sma_slow_period=20)
+    strategy = backtester.run()[0]
+    return backtester, strategy
+
+
+def test_lean_backtester_matches_default_and_counts_events():
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+    db = InMemoryDBManager()
+    db.bulk_load_minute_data(generate_minute_data([CODE], START, END, seed=11))
+    bars = 9 * 390
+
+    default, default_strategy = _run(db, lean=False)
+    lean, lean_strategy = _run(db, lean=True)
+
+    assert lean.cerebro.p.exactbars == LEAN_EXACTBARS and not lean.cerebro.p.stdstats
+    assert default_strategy.p.verbose and not lean_strategy.p.verbose # lean 모드의 verbose 기본값
+    assert lean.cerebro.broker.getvalue() == default.cerebro.broker.getvalue()
+    assert len(default_strategy.observers) > 0 and len(lean_strategy.observers) == 0
+    assert len(default_strategy.data) == bars
+    assert lean_strategy.data.close.buflen() < bars # 라인 버퍼가 전체 기간을 보관하지 않음
+    assert lean_strategy.counters['closed_trades'] > 0
+    assert lean_strategy.counters == default_strategy.counters
+    assert lean.peak_rss_mb > 0 and default.peak_rss_mb > 0
+
+    # 스트리밍 피드와 함께 써도 결과가 같음
+    streamed, streamed_strategy = _run(db, lean=True, streaming=True)
+    assert streamed.cerebro.broker.getvalue() == default.cerebro.broker.getvalue()
+    assert streamed_strategy.counters == default_strategy.counters
+
+    # verbose를 직접 지정하면 lean 모드에서도 그대로 사용
+    verbose = Backtester(START, END, db_manager=db, lean=True)
+    verbose.add_data(CODE, timeframe='minute')
+    verbose.add_strategy(SimpleMAStrategy, verbose=True)
+    assert verbose.run()[0].p.verbose
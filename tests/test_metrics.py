@@ -0,0 +1,64 @@
+# backtesting/tests/test_metrics.py
+
+import os
+import sys
+from datetime import date
+
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from benchmarks.memory_db import InMemoryDBManager
+from benchmarks.synthetic_data import make_stock_codes, generate_daily_data
+from feeds.db_data_loader import DBDataLoader
+from utils.metrics import MetricsRegistry, metrics
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(enabled=False)
+    with registry.timer('db_query', table='daily_stock_data') as t:
+        t.add(rows=10)
+    registry.inc('creon_rows', 5)
+    assert registry.snapshot() == {'timers': [], 'counters': []}
+
+
+def test_timers_counters_and_exports():
+    registry = MetricsRegistry(enabled=True)
+    for rows in (10, 30):
+        with registry.timer('db_query', op='fetch', table='daily_stock_data') as t:
+            t.add(rows=rows)
+    with pytest.raises(RuntimeError):
+        with registry.timer('db_query', op='fetch', table='daily_stock_data'):
+            raise RuntimeError("query failed")
+    registry.inc('creon_rows', 5, request='StockChart')
+
+    snapshot = registry.snapshot()
+    ok = [t for t in snapshot['timers'] if 'error' not in t['labels']]
+    failed = [t for t in snapshot['timers'] if 'error' in t['labels']]
+    assert ok[0]['count'] == 2 and failed[0]['count'] == 1
+    counters = {c['name']: c['value'] for c in snapshot['counters']}
+    assert counters == {'creon_rows': 5, 'db_query_rows': 40}
+
+    text = registry.to_prometheus()
+    assert '# TYPE backtesting_db_query_seconds summary' in text
+    assert 'backtesting_db_query_seconds_count{op="fetch",table="daily_stock_data"} 2' in text
+    assert 'backtesting_creon_rows_total{request="StockChart"} 5' in text
+    assert '"db_query_rows"' in registry.to_json()
+
+
+def test_loader_conversion_is_instrumented():
+    db = InMemoryDBManager()
+    codes = make_stock_codes(2)
+    db.bulk_load_daily_data(generate_daily_data(codes, date(2024, 1, 1), date(2024, 3, 31)))
+    metrics.reset()
+    metrics.enable()
+    try:
+        frames = DBDataLoader(db).load_daily_frames(codes, date(2024, 1, 1), date(2024, 3, 31))
+    finally:
+        metrics.disable()
+    counters = {c['name']: c['value'] for c in metrics.snapshot()['counters']}
+    assert counters['loader_convert_rows'] == sum(len(df) for df in frames.values())
+    assert counters['loader_convert_bytes'] > 0
+    metrics.reset()
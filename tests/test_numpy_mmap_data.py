@@ -0,0 +1,84 @@
+# backtesting/tests/test_numpy_mmap_data.py
+
+import logging
+import os
+import sys
+from datetime import date
+
+import backtrader as bt
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+import feeds.numpy_mmap_data as numpy_mmap_data
+from backtester.runner import run_single
+from benchmarks.memory_db import InMemoryDBManager
+from benchmarks.synthetic_data import generate_daily_data
+from feeds.db_data_loader import DBDataLoader
+from feeds.numpy_mmap_data import mmap_path, read_mmap_range, invalidate_mmap
+from strategies.simple_ma_strategy import SimpleMAStrategy
+
+CODE = 'A000010'
+
+
+class BarRecorder(bt.Strategy):
+    """피드가 공급한 바를 그대로 기록하는 테스트용 전략"""
+    def __init__(self):
+        self.bars = []
+
+    def next(self):
+        d = self.data
+        self.bars.append((d.datetime.datetime(0), d.open[0], d.high[0], d.low[0], d.close[0], d.volume[0]))
+
+
+def record_bars(feed) -> list:
+    cerebro = bt.Cerebro(stdstats=False)
+    cerebro.adddata(feed)
+    cerebro.addstrategy(BarRecorder)
+    return cerebro.run(maxcpus=1)[0].bars
+
+
+@pytest.fixture
+def loader(tmp_path, monkeypatch):
+    monkeypatch.setattr(numpy_mmap_data, 'MMAP_DIR', str(tmp_path))
+    db = InMemoryDBManager()
+    db.bulk_load_daily_data(generate_daily_data([CODE], date(2023, 1, 1), date(2024, 12, 31)))
+    return DBDataLoader(db)
+
+
+def test_mmap_feed_matches_pandas_data(loader):
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+    fromdate, todate = date(2023, 3, 1), date(2024, 6, 30)
+
+    mmap_bars = record_bars(loader.load_mmap_data(CODE, fromdate, todate))
+    pandas_bars = record_bars(loader.load_daily_data(CODE, fromdate, todate))
+    assert len(mmap_bars) == len(pandas_bars) > 0
+    assert mmap_bars == pandas_bars
+
+    params = {'sma_fast_period': 5, 'sma_slow_period': 20}
+    mmap_result = run_single(SimpleMAStrategy, loader.load_mmap_data(CODE, fromdate, todate), params)
+    expected = run_single(SimpleMAStrategy, loader.load_daily_frame(CODE, fromdate, todate), params)
+    assert mmap_result['final_value'] == pytest.approx(expected['final_value'])
+    assert mmap_result['trade_count'] == expected['trade_count']
+
+
+def test_mmap_file_is_rebuilt_when_request_exceeds_covered_range(loader):
+    short = record_bars(loader.load_mmap_data(CODE, date(2023, 1, 1), date(2023, 12, 31)))
+    assert short[-1][0].date() == date(2023, 12, 29)
+
+    wider = record_bars(loader.load_mmap_data(CODE, date(2023, 1, 1), date(2024, 12, 31)))
+    assert wider == record_bars(loader.load_daily_data(CODE, date(2023, 1, 1), date(2024, 12, 31)))
+    covered = read_mmap_range(mmap_path(CODE))
+    assert covered[0].date() == date(2023, 1, 1) and covered[1].date() == date(2024, 12, 31)
+
+
+def test_invalidate_removes_file_and_range(loader):
+    loader.load_mmap_data(CODE, date(2024, 1, 1), date(2024, 3, 31))
+    assert read_mmap_range(mmap_path(CODE)) is not None
+
+    invalidate_mmap(CODE)
+
+    assert not os.path.exists(mmap_path(CODE))
+    assert read_mmap_range(mmap_path(CODE)) is None
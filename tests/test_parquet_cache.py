@@ -0,0 +1,120 @@
+# backtesting/tests/test_parquet_cache.py
+
+import os
+import sys
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from benchmarks.memory_db import InMemoryDBManager
+from benchmarks.synthetic_data import generate_daily_data
+from data_manager.stock_data_manager import StockDataManager
+from feeds.db_data_loader import DBDataLoader
+from feeds.parquet_cache import ParquetCache
+
+CODE = 'A000010'
+
+
+def make_frame(start, end, close=100.0):
+    index = pd.bdate_range(start, end, name='datetime')
+    return pd.DataFrame({'open': close, 'high': close, 'low': close, 'close': close, 'volume': 1.0}, index=index)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ParquetCache(str(tmp_path))
+    cache.write(CODE, 'daily', make_frame('2024-01-02', '2024-01-31'), date(2024, 1, 2))
+    return cache
+
+
+def test_missing_ranges_without_cache(tmp_path):
+    assert ParquetCache(str(tmp_path)).missing_ranges(CODE, 'daily', date(2024, 1, 1), date(2024, 1, 31)) == \
+        [(date(2024, 1, 1), date(2024, 1, 31))]
+
+
+def test_missing_ranges_before_start_and_after_high_water_mark(cache):
+    assert cache.missing_ranges(CODE, 'daily', date(2024, 1, 3), date(2024, 1, 30)) == []
+    assert cache.missing_ranges(CODE, 'daily', date(2023, 12, 1), date(2024, 1, 15)) == \
+        [(date(2023, 12, 1), date(2024, 1, 1))]
+    assert cache.missing_ranges(CODE, 'daily', date(2024, 1, 10), date(2024, 2, 15)) == \
+        [(date(2024, 2, 1), date(2024, 2, 15))]
+    assert cache.missing_ranges(CODE, 'daily', date(2023, 12, 1), date(2024, 2, 15)) == \
+        [(date(2023, 12, 1), date(2024, 1, 1)), (date(2024, 2, 1), date(2024, 2, 15))]
+    # 분봉은 high-water mark 다음 초부터 조회
+    minute_df = make_frame('2024-01-02', '2024-01-02').set_axis(pd.DatetimeIndex([datetime(2024, 1, 2, 9, 1)]))
+    cache.write(CODE, 'minute', minute_df, datetime(2024, 1, 2, 9, 0))
+    assert cache.missing_ranges(CODE, 'minute', datetime(2024, 1, 2, 9, 0), datetime(2024, 1, 2, 15, 30)) == \
+        [(datetime(2024, 1, 2, 9, 1, 1), datetime(2024, 1, 2, 15, 30))]
+
+
+def test_merge_extends_covered_range(cache):
+    df = cache.merge(CODE, 'daily', date(2023, 12, 1), date(2024, 2, 15),
+                     [make_frame('2023-12-01', '2023-12-29', close=90.0), make_frame('2024-02-01', '2024-02-15')])
+
+    assert df.index[0] == pd.Timestamp('2023-12-01') and df.index[-1] == pd.Timestamp('2024-02-15')
+    assert df.index.is_monotonic_increasing and not df.index.duplicated().any()
+    assert cache.missing_ranges(CODE, 'daily', date(2023, 12, 1), date(2024, 2, 15)) == []
+    # 새 데이터가 없어도 조회를 마친 구간(시작)은 넓어져 같은 구간을 다시 조회하지 않음
+    cache.merge(CODE, 'daily', date(2023, 11, 1), date(2024, 1, 31), [])
+    assert cache.missing_ranges(CODE, 'daily', date(2023, 11, 1), date(2024, 1, 31)) == []
+
+
+def test_invalidate_since_truncates_and_refetches(cache):
+    cache.invalidate(CODE, 'daily', since=date(2024, 1, 15))
+
+    df, meta = cache.read(CODE, 'daily')
+    assert df.index[-1] == pd.Timestamp('2024-01-12')
+    assert meta['start'] == pd.Timestamp('2024-01-02')
+    assert cache.missing_ranges(CODE, 'daily', date(2024, 1, 2), date(2024, 1, 31)) == \
+        [(date(2024, 1, 13), date(2024, 1, 31))]
+
+    cache.invalidate(CODE, 'daily')
+    assert cache.read(CODE, 'daily') == (None, None)
+
+
+def test_saved_rows_replace_partial_bar_in_cache(tmp_path):
+    cache = ParquetCache(str(tmp_path))
+    db = InMemoryDBManager()
+    db.bulk_load_daily_data(generate_daily_data([CODE], date(2024, 1, 1), date(2024, 1, 31)))
+    loader = DBDataLoader(db, cache=cache)
+    assert len(loader.load_daily_frame(CODE, date(2024, 1, 1), date(2024, 1, 31))) == 23
+
+    # 장중에 캐시된 마지막 바를 야간 업데이트가 확정값으로 덮어씀
+    final_bar = db.fetch_daily_data(CODE, date(2024, 1, 31), date(2024, 1, 31)).assign(close_price=12345)
+    assert StockDataManager(db, None, cache=cache).save_daily_update(CODE, final_bar)
+
+    df = loader.load_daily_frame(CODE, date(2024, 1, 1), date(2024, 1, 31))
+    assert len(df) == 23
+    assert df['close'].iloc[-1] == 12345
+
+
+def test_stock_data_manager_uses_cache_by_default():
+    assert isinstance(StockDataManager(InMemoryDBManager(), None).cache, ParquetCache)
+    assert StockDataManager(InMemoryDBManager(), None, use_cache=False).cache is None
+
+
+def test_stock_data_manager_works_without_pyarrow(monkeypatch):
+    monkeypatch.setattr('feeds.parquet_cache.pyarrow', None)
+    with pytest.raises(ImportError):
+        ParquetCache()
+    assert StockDataManager(InMemoryDBManager(), None).cache is None # pyarrow 없이도 수집 가능
+
+
+def test_load_daily_frame_logs_cache_hits_separately(tmp_path, caplog):
+    db = InMemoryDBManager()
+    db.bulk_load_daily_data(generate_daily_data([CODE], date(2024, 1, 1), date(2024, 1, 31)))
+    loader = DBDataLoader(db, cache=ParquetCache(str(tmp_path)))
+
+    with caplog.at_level('INFO', logger='feeds.db_data_loader'):
+        loader.load_daily_frame(CODE, date(2024, 1, 2), date(2024, 1, 31))
+        first = caplog.text
+        caplog.clear()
+        loader.load_daily_frame(CODE, date(2024, 1, 2), date(2024, 1, 31))
+
+    assert 'DB에서' in first and '캐시에서' not in first
+    assert '캐시에서' in caplog.text and 'DB에서' not in caplog.text
@@ -0,0 +1,58 @@
+# backtesting/tests/test_profiling.py
+
+import json
+import logging
+import os
+import sys
+import time
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from backtester.runner import run_single
+from utils.profiling import SamplingProfiler
+
+
+class SlowNextStrategy(bt.Strategy):
+    """next()에서 일부러 시간을 쓰는 전략 (분류 확인용)"""
+    def next(self):
+        time.sleep(0.002)
+
+
+def _make_frame() -> pd.DataFrame:
+    index = pd.bdate_range('2023-01-02', periods=150)
+    close = 10_000 * np.exp(np.cumsum(np.random.default_rng(1).normal(0, 0.01, len(index))))
+    return pd.DataFrame({'open': close, 'high': close, 'low': close, 'close': close,
+                         'volume': 1000.0, 'openinterest': 0.0}, index=index)
+
+
+def test_profiler_attributes_time_to_strategy_next(tmp_path):
+    cerebro = bt.Cerebro()
+    cerebro.adddata(bt.feeds.PandasData(dataname=_make_frame()))
+    cerebro.addstrategy(SlowNextStrategy)
+    with SamplingProfiler(interval=0.001) as profiler:
+        cerebro.run()
+
+    categories = profiler.category_seconds()
+    assert categories['strategy'] > 0.5 * sum(categories.values())
+
+    paths = profiler.write('SlowNextStrategy-test', output_dir=str(tmp_path))
+    collapsed = open(paths['collapsed'], encoding='utf-8').read()
+    assert 'next (test_profiling.py:' in collapsed
+    speedscope = json.load(open(paths['speedscope'], encoding='utf-8'))
+    assert speedscope['profiles'][0]['type'] == 'sampled'
+    assert len(speedscope['profiles'][0]['samples']) == len(speedscope['profiles'][0]['weights'])
+
+
+def test_run_single_profile_writes_files(tmp_path, monkeypatch):
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+    monkeypatch.setattr('utils.profiling.PROFILE_DIR', str(tmp_path))
+    result = run_single(SlowNextStrategy, _make_frame(), profile=True, profile_name='A005930')
+    assert result['error'] is None
+    assert os.path.basename(result['profile']['collapsed']).startswith('SlowNextStrategy-A005930-')
+    assert os.path.exists(result['profile']['speedscope'])
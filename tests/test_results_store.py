@@ -0,0 +1,53 @@
+# backtesting/tests/test_results_store.py
+
+import json
+import logging
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from backtester.optimizer import optimize
+from backtester.results_store import ResultsStore
+from strategies.simple_ma_strategy import SimpleMAStrategy
+
+
+def _make_frame(seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range('2021-01-01', '2021-12-31')
+    close = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, len(index))))
+    return pd.DataFrame({'open': close, 'high': close * 1.01, 'low': close * 0.99, 'close': close,
+                         'volume': 1000.0, 'openinterest': 0.0}, index=index)
+
+
+def test_optimize_writes_runs_equity_trades_and_orders(tmp_path):
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+    df = _make_frame()
+    grid = {'sma_fast_period': [3, 5], 'sma_slow_period': [20]}
+
+    with ResultsStore(base_dir=str(tmp_path), batch_size=50) as store:
+        result_df = optimize(SimpleMAStrategy, df, grid, workers=1, results_store=store, stock_code='A005930')
+    assert 'record' not in result_df.columns
+
+    runs = store.read('runs')
+    equity = store.read('equity')
+    trades = store.read('trades')
+    orders = store.read('orders')
+
+    assert len(runs) == 2
+    assert set(runs['stock_codes']) == {'A005930'}
+    assert sorted(json.loads(p)['sma_fast_period'] for p in runs['params']) == [3, 5]
+    by_run = runs.set_index('run_id')
+    for run_id, group in equity.groupby('run_id'):
+        assert len(group) == len(df)
+        assert group.sort_values('datetime')['value'].iloc[-1] == by_run.loc[run_id, 'final_value']
+    for run_id, group in trades.groupby('run_id'):
+        assert len(group) == by_run.loc[run_id, 'trade_count']
+    assert set(orders['status']) <= {'Completed', 'Canceled', 'Margin', 'Rejected', 'Expired'}
+    assert set(trades['stock_code']) == {'A005930'} and set(orders['stock_code']) == {'A005930'}
+    assert runs['run_date'].nunique() == 1
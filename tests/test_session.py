@@ -0,0 +1,76 @@
+# backtesting/tests/test_session.py
+
+import logging
+import os
+import sys
+from datetime import date
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from backtester.session import BacktestSession
+from feeds.db_data_loader import DBDataLoader
+from strategies.simple_ma_strategy import SimpleMAStrategy
+
+
+class FakeDBManager:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class CountingLoader:
+    """DBDataLoader 대용: 조회 횟수만 셉니다."""
+    def __init__(self):
+        self.calls = []
+        rng = np.random.default_rng(3)
+        close = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, 200)))
+        self.df = pd.DataFrame({'open': close, 'high': close, 'low': close, 'close': close,
+                                'volume': 1000.0, 'openinterest': 0.0},
+                               index=pd.bdate_range('2023-01-02', periods=200))
+
+    def load_daily_frame(self, stock_code, fromdate, todate):
+        self.calls.append(('single', stock_code))
+        return self.df if stock_code == 'A000010' else DBDataLoader.empty_frame()
+
+    def load_daily_frames(self, stock_codes, fromdate, todate):
+        self.calls.append(('bulk', tuple(stock_codes)))
+        return {code: self.df for code in stock_codes if code == 'A000010'}
+
+
+def make_session(db_manager):
+    session = BacktestSession(date(2023, 1, 1), date(2023, 12, 31), db_manager=db_manager)
+    session.data_loader = CountingLoader()
+    return session
+
+
+def test_runs_reuse_loaded_data():
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+    db = FakeDBManager()
+    with make_session(db) as session:
+        assert session.preload(['A000010', 'A000020']) == ['A000010']
+        first = session.run(SimpleMAStrategy, 'A000010', analyzers={'trades': bt.analyzers.TradeAnalyzer},
+                            sma_fast_period=5, sma_slow_period=20)
+        second = session.evaluate(SimpleMAStrategy, 'A000010', sma_fast_period=5, sma_slow_period=20)
+        missing = session.run(SimpleMAStrategy, 'A000020')
+
+        assert session.data_loader.calls == [('bulk', ('A000010', 'A000020'))]
+        assert first[0].broker.getvalue() == second['final_value']
+        assert missing is None
+
+    assert not db.closed # 외부에서 받은 DBManager는 닫지 않음
+
+
+def test_close_releases_owned_connection(monkeypatch):
+    db = FakeDBManager()
+    monkeypatch.setattr('backtester.session.DBManager', lambda: db)
+    session = BacktestSession(date(2023, 1, 1), date(2023, 12, 31))
+    session.close()
+    assert db.closed and session.db_manager is None
@@ -0,0 +1,55 @@
+# backtesting/tests/test_shared_memory_data.py
+
+import logging
+import os
+import sys
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from backtester.runner import run_single
+from feeds.shared_memory_data import SharedMemoryData, SharedOHLCVStore
+from strategies.simple_ma_strategy import SimpleMAStrategy
+
+
+def make_frame(n=250):
+    rng = np.random.default_rng(7)
+    close = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    open_ = close * (1 + rng.normal(0, 0.005, n))
+    return pd.DataFrame({
+        'open': open_, 'high': np.maximum(open_, close) * 1.01, 'low': np.minimum(open_, close) * 0.99,
+        'close': close, 'volume': 1000.0, 'openinterest': 0.0,
+    }, index=pd.bdate_range('2023-01-02', periods=n))
+
+
+def test_shared_feed_matches_pandas_data():
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+    df = make_frame()
+    params = {'sma_fast_period': 5, 'sma_slow_period': 20}
+
+    with SharedOHLCVStore() as store:
+        store.publish('A000010', df)
+        feed = SharedMemoryData(dataname='A000010', registry=store.registry)
+        shared = run_single(SimpleMAStrategy, feed, params)
+
+    expected = run_single(SimpleMAStrategy, df, params)
+    assert shared['final_value'] == pytest.approx(expected['final_value'])
+    assert shared['trade_count'] == expected['trade_count']
+
+
+def test_close_unlinks_blocks():
+    store = SharedOHLCVStore()
+    name, rows = store.publish('A000010', make_frame(10))
+    assert rows == 10
+
+    store.close()
+
+    assert store.registry == {}
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
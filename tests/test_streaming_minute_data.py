@@ -0,0 +1,62 @@
+# backtesting/tests/test_streaming_minute_data.py
+
+import os
+import sys
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import backtrader as bt
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from backtester import Backtester
+from benchmarks.memory_db import InMemoryDBManager
+from benchmarks.synthetic_data import make_stock_codes, generate_minute_data
+from feeds.db_data_loader import DBDataLoader
+from feeds.streaming_minute_data import StreamingMinuteData
+
+START, END = datetime(2024, 1, 2, 10, 0), datetime(2024, 1, 4, 14, 0)
+
+
+class BarRecorder(bt.Strategy):
+    """피드가 공급한 바를 그대로 기록하는 테스트용 전략"""
+    def __init__(self):
+        self.bars = []
+
+    def next(self):
+        d = self.data
+        self.bars.append((d.datetime.datetime(0), d.open[0], d.high[0], d.low[0], d.close[0], d.volume[0]))
+
+
+def record_bars(feed, preload: bool) -> list:
+    cerebro = bt.Cerebro(stdstats=False, preload=preload)
+    cerebro.adddata(feed)
+    cerebro.addstrategy(BarRecorder)
+    return cerebro.run(maxcpus=1)[0].bars
+
+
+def test_streaming_matches_load_minute_data():
+    db = InMemoryDBManager()
+    codes = make_stock_codes(2)
+    db.bulk_load_minute_data(generate_minute_data(codes, date(2024, 1, 2), date(2024, 1, 5)))
+
+    streamed = record_bars(StreamingMinuteData(db_manager=db, dataname=codes[0], fromdate=START, todate=END,
+                                               chunk_size=100), preload=False)
+    loaded = record_bars(DBDataLoader(db).load_minute_data(codes[0], START, END), preload=True)
+
+    assert len(streamed) == len(loaded) > 100 # 청크 여러 개에 걸침
+    assert streamed[0][0] == START and streamed[-1][0] == END
+    assert streamed == loaded
+
+
+def test_streaming_feeds_are_limited_below_pool_size():
+    db = InMemoryDBManager()
+    db.pool = SimpleNamespace(max_size=3)
+    backtester = Backtester(date(2024, 1, 2), date(2024, 1, 5), db_manager=db)
+
+    assert backtester.add_streaming_minute_data('A000010')
+    assert backtester.add_streaming_minute_data('A000020')
+    assert not backtester.add_streaming_minute_data('A000030') # 다른 조회에 쓸 연결 하나는 남김
+    assert len(backtester.cerebro.datas) == 2
@@ -0,0 +1,60 @@
+# backtesting/tests/test_vectorized.py
+
+import logging
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from backtester.runner import run_single
+from backtester.vectorized import screen_sma_crossover
+from strategies.simple_ma_strategy import SimpleMAStrategy
+
+
+def make_frame(seed, n=400):
+    rng = np.random.default_rng(seed)
+    close = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    open_ = close * (1 + rng.normal(0, 0.005, n))
+    return pd.DataFrame({
+        'open': open_, 'high': np.maximum(open_, close) * 1.01, 'low': np.minimum(open_, close) * 0.99,
+        'close': close, 'volume': 1000.0, 'openinterest': 0.0,
+    }, index=pd.bdate_range('2020-01-01', periods=n))
+
+
+@pytest.fixture(autouse=True)
+def quiet_strategy_logs():
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+    yield
+    logging.getLogger('strategies').setLevel(logging.NOTSET)
+
+
+def test_matches_backtrader():
+    frames = {'A000010': make_frame(1), 'A000020': make_frame(2)}
+    grid = {'sma_fast_period': [3, 10], 'sma_slow_period': [20, 60]}
+
+    results = screen_sma_crossover(frames, grid)
+
+    assert len(results) == 2 * 4
+    for row in results.itertuples():
+        params = {'sma_fast_period': row.sma_fast_period, 'sma_slow_period': row.sma_slow_period}
+        expected = run_single(SimpleMAStrategy, frames[row.stock_code], params)
+        assert row.final_value == pytest.approx(expected['final_value'], abs=1e-6)
+        assert (row.trade_count, row.won, row.lost) == (expected['trade_count'], expected['won'], expected['lost'])
+
+
+def test_equity_curve_and_short_data():
+    frames = {'A000010': make_frame(3), 'A000020': make_frame(4, n=30)}
+    grid = {'sma_fast_period': [5], 'sma_slow_period': [50]}
+
+    results, equity = screen_sma_crossover(frames, grid, return_equity=True)
+
+    curve = equity['A000010'][(5, 50)]
+    assert curve.iloc[-1] == pytest.approx(results.set_index('stock_code').loc['A000010', 'final_value'])
+    short = results.set_index('stock_code').loc['A000020']
+    assert short['trade_count'] == 0 and short['pnl'] == 0 # 장기 기간보다 짧은 데이터는 거래 없음
@@ -0,0 +1,76 @@
+# backtesting/tests/test_walk_forward.py
+
+import logging
+import os
+import sys
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 디렉토리를 Python path에 추가
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from backtester.runner import run_single
+from backtester.walk_forward import split_walk_forward_windows, walk_forward
+from strategies.simple_ma_strategy import SimpleMAStrategy
+
+
+def test_split_rolling_and_anchored_windows():
+    rolling = split_walk_forward_windows(date(2020, 1, 1), date(2021, 12, 31), 12, 6)
+    anchored = split_walk_forward_windows(date(2020, 1, 1), date(2021, 12, 31), 12, 6, anchored=True)
+
+    assert [(w['is_start'], w['oos_start'], w['oos_end']) for w in rolling] == [
+        (date(2020, 1, 1), date(2021, 1, 1), date(2021, 6, 30)),
+        (date(2020, 7, 1), date(2021, 7, 1), date(2021, 12, 31)),
+    ]
+    assert rolling[0]['is_end'] == date(2020, 12, 31)
+    assert [w['is_start'] for w in anchored] == [date(2020, 1, 1), date(2020, 1, 1)]
+
+
+def test_walk_forward_picks_best_in_sample_params():
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+    rng = np.random.default_rng(5)
+    index = pd.bdate_range('2020-01-01', '2021-12-31')
+    close = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, len(index))))
+    df = pd.DataFrame({'open': close, 'high': close * 1.01, 'low': close * 0.99, 'close': close,
+                       'volume': 1000.0, 'openinterest': 0.0}, index=index)
+    grid = {'sma_fast_period': [3, 5], 'sma_slow_period': [20]}
+
+    results = walk_forward(SimpleMAStrategy, df, grid, date(2020, 1, 1), date(2021, 12, 31),
+                           in_sample_months=12, out_of_sample_months=6, workers=1)
+
+    assert list(results['window']) == [0, 1]
+    first = results.iloc[0]
+    in_sample = df.loc['2020-01-01':'2020-12-31']
+    pnls = {fast: run_single(SimpleMAStrategy, in_sample, {'sma_fast_period': fast, 'sma_slow_period': 20})['pnl']
+            for fast in (3, 5)}
+    assert first['sma_fast_period'] == max(pnls, key=pnls.get)
+    assert first['is_pnl'] == max(pnls.values())
+    assert first['oos_bars'] == len(df.loc['2021-01-01':'2021-06-30'])
+
+
+def test_out_of_sample_is_warmed_up_with_in_sample_data():
+    logging.getLogger('strategies').setLevel(logging.WARNING)
+    index = pd.bdate_range('2020-01-01', '2021-06-30')
+    close = 10_000 * (1 + 0.2 * np.sin(np.arange(len(index)) * 2 * np.pi / 40))
+    df = pd.DataFrame({'open': close, 'high': close * 1.01, 'low': close * 0.99, 'close': close,
+                       'volume': 1000.0, 'openinterest': 0.0}, index=index)
+    params = {'sma_fast_period': 5, 'sma_slow_period': 70} # 장기 이평 기간 > 검증 구간 바 수 (약 63개)
+
+    results = walk_forward(SimpleMAStrategy, df, {key: [value] for key, value in params.items()},
+                           date(2020, 1, 1), date(2021, 6, 30), in_sample_months=12, out_of_sample_months=3, workers=1)
+
+    first = results.iloc[0]
+    assert first['oos_bars'] < params['sma_slow_period']
+    # 검증 구간만 넣으면 지표가 워밍업되지 않아 거래가 없음
+    assert run_single(SimpleMAStrategy, df.loc['2021-01-01':'2021-03-31'], params)['trade_count'] == 0
+    assert first['oos_trade_count'] > 0
+
+    # 워밍업 구간에서는 주문이 없고, 평가금액 곡선은 검증 구간부터 기록
+    warmed = run_single(SimpleMAStrategy, df.loc['2020-01-01':'2021-03-31'], params, record=True,
+                        trade_start=date(2021, 1, 1))
+    assert warmed['trade_count'] == first['oos_trade_count'] and warmed['pnl'] == first['oos_pnl']
+    assert min(order['datetime'] for order in warmed['record']['orders']) >= pd.Timestamp('2021-01-01')
+    assert warmed['record']['equity'][0]['datetime'] >= pd.Timestamp('2021-01-01')
@@ -0,0 +1,34 @@
+# backtesting/utils/memory.py
+
+import logging
+import sys
+
+try:
+    import resource # Linux/macOS
+except ImportError:
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+
+def get_peak_rss_mb() -> float:
+    """
+    현재 프로세스의 최대 상주 메모리(peak RSS)를 MB 단위로 반환합니다.
+    Linux/macOS는 resource.getrusage, Windows는 psutil의 peak_wset을 사용합니다. 측정할 수 없으면 None.
+    """
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux는 KB, macOS는 바이트 단위
+        return round(peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024, 1)
+    if psutil is not None:
+        info = psutil.Process().memory_info()
+        peak = getattr(info, 'peak_wset', None) or info.rss # peak_wset은 Windows에만 있음
+        return round(peak / (1024 * 1024), 1)
+    logger.debug("peak RSS를 측정할 수 없습니다. (resource/psutil 없음)")
+    return None
+
@@ -0,0 +1,173 @@
+# backtesting/utils/metrics.py
+
+import json
+import os
+import sys
+import threading
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from config.settings import METRICS_ENABLED, METRICS_PREFIX
+
+
+class _NullTimer:
+    """계측이 꺼져 있을 때 timer()가 돌려주는 공유 객체. 아무것도 기록하지 않습니다."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def add(self, **counts):
+        pass
+
+    def add_frame(self, df):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    """with 블록의 경과 시간을 레지스트리에 기록하고, 블록 안에서 처리한 행/바이트 수 등을 함께 집계합니다."""
+    __slots__ = ('registry', 'name', 'labels', 'counts', '_started')
+
+    def __init__(self, registry, name: str, labels: tuple):
+        self.registry = registry
+        self.name = name
+        self.labels = labels
+        self.counts = {}
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        elapsed = time.perf_counter() - self._started
+        labels = tuple(sorted(self.labels + (('error', '1'),))) if exc_type is not None else self.labels
+        self.registry._observe(self.name, labels, elapsed, self.counts)
+        return False
+
+    def add(self, **counts):
+        """블록에서 처리한 양을 더합니다. (예: rows=len(result)) -> {name}_{key}_total 카운터"""
+        for key, value in counts.items():
+            self.counts[key] = self.counts.get(key, 0) + value
+
+    def add_frame(self, df):
+        """DataFrame의 행 수와 메모리 크기(바이트)를 더합니다."""
+        self.add(rows=len(df), bytes=int(df.memory_usage(index=False, deep=False).sum()) if len(df) else 0)
+
+
+class MetricsRegistry:
+    """
+    프로세스 안의 타이머/카운터 저장소.
+    - timer(name, **labels): with 블록 시간 측정 -> {name}_seconds의 count/sum/max
+    - inc(name, value, **labels): 카운터 -> {name}_total
+    꺼져 있으면(enabled=False) timer()는 공유 no-op 객체를, inc()는 바로 반환하므로 계측 지점의 비용은 속성 확인 한 번입니다.
+    to_json() / to_prometheus()로 내보냅니다.
+    사용 예:
+        with metrics.timer('db_query', table='daily_stock_data') as t:
+            rows = cursor.fetchall()
+            t.add(rows=len(rows))
+    """
+    def __init__(self, enabled: bool = False, prefix: str = METRICS_PREFIX):
+        self.enabled = enabled
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._timers = {} # (name, labels) -> [count, sum, max]
+        self._counters = {} # (name, labels) -> value
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+
+    @staticmethod
+    def _labels(labels: dict) -> tuple:
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def timer(self, name: str, **labels):
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name, self._labels(labels))
+
+    def inc(self, name: str, value: float = 1, **labels):
+        if not self.enabled:
+            return
+        key = (name, self._labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def _observe(self, name: str, labels: tuple, elapsed: float, counts: dict):
+        with self._lock:
+            stats = self._timers.get((name, labels))
+            if stats is None:
+                self._timers[(name, labels)] = [1, elapsed, elapsed]
+            else:
+                stats[0] += 1
+                stats[1] += elapsed
+                if elapsed > stats[2]:
+                    stats[2] = elapsed
+            for key, value in counts.items():
+                counter_key = (f"{name}_{key}", labels)
+                self._counters[counter_key] = self._counters.get(counter_key, 0) + value
+
+    def snapshot(self) -> dict:
+        """
+        현재 값을 딕셔너리로 반환합니다.
+        :return: {'timers': [{'name', 'labels', 'count', 'sum_sec', 'max_sec', 'avg_sec'}], 'counters': [{'name', 'labels', 'value'}]}
+        """
+        with self._lock:
+            timers = [{'name': name, 'labels': dict(labels), 'count': count, 'sum_sec': round(total, 6),
+                       'max_sec': round(max_, 6), 'avg_sec': round(total / count, 6)}
+                      for (name, labels), (count, total, max_) in sorted(self._timers.items())]
+            counters = [{'name': name, 'labels': dict(labels), 'value': value}
+                        for (name, labels), value in sorted(self._counters.items())]
+        return {'timers': timers, 'counters': counters}
+
+    def to_json(self, indent: int = 2) -> str:
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=indent)
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 형식으로 내보냅니다. (타이머는 summary의 _count/_sum과 _max gauge)"""
+        def fmt(labels: dict) -> str:
+            parts = [f'{key}="{value}"' for key, value in labels.items()]
+            return '{' + ','.join(parts) + '}' if parts else ''
+
+        snapshot = self.snapshot()
+        lines = []
+        for name in sorted({t['name'] for t in snapshot['timers']}):
+            metric = f"{self.prefix}{name}_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for t in (t for t in snapshot['timers'] if t['name'] == name):
+                lines.append(f"{metric}_count{fmt(t['labels'])} {t['count']}")
+                lines.append(f"{metric}_sum{fmt(t['labels'])} {t['sum_sec']}")
+            lines.append(f"# TYPE {metric}_max gauge")
+            for t in (t for t in snapshot['timers'] if t['name'] == name):
+                lines.append(f"{metric}_max{fmt(t['labels'])} {t['max_sec']}")
+        for name in sorted({c['name'] for c in snapshot['counters']}):
+            metric = f"{self.prefix}{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for c in (c for c in snapshot['counters'] if c['name'] == name):
+                lines.append(f"{metric}{fmt(c['labels'])} {c['value']}")
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path: str):
+        """확장자가 .json이면 JSON, 그 외(.prom, .txt 등)는 Prometheus 텍스트로 파일에 씁니다."""
+        content = self.to_json() if path.endswith('.json') else self.to_prometheus()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+
+# 프로세스 전역 기본 레지스트리 (METRICS_ENABLED 또는 metrics.enable()로 켭니다)
+metrics = MetricsRegistry(enabled=METRICS_ENABLED)
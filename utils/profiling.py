@@ -0,0 +1,228 @@
+# backtesting/utils/profiling.py
+
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import types
+from collections import Counter
+from datetime import datetime
+
+import backtrader as bt
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, project_root)
+
+from config.settings import PROFILE_DIR, PROFILE_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ('strategy', 'indicator', 'broker', 'data_feed', 'analyzer', 'engine', 'other')
+
+_BT_DIR = os.path.dirname(os.path.abspath(bt.__file__)).replace(os.sep, '/') + '/'
+_FEEDS_DIR = os.path.join(project_root, 'feeds').replace(os.sep, '/') + '/'
+
+# backtrader 내부 모듈 -> 분류 (여기에 없는 backtrader 모듈(cerebro, lineiterator, linebuffer 등)은
+# 호출한 쪽으로 시간을 넘기고, 스택 전체가 엔진 코드이면 'engine')
+_BT_MODULE_CATEGORIES = (
+    ('indicators/', 'indicator'), ('indicator.py', 'indicator'), ('functions.py', 'indicator'), ('talib.py', 'indicator'),
+    ('brokers/', 'broker'), ('broker.py', 'broker'), ('order.py', 'broker'), ('comminfo.py', 'broker'),
+    ('trade.py', 'broker'), ('position.py', 'broker'), ('sizer.py', 'broker'), ('sizers/', 'broker'),
+    ('feeds/', 'data_feed'), ('feed.py', 'data_feed'), ('resamplerfilter.py', 'data_feed'),
+    ('analyzers/', 'analyzer'), ('analyzer.py', 'analyzer'), ('observers/', 'analyzer'), ('observer.py', 'analyzer'),
+)
+
+# 사용자 정의 클래스의 메서드를 분류할 기준 클래스
+_BASE_CATEGORIES = (
+    (bt.Strategy, 'strategy'),
+    (bt.Indicator, 'indicator'),
+    (bt.Analyzer, 'analyzer'),
+    (bt.Observer, 'analyzer'),
+    (bt.feed.AbstractDataBase, 'data_feed'),
+)
+
+
+def _user_code_categories() -> dict:
+    """
+    지금까지 로드된 전략/지표/분석기/피드 하위 클래스 중 backtrader 밖에서 정의된 클래스의 메서드 코드 -> 분류.
+    (SimpleMAStrategy.next -> 'strategy', CachedSMA.once -> 'indicator' 등)
+    """
+    codes = {}
+    for base, category in _BASE_CATEGORIES:
+        stack, seen = [base], set()
+        while stack:
+            cls = stack.pop()
+            for sub in cls.__subclasses__():
+                if sub in seen:
+                    continue
+                seen.add(sub)
+                stack.append(sub)
+                if sub.__module__.startswith('backtrader'):
+                    continue
+                for attr in vars(sub).values():
+                    func = getattr(attr, '__func__', attr)
+                    if isinstance(func, types.FunctionType):
+                        codes.setdefault(func.__code__, category)
+    return codes
+
+
+class SamplingProfiler:
+    """
+    별도 스레드에서 interval초마다 대상 스레드의 호출 스택을 표본 추출하는 프로파일러.
+    코드를 고치거나 함수마다 추적 훅을 걸지 않으므로 실행 속도에 거의 영향이 없습니다.
+    결과는 collapsed-stack 텍스트(flamegraph.pl, speedscope에서 열기)와 speedscope JSON으로 저장하며,
+    표본을 전략 next()/지표/브로커/데이터 피드/분석기/엔진으로 분류한 시간도 계산합니다.
+    사용 예:
+        with SamplingProfiler() as profiler:
+            cerebro.run()
+        profiler.write('SimpleMAStrategy-A005930')
+        profiler.category_seconds() # {'strategy': 0.8, 'data_feed': 2.1, ...}
+    """
+    def __init__(self, interval: float = PROFILE_INTERVAL):
+        """:param interval: 표본 추출 간격 (초)"""
+        self.interval = interval
+        self.samples = Counter() # 스택(코드 객체 튜플, 바깥 -> 안쪽) -> 표본 수
+        self.elapsed = 0.0
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._code_categories = {}
+
+    def start(self):
+        """현재 스레드를 대상으로 표본 추출을 시작합니다."""
+        self._code_categories = _user_code_categories()
+        self._target = threading.get_ident()
+        self._stop_event.clear()
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self.elapsed += time.perf_counter() - self._started
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    def _run(self):
+        current_frames = sys._current_frames
+        while not self._stop_event.wait(self.interval):
+            frame = current_frames().get(self._target)
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            if stack:
+                stack.reverse()
+                self.samples[tuple(stack)] += 1
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.samples.values())
+
+    def _sample_seconds(self) -> float:
+        """표본 하나가 나타내는 시간. (실제 경과 시간을 표본 수로 나눔 - 스레드 전환 지연으로 interval보다 길 수 있음)"""
+        total = self.sample_count
+        return self.elapsed / total if total else self.interval
+
+    def _code_category(self, code) -> str:
+        """코드 객체 하나의 분류. backtrader의 공통 엔진 코드나 외부 라이브러리(pandas 등)는 None (호출한 쪽으로 넘김)"""
+        category = self._code_categories.get(code)
+        if category is not None:
+            return category
+        filename = code.co_filename.replace(os.sep, '/')
+        if filename.startswith(_BT_DIR):
+            relative = filename[len(_BT_DIR):]
+            for prefix, bt_category in _BT_MODULE_CATEGORIES:
+                if relative.startswith(prefix):
+                    return bt_category
+            return None
+        if filename.startswith(_FEEDS_DIR):
+            return 'data_feed'
+        return None
+
+    def classify(self, stack: tuple) -> str:
+        """스택의 안쪽 프레임부터 살펴 처음으로 분류되는 항목을 반환합니다."""
+        for code in reversed(stack):
+            category = self._code_category(code)
+            if category is not None:
+                return category
+        if any(code.co_filename.replace(os.sep, '/').startswith(_BT_DIR) for code in stack):
+            return 'engine'
+        return 'other'
+
+    def category_seconds(self) -> dict:
+        """분류별 추정 시간 (초). {'strategy': ..., 'indicator': ..., 'broker': ..., 'data_feed': ..., ...}"""
+        seconds = dict.fromkeys(CATEGORIES, 0.0)
+        per_sample = self._sample_seconds()
+        for stack, count in self.samples.items():
+            seconds[self.classify(stack)] += count * per_sample
+        return {category: round(value, 4) for category, value in seconds.items()}
+
+    @staticmethod
+    def _frame_name(code) -> str:
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+    def collapsed(self) -> str:
+        """collapsed-stack 형식 ('바깥;...;안쪽 표본수' 한 줄씩)"""
+        lines = []
+        for stack, count in self.samples.most_common():
+            lines.append(';'.join(self._frame_name(code).replace(';', ':') for code in stack) + f" {count}")
+        return '\n'.join(lines) + '\n'
+
+    def speedscope(self, name: str) -> dict:
+        """speedscope(https://www.speedscope.app) sampled 프로파일 형식의 딕셔너리"""
+        frames, frame_index = [], {}
+        samples, weights = [], []
+        per_sample = self._sample_seconds()
+        for stack, count in self.samples.most_common():
+            indices = []
+            for code in stack:
+                if code not in frame_index:
+                    frame_index[code] = len(frames)
+                    frames.append({'name': code.co_name, 'file': code.co_filename, 'line': code.co_firstlineno})
+                indices.append(frame_index[code])
+            samples.append(indices)
+            weights.append(count * per_sample)
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': 'sampled', 'name': name, 'unit': 'seconds',
+                'startValue': 0, 'endValue': sum(weights), 'samples': samples, 'weights': weights,
+            }],
+            'name': name,
+            'exporter': 'backtesting.utils.profiling',
+        }
+
+    def write(self, name: str, output_dir: str = None) -> dict:
+        """
+        collapsed-stack 파일과 speedscope 파일을 저장하고 분류별 시간을 로그로 남깁니다.
+        :param name: 실행 이름 (파일명에 사용, 예: 'SimpleMAStrategy-A005930')
+        :param output_dir: 저장 디렉토리 (None이면 PROFILE_DIR)
+        :return: {'collapsed': 경로, 'speedscope': 경로, 'categories': category_seconds()}
+        """
+        output_dir = output_dir or PROFILE_DIR
+        os.makedirs(output_dir, exist_ok=True)
+        safe_name = re.sub(r'[^\w.=-]+', '_', name)
+        base = os.path.join(output_dir, f"{safe_name}-{datetime.now():%Y%m%d-%H%M%S}-{os.getpid()}")
+        with open(f"{base}.collapsed.txt", 'w', encoding='utf-8') as f:
+            f.write(self.collapsed())
+        with open(f"{base}.speedscope.json", 'w', encoding='utf-8') as f:
+            json.dump(self.speedscope(name), f)
+        categories = self.category_seconds()
+        summary = ', '.join(f"{category} {seconds:.2f}s" for category, seconds in categories.items() if seconds)
+        logger.info(f"프로파일 저장: {base}.* (표본 {self.sample_count}개, {self.elapsed:.2f}초) - {summary}")
+        return {'collapsed': f"{base}.collapsed.txt", 'speedscope': f"{base}.speedscope.json",
+                'categories': categories}